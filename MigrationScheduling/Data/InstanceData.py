@@ -2,6 +2,9 @@
 instance used to construct an optimization model.
 
 """
+import numpy as np
+import scipy.sparse as sp
+from MigrationScheduling.Data.MigrationClass import MigrationClass
 
 class InstanceData:
     """Stores the data of a migration scheduling instance.
@@ -42,6 +45,9 @@ class InstanceData:
         The IDs of the destination controllers for migrations.
     _qos_ids: list
         The IDs of the QoS groups.
+    _migration_classes: dict
+        A cache of the classes of interchangeable migrations, keyed by
+        whether failure resiliency is considered.
 
     """
     def __init__(self, migrations, controller_consts, qos_consts,
@@ -53,6 +59,7 @@ class InstanceData:
         self._round_ids = round_ids
         self._controller_ids = controller_ids
         self._qos_ids = qos_ids
+        self._migration_classes = {}
 
     def get_migrations(self):
         """The migrations for the scheduling instance.
@@ -104,6 +111,89 @@ class InstanceData:
         """
         return self._qos_consts
 
+    def get_migration_classes(self, resiliency=False):
+        """The classes of interchangeable migrations of the instance.
+
+        Two migrations are interchangeable if they have the same destination
+        controller, load and QoS groups, and also the same source controller
+        if `resiliency` is True. The classes are computed once for each
+        value of `resiliency`.
+
+        Parameters
+        ----------
+        resiliency: bool
+            A boolean value indicating whether failure resiliency should be
+            considered. A value of True indicates that the load of a
+            migration will be considered for both the source and destination
+            controllers. Otherwise, the load is only considered for the
+            destination controller.
+
+        Returns
+        -------
+        list
+            A list of `MigrationClass` objects, one per class, ordered by the
+            first migration of each class.
+
+        """
+        if resiliency not in self._migration_classes:
+            classes = {}
+            for switch, migration in self._migrations.items():
+                key = (migration.get_dst_controller(),
+                       migration.get_src_controller() if resiliency else None,
+                       migration.get_load(),
+                       frozenset(migration.get_groups()))
+                if key in classes:
+                    classes[key].add_switch(switch)
+                else:
+                    classes[key] = MigrationClass(migration)
+            self._migration_classes[resiliency] = list(classes.values())
+        return self._migration_classes[resiliency]
+
+    def get_constraint_matrices(self, resiliency=False):
+        """The matrices of the controller and QoS constraints of a round.
+
+        Each row of a matrix is a constraint and each column a migration,
+        with the rows in the order of `get_control_consts` and
+        `get_qos_consts` and the columns in the order of `get_switch_ids`.
+        An entry of the controller matrix is the load placed on the
+        controller by the migration and an entry of the QoS matrix is 1 if
+        the migration is in the group.
+
+        Parameters
+        ----------
+        resiliency: bool
+            A boolean value indicating whether failure resiliency should be
+            considered. A value of True indicates that the load of a
+            migration will be considered for both the source and destination
+            controllers. Otherwise, the load is only considered for the
+            destination controller.
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix, np.array, scipy.sparse.csr_matrix, np.array
+            The controller matrix, the capacity of each controller, the QoS
+            matrix and the capacity of each QoS group.
+
+        """
+        columns = {switch_id: col
+                   for col, switch_id in enumerate(self._switch_ids)}
+        control_entries = [
+            (row, columns[self.get_switch_id(switch)], self.get_load(switch))
+            for row, const in enumerate(self._controller_consts)
+            for switch in const.get_constraint_switches(resiliency)]
+        qos_entries = [
+            (row, columns[self.get_switch_id(switch)], 1.0)
+            for row, const in enumerate(self._qos_consts)
+            for switch in const.get_switches()]
+        return (
+            self._build_sparse_matrix(
+                control_entries, len(self._controller_consts)),
+            np.array([const.get_cap() for const in self._controller_consts],
+                     dtype=float),
+            self._build_sparse_matrix(qos_entries, len(self._qos_consts)),
+            np.array([const.get_cap() for const in self._qos_consts],
+                     dtype=float))
+
     def get_switch_ids(self):
         """The IDs of the switches being migrated.
 
@@ -204,3 +294,25 @@ class InstanceData:
             len(self._switch_ids),
             len(self._controller_ids),
             len(self._qos_ids))
+
+    def _build_sparse_matrix(self, entries, num_rows):
+        """Builds a sparse matrix with a column per migration.
+
+        Parameters
+        ----------
+        entries: list
+            A list of tuples of the row, column and value of each entry.
+        num_rows: int
+            An integer representing the number of rows of the matrix.
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            A sparse matrix holding `entries`, with `num_rows` rows and a
+            column per switch of `get_switch_ids`.
+
+        """
+        rows, cols, values = zip(*entries) if entries else ((), (), ())
+        return sp.csr_matrix(
+            (values, (rows, cols)),
+            shape=(num_rows, len(self._switch_ids)), dtype=float)
@@ -0,0 +1,93 @@
+"""The `MigrationClass` class is used to store a class of interchangeable
+migrations, which have the same controllers, load and QoS groups.
+
+"""
+
+class MigrationClass:
+    """Stores a class of interchangeable migrations.
+
+    The migrations of a class place the same demand on the same constraints,
+    so any one of them can be exchanged for another in a schedule. The class
+    is stored once, as a representative migration, with the switches of its
+    migrations.
+
+    Parameters
+    ----------
+    migration: Migration
+        A `Migration` object representing the first migration of the class,
+        used as the representative of the class.
+
+    Attributes
+    ----------
+    _migration: Migration
+        The representative migration of the class.
+    _switches: list
+        The names of the switches whose migrations are in the class, in the
+        order in which they were added.
+
+    """
+    def __init__(self, migration):
+        self._migration = migration
+        self._switches = [migration.get_switch()]
+
+    def get_migration(self):
+        """The representative migration of the class.
+
+        Returns
+        -------
+        Migration
+            A `Migration` object representing the first migration added to
+            the class.
+
+        """
+        return self._migration
+
+    def get_switches(self):
+        """The switches whose migrations are in the class.
+
+        Returns
+        -------
+        list
+            A list of strings representing the names of the switches, in
+            the order in which they were added.
+
+        """
+        return self._switches
+
+    def get_count(self):
+        """The number of migrations in the class.
+
+        Returns
+        -------
+        int
+            An integer representing the number of migrations in the class.
+
+        """
+        return len(self._switches)
+
+    def get_load(self):
+        """The load of each migration of the class.
+
+        Returns
+        -------
+        float
+            A float representing the load of a migration of the class.
+
+        """
+        return self._migration.get_load()
+
+    def add_switch(self, switch_name):
+        """Adds the migration of `switch_name` to the class.
+
+        Parameters
+        ----------
+        switch_name: str
+            A string representing the name of a switch whose migration is
+            interchangeable with the representative migration.
+
+        Returns
+        -------
+        None
+
+        """
+        self._switches.append(switch_name)
@@ -4,6 +4,7 @@ scheduling instance.
 """
 from MigrationScheduling.Data.ConstraintDict import ConstraintDict
 from MigrationScheduling.Data.Migration import Migration
+from MigrationScheduling.Data.MigrationClass import MigrationClass
 from MigrationScheduling.Data.ControllerConstraint import ControllerConstraint
 from MigrationScheduling.Data.QosConstraint import QosConstraint
 from MigrationScheduling.Data.InstanceData import InstanceData
@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import MagicMock
 from MigrationScheduling.Data import InstanceData
+from MigrationScheduling.tests.helpers import build_instance
 
 
 @pytest.fixture(scope="function")
@@ -132,3 +133,74 @@ def test_get_size_string(no_data, small_instance, large_instance):
     assert no_data.get_size_string() == "0 0 0"
     assert small_instance.get_size_string() == "1 1 1"
     assert large_instance.get_size_string() == "3 2 5"
+
+
+def build_class_migration(src, dst, load, groups):
+    migration = MagicMock()
+    migration.get_src_controller = MagicMock(return_value=src)
+    migration.get_dst_controller = MagicMock(return_value=dst)
+    migration.get_load = MagicMock(return_value=load)
+    migration.get_groups = MagicMock(return_value=set(groups))
+    return migration
+
+
+@pytest.fixture(scope="function")
+def class_instance():
+    migrations = {
+        's0': build_class_migration('c0', 'c1', 2.0, ['g0']),
+        's1': build_class_migration('c2', 'c1', 2.0, ['g0']),
+        's2': build_class_migration('c0', 'c1', 2.0, ['g0']),
+        's3': build_class_migration('c0', 'c1', 2.0, []),
+        's4': build_class_migration('c0', 'c1', 3.0, ['g0'])}
+    for switch, migration in migrations.items():
+        migration.get_switch = MagicMock(return_value=switch)
+    return InstanceData(migrations, set(), set(), [0, 1, 2, 3, 4],
+                        [0, 1, 2, 3, 4], [0, 1, 2], [0])
+
+
+def test_migration_classes_no_data(no_data):
+    assert no_data.get_migration_classes() == []
+
+
+def test_migration_classes(class_instance):
+    classes = class_instance.get_migration_classes()
+    assert [migration_class.get_switches() for migration_class in classes] == [
+        ['s0', 's1', 's2'], ['s3'], ['s4']]
+    assert classes[0].get_migration() is class_instance.get_migration('s0')
+    assert class_instance.get_migration_classes() is classes
+
+
+def test_migration_classes_with_resiliency(class_instance):
+    # the source controller of s1 differs from that of s0 and s2
+    classes = class_instance.get_migration_classes(True)
+    assert [migration_class.get_switches() for migration_class in classes] == [
+        ['s0', 's2'], ['s1'], ['s3'], ['s4']]
+    assert len(class_instance.get_migration_classes()) == 3
+
+
+def test_constraint_matrices_no_data(no_data):
+    control_matrix, control_caps, qos_matrix, qos_caps = (
+        no_data.get_constraint_matrices())
+    assert control_matrix.shape == (0, 0)
+    assert len(control_caps) == 0
+    assert qos_matrix.shape == (0, 0)
+    assert len(qos_caps) == 0
+
+
+@pytest.mark.parametrize("resiliency", [False, True])
+def test_constraint_matrices(resiliency):
+    data = build_instance(
+        {'g0': 1}, {'g0': ['s0', 's2']}, {'c0': 5.0, 'c1': 8.0},
+        [('s0', 'c0', 'c1', 2.0), ('s1', 'c1', 'c0', 3.0),
+         ('s2', 'c0', 'c1', 4.0)])
+    control_matrix, control_caps, qos_matrix, qos_caps = (
+        data.get_constraint_matrices(resiliency))
+    expected_rows = {
+        'c0': [2.0, 3.0, 4.0] if resiliency else [0.0, 3.0, 0.0],
+        'c1': [2.0, 3.0, 4.0] if resiliency else [2.0, 0.0, 4.0]}
+    for row, const in enumerate(data.get_control_consts()):
+        assert list(control_matrix[row].toarray()[0]) == (
+            expected_rows[const.get_controller()])
+        assert control_caps[row] == const.get_cap()
+    assert qos_matrix.toarray().tolist() == [[1.0, 0.0, 1.0]]
+    assert list(qos_caps) == [1.0]
@@ -0,0 +1,31 @@
+import pytest
+from unittest.mock import MagicMock
+from MigrationScheduling.Data import MigrationClass
+
+
+@pytest.fixture(scope="function")
+def migration():
+    migration = MagicMock()
+    migration.get_switch = MagicMock(return_value='s3')
+    migration.get_load = MagicMock(return_value=2.5)
+    return migration
+
+
+@pytest.fixture(scope="function")
+def migration_class(migration):
+    return MigrationClass(migration)
+
+
+def test_instantiation(migration_class, migration):
+    assert migration_class.get_migration() is migration
+    assert migration_class.get_switches() == ['s3']
+    assert migration_class.get_count() == 1
+    assert migration_class.get_load() == 2.5
+
+
+def test_add_switch(migration_class, migration):
+    migration_class.add_switch('s7')
+    migration_class.add_switch('s1')
+    assert migration_class.get_switches() == ['s3', 's7', 's1']
+    assert migration_class.get_count() == 3
+    assert migration_class.get_migration() is migration
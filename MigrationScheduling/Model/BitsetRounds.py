@@ -0,0 +1,345 @@
+"""The `BitsetRounds` class stores the remaining capacity of the scheduling
+rounds over a `CompiledInstance`, keeping the full QoS groups of each round
+as a bitmask.
+
+"""
+from MigrationScheduling.Model.CompiledInstance import CompiledInstance
+
+
+class BitsetRounds:
+    """The remaining capacities of the rounds held as bitmasks and lists.
+
+    Each round keeps a list of the remaining capacity of each controller, a
+    list of the remaining capacity of each QoS group and a bitmask of the
+    groups that are saturated, that is, that have no capacity left in the
+    round. A migration fits in a round if its group bitmask does not
+    intersect the saturated bitmask of the round and the controllers
+    receiving its load have enough capacity remaining, so the QoS groups of
+    a migration are checked with a single AND.
+
+    Parameters
+    ----------
+    controller_caps: dict
+        A dictionary of controller capacities. The keys are strings
+        representing the names of the controllers and the corresponding value
+        is a float representing the amount of migration load that the
+        controller can handle in a single round.
+    qos_caps: dict
+        A dictionary of QoS group capacities. The keys are strings
+        representing the names of the QoS groups and the corresponding value
+        is an integer representing the maximum amount of migrations from the
+        group that can be scheduled in a single round.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. A value of True indicates that the load of a migration
+        will be considered for both the source and destination controllers.
+        Otherwise, the load is only considered for the destination controller.
+
+    Attributes
+    ----------
+    _compiled: CompiledInstance
+        The integer encoding of the controllers, QoS groups and migrations.
+    _base_saturated: int
+        The bitmask of the QoS groups with no capacity in an empty round.
+    _rem_controller_caps: list
+        A list with one list per round of the remaining capacity of each
+        controller, indexed by controller index.
+    _rem_qos_caps: list
+        A list with one list per round of the remaining capacity of each
+        QoS group, indexed by group index.
+    _saturated: list
+        A list with one integer per round whose set bits are the QoS groups
+        with no capacity left in that round.
+
+    """
+    def __init__(self, controller_caps, qos_caps, resiliency=False):
+        self._compiled = CompiledInstance(
+            controller_caps, qos_caps, resiliency)
+        self._base_saturated = sum(
+            1 << idx for idx, cap in enumerate(self._compiled.get_qos_caps())
+            if cap < 1)
+        self._rem_controller_caps = []
+        self._rem_qos_caps = []
+        self._saturated = []
+
+    def get_num_rounds(self):
+        """The number of rounds that have been opened.
+
+        Returns
+        -------
+        int
+            An integer representing the number of open rounds.
+
+        """
+        return len(self._saturated)
+
+    def get_compiled_instance(self):
+        """The integer encoding of the instance.
+
+        Returns
+        -------
+        CompiledInstance
+            The `CompiledInstance` used to encode the migrations.
+
+        """
+        return self._compiled
+
+    def get_saturated_mask(self, round_num):
+        """The QoS groups with no capacity left in round `round_num`.
+
+        Parameters
+        ----------
+        round_num: int
+            An integer representing the index of an open round.
+
+        Returns
+        -------
+        int
+            An integer whose set bits are the indices of the QoS groups that
+            have no capacity left in round `round_num`.
+
+        """
+        return self._saturated[round_num]
+
+    def get_remaining_capacity(self, const_name, round_num):
+        """The remaining capacity of `const_name` in round `round_num`.
+
+        Parameters
+        ----------
+        const_name: str
+            A string representing the name of a controller or QoS group.
+        round_num: int
+            An integer representing the index of an open round.
+
+        Returns
+        -------
+        float
+            A float representing the capacity of `const_name` remaining in
+            round `round_num` after accounting for the migrations scheduled
+            in that round.
+
+        """
+        try:
+            controller_idx = self._compiled.get_controller_idx(const_name)
+        except KeyError:
+            return self._rem_qos_caps[round_num][
+                self._compiled.get_group_idx(const_name)]
+        return self._rem_controller_caps[round_num][controller_idx]
+
+    def add_round(self):
+        """Opens a new round with the full capacity for each constraint.
+
+        Returns
+        -------
+        int
+            An integer representing the index of the new round.
+
+        """
+        self._rem_controller_caps.append(
+            list(self._compiled.get_controller_caps()))
+        self._rem_qos_caps.append(list(self._compiled.get_qos_caps()))
+        self._saturated.append(self._base_saturated)
+        return len(self._saturated) - 1
+
+    def can_schedule_migration(self, migration, round_num):
+        """Indicates if `migration` can be scheduled in round `round_num`.
+
+        Parameters
+        ----------
+        migration: Migration
+            A `Migration` object representing the migration to be scheduled.
+        round_num: int
+            An integer representing the index of an open round.
+
+        Returns
+        -------
+        bool
+            True if `migration` fits within the remaining capacity of every
+            constraint it is involved in for the round. Otherwise, False.
+
+        """
+        group_mask, _, controller_idxs, load = (
+            self._compiled.compile_migration(migration))
+        return self._fits(group_mask, controller_idxs, load, round_num)
+
+    def find_scheduling_round(self, migration, start_round=0):
+        """The earliest open round in which `migration` can be scheduled.
+
+        Parameters
+        ----------
+        migration: Migration
+            A `Migration` object representing the migration to be scheduled.
+        start_round: int
+            An integer representing the index of the first round considered.
+            The default value is 0.
+
+        Returns
+        -------
+        int
+            An integer representing the index of the first round from
+            `start_round` in which `migration` fits. If it does not fit in
+            any open round from `start_round` then the number of open rounds
+            is returned, signifying that it should be scheduled in a new
+            round.
+
+        """
+        group_mask, _, controller_idxs, load = (
+            self._compiled.compile_migration(migration))
+        for round_num in range(start_round, len(self._saturated)):
+            if self._fits(group_mask, controller_idxs, load, round_num):
+                return round_num
+        return len(self._saturated)
+
+    def find_scheduling_rounds(self, migration):
+        """The open rounds in which `migration` can be scheduled.
+
+        Parameters
+        ----------
+        migration: Migration
+            A `Migration` object representing the migration to be scheduled.
+
+        Returns
+        -------
+        list
+            A list of integers representing the indices of the open rounds
+            in which `migration` fits, in increasing order.
+
+        """
+        group_mask, _, controller_idxs, load = (
+            self._compiled.compile_migration(migration))
+        return [round_num for round_num in range(len(self._saturated))
+                if self._fits(group_mask, controller_idxs, load, round_num)]
+
+    def schedule_migration(self, migration, round_num):
+        """Schedules `migration` in round `round_num`.
+
+        If `round_num` is the number of open rounds a new round is opened
+        for the migration. The QoS groups of `migration` left with no
+        capacity are marked as saturated in the round.
+
+        Parameters
+        ----------
+        migration: Migration
+            A `Migration` object representing the migration being scheduled.
+        round_num: int
+            An integer representing the index of the round in which
+            `migration` is scheduled.
+
+        Returns
+        -------
+        None
+
+        """
+        while round_num >= len(self._saturated):
+            self.add_round()
+        _, group_idxs, controller_idxs, load = (
+            self._compiled.compile_migration(migration))
+        rem_controller_caps = self._rem_controller_caps[round_num]
+        for idx in controller_idxs:
+            rem_controller_caps[idx] -= load
+        rem_qos_caps = self._rem_qos_caps[round_num]
+        for idx in group_idxs:
+            rem_qos_caps[idx] -= 1
+            if rem_qos_caps[idx] < 1:
+                self._saturated[round_num] |= 1 << idx
+
+    def unschedule_migration(self, migration, round_num):
+        """Removes `migration` from round `round_num`.
+
+        The demands of `migration` are returned to the remaining capacities
+        of its constraints in the round and its QoS groups that regain
+        capacity are no longer marked as saturated.
+
+        Parameters
+        ----------
+        migration: Migration
+            A `Migration` object representing a migration scheduled in round
+            `round_num`.
+        round_num: int
+            An integer representing the index of the round in which
+            `migration` is scheduled.
+
+        Returns
+        -------
+        None
+
+        """
+        _, group_idxs, controller_idxs, load = (
+            self._compiled.compile_migration(migration))
+        rem_controller_caps = self._rem_controller_caps[round_num]
+        for idx in controller_idxs:
+            rem_controller_caps[idx] += load
+        rem_qos_caps = self._rem_qos_caps[round_num]
+        for idx in group_idxs:
+            rem_qos_caps[idx] += 1
+            if rem_qos_caps[idx] >= 1:
+                self._saturated[round_num] &= ~(1 << idx)
+
+    def change_capacity(self, const_name, delta):
+        """Changes the capacity of `const_name` by `delta` in every round.
+
+        If `const_name` is a QoS group, its bit in the saturated bitmask of
+        each round is updated to reflect its new remaining capacity.
+
+        Parameters
+        ----------
+        const_name: str
+            A string representing the name of a controller or QoS group.
+        delta: float
+            A float representing the change in the capacity of `const_name`.
+
+        Returns
+        -------
+        None
+
+        """
+        self._compiled.change_capacity(const_name, delta)
+        try:
+            idx = self._compiled.get_controller_idx(const_name)
+        except KeyError:
+            idx = self._compiled.get_group_idx(const_name)
+        else:
+            for rem_controller_caps in self._rem_controller_caps:
+                rem_controller_caps[idx] += delta
+            return
+        bit = 1 << idx
+        self._base_saturated &= ~bit
+        if self._compiled.get_qos_caps()[idx] < 1:
+            self._base_saturated |= bit
+        for round_num, rem_qos_caps in enumerate(self._rem_qos_caps):
+            rem_qos_caps[idx] += delta
+            if rem_qos_caps[idx] < 1:
+                self._saturated[round_num] |= bit
+            else:
+                self._saturated[round_num] &= ~bit
+
+    def _fits(self, group_mask, controller_idxs, load, round_num):
+        """Whether a compiled migration fits in round `round_num`.
+
+        Parameters
+        ----------
+        group_mask: int
+            An integer whose set bits are the QoS groups of the migration.
+        controller_idxs: tuple
+            A tuple of the indices of the controllers receiving the load of
+            the migration.
+        load: float
+            A float representing the load of the migration.
+        round_num: int
+            An integer representing the index of an open round.
+
+        Returns
+        -------
+        bool
+            True if none of the QoS groups of the migration are saturated in
+            the round and each of its controllers has at least `load`
+            capacity remaining. Otherwise, False.
+
+        """
+        if group_mask & self._saturated[round_num]:
+            return False
+        rem_controller_caps = self._rem_controller_caps[round_num]
+        for idx in controller_idxs:
+            if rem_controller_caps[idx] < load:
+                return False
+        return True
@@ -0,0 +1,136 @@
+"""The `BottleneckQueue` class is a priority queue of constraints keyed by
+load factor, used to find the bottleneck constraint without rescanning every
+constraint of the load migration scheduling problem.
+
+"""
+import heapq
+
+
+class BottleneckQueue:
+    """A lazily invalidated max-heap of constraint load factors.
+
+    Each heap entry records the load factor of a constraint at the time it
+    was pushed along with a version number. When the load on a constraint
+    changes a new entry is pushed and the old one becomes stale. Stale
+    entries, and entries for constraints that have been removed from the
+    underlying dictionary, are discarded when they reach the top of the heap.
+
+    Ties between constraints with the same load factor are broken by the
+    position of the constraint in the dictionary used to build the queue,
+    matching a linear scan of that dictionary.
+
+    Parameters
+    ----------
+    consts_dict: dict
+        A dictionary of constraints. The keys are strings representing the
+        names of the constraints and the corresponding value is a
+        `ConstraintDict` object representing the constraint. The queue keeps
+        a reference to this dictionary, treating a constraint as removed
+        once its key is deleted.
+
+    Attributes
+    ----------
+    _consts_dict: dict
+        The dictionary of constraints tracked by the queue.
+    _const_orders: dict
+        A dictionary mapping the name of each constraint to its position in
+        `consts_dict`, used to break ties.
+    _versions: dict
+        A dictionary mapping the name of each constraint to the version of
+        its most recent heap entry.
+    _heap: list
+        The heap of entries. Each entry is a tuple of the negated load
+        factor, the constraint position, the entry version, and the
+        constraint name.
+
+    """
+    def __init__(self, consts_dict):
+        self._consts_dict = consts_dict
+        self._const_orders = {}
+        self._versions = {}
+        self._heap = []
+        for const_name, const_dict in consts_dict.items():
+            self._const_orders[const_name] = len(self._const_orders)
+            self._versions[const_name] = 0
+            self._heap.append((-const_dict.get_load_factor(),
+                               self._const_orders[const_name],
+                               0, const_name))
+        heapq.heapify(self._heap)
+
+    def get_heap_size(self):
+        """The number of entries in the heap, including stale entries.
+
+        Returns
+        -------
+        int
+            An integer representing the number of heap entries.
+
+        """
+        return len(self._heap)
+
+    def get_bottleneck_constraint(self):
+        """The bottleneck constraint among the tracked constraints.
+
+        The bottleneck constraint is the most loaded constraint. Stale
+        entries at the top of the heap are discarded until a current entry
+        is found.
+
+        Returns
+        -------
+        str, ConstraintDict
+            A string representing the name of a bottleneck constraint and the
+            associated `ConstraintDict` object. If no constraints remain then
+            both values are None.
+
+        """
+        while self._heap:
+            _, _, version, const_name = self._heap[0]
+            if (const_name in self._consts_dict and
+                version == self._versions[const_name]):
+                return const_name, self._consts_dict[const_name]
+            heapq.heappop(self._heap)
+        return None, None
+
+    def update_constraint(self, const_name):
+        """Records that the load on `const_name` has changed.
+
+        Any existing entry for the constraint is invalidated and, if the
+        constraint has not been removed, a new entry is pushed with its
+        current load factor. A constraint that the queue was not built with
+        is ignored.
+
+        Parameters
+        ----------
+        const_name: str
+            A string representing the name of the constraint that changed.
+
+        Returns
+        -------
+        None
+
+        """
+        if const_name not in self._versions:
+            return
+        self._versions[const_name] += 1
+        if const_name in self._consts_dict:
+            heapq.heappush(self._heap, (
+                -self._consts_dict[const_name].get_load_factor(),
+                self._const_orders[const_name],
+                self._versions[const_name], const_name))
+
+    def update_constraints(self, const_names):
+        """Records that the load on each constraint of `const_names` changed.
+
+        Parameters
+        ----------
+        const_names: collection
+            A collection of strings representing the names of the constraints
+            that changed.
+
+        Returns
+        -------
+        None
+
+        """
+        for const_name in const_names:
+            self.update_constraint(const_name)
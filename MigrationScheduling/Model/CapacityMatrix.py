@@ -0,0 +1,354 @@
+"""The `CapacityMatrix` class stores the remaining capacity of every
+constraint in every scheduling round in a single NumPy array.
+
+"""
+import numpy as np
+from MigrationScheduling import specs
+
+
+class CapacityMatrix:
+    """The remaining capacities of all rounds for the scheduling problem.
+
+    Each controller and QoS group is interned to an index of a 2-D array
+    holding one entry per constraint and scheduling round. The array is
+    stored constraint-major so that the remaining capacities of one
+    constraint across all rounds are contiguous, and it is grown
+    geometrically as rounds are opened so that a new round only requires
+    the base capacities to already be in place.
+
+    Parameters
+    ----------
+    controller_caps: dict
+        A dictionary of controller capacities. The keys are strings
+        representing the names of the controllers and the corresponding value
+        is a float representing the amount of migration load that the
+        controller can handle in a single round.
+    qos_caps: dict
+        A dictionary of QoS group capacities. The keys are strings
+        representing the names of the QoS groups and the corresponding value
+        is an integer representing the maximum amount of migrations from the
+        group that can be scheduled in a single round.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. A value of True indicates that the load of a migration
+        will be considered for both the source and destination controllers.
+        Otherwise, the load is only considered for the destination controller.
+    init_rounds: int
+        An integer representing the number of rounds for which space is
+        initially allocated. The default value is 8.
+
+    Attributes
+    ----------
+    _resiliency: bool
+        Whether failure resiliency is considered.
+    _const_idxs: dict
+        A dictionary mapping the name of each constraint to its index.
+    _base_caps: np.array
+        A 1-D array of the capacity of each constraint in a single round.
+    _rem_caps: np.array
+        A 2-D array of the remaining capacity of each constraint (rows) in
+        each round (columns). Only the first `_num_rounds` columns represent
+        open rounds.
+    _num_rounds: int
+        The number of rounds that have been opened.
+    _migration_demands: dict
+        A cache mapping the name of a switch to the indices of the
+        constraints involved in its migration and the demand placed on
+        each of those constraints.
+
+    """
+    def __init__(self, controller_caps, qos_caps,
+                 resiliency=False, init_rounds=8):
+        self._resiliency = resiliency
+        self._const_idxs = {}
+        caps = []
+        for const_name, cap in list(controller_caps.items()) + list(
+            qos_caps.items()):
+            self._const_idxs[const_name] = len(caps)
+            caps.append(cap)
+        self._base_caps = np.array(caps, dtype=float)
+        self._rem_caps = np.repeat(
+            self._base_caps[:, np.newaxis], max(1, init_rounds), axis=1)
+        self._num_rounds = 0
+        self._migration_demands = {}
+
+    def get_num_rounds(self):
+        """The number of rounds that have been opened.
+
+        Returns
+        -------
+        int
+            An integer representing the number of open rounds.
+
+        """
+        return self._num_rounds
+
+    def get_num_constraints(self):
+        """The number of constraints interned in the matrix.
+
+        Returns
+        -------
+        int
+            An integer representing the number of constraints.
+
+        """
+        return len(self._base_caps)
+
+    def get_constraint_idx(self, const_name):
+        """The index of the constraint named `const_name`.
+
+        Parameters
+        ----------
+        const_name: str
+            A string representing the name of a controller or QoS group.
+
+        Returns
+        -------
+        int
+            An integer representing the index of `const_name`.
+
+        """
+        return self._const_idxs[const_name]
+
+    def get_base_capacities(self):
+        """The capacity of each constraint in a single round.
+
+        Returns
+        -------
+        np.array
+            A 1-D array of the per round capacity of each constraint, indexed
+            by constraint index.
+
+        """
+        return self._base_caps
+
+    def get_remaining_capacities(self):
+        """The remaining capacity of each constraint in the open rounds.
+
+        Returns
+        -------
+        np.array
+            A 2-D array with one row per open round and one column per
+            constraint, giving the capacity remaining after accounting for
+            the migrations scheduled in that round.
+
+        """
+        return self._rem_caps[:, :self._num_rounds].T
+
+    def get_remaining_capacity(self, const_name, round_num):
+        """The remaining capacity of `const_name` in round `round_num`.
+
+        Parameters
+        ----------
+        const_name: str
+            A string representing the name of a controller or QoS group.
+        round_num: int
+            An integer representing the index of an open round.
+
+        Returns
+        -------
+        float
+            A float representing the capacity of `const_name` remaining in
+            round `round_num` after accounting for the migrations scheduled
+            in that round.
+
+        """
+        return float(self._rem_caps[self._const_idxs[const_name], round_num])
+
+    def get_migration_demands(self, migration):
+        """The constraint indices of `migration` and its demand on each.
+
+        The destination controller (and the source controller if resiliency
+        is considered) receives the load of the migration while each QoS
+        group of the migration receives a demand of 1. The result is cached
+        by switch name.
+
+        Parameters
+        ----------
+        migration: Migration
+            The `Migration` object for which the demands are retrieved.
+
+        Returns
+        -------
+        np.array, np.array
+            An integer array of the indices of the constraints involving
+            `migration` and a float array of the demand of `migration` on
+            each of those constraints.
+
+        """
+        switch = migration.get_switch()
+        if switch not in self._migration_demands:
+            demands = {self._const_idxs[migration.get_dst_controller()]:
+                       migration.get_load()}
+            if self._resiliency:
+                demands[self._const_idxs[
+                    migration.get_src_controller()]] = migration.get_load()
+            for group in migration.get_groups():
+                demands[self._const_idxs[group]] = 1.0
+            self._migration_demands[switch] = (
+                np.fromiter(demands.keys(), dtype=int, count=len(demands)),
+                np.fromiter(demands.values(), dtype=float,
+                            count=len(demands)))
+        return self._migration_demands[switch]
+
+    def add_round(self):
+        """Opens a new round with the full capacity for each constraint.
+
+        Returns
+        -------
+        int
+            An integer representing the index of the new round.
+
+        """
+        if self._num_rounds == self._rem_caps.shape[1]:
+            self._rem_caps = np.concatenate(
+                [self._rem_caps, np.repeat(
+                    self._base_caps[:, np.newaxis],
+                    self._rem_caps.shape[1], axis=1)], axis=1)
+        self._num_rounds += 1
+        return self._num_rounds - 1
+
+    def can_schedule_migration(self, migration, round_num):
+        """Indicates if `migration` can be scheduled in round `round_num`.
+
+        Parameters
+        ----------
+        migration: Migration
+            A `Migration` object representing the migration to be scheduled.
+        round_num: int
+            An integer representing the index of an open round.
+
+        Returns
+        -------
+        bool
+            True if `migration` fits within the remaining capacity of every
+            constraint it is involved in for the round. Otherwise, False.
+
+        """
+        cols, demands = self.get_migration_demands(migration)
+        return bool(np.all(self._rem_caps[cols, round_num] >= demands))
+
+    def find_scheduling_round(self, migration, start_round=0):
+        """The earliest open round in which `migration` can be scheduled.
+
+        All open rounds are checked at once with a single comparison over
+        the constraints involving `migration`. Migrations involved in more
+        than `specs.MATRIX_CHUNK_SIZE` constraints are checked one chunk of
+        constraints at a time, discarding the rounds that fail each chunk, so
+        that rounds which are quickly ruled out are not compared against
+        every constraint.
+
+        Parameters
+        ----------
+        migration: Migration
+            A `Migration` object representing the migration to be scheduled.
+        start_round: int
+            An integer representing the index of the first round considered.
+            The default value is 0.
+
+        Returns
+        -------
+        int
+            An integer representing the index of the first round from
+            `start_round` in which `migration` fits. If it does not fit in
+            any open round from `start_round` then the number of open rounds
+            is returned, signifying that it should be scheduled in a new
+            round.
+
+        """
+        cols, demands = self.get_migration_demands(migration)
+        rounds = np.arange(start_round, self._num_rounds)
+        start = 0
+        while rounds.size and start < len(cols):
+            end = start + specs.MATRIX_CHUNK_SIZE
+            fits = np.all(self._rem_caps[np.ix_(cols[start:end], rounds)] >=
+                          demands[start:end, np.newaxis], axis=0)
+            rounds = rounds[fits]
+            start = end
+        return int(rounds[0]) if rounds.size else self._num_rounds
+
+    def find_scheduling_rounds(self, migration):
+        """The open rounds in which `migration` can be scheduled.
+
+        Parameters
+        ----------
+        migration: Migration
+            A `Migration` object representing the migration to be scheduled.
+
+        Returns
+        -------
+        list
+            A list of integers representing the indices of the open rounds
+            in which `migration` fits, in increasing order.
+
+        """
+        cols, demands = self.get_migration_demands(migration)
+        fits = np.all(self._rem_caps[cols, :self._num_rounds] >=
+                      demands[:, np.newaxis], axis=0)
+        return np.flatnonzero(fits).tolist()
+
+    def schedule_migration(self, migration, round_num):
+        """Schedules `migration` in round `round_num`.
+
+        If `round_num` is the number of open rounds a new round is opened
+        for the migration.
+
+        Parameters
+        ----------
+        migration: Migration
+            A `Migration` object representing the migration being scheduled.
+        round_num: int
+            An integer representing the index of the round in which
+            `migration` is scheduled.
+
+        Returns
+        -------
+        None
+
+        """
+        while round_num >= self._num_rounds:
+            self.add_round()
+        cols, demands = self.get_migration_demands(migration)
+        self._rem_caps[cols, round_num] -= demands
+
+    def change_capacity(self, const_name, delta):
+        """Changes the capacity of `const_name` by `delta` in every round.
+
+        Parameters
+        ----------
+        const_name: str
+            A string representing the name of a controller or QoS group.
+        delta: float
+            A float representing the change in the capacity of `const_name`.
+
+        Returns
+        -------
+        None
+
+        """
+        const_idx = self._const_idxs[const_name]
+        self._base_caps[const_idx] += delta
+        self._rem_caps[const_idx] += delta
+
+    def unschedule_migration(self, migration, round_num):
+        """Removes `migration` from round `round_num`.
+
+        The demands of `migration` are returned to the remaining capacities
+        of its constraints in the round.
+
+        Parameters
+        ----------
+        migration: Migration
+            A `Migration` object representing a migration scheduled in round
+            `round_num`.
+        round_num: int
+            An integer representing the index of the round in which
+            `migration` is scheduled.
+
+        Returns
+        -------
+        None
+
+        """
+        cols, demands = self.get_migration_demands(migration)
+        self._rem_caps[cols, round_num] += demands
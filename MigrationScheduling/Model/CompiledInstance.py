@@ -0,0 +1,171 @@
+"""The `CompiledInstance` class encodes the constraints of a load migration
+scheduling instance as integer indices and bitmasks, so that the
+constraints of a migration can be checked without string lookups.
+
+"""
+
+class CompiledInstance:
+    """An integer encoding of the constraints of a scheduling instance.
+
+    Each controller is interned to an index and each QoS group to a bit.
+    A migration is compiled to the bitmask of its QoS groups, the indices
+    of those groups, the indices of the controllers receiving its load and
+    its load.
+
+    Parameters
+    ----------
+    controller_caps: dict
+        A dictionary of controller capacities. The keys are strings
+        representing the names of the controllers and the corresponding value
+        is a float representing the amount of migration load that the
+        controller can handle in a single round.
+    qos_caps: dict
+        A dictionary of QoS group capacities. The keys are strings
+        representing the names of the QoS groups and the corresponding value
+        is an integer representing the maximum amount of migrations from the
+        group that can be scheduled in a single round.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. A value of True indicates that the load of a migration
+        will be considered for both the source and destination controllers.
+        Otherwise, the load is only considered for the destination controller.
+
+    Attributes
+    ----------
+    _resiliency: bool
+        Whether failure resiliency is considered.
+    _controller_idxs: dict
+        A dictionary mapping the name of each controller to its index.
+    _group_idxs: dict
+        A dictionary mapping the name of each QoS group to its index, which
+        is also the position of its bit in a group bitmask.
+    _controller_caps: list
+        The capacity of each controller in a single round, indexed by
+        controller index.
+    _qos_caps: list
+        The capacity of each QoS group in a single round, indexed by group
+        index.
+    _compiled_migrations: dict
+        A cache mapping the name of a switch to its compiled migration.
+
+    """
+    def __init__(self, controller_caps, qos_caps, resiliency=False):
+        self._resiliency = resiliency
+        self._controller_idxs = {
+            controller: idx for idx, controller in enumerate(controller_caps)}
+        self._group_idxs = {group: idx for idx, group in enumerate(qos_caps)}
+        self._controller_caps = list(controller_caps.values())
+        self._qos_caps = list(qos_caps.values())
+        self._compiled_migrations = {}
+
+    def get_controller_idx(self, controller):
+        """The index of `controller`.
+
+        Parameters
+        ----------
+        controller: str
+            A string representing the name of a controller.
+
+        Returns
+        -------
+        int
+            An integer representing the index of `controller`.
+
+        """
+        return self._controller_idxs[controller]
+
+    def get_group_idx(self, group):
+        """The index of the QoS group `group`.
+
+        Parameters
+        ----------
+        group: str
+            A string representing the name of a QoS group.
+
+        Returns
+        -------
+        int
+            An integer representing the index of `group`, which is the
+            position of its bit in a group bitmask.
+
+        """
+        return self._group_idxs[group]
+
+    def get_controller_caps(self):
+        """The capacity of each controller in a single round.
+
+        Returns
+        -------
+        list
+            A list of floats representing the capacity of each controller,
+            indexed by controller index.
+
+        """
+        return self._controller_caps
+
+    def get_qos_caps(self):
+        """The capacity of each QoS group in a single round.
+
+        Returns
+        -------
+        list
+            A list of integers representing the capacity of each QoS group,
+            indexed by group index.
+
+        """
+        return self._qos_caps
+
+    def change_capacity(self, const_name, delta):
+        """Changes the capacity of `const_name` by `delta`.
+
+        Parameters
+        ----------
+        const_name: str
+            A string representing the name of a controller or QoS group.
+        delta: float
+            A float representing the change in the capacity of `const_name`.
+
+        Returns
+        -------
+        None
+
+        """
+        if const_name in self._controller_idxs:
+            self._controller_caps[self._controller_idxs[const_name]] += delta
+        else:
+            self._qos_caps[self._group_idxs[const_name]] += delta
+
+    def compile_migration(self, migration):
+        """The integer encoding of `migration`.
+
+        The destination controller (and the source controller if resiliency
+        is considered) receives the load of the migration. The result is
+        cached by switch name.
+
+        Parameters
+        ----------
+        migration: Migration
+            The `Migration` object being compiled.
+
+        Returns
+        -------
+        int, tuple, tuple, float
+            An integer whose set bits are the QoS groups of `migration`, a
+            tuple of the indices of those groups, a tuple of the indices of
+            the controllers receiving the load of `migration` and a float
+            representing that load.
+
+        """
+        switch = migration.get_switch()
+        if switch not in self._compiled_migrations:
+            group_idxs = tuple(sorted(
+                self._group_idxs[group] for group in migration.get_groups()))
+            controllers = {migration.get_dst_controller()}
+            if self._resiliency:
+                controllers.add(migration.get_src_controller())
+            self._compiled_migrations[switch] = (
+                sum(1 << idx for idx in group_idxs), group_idxs,
+                tuple(sorted(self._controller_idxs[controller]
+                             for controller in controllers)),
+                migration.get_load())
+        return self._compiled_migrations[switch]
@@ -0,0 +1,118 @@
+"""The `DisjointSets` class implements a union-find structure over arbitrary
+hashable items, used to find the independent components of an instance.
+
+"""
+
+class DisjointSets:
+    """A collection of disjoint sets supporting union and find.
+
+    Each set is stored as a tree whose root identifies the set. Trees are
+    merged by size and paths are compressed during `find`, so a sequence of
+    operations takes near linear time. Items are added the first time they
+    are seen.
+
+    Attributes
+    ----------
+    _parents: dict
+        A dictionary mapping each item to its parent in its tree. A root is
+        its own parent.
+    _sizes: dict
+        A dictionary mapping each root to the number of items in its set.
+
+    """
+    def __init__(self):
+        self._parents = {}
+        self._sizes = {}
+
+    def __len__(self):
+        """The number of items in the collection.
+
+        Returns
+        -------
+        int
+            An integer representing the number of items added.
+
+        """
+        return len(self._parents)
+
+    def add(self, item):
+        """Adds `item` as a singleton set if it has not been seen.
+
+        Parameters
+        ----------
+        item: object
+            A hashable object being added.
+
+        Returns
+        -------
+        None
+
+        """
+        if item not in self._parents:
+            self._parents[item] = item
+            self._sizes[item] = 1
+
+    def find(self, item):
+        """The root of the set containing `item`.
+
+        Parameters
+        ----------
+        item: object
+            A hashable object. It is added as a singleton set if it has not
+            been seen.
+
+        Returns
+        -------
+        object
+            The item at the root of the set containing `item`.
+
+        """
+        self.add(item)
+        root = item
+        while self._parents[root] != root:
+            root = self._parents[root]
+        while self._parents[item] != root:
+            self._parents[item], item = root, self._parents[item]
+        return root
+
+    def union(self, first, second):
+        """Merges the sets containing `first` and `second`.
+
+        Parameters
+        ----------
+        first: object
+            A hashable object.
+        second: object
+            A hashable object.
+
+        Returns
+        -------
+        object
+            The item at the root of the merged set.
+
+        """
+        first_root = self.find(first)
+        second_root = self.find(second)
+        if first_root == second_root:
+            return first_root
+        if self._sizes[first_root] < self._sizes[second_root]:
+            first_root, second_root = second_root, first_root
+        self._parents[second_root] = first_root
+        self._sizes[first_root] += self._sizes.pop(second_root)
+        return first_root
+
+    def get_sets(self):
+        """The disjoint sets of the collection.
+
+        Returns
+        -------
+        list
+            A list of lists, one per set, each holding the items of the set
+            in the order in which they were added. The sets are ordered by
+            their first item added.
+
+        """
+        sets = {}
+        for item in self._parents:
+            sets.setdefault(self.find(item), []).append(item)
+        return list(sets.values())
@@ -0,0 +1,190 @@
+"""The `InstanceBatch` class packs a batch of load migration scheduling
+instances into NumPy arrays so that they can be scheduled together.
+
+"""
+import numpy as np
+from MigrationScheduling import utils
+
+
+class InstanceBatch:
+    """A batch of scheduling instances stored in NumPy arrays.
+
+    For each instance the controllers and QoS groups are interned to
+    constraint indices. The capacities are stored in a 2-D array padded to
+    the largest number of constraints in the batch. The migrations are
+    stored as a ragged list of entries, one per constraint involved in a
+    migration, giving the instance, the constraint index and the demand of
+    the migration on that constraint.
+
+    The entries are grouped by step, where step i holds the entries of the
+    i-th migration of every instance with at least i + 1 migrations. Within
+    a step the entries are ordered by instance, so the entries of each
+    migration are contiguous.
+
+    Parameters
+    ----------
+    instances: list
+        A list of `InstanceData` objects representing the instances in the
+        batch.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. A value of True indicates that the load of a migration
+        will be considered for both the source and destination controllers.
+        Otherwise, the load is only considered for the destination controller.
+
+    Attributes
+    ----------
+    _caps: np.array
+        A 2-D array with one row per instance giving the capacity of each
+        constraint of the instance. Padded entries have a capacity of 0.
+    _num_migrations: np.array
+        A 1-D integer array of the number of migrations of each instance.
+    _entry_instances: np.array
+        A 1-D integer array of the instance of each entry.
+    _entry_cols: np.array
+        A 1-D integer array of the constraint index of each entry.
+    _entry_demands: np.array
+        A 1-D float array of the demand of each entry.
+    _step_ptrs: np.array
+        A 1-D integer array such that the entries of step i are those from
+        position `_step_ptrs[i]` up to, but excluding, `_step_ptrs[i + 1]`.
+
+    """
+    def __init__(self, instances, resiliency=False):
+        packed = [self._pack_instance(instance_data, resiliency)
+                  for instance_data in instances]
+        num_consts = max([len(caps) for caps, _, _, _ in packed], default=0)
+        self._caps = np.zeros((len(packed), num_consts))
+        self._num_migrations = np.zeros(len(packed), dtype=int)
+        for idx, (caps, _, _, migration_idxs) in enumerate(packed):
+            self._caps[idx, :len(caps)] = caps
+            if migration_idxs:
+                self._num_migrations[idx] = migration_idxs[-1] + 1
+        entry_instances = np.repeat(
+            np.arange(len(packed), dtype=int),
+            [len(cols) for _, cols, _, _ in packed])
+        entry_cols = np.fromiter(
+            (col for _, cols, _, _ in packed for col in cols), dtype=int,
+            count=len(entry_instances))
+        entry_demands = np.fromiter(
+            (demand for _, _, demands, _ in packed for demand in demands),
+            dtype=float, count=len(entry_instances))
+        entry_steps = np.fromiter(
+            (step for _, _, _, steps in packed for step in steps), dtype=int,
+            count=len(entry_instances))
+        order = np.argsort(entry_steps, kind="stable")
+        self._entry_instances = entry_instances[order]
+        self._entry_cols = entry_cols[order]
+        self._entry_demands = entry_demands[order]
+        self._step_ptrs = np.searchsorted(
+            entry_steps[order],
+            np.arange(self._num_migrations.max(initial=0) + 1))
+
+    def get_num_instances(self):
+        """The number of instances in the batch.
+
+        Returns
+        -------
+        int
+            An integer representing the number of instances.
+
+        """
+        return len(self._num_migrations)
+
+    def get_num_steps(self):
+        """The number of lockstep steps needed to visit every migration.
+
+        Returns
+        -------
+        int
+            An integer representing the largest number of migrations of an
+            instance in the batch.
+
+        """
+        return len(self._step_ptrs) - 1
+
+    def get_capacities(self):
+        """The capacity of each constraint of each instance.
+
+        Returns
+        -------
+        np.array
+            A 2-D array with one row per instance and one column per
+            constraint index.
+
+        """
+        return self._caps
+
+    def get_num_migrations(self):
+        """The number of migrations of each instance.
+
+        Returns
+        -------
+        np.array
+            A 1-D integer array of the number of migrations of each instance.
+
+        """
+        return self._num_migrations
+
+    def get_step_entries(self, step):
+        """The entries of the migrations visited at step `step`.
+
+        Parameters
+        ----------
+        step: int
+            An integer representing the index of the step.
+
+        Returns
+        -------
+        np.array, np.array, np.array
+            Three 1-D arrays giving the instance, constraint index and demand
+            of each entry of the step. The entries of each instance are
+            contiguous and the instances appear in increasing order.
+
+        """
+        start, end = self._step_ptrs[step], self._step_ptrs[step + 1]
+        return (self._entry_instances[start:end],
+                self._entry_cols[start:end],
+                self._entry_demands[start:end])
+
+    def _pack_instance(self, instance_data, resiliency=False):
+        """The capacities and migration entries of `instance_data`.
+
+        Parameters
+        ----------
+        instance_data: InstanceData
+            The `InstanceData` object being packed.
+        resiliency: bool
+            Whether failure resiliency is considered.
+
+        Returns
+        -------
+        list, list, list, list
+            A list of the capacity of each constraint of the instance
+            followed by three lists with one element per entry, in the order
+            of the migrations of the instance, giving the constraint index,
+            the demand and the position of the migration of the entry.
+
+        """
+        controller_caps, qos_caps = utils.get_cap_dicts(instance_data)
+        const_idxs = {}
+        caps = []
+        for const_name, cap in {**controller_caps, **qos_caps}.items():
+            const_idxs[const_name] = len(caps)
+            caps.append(cap)
+        cols, demands, migration_idxs = [], [], []
+        for migration_idx, migration in enumerate(
+            instance_data.get_migrations().values()):
+            groups = migration.get_groups()
+            cols.append(const_idxs[migration.get_dst_controller()])
+            demands.append(migration.get_load())
+            num_entries = 1 + len(groups)
+            if (resiliency and migration.get_src_controller() !=
+                migration.get_dst_controller()):
+                cols.append(const_idxs[migration.get_src_controller()])
+                demands.append(migration.get_load())
+                num_entries += 1
+            cols.extend(map(const_idxs.__getitem__, groups))
+            demands.extend([1] * len(groups))
+            migration_idxs.extend([migration_idx] * num_entries)
+        return caps, cols, demands, migration_idxs
@@ -0,0 +1,130 @@
+"""The `MigrationScores` class caches the score of each unscheduled migration
+used to choose the bottleneck migration of a bottleneck constraint.
+
+"""
+import heapq
+
+
+class MigrationScores:
+    """The cached bottleneck scores of the unscheduled migrations.
+
+    The score of a migration, excluding a constraint, is the maximum load
+    factor among the constraints of the migration other than the excluded
+    constraint. The constraints of a migration are its QoS groups and its
+    destination controller.
+
+    For each migration the load factors of its constraints are kept in a
+    max-heap. Load factors only decrease as migrations are removed from the
+    constraints, so every cached load factor is an upper bound on the
+    current one. When a score is requested, only the entries at the top of
+    the heap are refreshed, and only until the top entry matches the current
+    load factor of its constraint. Scheduling a migration therefore updates
+    the cached scores of the migrations sharing its constraints lazily, and
+    only as far as is needed to answer later requests.
+
+    Parameters
+    ----------
+    instance_data: InstanceData
+        An `InstanceData` object specifying the data for a load migration
+        scheduling instance.
+    consts_dict: dict
+        A dictionary of constraints. The keys are strings representing the
+        names of the constraints and the corresponding value is a
+        `ConstraintDict` object representing the constraint. The scores keep
+        a reference to this dictionary and read load factors from it.
+
+    Attributes
+    ----------
+    _consts_dict: dict
+        The dictionary of constraints from which load factors are read.
+    _heaps: dict
+        A dictionary mapping the name of each unscheduled switch to a heap
+        of the constraints of its migration. Each entry is a tuple of the
+        negated cached load factor and the constraint name.
+
+    """
+    def __init__(self, instance_data, consts_dict):
+        self._consts_dict = consts_dict
+        self._heaps = {}
+        for switch, migration in instance_data.get_migrations().items():
+            heap = [(-consts_dict[const_name].get_load_factor(), const_name)
+                    for const_name in migration.get_groups().union(
+                        {migration.get_dst_controller()})
+                    if const_name in consts_dict]
+            heapq.heapify(heap)
+            self._heaps[switch] = heap
+
+    def get_num_migrations(self):
+        """The number of unscheduled migrations being tracked.
+
+        Returns
+        -------
+        int
+            An integer representing the number of unscheduled migrations.
+
+        """
+        return len(self._heaps)
+
+    def get_score(self, switch_name, exclude_const):
+        """The score of the migration for `switch_name`.
+
+        Parameters
+        ----------
+        switch_name: str
+            A string representing the name of the switch being migrated.
+        exclude_const: str
+            A string representing the name of the constraint excluded from
+            the score.
+
+        Returns
+        -------
+        float
+            A float representing the maximum load factor among the
+            constraints of the migration, excluding `exclude_const`. If the
+            migration has no other constraints the score is 0.
+
+        """
+        heap = self._heaps[switch_name]
+        self._refresh_top(heap)
+        if heap and heap[0][1] == exclude_const:
+            top_entry = heapq.heappop(heap)
+            self._refresh_top(heap)
+            score = -heap[0][0] if heap else 0
+            heapq.heappush(heap, top_entry)
+            return score
+        return -heap[0][0] if heap else 0
+
+    def remove_migration(self, switch_name):
+        """Stops tracking the migration for `switch_name`.
+
+        Parameters
+        ----------
+        switch_name: str
+            A string representing the name of the switch that was scheduled.
+
+        Returns
+        -------
+        None
+
+        """
+        self._heaps.pop(switch_name, None)
+
+    def _refresh_top(self, heap):
+        """Refreshes the top of `heap` until it holds a current load factor.
+
+        Parameters
+        ----------
+        heap: list
+            The heap of constraints for a migration.
+
+        Returns
+        -------
+        None
+
+        """
+        while heap:
+            neg_load, const_name = heap[0]
+            load = self._consts_dict[const_name].get_load_factor()
+            if -neg_load == load:
+                return
+            heapq.heapreplace(heap, (-load, const_name))
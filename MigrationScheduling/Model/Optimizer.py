@@ -5,9 +5,11 @@ migration schedule.
 from MigrationScheduling.Data import InstanceData
 from MigrationScheduling.Model import Parser
 from MigrationScheduling import exceptions as exc
-from MigrationScheduling import utils
+from MigrationScheduling import validation as val
+from MigrationScheduling import specs, utils
 import gurobipy as gp
 import numpy as np
+import scipy.sparse as sp
 
 class Optimizer:
     """Builds an optimization model for a migration scheduling instance.
@@ -21,11 +23,29 @@ class Optimizer:
         An `InstanceData` object containing the data for the migration
         scheduling instance being modeled. A value of None indicates
         that the instance has not yet been specified.
+    _x_vars: gp.Vars
+        The variables of the last model built, indicating in which round
+        each migration is scheduled. A value of None indicates that no model
+        has been built.
+    _y_vars: gp.Vars
+        The variables of the last class model built, giving the number of
+        migrations of each class scheduled in each round. A value of None
+        indicates that the last model built was not a class model.
+    _classes: list
+        The `MigrationClass` objects of the last class model built, indexed
+        as in `_y_vars`.
+    _round_ids: collection
+        The ids of the rounds of the last model built. A value of None
+        indicates that no model has been built.
 
     """
     def __init__(self):
         self._model = None
         self._data = None
+        self._x_vars = None
+        self._y_vars = None
+        self._classes = None
+        self._round_ids = None
 
     def instance_data(self):
         """The data for the load migration scheduling instance being modeled.
@@ -76,7 +96,88 @@ class Optimizer:
         parser.parse_migrations(migration_file)
         self._data = parser.to_data()
 
-    def build_ip_model(self, resiliency=False, verbose=True):
+    def set_model_data(self, instance_data):
+        """Sets the data for the migration scheduling instance.
+
+        This allows an instance that was not parsed from a file, such as a
+        component of a larger instance, to be optimized.
+
+        Parameters
+        ----------
+        instance_data: InstanceData
+            An `InstanceData` object specifying the data for a load migration
+            scheduling instance.
+
+        Returns
+        -------
+        None
+
+        """
+        self._data = instance_data
+
+    def get_assignment(self):
+        """The rounds of the migrations in the solution of the IP model.
+
+        Raises
+        ------
+        ModelNotOptimized
+            If an Integer Programming model has not been solved to
+            optimality.
+
+        Returns
+        -------
+        dict
+            A dictionary in which the keys are strings representing the names
+            of the switches and the corresponding value is an integer
+            representing the index of the round of its migration.
+
+        """
+        if not (self._model and self._model.status == gp.GRB.OPTIMAL):
+            raise exc.ModelNotOptimized()
+        if self._x_vars is not None:
+            solution = self._model.getAttr("x", self._x_vars)
+            return {switch: next(
+                        r for r in self._round_ids
+                        if solution[self._data.get_switch_id(switch), r] > 0.5)
+                    for switch in self._data.get_migrations()}
+        if self._y_vars is not None:
+            solution = self._model.getAttr("x", self._y_vars)
+            assignment = {}
+            for j, migration_class in enumerate(self._classes):
+                switches = iter(migration_class.get_switches())
+                for r in self._round_ids:
+                    for _ in range(int(round(solution[j, r]))):
+                        assignment[next(switches)] = r
+            return assignment
+        raise exc.ModelNotOptimized()
+
+    def get_num_rounds(self):
+        """The number of rounds given by the solved model.
+
+        The objective value of the model is the number of rounds less one.
+        It is rounded up after allowing for `specs.MODEL_TOLERANCE`, so the
+        objective of an IP model solved to a value such as
+        1.9999999999999973 gives 3 rounds, and the objective of an LP model
+        gives a lower bound on the number of rounds.
+
+        Raises
+        ------
+        ModelNotOptimized
+            If the model has not been solved to optimality.
+
+        Returns
+        -------
+        int
+            An integer representing the number of rounds of the solution.
+
+        """
+        return int(np.ceil(
+            self._get_objective_value() - specs.MODEL_TOLERANCE)) + 1
+
+    def build_ip_model(self, resiliency=False, verbose=True,
+                       num_rounds=None, formulation="lambda",
+                       start_schedule=None, symmetry_breaking=False,
+                       matrix_api=False):
         """Builds an Integer Programming model for the migration instance.
 
         The model is instantiated and solved based on the pre-loaded instance
@@ -93,23 +194,146 @@ class Optimizer:
             A boolean indicating whether verbose mode is used. If used the
             entire solution will be printed, otherwise, only gurobi messages
             will be printed. The default value is True.
+        num_rounds: int
+            An integer representing the number of rounds in the model, such
+            as the number of rounds of a heuristic schedule. Variables and
+            constraints are only created for the first `num_rounds` rounds,
+            so if the instance cannot be scheduled in that many rounds the
+            model is infeasible. The default value is None, in which case
+            the model has one round per migration.
+        formulation: str
+            A string identifying the formulation of the model. A value of
+            'lambda' minimizes the latest round used, with a constraint per
+            migration and round bounding it. A value of 'rounds' minimizes
+            the number of rounds used, with a variable per round indicating
+            whether it is used that scales the capacity of each constraint
+            in the round. The objective value is the number of rounds less
+            one in both cases. The default value is 'lambda'.
+        start_schedule: Schedule
+            A `Schedule` of the instance, such as a heuristic schedule, used
+            as the starting solution of the model so that the solver begins
+            with its number of rounds as an incumbent. It is not used if it
+            has a round beyond the rounds of the model. The default value is
+            None, in which case the model is solved without a start.
+        symmetry_breaking: bool
+            A boolean indicating whether constraints are added to break the
+            symmetry between rounds, which are otherwise interchangeable.
+            The migrations are ordered by decreasing load and the rounds by
+            their first migration in this order, so that the first migration
+            is fixed in round 0 and the k-th migration is in one of the
+            first k rounds. The rounds of `start_schedule` are renumbered
+            in the same order. The default value is False.
+        matrix_api: bool
+            A boolean indicating whether the constraints are assembled as
+            sparse matrices and added in bulk with the matrix API of gurobi,
+            which is faster to build on large instances. The model built is
+            the same. The default value is False.
 
         Raises
         ------
         InstanceNotSpecified
             If a migration scheduling instance has not yet been specified.
+        IncorrectFormulation
+            If `formulation` is not one of the formulations in
+            `specs.MODEL_FORMULATIONS`.
 
         Returns
         -------
         float
             A float representing the best objective value found during
-            optimization.
+            optimization. The number of rounds it gives is returned by
+            `get_num_rounds`.
 
         """
         return self._build_model(
-            resiliency=resiliency, is_ip=True, verbose=verbose)
+            resiliency=resiliency, is_ip=True, verbose=verbose,
+            num_rounds=num_rounds, formulation=formulation,
+            start_schedule=start_schedule,
+            symmetry_breaking=symmetry_breaking, matrix_api=matrix_api)
+
+    def build_class_ip_model(self, resiliency=False, verbose=True,
+                             num_rounds=None):
+        """Builds an Integer Programming model over classes of migrations.
+
+        The migrations are grouped into classes of interchangeable
+        migrations by `InstanceData.get_migration_classes`. Instead of a
+        binary variable per migration and round, the model has an integer
+        variable per class and round giving the number of migrations of the
+        class scheduled in the round, and a binary variable per round
+        indicating whether the round is used. The optimal value is the same
+        as that of `build_ip_model`.
 
-    def build_lp_model(self, resiliency=False, verbose=True):
+        Parameters
+        ----------
+        resiliency: bool
+            A boolean specifying whether resiliency should be considered in
+            the model. The default value is False, specifying that the model
+            does not consider the possibility of failures during the
+            migration process.
+        verbose: bool
+            A boolean indicating whether verbose mode is used. If used the
+            number of migrations of each class in each round will be
+            printed, otherwise, only gurobi messages will be printed. The
+            default value is True.
+        num_rounds: int
+            An integer representing the number of rounds in the model, such
+            as the number of rounds of a heuristic schedule. Variables and
+            constraints are only created for the first `num_rounds` rounds,
+            so if the instance cannot be scheduled in that many rounds the
+            model is infeasible. The default value is None, in which case
+            the model has one round per migration.
+
+        Raises
+        ------
+        InstanceNotSpecified
+            If a migration scheduling instance has not yet been specified.
+        ModelNotOptimized
+            If the optimization model cannot be optimized.
+
+        Returns
+        -------
+        float
+            A float representing the best objective value found during
+            optimization. The number of rounds it gives is returned by
+            `get_num_rounds`.
+
+        """
+        if not self._data:
+            raise exc.InstanceNotSpecified()
+        classes = self._data.get_migration_classes(resiliency)
+        self._round_ids = self._get_round_ids(num_rounds)
+        round_ids = self._round_ids
+        self._model = gp.Model("migration_classes")
+        lambda_var = self._model.addVar(name="lambda")
+        y_vars = self._model.addVars(
+            range(len(classes)), round_ids, lb=0.0,
+            vtype=gp.GRB.INTEGER, name="y")
+        used_vars = self._model.addVars(
+            round_ids, vtype=gp.GRB.BINARY, name="used")
+        self._x_vars = None
+        self._y_vars = y_vars
+        self._classes = classes
+        self._model.setObjective(lambda_var, gp.GRB.MINIMIZE)
+        for j, migration_class in enumerate(classes):
+            count = migration_class.get_count()
+            self._model.addConstr(
+                y_vars.sum(j, '*') == count, "migrate[{}]".format(j))
+            for r in round_ids:
+                self._model.addConstr(
+                    y_vars[j, r] <= count * used_vars[r],
+                    "used[{0}, {1}]".format(j, r))
+        for r in round_ids:
+            self._model.addConstr(
+                r * used_vars[r] <= lambda_var, "bound[{}]".format(r))
+        self._add_class_constraints(y_vars, resiliency)
+        self._model.optimize()
+        if verbose:
+            self._print_class_output(y_vars)
+        return self._get_objective_value()
+
+    def build_lp_model(self, resiliency=False, verbose=True,
+                       num_rounds=None, formulation="lambda",
+                       matrix_api=False):
         """Builds a Linear Programming model for the migration instance.
 
         The model is instantiated and solved based on the pre-loaded instance
@@ -126,11 +350,34 @@ class Optimizer:
             A boolean indicating whether verbose mode is used. If used the
             entire solution will be printed, otherwise, only gurobi messages
             will be printed. The default value is True.
+        num_rounds: int
+            An integer representing the number of rounds in the model, such
+            as the number of rounds of a heuristic schedule. Variables and
+            constraints are only created for the first `num_rounds` rounds,
+            so if the instance cannot be scheduled in that many rounds the
+            model is infeasible. The default value is None, in which case
+            the model has one round per migration.
+        formulation: str
+            A string identifying the formulation of the model. A value of
+            'lambda' minimizes the latest round used, with a constraint per
+            migration and round bounding it. A value of 'rounds' minimizes
+            the number of rounds used, with a variable per round indicating
+            whether it is used that scales the capacity of each constraint
+            in the round. The objective value is the number of rounds less
+            one in both cases. The default value is 'lambda'.
+        matrix_api: bool
+            A boolean indicating whether the constraints are assembled as
+            sparse matrices and added in bulk with the matrix API of gurobi,
+            which is faster to build on large instances. The model built is
+            the same. The default value is False.
 
         Raises
         ------
         InstanceNotSpecified
             If a migration scheduling instance has not yet been specified.
+        IncorrectFormulation
+            If `formulation` is not one of the formulations in
+            `specs.MODEL_FORMULATIONS`.
 
         Returns
         -------
@@ -140,13 +387,17 @@ class Optimizer:
 
         """
         return self._build_model(
-            resiliency=resiliency, is_ip=False, verbose=verbose)
+            resiliency=resiliency, is_ip=False, verbose=verbose,
+            num_rounds=num_rounds, formulation=formulation,
+            matrix_api=matrix_api)
 
-    def get_model_bounds(self, resiliency=False):
+    def get_model_bounds(self, resiliency=False, num_rounds=None,
+                         formulation="lambda"):
         """Computes upper and lower bounds for the model.
 
-        The upper bound is computed by taking one round per migration. The
-        lower bound is the solution to the linear program.
+        The upper bound is `num_rounds` if it is specified and otherwise is
+        computed by taking one round per migration. The lower bound is the
+        solution to the linear program over the rounds of the upper bound.
 
         Parameters
         ----------
@@ -155,6 +406,15 @@ class Optimizer:
             the model. The default value is False, specifying that the model
             does not consider the possibility of failures during the
             migration process.
+        num_rounds: int
+            An integer representing the number of rounds of a known
+            schedule, such as a heuristic schedule. The default value is
+            None, in which case one round per migration is used.
+        formulation: str
+            A string identifying the formulation of the linear program, as
+            in `build_lp_model`. The 'rounds' formulation gives a lower
+            bound at least as tight as the bounds on the load of each
+            constraint. The default value is 'lambda'.
 
         Returns
         -------
@@ -165,14 +425,32 @@ class Optimizer:
 
         """
         if self._data:
-            ub = len(self._data.get_round_ids())
-            self._build_model(
-                resiliency=resiliency, is_ip=False, verbose=False)
-            lb = int(np.ceil(self._model.objVal)) + 1
-            return lb, ub
+            ub = len(self._get_round_ids(num_rounds))
+            self._build_model(resiliency=resiliency, is_ip=False,
+                              verbose=False, num_rounds=ub,
+                              formulation=formulation)
+            return self.get_num_rounds(), ub
         raise exc.InstanceNotSpecified()
 
-    def _initialize_variables(self, is_ip=True):
+    def _get_round_ids(self, num_rounds=None):
+        """The ids of the rounds of a model with `num_rounds` rounds.
+
+        Parameters
+        ----------
+        num_rounds: int
+            An integer representing the number of rounds in the model. The
+            default value is None, in which case every round of the instance
+            is used.
+
+        Returns
+        -------
+        collection
+            The first `num_rounds` round ids of the instance.
+
+        """
+        return self._data.get_round_ids()[:num_rounds]
+
+    def _initialize_variables(self, is_ip=True, formulation="lambda"):
         """Initializes the variables for the optimization model.
 
         Parameters
@@ -180,6 +458,9 @@ class Optimizer:
         is_ip: bool
             A boolean flag indicating whether it is an IP model. If true
             the variables will be integer, otherwise, they will be continuous.
+        formulation: str
+            A string identifying the formulation of the model. The default
+            value is 'lambda'.
 
         Raises
         ------
@@ -188,23 +469,32 @@ class Optimizer:
 
         Returns
         -------
-        gp.Var, gp.Vars
-            A variable representing the parameter to be optimized and a
-            collection of variables representing which round each migration
-            is scheduled in.
+        gp.Var or gp.Vars, gp.Vars
+            The variables of the objective and a collection of variables
+            representing which round each migration is scheduled in. For
+            the 'lambda' formulation the objective has a single variable
+            representing the parameter to be optimized and for the 'rounds'
+            formulation it has a variable per round indicating whether the
+            round is used.
 
         """
         if self._model:
-            lambda_var = self._model.addVar(name="lambda")
+            if formulation == "rounds":
+                obj_vars = self._model.addVars(
+                    self._round_ids, lb=0.0, ub=1.0,
+                    vtype=gp.GRB.BINARY if is_ip else gp.GRB.CONTINUOUS,
+                    name="y")
+            else:
+                obj_vars = self._model.addVar(name="lambda")
             if is_ip:
                 x_vars = self._model.addVars(
-                    self._data.get_switch_ids(), self._data.get_round_ids(),
+                    self._data.get_switch_ids(), self._round_ids,
                     vtype=gp.GRB.BINARY, name="x")
             else:
                 x_vars = self._model.addVars(
-                    self._data.get_switch_ids(), self._data.get_round_ids(),
+                    self._data.get_switch_ids(), self._round_ids,
                     lb=0.0, ub=1.0, vtype=gp.GRB.CONTINUOUS, name="x")
-            return lambda_var, x_vars
+            return obj_vars, x_vars
         raise exc.UninitializedModel()
 
     def _add_migrate_constraints(self, x_vars):
@@ -247,13 +537,17 @@ class Optimizer:
 
         """
         for i in self._data.get_switch_ids():
-            for r in self._data.get_round_ids():
+            for r in self._round_ids:
                 self._model.addConstr(r * x_vars[i, r] <= lambda_var,
                                       "bound[{0}, {1}]".format(i, r))
 
-    def _add_controller_constraints(self, x_vars, resiliency=False):
+    def _add_controller_constraints(self, x_vars, resiliency=False,
+                                    y_vars=None):
         """Adds the set of controller constraints to the model using `x_vars`.
 
+        A controller that none of the migrations place load on is skipped, as
+        its constraint cannot bind.
+
         Parameters
         ----------
         x_vars: gp.Vars
@@ -263,6 +557,10 @@ class Optimizer:
             the model. The default value is False, specifying that the model
             does not consider the possibility of failures during the
             migration process.
+        y_vars: gp.Vars
+            The variables indicating whether each round is used, by which the
+            capacity of a controller in the round is multiplied. The default
+            value is None, in which case the capacity is not scaled.
 
         Returns
         -------
@@ -270,22 +568,31 @@ class Optimizer:
 
         """
         for control_const in self._data.get_control_consts():
-            for r in self._data.get_round_ids():
+            if not control_const.get_constraint_switches(resiliency):
+                continue
+            for r in self._round_ids:
                 self._model.addConstr(sum(
                     self._data.get_load(s) *
                     x_vars[self._data.get_switch_id(s), r] for s
                     in control_const.get_constraint_switches(resiliency))
-                    <= control_const.get_cap(),
+                    <= self._get_round_cap(control_const.get_cap(), y_vars, r),
                     "controller[{0}, {1}]".format(
                         control_const.get_controller_idx(), r))
 
-    def _add_qos_constraints(self, x_vars):
+    def _add_qos_constraints(self, x_vars, y_vars=None):
         """Adds the set of QoS constraints to the model using `x_vars`.
 
+        A QoS group without migrations is skipped, as its constraint cannot
+        bind.
+
         Parameters
         ----------
         x_vars: gp.Vars
             The set of model variables used in the controller constraints.
+        y_vars: gp.Vars
+            The variables indicating whether each round is used, by which the
+            capacity of a QoS group in the round is multiplied. The default
+            value is None, in which case the capacity is not scaled.
 
         Returns
         -------
@@ -293,20 +600,243 @@ class Optimizer:
 
         """
         for qos_const in self._data.get_qos_consts():
-            for r in self._data.get_round_ids():
+            if not qos_const.get_switches():
+                continue
+            for r in self._round_ids:
                 self._model.addConstr(sum(
                     x_vars[self._data.get_switch_id(s), r]
-                    for s in qos_const.get_switches()) <= qos_const.get_cap(),
+                    for s in qos_const.get_switches())
+                    <= self._get_round_cap(qos_const.get_cap(), y_vars, r),
                     "QoS[{0}, {1}]".format(qos_const.get_group_idx(), r))
 
-    def _add_constraints(self, lambda_var, x_vars, resiliency=False):
-        """Adds all constraints to the model using `lambda_var` and `x_vars`.
+    def _add_round_constraints(self, y_vars, x_vars):
+        """Adds the constraints on the round variables `y_vars`.
+
+        The rounds are used in order, so that a round is only used if the
+        round before it is used. The capacity constraints prevent a
+        migration with a load from being scheduled in an unused round, so
+        only a migration with no load is bounded by the variable of each
+        round.
 
         Parameters
         ----------
-        lambda_var: gp.Var
-            The variable to be minimized, representing the maximum number
-            of rounds required.
+        y_vars: gp.Vars
+            The variables indicating whether each round is used.
+        x_vars: gp.Vars
+            The collection of variables indicating in which round each
+            migration is scheduled.
+
+        Returns
+        -------
+        None
+
+        """
+        for r, next_r in zip(self._round_ids, self._round_ids[1:]):
+            self._model.addConstr(
+                y_vars[r] >= y_vars[next_r], "order[{}]".format(r))
+        for switch, migration in self._data.get_migrations().items():
+            if migration.get_load() <= 0:
+                i = self._data.get_switch_id(switch)
+                for r in self._round_ids:
+                    self._model.addConstr(x_vars[i, r] <= y_vars[r],
+                                          "used[{0}, {1}]".format(i, r))
+
+    def _get_round_cap(self, cap, y_vars, r):
+        """The capacity `cap` of a constraint in round `r`.
+
+        Parameters
+        ----------
+        cap: float
+            A float representing the capacity of the constraint.
+        y_vars: gp.Vars
+            The variables indicating whether each round is used. A value of
+            None indicates that the capacity is not scaled.
+        r: int
+            An integer representing the id of the round.
+
+        Returns
+        -------
+        float or gp.LinExpr
+            `cap` if `y_vars` is None. Otherwise, `cap` multiplied by the
+            variable of round `r`.
+
+        """
+        if y_vars is None:
+            return cap
+        return cap * y_vars[r]
+
+    def _add_matrix_constraints(self, obj_vars, x_vars, resiliency=False,
+                                formulation="lambda"):
+        """Adds all constraints to the model in bulk using sparse matrices.
+
+        The constraints are the same, in the same order and with the same
+        names, as those added one at a time by `_add_constraints`. The
+        matrix of the controller or QoS constraints in every round is the
+        Kronecker product of the matrix of the constraints in a single
+        round, from `InstanceData.get_constraint_matrices`, with the
+        identity matrix of the rounds.
+
+        Parameters
+        ----------
+        obj_vars: gp.Var or gp.Vars
+            The variables of the objective of the model.
+        x_vars: gp.Vars
+            A collection of boolean variables for each migration and round
+            pair, indicating if the migration is scheduled in that round.
+        resiliency: bool
+            A boolean specifying whether resiliency should be considered in
+            the model. The default value is False, specifying that the model
+            does not consider the possibility of failures during the
+            migration process.
+        formulation: str
+            A string identifying the formulation of the model. The default
+            value is 'lambda'.
+
+        Returns
+        -------
+        None
+
+        """
+        switch_ids = self._data.get_switch_ids()
+        num_rounds = len(self._round_ids)
+        x_list = [x_vars[i, r] for i in switch_ids for r in self._round_ids]
+        self._model.addMConstr(
+            sp.kron(sp.identity(len(switch_ids)), np.ones((1, num_rounds))),
+            x_list, gp.GRB.EQUAL, np.ones(len(switch_ids)),
+            ["migrate[{}]".format(i) for i in switch_ids])
+        round_vars = None
+        if formulation == "rounds":
+            self._add_round_constraints(obj_vars, x_vars)
+            round_vars = [obj_vars[r] for r in self._round_ids]
+        else:
+            self._model.addMConstr(
+                sp.hstack([
+                    sp.diags(np.tile(np.array(self._round_ids, dtype=float),
+                                     len(switch_ids))),
+                    -np.ones((len(x_list), 1))]),
+                x_list + [obj_vars], gp.GRB.LESS_EQUAL,
+                np.zeros(len(x_list)),
+                ["bound[{0}, {1}]".format(i, r)
+                 for i in switch_ids for r in self._round_ids])
+        control_matrix, control_caps, qos_matrix, qos_caps = (
+            self._data.get_constraint_matrices(resiliency))
+        control_consts = list(self._data.get_control_consts())
+        qos_consts = list(self._data.get_qos_consts())
+        control_rows = [row for row, const in enumerate(control_consts)
+                        if const.get_constraint_switches(resiliency)]
+        qos_rows = [row for row, const in enumerate(qos_consts)
+                    if const.get_switches()]
+        self._add_capacity_matrix(
+            control_matrix[control_rows], control_caps[control_rows],
+            x_list, round_vars,
+            ["controller[{0}, {1}]".format(
+                control_consts[row].get_controller_idx(), r)
+             for row in control_rows for r in self._round_ids])
+        self._add_capacity_matrix(
+            qos_matrix[qos_rows], qos_caps[qos_rows], x_list, round_vars,
+            ["QoS[{0}, {1}]".format(qos_consts[row].get_group_idx(), r)
+             for row in qos_rows for r in self._round_ids])
+
+    def _add_capacity_matrix(self, matrix, caps, x_list, round_vars, names):
+        """Adds the capacity constraints of `matrix` in every round.
+
+        Parameters
+        ----------
+        matrix: scipy.sparse.csr_matrix
+            The matrix of the capacity constraints in a single round, with a
+            row per constraint and a column per migration.
+        caps: np.array
+            The capacity of each constraint of `matrix`.
+        x_list: list
+            The variables indicating in which round each migration is
+            scheduled, ordered by migration and then by round.
+        round_vars: list
+            The variables indicating whether each round is used, by which the
+            capacity in the round is multiplied. A value of None indicates
+            that the capacity is not scaled.
+        names: list
+            The names of the constraints, ordered by constraint and then by
+            round.
+
+        Returns
+        -------
+        None
+
+        """
+        if not len(caps):
+            return
+        identity = sp.identity(len(self._round_ids))
+        constrs_matrix = sp.kron(matrix, identity)
+        rhs = np.repeat(caps, len(self._round_ids))
+        if round_vars is not None:
+            constrs_matrix = sp.hstack([
+                constrs_matrix, sp.kron(-caps.reshape(-1, 1), identity)])
+            x_list = x_list + round_vars
+            rhs = np.zeros(len(rhs))
+        self._model.addMConstr(
+            constrs_matrix.tocsr(), x_list, gp.GRB.LESS_EQUAL, rhs, names)
+
+    def _add_class_constraints(self, y_vars, resiliency=False):
+        """Adds the controller and QoS constraints of the class model.
+
+        As in `_add_constraints`, the constraints that involve none of the
+        migrations are skipped.
+
+        Parameters
+        ----------
+        y_vars: gp.Vars
+            The collection of variables giving the number of migrations of
+            each class scheduled in each round.
+        resiliency: bool
+            A boolean specifying whether resiliency should be considered in
+            the model. The default value is False, specifying that the model
+            does not consider the possibility of failures during the
+            migration process.
+
+        Returns
+        -------
+        None
+
+        """
+        for control_const in self._data.get_control_consts():
+            controller = control_const.get_controller()
+            loads = {j: utils.get_load_contribution(
+                         migration_class.get_migration(), controller,
+                         resiliency)
+                     for j, migration_class in enumerate(self._classes)}
+            loads = {j: load for j, load in loads.items() if load > 0}
+            if not loads:
+                continue
+            for r in self._round_ids:
+                self._model.addConstr(sum(
+                    load * y_vars[j, r] for j, load in loads.items())
+                    <= control_const.get_cap(),
+                    "controller[{0}, {1}]".format(
+                        control_const.get_controller_idx(), r))
+        for qos_const in self._data.get_qos_consts():
+            group_classes = [
+                j for j, migration_class in enumerate(self._classes)
+                if migration_class.get_migration().is_in_group(
+                    qos_const.get_group())]
+            if not group_classes:
+                continue
+            for r in self._round_ids:
+                self._model.addConstr(sum(
+                    y_vars[j, r] for j in group_classes)
+                    <= qos_const.get_cap(),
+                    "QoS[{0}, {1}]".format(qos_const.get_group_idx(), r))
+
+    def _add_constraints(self, obj_vars, x_vars, resiliency=False,
+                         formulation="lambda", matrix_api=False):
+        """Adds all constraints to the model using `obj_vars` and `x_vars`.
+
+        Parameters
+        ----------
+        obj_vars: gp.Var or gp.Vars
+            The variables of the objective. For the 'lambda' formulation it
+            is the variable to be minimized, representing the maximum number
+            of rounds required, and for the 'rounds' formulation it is the
+            collection of variables indicating whether each round is used.
         x_vars: gp.Vars
             A collection of boolean variables for each migration and round
             pair, indicating if the migration is scheduled in that round.
@@ -315,6 +845,12 @@ class Optimizer:
             the model. The default value is False, specifying that the model
             does not consider the possibility of failures during the
             migration process.
+        formulation: str
+            A string identifying the formulation of the model. The default
+            value is 'lambda'.
+        matrix_api: bool
+            A boolean indicating whether the constraints are added in bulk
+            by `_add_matrix_constraints`. The default value is False.
 
         Raises
         ------
@@ -326,15 +862,27 @@ class Optimizer:
         None
 
         """
-        if self._model:
+        if self._model and matrix_api:
+            self._add_matrix_constraints(
+                obj_vars, x_vars, resiliency, formulation)
+        elif self._model:
             self._add_migrate_constraints(x_vars)
-            self._add_bound_constraints(lambda_var, x_vars)
-            self._add_controller_constraints(x_vars, resiliency)
-            self._add_qos_constraints(x_vars)
+            if formulation == "rounds":
+                self._add_round_constraints(obj_vars, x_vars)
+                self._add_controller_constraints(
+                    x_vars, resiliency, obj_vars)
+                self._add_qos_constraints(x_vars, obj_vars)
+            else:
+                self._add_bound_constraints(obj_vars, x_vars)
+                self._add_controller_constraints(x_vars, resiliency)
+                self._add_qos_constraints(x_vars)
         else:
             raise exc.UninitializedModel()
 
-    def _build_model(self, resiliency=False, is_ip=True, verbose=True):
+    def _build_model(self, resiliency=False, is_ip=True, verbose=True,
+                     num_rounds=None, formulation="lambda",
+                     start_schedule=None, symmetry_breaking=False,
+                     matrix_api=False):
         """Builds the optimization album for `migration_file`.
 
         The data is loaded from `migration_file` and an optimization model
@@ -355,11 +903,32 @@ class Optimizer:
             A boolean indicating whether verbose mode is used. If used the
             entire solution will be printed, otherwise, only gurobi messages
             will be printed.
+        num_rounds: int
+            An integer representing the number of rounds in the model. The
+            default value is None, in which case the model has one round per
+            migration.
+        formulation: str
+            A string identifying the formulation of the model. The default
+            value is 'lambda'.
+        start_schedule: Schedule
+            A `Schedule` of the instance used as the starting solution of an
+            IP model. The default value is None, in which case the model is
+            solved without a start.
+        symmetry_breaking: bool
+            A boolean indicating whether the symmetry between rounds is
+            broken by fixing the rounds in which each migration can be
+            scheduled. The default value is False.
+        matrix_api: bool
+            A boolean indicating whether the constraints are added in bulk
+            with the matrix API of gurobi. The default value is False.
 
         Raises
         ------
         InstanceNotSpecified
             If a migration scheduling instance has not yet been specified.
+        IncorrectFormulation
+            If `formulation` is not one of the formulations in
+            `specs.MODEL_FORMULATIONS`.
         ModelNotOptimized
             If the optimization model cannot be optimized.
 
@@ -371,10 +940,23 @@ class Optimizer:
 
         """
         if self._data:
+            val.validate_formulation(formulation)
             self._model = gp.Model("migration")
-            lambda_var, x_vars = self._initialize_variables(is_ip)
-            self._model.setObjective(lambda_var, gp.GRB.MINIMIZE)
-            self._add_constraints(lambda_var, x_vars, resiliency)
+            self._round_ids = self._get_round_ids(num_rounds)
+            obj_vars, x_vars = self._initialize_variables(is_ip, formulation)
+            self._x_vars = x_vars if is_ip else None
+            self._y_vars = None
+            if formulation == "rounds":
+                self._model.setObjective(obj_vars.sum() - 1, gp.GRB.MINIMIZE)
+            else:
+                self._model.setObjective(obj_vars, gp.GRB.MINIMIZE)
+            self._add_constraints(
+                obj_vars, x_vars, resiliency, formulation, matrix_api)
+            if symmetry_breaking:
+                self._add_symmetry_constraints(x_vars)
+            if is_ip and start_schedule is not None:
+                self._set_start(start_schedule, obj_vars, x_vars,
+                                formulation, symmetry_breaking)
             self._model.optimize()
             if verbose:
                 self._print_output(x_vars, is_ip)
@@ -382,6 +964,97 @@ class Optimizer:
         else:
             raise exc.InstanceNotSpecified()
 
+    def _get_symmetry_order(self):
+        """The migrations in the order used to break the round symmetry.
+
+        Returns
+        -------
+        list
+            A list of strings representing the names of the switches, in
+            order of decreasing load with ties broken by switch id.
+
+        """
+        return sorted(self._data.get_migrations(), key=lambda switch: (
+            -self._data.get_load(switch), self._data.get_switch_id(switch)))
+
+    def _add_symmetry_constraints(self, x_vars):
+        """Breaks the symmetry between rounds using `x_vars`.
+
+        Any schedule can have its rounds renumbered in the order of their
+        first migration in `_get_symmetry_order`, in which case the k-th
+        migration of the order, counting from 0, is in one of the rounds 0
+        to k. The variables of every later round are fixed to 0 for the
+        migration, which in particular fixes the first migration in round 0.
+
+        Parameters
+        ----------
+        x_vars: gp.Vars
+            The collection of variables indicating in which round each
+            migration is scheduled.
+
+        Returns
+        -------
+        None
+
+        """
+        for k, switch in enumerate(self._get_symmetry_order()):
+            i = self._data.get_switch_id(switch)
+            for r in self._round_ids[k + 1:]:
+                x_vars[i, r].UB = 0.0
+
+    def _set_start(self, schedule, obj_vars, x_vars, formulation="lambda",
+                   symmetry_breaking=False):
+        """Sets `schedule` as the starting solution of the model.
+
+        The start values of the variables of the scheduled migrations and
+        of the objective are set from `schedule`. The start is not set if
+        `schedule` has a round beyond the rounds of the model.
+
+        Parameters
+        ----------
+        schedule: Schedule
+            A `Schedule` of the instance being modeled.
+        obj_vars: gp.Var or gp.Vars
+            The variables of the objective of the model.
+        x_vars: gp.Vars
+            The collection of variables indicating in which round each
+            migration is scheduled.
+        formulation: str
+            A string identifying the formulation of the model. The default
+            value is 'lambda'.
+        symmetry_breaking: bool
+            A boolean indicating whether the rounds of `schedule` are
+            renumbered in the order of their first migration in
+            `_get_symmetry_order`, to satisfy the symmetry breaking
+            constraints. The default value is False.
+
+        Returns
+        -------
+        None
+
+        """
+        assignment = schedule.get_assignment()
+        num_rounds = schedule.get_num_rounds()
+        if symmetry_breaking:
+            labels = {}
+            for switch in self._get_symmetry_order():
+                if switch in assignment:
+                    labels.setdefault(assignment[switch], len(labels))
+            assignment = {switch: labels[round_num]
+                          for switch, round_num in assignment.items()}
+            num_rounds = len(labels)
+        if num_rounds > len(self._round_ids):
+            return
+        for switch, round_num in assignment.items():
+            i = self._data.get_switch_id(switch)
+            for r in self._round_ids:
+                x_vars[i, r].Start = 1.0 if r == round_num else 0.0
+        if formulation == "rounds":
+            for r in self._round_ids:
+                obj_vars[r].Start = 1.0 if r < num_rounds else 0.0
+        else:
+            obj_vars.Start = max(num_rounds - 1, 0)
+
     def _print_solution(self, solution, is_binary=True):
         """Prints the model solution given by `solution`.
 
@@ -404,7 +1077,7 @@ class Optimizer:
         None
 
         """
-        for r in self._data.get_round_ids():
+        for r in self._round_ids:
             for i in self._data.get_switch_ids():
                 if solution[i, r] > 0:
                     if is_binary:
@@ -437,7 +1110,38 @@ class Optimizer:
         if self._model and self._model.status == gp.GRB.OPTIMAL:
             solution = self._model.getAttr("x", x_vars)
             self._print_solution(solution, is_ip)
-            print("Number of Rounds: {0}".format(self._model.objVal + 1))
+            print("Number of Rounds: {0}".format(
+                self.get_num_rounds() if is_ip else self._model.objVal + 1))
+        else:
+            raise exc.ModelNotOptimized()
+
+    def _print_class_output(self, y_vars):
+        """Print the results of fitting the class model.
+
+        Parameters
+        ----------
+        y_vars: gp.Vars
+            The collection of variables giving the number of migrations of
+            each class scheduled in each round.
+
+        Raises
+        ------
+        ModelNotOptimized
+            If the optimization model has not yet been solved.
+
+        Returns
+        -------
+        None
+
+        """
+        if self._model and self._model.status == gp.GRB.OPTIMAL:
+            solution = self._model.getAttr("x", y_vars)
+            for r in self._round_ids:
+                for j in range(len(self._classes)):
+                    if solution[j, r] > 0.5:
+                        print("Class {0} has {1} migrations in round {2}"
+                              .format(j, int(round(solution[j, r])), r))
+            print("Number of Rounds: {0}".format(self.get_num_rounds()))
         else:
             raise exc.ModelNotOptimized()
 
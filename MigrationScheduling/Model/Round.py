@@ -55,6 +55,25 @@ class Round:
         """
         return self._round_num
 
+    def get_remaining_capacity(self, const_name):
+        """The remaining capacity of `const_name` in the round.
+
+        Parameters
+        ----------
+        const_name: str
+            A string representing the name of a controller or QoS group.
+
+        Returns
+        -------
+        float
+            A float representing the remaining capacity of `const_name` in
+            the round.
+
+        """
+        if const_name in self._rem_controller_caps:
+            return self._rem_controller_caps[const_name]
+        return self._rem_qos_caps[const_name]
+
     def get_remaining_controller_capacities(self):
         """The remaining capacity of controllers in the round.
 
@@ -156,6 +175,55 @@ class Round:
         self._reduce_qos_caps(migration.get_groups())
         self._migrations.add(migration.get_switch())
 
+    def unschedule_migration(self, migration, resiliency=False):
+        """Removes `migration` from the round, restoring its capacity.
+
+        Parameters
+        ----------
+        migration: Migration
+            A `Migration` object representing a migration scheduled in the
+            round.
+        resiliency: bool
+            A boolean value indicating whether failure resiliency should be
+            considered. A value of True indicates that the load of a migration
+            will be considered for both the source and destination controllers.
+            Otherwise, the load is only considered for the destination
+            controller.
+
+        Returns
+        -------
+        None
+
+        """
+        self._reduce_controller_cap(
+            migration.get_dst_controller(), -migration.get_load())
+        if resiliency:
+            self._reduce_controller_cap(
+                migration.get_src_controller(), -migration.get_load())
+        for qos_group in migration.get_groups():
+            self._rem_qos_caps[qos_group] += 1
+        self._migrations.discard(migration.get_switch())
+
+    def change_capacity(self, const_name, delta):
+        """Changes the remaining capacity of `const_name` by `delta`.
+
+        Parameters
+        ----------
+        const_name: str
+            A string representing the name of a controller or QoS group.
+        delta: float
+            A float representing the change in the capacity of `const_name`.
+
+        Returns
+        -------
+        None
+
+        """
+        if const_name in self._rem_controller_caps:
+            self._rem_controller_caps[const_name] += delta
+        else:
+            self._rem_qos_caps[const_name] += delta
+
     def _below_controller_caps(self, migration, resiliency=False):
         """Whether the migration is below the controller capacities.
 
@@ -0,0 +1,465 @@
+"""The `RoundIndex` class indexes the remaining capacity of every constraint
+across the scheduling rounds so that the earliest round in which a migration
+fits can be found without probing each round in turn.
+
+"""
+
+class RoundIndex:
+    """A segment tree index of the remaining capacities of the rounds.
+
+    For each constraint a max segment tree is kept over the rounds, giving
+    the largest remaining capacity of the constraint in any range of rounds.
+    The earliest round at or after a given round in which one constraint has
+    at least a given capacity remaining is found in time logarithmic in the
+    number of rounds. The earliest round in which a migration fits is found
+    by skipping ahead through these per constraint searches until every
+    constraint of the migration agrees on the same round.
+
+    Trees are only allocated for constraints once a migration involving them
+    is scheduled, as an untouched constraint has its full capacity in every
+    round. All trees cover the same number of rounds, which is doubled as
+    rounds are opened.
+
+    Parameters
+    ----------
+    controller_caps: dict
+        A dictionary of controller capacities. The keys are strings
+        representing the names of the controllers and the corresponding value
+        is a float representing the amount of migration load that the
+        controller can handle in a single round.
+    qos_caps: dict
+        A dictionary of QoS group capacities. The keys are strings
+        representing the names of the QoS groups and the corresponding value
+        is an integer representing the maximum amount of migrations from the
+        group that can be scheduled in a single round.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. A value of True indicates that the load of a migration
+        will be considered for both the source and destination controllers.
+        Otherwise, the load is only considered for the destination controller.
+    init_rounds: int
+        An integer representing the number of rounds initially covered by
+        each tree. The default value is 8.
+
+    Attributes
+    ----------
+    _resiliency: bool
+        Whether failure resiliency is considered.
+    _base_caps: dict
+        A dictionary mapping the name of each constraint to its capacity in
+        a single round.
+    _size: int
+        The number of rounds covered by each tree. This is a power of 2.
+    _trees: dict
+        A dictionary mapping the name of a constraint to its segment tree.
+        A tree is a list of length `2 * _size` in which the leaf for round
+        `r` is at position `_size + r` and each internal node holds the
+        maximum of its two children.
+    _num_rounds: int
+        The number of rounds that have been opened.
+    _migration_demands: dict
+        A cache mapping the name of a switch to a list of pairs of the name
+        of a constraint involved in its migration and the demand placed on
+        that constraint.
+
+    """
+    def __init__(self, controller_caps, qos_caps,
+                 resiliency=False, init_rounds=8):
+        self._resiliency = resiliency
+        self._base_caps = {**controller_caps, **qos_caps}
+        self._size = 1
+        while self._size < init_rounds:
+            self._size *= 2
+        self._trees = {}
+        self._num_rounds = 0
+        self._migration_demands = {}
+
+    def get_num_rounds(self):
+        """The number of rounds that have been opened.
+
+        Returns
+        -------
+        int
+            An integer representing the number of open rounds.
+
+        """
+        return self._num_rounds
+
+    def get_size(self):
+        """The number of rounds covered by each tree.
+
+        Returns
+        -------
+        int
+            An integer representing the number of rounds covered.
+
+        """
+        return self._size
+
+    def get_remaining_capacity(self, const_name, round_num):
+        """The remaining capacity of `const_name` in round `round_num`.
+
+        Parameters
+        ----------
+        const_name: str
+            A string representing the name of a controller or QoS group.
+        round_num: int
+            An integer representing the index of a round.
+
+        Returns
+        -------
+        float
+            A float representing the capacity of `const_name` remaining in
+            round `round_num` after accounting for the migrations scheduled
+            in that round.
+
+        """
+        if const_name not in self._trees or round_num >= self._size:
+            return self._base_caps[const_name]
+        return self._trees[const_name][self._size + round_num]
+
+    def get_migration_demands(self, migration):
+        """The constraints of `migration` and its demand on each.
+
+        The destination controller (and the source controller if resiliency
+        is considered) receives the load of the migration while each QoS
+        group of the migration receives a demand of 1. The result is cached
+        by switch name.
+
+        Parameters
+        ----------
+        migration: Migration
+            The `Migration` object for which the demands are retrieved.
+
+        Returns
+        -------
+        list
+            A list of pairs of a string representing the name of a constraint
+            involving `migration` and a float representing the demand of
+            `migration` on that constraint.
+
+        """
+        switch = migration.get_switch()
+        if switch not in self._migration_demands:
+            demands = {migration.get_dst_controller(): migration.get_load()}
+            if self._resiliency:
+                demands[migration.get_src_controller()] = migration.get_load()
+            for group in migration.get_groups():
+                demands[group] = 1
+            self._migration_demands[switch] = list(demands.items())
+        return self._migration_demands[switch]
+
+    def add_round(self):
+        """Opens a new round with the full capacity for each constraint.
+
+        Returns
+        -------
+        int
+            An integer representing the index of the new round.
+
+        """
+        if self._num_rounds == self._size:
+            self._grow()
+        self._num_rounds += 1
+        return self._num_rounds - 1
+
+    def can_schedule_migration(self, migration, round_num):
+        """Indicates if `migration` can be scheduled in round `round_num`.
+
+        Parameters
+        ----------
+        migration: Migration
+            A `Migration` object representing the migration to be scheduled.
+        round_num: int
+            An integer representing the index of an open round.
+
+        Returns
+        -------
+        bool
+            True if `migration` fits within the remaining capacity of every
+            constraint it is involved in for the round. Otherwise, False.
+
+        """
+        for const_name, demand in self.get_migration_demands(migration):
+            if self.get_remaining_capacity(const_name, round_num) < demand:
+                return False
+        return True
+
+    def find_scheduling_round(self, migration, start_round=0):
+        """The earliest open round in which `migration` can be scheduled.
+
+        Starting from `start_round`, each constraint of `migration` is
+        asked in turn for the earliest round at or after the current
+        candidate in which it can accommodate the migration. The candidate is
+        moved ahead to that round and the constraints continue to be asked,
+        cycling through them, until every constraint has accommodated the
+        migration in the candidate round since it was last moved.
+
+        Parameters
+        ----------
+        migration: Migration
+            A `Migration` object representing the migration to be scheduled.
+        start_round: int
+            An integer representing the index of the first round considered.
+            The default value is 0.
+
+        Returns
+        -------
+        int
+            An integer representing the index of the first round from
+            `start_round` in which `migration` fits. If it does not fit in
+            any open round from `start_round` then the number of open rounds
+            is returned, signifying that it should be scheduled in a new
+            round.
+
+        """
+        return self._find_round_from(
+            self.get_migration_demands(migration), start_round)
+
+    def find_scheduling_rounds(self, migration):
+        """The open rounds in which `migration` can be scheduled.
+
+        Each round is found by searching the index from the round after the
+        previous one found, so rounds in which the migration does not fit
+        are skipped over rather than checked.
+
+        Parameters
+        ----------
+        migration: Migration
+            A `Migration` object representing the migration to be scheduled.
+
+        Returns
+        -------
+        list
+            A list of integers representing the indices of the open rounds
+            in which `migration` fits, in increasing order.
+
+        """
+        demands = self.get_migration_demands(migration)
+        round_nums = []
+        round_num = self._find_round_from(demands, 0)
+        while round_num < self._num_rounds:
+            round_nums.append(round_num)
+            round_num = self._find_round_from(demands, round_num + 1)
+        return round_nums
+
+    def schedule_migration(self, migration, round_num):
+        """Schedules `migration` in round `round_num`.
+
+        If `round_num` is the number of open rounds a new round is opened
+        for the migration.
+
+        Parameters
+        ----------
+        migration: Migration
+            A `Migration` object representing the migration being scheduled.
+        round_num: int
+            An integer representing the index of the round in which
+            `migration` is scheduled.
+
+        Returns
+        -------
+        None
+
+        """
+        while round_num >= self._num_rounds:
+            self.add_round()
+        for const_name, demand in self.get_migration_demands(migration):
+            self._update_leaf(self._get_tree(const_name), round_num, -demand)
+
+    def unschedule_migration(self, migration, round_num):
+        """Removes `migration` from round `round_num`.
+
+        The demands of `migration` are returned to the remaining capacities
+        of its constraints in the round.
+
+        Parameters
+        ----------
+        migration: Migration
+            A `Migration` object representing a migration scheduled in round
+            `round_num`.
+        round_num: int
+            An integer representing the index of the round in which
+            `migration` is scheduled.
+
+        Returns
+        -------
+        None
+
+        """
+        for const_name, demand in self.get_migration_demands(migration):
+            self._update_leaf(self._get_tree(const_name), round_num, demand)
+
+    def change_capacity(self, const_name, delta):
+        """Changes the capacity of `const_name` by `delta` in every round.
+
+        Adding `delta` to every node of the tree of `const_name` keeps each
+        internal node the maximum of its children, so the tree is updated
+        in place.
+
+        Parameters
+        ----------
+        const_name: str
+            A string representing the name of a controller or QoS group.
+        delta: float
+            A float representing the change in the capacity of `const_name`.
+
+        Returns
+        -------
+        None
+
+        """
+        self._base_caps[const_name] += delta
+        if const_name in self._trees:
+            tree = self._trees[const_name]
+            for idx in range(1, len(tree)):
+                tree[idx] += delta
+
+    def _update_leaf(self, tree, round_num, change):
+        """Adds `change` to the leaf of `tree` for round `round_num`.
+
+        The ancestors of the leaf are updated until one is reached whose
+        maximum is unchanged.
+
+        Parameters
+        ----------
+        tree: list
+            The segment tree of remaining capacities of a constraint.
+        round_num: int
+            An integer representing the index of the round being updated.
+        change: float
+            A float representing the change in remaining capacity.
+
+        Returns
+        -------
+        None
+
+        """
+        idx = self._size + round_num
+        tree[idx] += change
+        idx //= 2
+        while idx:
+            left, right = tree[2 * idx], tree[2 * idx + 1]
+            new_max = left if left >= right else right
+            if tree[idx] == new_max:
+                break
+            tree[idx] = new_max
+            idx //= 2
+
+    def _get_tree(self, const_name):
+        """The segment tree for `const_name`, allocating it if needed.
+
+        Parameters
+        ----------
+        const_name: str
+            A string representing the name of a controller or QoS group.
+
+        Returns
+        -------
+        list
+            The segment tree of remaining capacities for `const_name`.
+
+        """
+        if const_name not in self._trees:
+            self._trees[const_name] = (
+                [self._base_caps[const_name]] * (2 * self._size))
+        return self._trees[const_name]
+
+    def _grow(self):
+        """Doubles the number of rounds covered by every tree.
+
+        The old tree becomes the left subtree of the root of the new tree,
+        so each of its levels is copied into the left half of the level
+        below it while the right halves hold the full capacity.
+
+        Returns
+        -------
+        None
+
+        """
+        old_size = self._size
+        self._size *= 2
+        for const_name, old_tree in self._trees.items():
+            tree = [self._base_caps[const_name]] * (2 * self._size)
+            start = 1
+            while start <= old_size:
+                tree[2 * start:3 * start] = old_tree[start:2 * start]
+                start *= 2
+            tree[1] = max(old_tree[1], self._base_caps[const_name])
+            self._trees[const_name] = tree
+
+    def _find_round_from(self, demands, round_num):
+        """The earliest open round from `round_num` satisfying `demands`.
+
+        Parameters
+        ----------
+        demands: list
+            A list of pairs of the name of a constraint and the demand
+            placed on that constraint.
+        round_num: int
+            An integer representing the index of the first round considered.
+
+        Returns
+        -------
+        int
+            An integer representing the index of the first open round at or
+            after `round_num` in which every demand fits, or the number of
+            open rounds if there is no such round.
+
+        """
+        if round_num >= self._num_rounds:
+            return self._num_rounds
+        num_agreed = 0
+        idx = 0
+        while num_agreed < len(demands):
+            const_name, demand = demands[idx]
+            idx = (idx + 1) % len(demands)
+            num_agreed += 1
+            if const_name not in self._trees:
+                if self._base_caps[const_name] < demand:
+                    return self._num_rounds
+                continue
+            next_round = self._first_round_with(
+                self._trees[const_name], round_num, demand)
+            if next_round is None or next_round >= self._num_rounds:
+                return self._num_rounds
+            if next_round > round_num:
+                round_num = next_round
+                num_agreed = 1
+        return round_num
+
+    def _first_round_with(self, tree, start, demand):
+        """The first round from `start` in which `tree` has `demand` left.
+
+        Parameters
+        ----------
+        tree: list
+            The segment tree of remaining capacities of a constraint.
+        start: int
+            An integer representing the index of the first round considered.
+        demand: float
+            A float representing the capacity required.
+
+        Returns
+        -------
+        int
+            An integer representing the index of the first round at or after
+            `start` in which the remaining capacity in `tree` is at least
+            `demand`, or None if there is no such round among the rounds
+            covered by `tree`.
+
+        """
+        if start >= self._size:
+            return None
+        idx = self._size + start
+        while tree[idx] < demand:
+            while idx % 2:
+                idx //= 2
+            if not idx:
+                return None
+            idx += 1
+        while idx < self._size:
+            idx *= 2
+            if tree[idx] < demand:
+                idx += 1
+        return idx - self._size
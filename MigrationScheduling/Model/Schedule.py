@@ -0,0 +1,553 @@
+"""The `Schedule` class holds an assignment of migrations to rounds for the
+load migration scheduling problem and is updated in place as migrations are
+scheduled.
+
+"""
+from MigrationScheduling import validation as val
+from MigrationScheduling.Model.Round import Round
+from MigrationScheduling.Model.SparseRound import SparseRound
+from MigrationScheduling.Model.CapacityMatrix import CapacityMatrix
+from MigrationScheduling.Model.RoundIndex import RoundIndex
+from MigrationScheduling.Model.BitsetRounds import BitsetRounds
+
+
+class Schedule:
+    """A mutable schedule of migrations.
+
+    The schedule owns the rounds in which migrations are scheduled and a map
+    from each scheduled switch to its round. The remaining capacities of the
+    rounds are tracked by the selected backend: a list of `Round` objects, a
+    list of `SparseRound` objects, a `CapacityMatrix`, a `RoundIndex` or a
+    `BitsetRounds`.
+
+    Parameters
+    ----------
+    controller_caps: dict
+        A dictionary of controller capacities. The keys are strings
+        representing the names of the controllers and the corresponding value
+        is a float representing the amount of migration load that the
+        controller can handle in a single round.
+    qos_caps: dict
+        A dictionary of QoS group capacities. The keys are strings
+        representing the names of the QoS groups and the corresponding value
+        is an integer representing the maximum amount of migrations from the
+        group that can be scheduled in a single round.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. A value of True indicates that the load of a migration
+        will be considered for both the source and destination controllers.
+        Otherwise, the load is only considered for the destination controller.
+    backend: str
+        A string identifying how the remaining capacity of the rounds is
+        tracked. The default value is 'rounds'.
+
+    Raises
+    ------
+    IncorrectBackend
+        If `backend` is not one of the backends in
+        `specs.SCHEDULING_BACKENDS`.
+
+    Attributes
+    ----------
+    _controller_caps: dict
+        The capacity of each controller in a single round.
+    _qos_caps: dict
+        The capacity of each QoS group in a single round.
+    _resiliency: bool
+        Whether failure resiliency is considered.
+    _backend: str
+        The backend used to track the remaining capacities.
+    _rounds: list
+        The `Round` or `SparseRound` objects of the schedule. Only used by
+        the 'rounds' and 'sparse' backends. The sparse rounds share
+        `_controller_caps` and `_qos_caps`.
+    _tracker: CapacityMatrix, RoundIndex or BitsetRounds
+        The object tracking the remaining capacities. None for the 'rounds'
+        and 'sparse' backends.
+    _round_switches: list
+        A list with one set per round containing the names of the switches
+        scheduled in that round.
+    _switch_rounds: dict
+        A dictionary mapping the name of each scheduled switch to the index
+        of the round in which it is scheduled.
+    _migrations: dict
+        A dictionary mapping the name of each scheduled switch to its
+        `Migration` object.
+
+    """
+    def __init__(self, controller_caps, qos_caps,
+                 resiliency=False, backend="rounds"):
+        val.validate_backend(backend)
+        self._controller_caps = dict(controller_caps)
+        self._qos_caps = dict(qos_caps)
+        self._resiliency = resiliency
+        self._backend = backend
+        self._rounds = []
+        self._tracker = self._new_tracker()
+        self._round_switches = []
+        self._switch_rounds = {}
+        self._migrations = {}
+
+    def get_backend(self):
+        """The backend used to track the remaining capacities.
+
+        Returns
+        -------
+        str
+            A string representing the backend of the schedule.
+
+        """
+        return self._backend
+
+    def get_resiliency(self):
+        """Whether failure resiliency is considered by the schedule.
+
+        Returns
+        -------
+        bool
+            True if the schedule accounts for the load of a migration on its
+            source controller as well as its destination controller.
+            Otherwise, False.
+
+        """
+        return self._resiliency
+
+    def get_num_rounds(self):
+        """The number of rounds in the schedule.
+
+        Returns
+        -------
+        int
+            An integer representing the number of rounds.
+
+        """
+        return len(self._round_switches)
+
+    def get_num_migrations(self):
+        """The number of migrations that have been scheduled.
+
+        Returns
+        -------
+        int
+            An integer representing the number of scheduled migrations.
+
+        """
+        return len(self._switch_rounds)
+
+    def get_round_switches(self, round_num):
+        """The switches scheduled in round `round_num`.
+
+        Parameters
+        ----------
+        round_num: int
+            An integer representing the index of the round.
+
+        Returns
+        -------
+        set
+            A set of strings representing the names of the switches whose
+            migrations are scheduled in round `round_num`.
+
+        """
+        return self._round_switches[round_num]
+
+    def get_switch_round(self, switch_name):
+        """The round in which the migration of `switch_name` is scheduled.
+
+        Parameters
+        ----------
+        switch_name: str
+            A string representing the name of a scheduled switch.
+
+        Returns
+        -------
+        int
+            An integer representing the index of the round.
+
+        """
+        return self._switch_rounds[switch_name]
+
+    def get_assignment(self):
+        """The round of every scheduled migration.
+
+        Returns
+        -------
+        dict
+            A dictionary in which the keys are strings representing the
+            names of the scheduled switches and the corresponding value is
+            an integer representing the index of the round in which the
+            migration of that switch is scheduled.
+
+        """
+        return dict(self._switch_rounds)
+
+    def get_migration(self, switch_name):
+        """The migration of `switch_name`.
+
+        Parameters
+        ----------
+        switch_name: str
+            A string representing the name of a scheduled switch.
+
+        Returns
+        -------
+        Migration
+            The `Migration` object of the scheduled switch.
+
+        """
+        return self._migrations[switch_name]
+
+    def is_scheduled(self, switch_name):
+        """Whether the migration of `switch_name` has been scheduled.
+
+        Parameters
+        ----------
+        switch_name: str
+            A string representing the name of a switch.
+
+        Returns
+        -------
+        bool
+            True if the migration of `switch_name` is scheduled in one of
+            the rounds. Otherwise, False.
+
+        """
+        return switch_name in self._switch_rounds
+
+    def get_capacity(self, const_name):
+        """The capacity of `const_name` in a single round.
+
+        Parameters
+        ----------
+        const_name: str
+            A string representing the name of a controller or QoS group.
+
+        Returns
+        -------
+        float
+            A float representing the capacity of `const_name` in an empty
+            round.
+
+        """
+        if const_name in self._controller_caps:
+            return self._controller_caps[const_name]
+        return self._qos_caps[const_name]
+
+    def is_qos_group(self, const_name):
+        """Whether `const_name` is the name of a QoS group.
+
+        Parameters
+        ----------
+        const_name: str
+            A string representing the name of a controller or QoS group.
+
+        Returns
+        -------
+        bool
+            True if `const_name` is a QoS group of the schedule. Otherwise,
+            False.
+
+        """
+        return const_name in self._qos_caps
+
+    def get_remaining_capacity(self, const_name, round_num):
+        """The remaining capacity of `const_name` in round `round_num`.
+
+        Parameters
+        ----------
+        const_name: str
+            A string representing the name of a controller or QoS group.
+        round_num: int
+            An integer representing the index of a round of the schedule.
+
+        Returns
+        -------
+        float
+            A float representing the capacity of `const_name` remaining in
+            round `round_num` after accounting for the migrations scheduled
+            in that round.
+
+        """
+        if self._tracker:
+            return self._tracker.get_remaining_capacity(const_name, round_num)
+        return self._rounds[round_num].get_remaining_capacity(const_name)
+
+    def can_schedule_migration(self, migration, round_num):
+        """Indicates if `migration` can be scheduled in round `round_num`.
+
+        Parameters
+        ----------
+        migration: Migration
+            A `Migration` object representing the migration to be scheduled.
+        round_num: int
+            An integer representing the index of a round of the schedule.
+
+        Returns
+        -------
+        bool
+            True if `migration` fits within the remaining capacities of the
+            round. Otherwise, False.
+
+        """
+        if self._tracker:
+            return self._tracker.can_schedule_migration(migration, round_num)
+        return self._rounds[round_num].can_schedule_migration(
+            migration, self._resiliency)
+
+    def find_scheduling_round(self, migration, start_round=0):
+        """The earliest round in which `migration` can be scheduled.
+
+        Parameters
+        ----------
+        migration: Migration
+            A `Migration` object representing the migration to be scheduled.
+        start_round: int
+            An integer representing the index of the first round considered.
+            The default value is 0.
+
+        Returns
+        -------
+        int
+            An integer representing the index of the first round from
+            `start_round` in which `migration` fits. If it does not fit in
+            any round from `start_round` then the number of rounds is
+            returned, signifying that a new round is needed.
+
+        """
+        if self._tracker:
+            return self._tracker.find_scheduling_round(
+                migration, start_round)
+        for round_num in range(start_round, len(self._rounds)):
+            if self._rounds[round_num].can_schedule_migration(
+                migration, self._resiliency):
+                return round_num
+        return len(self._rounds)
+
+    def find_scheduling_rounds(self, migration):
+        """The rounds in which `migration` can be scheduled.
+
+        Parameters
+        ----------
+        migration: Migration
+            A `Migration` object representing the migration to be scheduled.
+
+        Returns
+        -------
+        list
+            A list of integers representing the indices of the rounds in
+            which `migration` fits, in increasing order.
+
+        """
+        if self._tracker:
+            return self._tracker.find_scheduling_rounds(migration)
+        return [round_num for round_num, curr_round in enumerate(self._rounds)
+                if curr_round.can_schedule_migration(
+                    migration, self._resiliency)]
+
+    def schedule_migration(self, migration, round_num=None):
+        """Schedules `migration` in place.
+
+        The migration is scheduled in round `round_num`, or in the earliest
+        round in which it fits if `round_num` is None. New rounds are added
+        to the schedule as needed.
+
+        Parameters
+        ----------
+        migration: Migration
+            A `Migration` object representing the migration being scheduled.
+        round_num: int
+            An integer representing the index of the round in which the
+            migration is scheduled. The default value is None.
+
+        Returns
+        -------
+        int
+            An integer representing the index of the round in which
+            `migration` was scheduled.
+
+        """
+        if round_num is None:
+            round_num = self.find_scheduling_round(migration)
+        while round_num >= len(self._round_switches):
+            self._add_round()
+        if self._tracker:
+            self._tracker.schedule_migration(migration, round_num)
+        else:
+            self._rounds[round_num].schedule_migration(
+                migration, self._resiliency)
+        switch = migration.get_switch()
+        self._round_switches[round_num].add(switch)
+        self._switch_rounds[switch] = round_num
+        self._migrations[switch] = migration
+        return round_num
+
+    def unschedule_migration(self, switch_name):
+        """Removes the migration of `switch_name` from the schedule.
+
+        The capacity used by the migration is restored to its round. The
+        round itself is kept, even if it is left empty.
+
+        Parameters
+        ----------
+        switch_name: str
+            A string representing the name of a scheduled switch.
+
+        Returns
+        -------
+        int
+            An integer representing the index of the round from which the
+            migration was removed.
+
+        """
+        round_num = self._switch_rounds.pop(switch_name)
+        migration = self._migrations.pop(switch_name)
+        if self._tracker:
+            self._tracker.unschedule_migration(migration, round_num)
+        else:
+            self._rounds[round_num].unschedule_migration(
+                migration, self._resiliency)
+        self._round_switches[round_num].discard(switch_name)
+        return round_num
+
+    def change_capacity(self, const_name, delta):
+        """Changes the capacity of `const_name` by `delta` in every round.
+
+        The migrations already scheduled are kept in their rounds, so the
+        remaining capacity of `const_name` becomes negative in any round in
+        which they no longer fit.
+
+        Parameters
+        ----------
+        const_name: str
+            A string representing the name of a controller or QoS group.
+        delta: float
+            A float representing the change in the capacity of `const_name`.
+
+        Returns
+        -------
+        None
+
+        """
+        if const_name in self._controller_caps:
+            self._controller_caps[const_name] += delta
+        else:
+            self._qos_caps[const_name] += delta
+        if self._tracker:
+            self._tracker.change_capacity(const_name, delta)
+        elif self._backend == "rounds":
+            for curr_round in self._rounds:
+                curr_round.change_capacity(const_name, delta)
+
+    def remove_empty_rounds(self):
+        """Removes the rounds in which no migrations are scheduled.
+
+        The remaining rounds keep their relative order and are renumbered
+        from 0, and the capacities of the backend are rebuilt.
+
+        Returns
+        -------
+        int
+            An integer representing the number of rounds removed.
+
+        """
+        round_switches = [switches for switches in self._round_switches
+                          if switches]
+        num_removed = len(self._round_switches) - len(round_switches)
+        if num_removed:
+            migrations = self._migrations
+            self._rounds = []
+            self._tracker = self._new_tracker()
+            self._round_switches = []
+            self._switch_rounds = {}
+            self._migrations = {}
+            for round_num, switches in enumerate(round_switches):
+                for switch in switches:
+                    self.schedule_migration(migrations[switch], round_num)
+        return num_removed
+
+    def copy(self, backend=None):
+        """A copy of the schedule, optionally using a different backend.
+
+        Parameters
+        ----------
+        backend: str
+            A string identifying the backend of the copy. The default value
+            is None, in which case the backend of the schedule is used.
+
+        Raises
+        ------
+        IncorrectBackend
+            If `backend` is not one of the backends in
+            `specs.SCHEDULING_BACKENDS`.
+
+        Returns
+        -------
+        Schedule
+            A `Schedule` with the same rounds and the same migrations
+            scheduled in each round.
+
+        """
+        schedule = Schedule(
+            self._controller_caps, self._qos_caps, self._resiliency,
+            self._backend if backend is None else backend)
+        while schedule.get_num_rounds() < self.get_num_rounds():
+            schedule._add_round()
+        for switch, round_num in self._switch_rounds.items():
+            schedule.schedule_migration(self._migrations[switch], round_num)
+        return schedule
+
+    def print_rounds(self):
+        """Prints the migrations completed in each round.
+
+        Returns
+        -------
+        None
+
+        """
+        for round_num, switches in enumerate(self._round_switches):
+            if switches:
+                print("Migrations completed in round {0}: {1}.".format(
+                    round_num, " ".join(sorted(switches))))
+            else:
+                print("No migrations scheduled in round {}.".format(
+                    round_num))
+
+    def _add_round(self):
+        """Adds an empty round to the end of the schedule.
+
+        Returns
+        -------
+        None
+
+        """
+        round_num = len(self._round_switches)
+        if self._tracker:
+            self._tracker.add_round()
+        elif self._backend == "sparse":
+            self._rounds.append(
+                SparseRound(round_num, self._controller_caps, self._qos_caps))
+        else:
+            self._rounds.append(
+                Round(round_num, self._controller_caps, self._qos_caps))
+        self._round_switches.append(set())
+
+    def _new_tracker(self):
+        """A new object tracking the capacities for the backend.
+
+        Returns
+        -------
+        CapacityMatrix, RoundIndex or BitsetRounds
+            The object tracking the remaining capacities of the rounds, or
+            None for the 'rounds' and 'sparse' backends.
+
+        """
+        if self._backend == "matrix":
+            return CapacityMatrix(
+                self._controller_caps, self._qos_caps, self._resiliency)
+        if self._backend == "tree":
+            return RoundIndex(
+                self._controller_caps, self._qos_caps, self._resiliency)
+        if self._backend == "bitset":
+            return BitsetRounds(
+                self._controller_caps, self._qos_caps, self._resiliency)
+        return None
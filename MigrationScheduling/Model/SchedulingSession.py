@@ -0,0 +1,172 @@
+"""The `SchedulingSession` class schedules migrations as they arrive,
+placing them into the rounds that have not yet been executed.
+
+"""
+from MigrationScheduling import exceptions as exc
+from MigrationScheduling.Model.Schedule import Schedule
+
+
+class SchedulingSession:
+    """An online schedule of migrations arriving over time.
+
+    The session holds a `Schedule` whose rounds are executed in order. The
+    executed rounds form a prefix of the schedule and are frozen, so no
+    migration is added to them. Each arriving migration is scheduled in the
+    earliest pending round in which it fits, or in a new round if it fits in
+    none. Only the migration being added is checked against the rounds, so
+    the cost of adding a migration does not grow with the number already
+    scheduled beyond the search of the backend.
+
+    Parameters
+    ----------
+    controller_caps: dict
+        A dictionary of controller capacities. The keys are strings
+        representing the names of the controllers and the corresponding value
+        is a float representing the amount of migration load that the
+        controller can handle in a single round.
+    qos_caps: dict
+        A dictionary of QoS group capacities. The keys are strings
+        representing the names of the QoS groups and the corresponding value
+        is an integer representing the maximum amount of migrations from the
+        group that can be scheduled in a single round.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. A value of True indicates that the load of a migration
+        will be considered for both the source and destination controllers.
+        Otherwise, the load is only considered for the destination controller.
+    backend: str
+        A string identifying how the remaining capacity of the rounds is
+        tracked. The default value is 'tree', which searches the pending
+        rounds in logarithmic time per constraint.
+
+    Raises
+    ------
+    IncorrectBackend
+        If `backend` is not one of the backends in
+        `specs.SCHEDULING_BACKENDS`.
+
+    Attributes
+    ----------
+    _schedule: Schedule
+        The schedule of the migrations added to the session.
+    _num_executed: int
+        The number of rounds that have been executed. These are the first
+        `_num_executed` rounds of `_schedule`.
+
+    """
+    def __init__(self, controller_caps, qos_caps,
+                 resiliency=False, backend="tree"):
+        self._schedule = Schedule(
+            controller_caps, qos_caps, resiliency, backend)
+        self._num_executed = 0
+
+    def get_schedule(self):
+        """The schedule of the migrations added to the session.
+
+        Returns
+        -------
+        Schedule
+            The `Schedule` holding the executed and pending rounds.
+
+        """
+        return self._schedule
+
+    def get_num_rounds(self):
+        """The number of rounds in the session.
+
+        Returns
+        -------
+        int
+            An integer representing the number of executed and pending
+            rounds.
+
+        """
+        return self._schedule.get_num_rounds()
+
+    def get_num_executed_rounds(self):
+        """The number of rounds that have been executed.
+
+        Returns
+        -------
+        int
+            An integer representing the number of executed rounds.
+
+        """
+        return self._num_executed
+
+    def is_frozen(self, round_num):
+        """Whether round `round_num` has been executed and is frozen.
+
+        Parameters
+        ----------
+        round_num: int
+            An integer representing the index of a round.
+
+        Returns
+        -------
+        bool
+            True if round `round_num` has been executed, in which case no
+            migrations can be added to it. Otherwise, False.
+
+        """
+        return round_num < self._num_executed
+
+    def add_migrations(self, migrations):
+        """Schedules `migrations` in the pending rounds.
+
+        The migrations are scheduled in turn, each in the earliest pending
+        round in which it fits. New rounds are added as needed.
+
+        Parameters
+        ----------
+        migrations: collection
+            A collection of `Migration` objects representing the migrations
+            that have arrived.
+
+        Raises
+        ------
+        MigrationAlreadyScheduled
+            If the switch of one of `migrations` has already been added to
+            the session or appears more than once in `migrations`. No
+            migrations are scheduled in this case.
+
+        Returns
+        -------
+        dict
+            A dictionary in which the keys are strings representing the names
+            of the switches of `migrations` and the corresponding value is an
+            integer representing the index of the round in which the
+            migration of that switch is scheduled.
+
+        """
+        migrations = list(migrations)
+        switches = set()
+        for migration in migrations:
+            switch = migration.get_switch()
+            if switch in switches or self._schedule.is_scheduled(switch):
+                raise exc.MigrationAlreadyScheduled(switch)
+            switches.add(switch)
+        return {migration.get_switch(): self._schedule.schedule_migration(
+                    migration, self._schedule.find_scheduling_round(
+                        migration, self._num_executed))
+                for migration in migrations}
+
+    def execute_round(self):
+        """Executes the earliest pending round, freezing it.
+
+        Raises
+        ------
+        NoPendingRounds
+            If every round of the session has already been executed.
+
+        Returns
+        -------
+        set
+            A set of strings representing the names of the switches whose
+            migrations are completed in the executed round.
+
+        """
+        if self._num_executed == self._schedule.get_num_rounds():
+            raise exc.NoPendingRounds()
+        self._num_executed += 1
+        return self._schedule.get_round_switches(self._num_executed - 1)
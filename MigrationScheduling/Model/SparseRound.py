@@ -0,0 +1,348 @@
+"""The `SparseRound` class represents a scheduling round by the capacity
+used in it, storing only the constraints involved in its migrations.
+
+"""
+
+class SparseRound:
+    """Stores the capacity used by the migrations of a scheduling round.
+
+    Unlike `Round`, which copies the capacity of every constraint, a sparse
+    round refers to the capacity dictionaries it is given without copying
+    them and records the capacity used only for the constraints involved in
+    its migrations. The remaining capacity of any other constraint is its
+    full capacity. The memory of a round is therefore proportional to the
+    number of constraints its migrations touch, and rounds sharing the same
+    capacity dictionaries see any change to them.
+
+    Parameters
+    ----------
+    round_num: int
+        An integer representing the round number.
+    controller_caps: dict
+        A dictionary of controller capacities. The keys are strings
+        representing the names of the controllers and the corresponding value
+        is a float representing the amount of migration load that the
+        controller can handle in a single round.
+    qos_caps: dict
+        A dictionary of QoS group capacities. The keys are strings
+        representing the names of the QoS groups and the corresponding value
+        is an integer representing the maximum amount of migrations from the
+        group that can be scheduled in a single round.
+
+    Attributes
+    ----------
+    _round_num: int
+        The round number.
+    _controller_caps: dict
+        The capacity of each controller, shared and not copied.
+    _qos_caps: dict
+        The capacity of each QoS group, shared and not copied.
+    _used_controller_caps: dict
+        A dictionary mapping each controller involved in the migrations of
+        the round to the load placed on it in the round.
+    _used_qos_caps: dict
+        A dictionary mapping each QoS group involved in the migrations of the
+        round to the number of its migrations in the round.
+    _migrations: set
+        A set of strings representing the name of the migrations completed
+        in the round.
+
+    """
+    __slots__ = ("_round_num", "_controller_caps", "_qos_caps",
+                 "_used_controller_caps", "_used_qos_caps", "_migrations")
+
+    def __init__(self, round_num, controller_caps, qos_caps):
+        self._round_num = round_num
+        self._controller_caps = controller_caps
+        self._qos_caps = qos_caps
+        self._used_controller_caps = {}
+        self._used_qos_caps = {}
+        self._migrations = set()
+
+    def get_round_number(self):
+        """The round number.
+
+        Returns
+        -------
+        int
+            An integer representing the round number.
+
+        """
+        return self._round_num
+
+    def get_remaining_capacity(self, const_name):
+        """The remaining capacity of `const_name` in the round.
+
+        Parameters
+        ----------
+        const_name: str
+            A string representing the name of a controller or QoS group.
+
+        Returns
+        -------
+        float
+            A float representing the capacity of `const_name` less the
+            capacity used by the migrations of the round.
+
+        """
+        if const_name in self._controller_caps:
+            return (self._controller_caps[const_name] -
+                    self._used_controller_caps.get(const_name, 0.0))
+        return self._qos_caps[const_name] - self._used_qos_caps.get(
+            const_name, 0)
+
+    def get_remaining_controller_capacities(self):
+        """The remaining capacity of controllers in the round.
+
+        The dictionary is built on each call, so `get_remaining_capacity` is
+        preferred for individual controllers.
+
+        Returns
+        -------
+        dict
+            A dictionary of remaining controller capacities. The keys are
+            strings representing the names of the controllers and the
+            corresponding value is a float representing the remaining
+            capacity for that controller in the round.
+
+        """
+        return {controller: self.get_remaining_capacity(controller)
+                for controller in self._controller_caps}
+
+    def get_remaining_qos_capacities(self):
+        """The remaining capacity of QoS groups in the round.
+
+        The dictionary is built on each call, so `get_remaining_capacity` is
+        preferred for individual QoS groups.
+
+        Returns
+        -------
+        dict
+            A dictionary of remaining QoS group capacities. The keys are
+            strings representing the names of the QoS groups and the
+            corresponding value is an integer representing the remaining
+            capacity of the QoS group in the round.
+
+        """
+        return {qos_group: self.get_remaining_capacity(qos_group)
+                for qos_group in self._qos_caps}
+
+    def get_used_constraints(self):
+        """The constraints for which the round stores the capacity used.
+
+        Returns
+        -------
+        set
+            A set of strings representing the names of the controllers and
+            QoS groups involved in the migrations of the round.
+
+        """
+        return set(self._used_controller_caps).union(self._used_qos_caps)
+
+    def get_scheduled_migrations(self):
+        """The migrations that have been scheduled in the round.
+
+        Returns
+        -------
+        set
+            A set of strings representing the names of the switches whose
+            migrations have been scheduled in the round.
+
+        """
+        return self._migrations
+
+    def can_schedule_migration(self, migration, resiliency=False):
+        """Indicates if `migration` can be scheduled in the round.
+
+        Parameters
+        ----------
+        migration: Migration
+            A `Migration` object representing the migration to be scheduled.
+        resiliency: bool
+            A boolean value indicating whether failure resiliency should be
+            considered. A value of True indicates that the load of a migration
+            will be considered for both the source and destination controllers.
+            Otherwise, the load is only considered for the destination
+            controller.
+
+        Returns
+        -------
+        bool
+            True if `migration` can be scheduled in the round without
+            exceeding the remaining capacities of the controllers and QoS
+            groups. Otherwise, False.
+
+        """
+        load = migration.get_load()
+        if not self._within_controller_cap(
+                migration.get_dst_controller(), load):
+            return False
+        if resiliency and not self._within_controller_cap(
+                migration.get_src_controller(), load):
+            return False
+        for qos_group in migration.get_groups():
+            if (qos_group not in self._qos_caps or
+                    self.get_remaining_capacity(qos_group) < 1):
+                return False
+        return True
+
+    def schedule_migration(self, migration, resiliency=False):
+        """Schedules `migration` in the round.
+
+        Parameters
+        ----------
+        migration: Migration
+            A `Migration` object representing the migration being scheduled
+            in the round.
+        resiliency: bool
+            A boolean value indicating whether failure resiliency should be
+            considered. A value of True indicates that the load of a migration
+            will be considered for both the source and destination controllers.
+            Otherwise, the load is only considered for the destination
+            controller.
+
+        Returns
+        -------
+        None
+
+        """
+        self._use_controller_cap(
+            migration.get_dst_controller(), migration.get_load())
+        if resiliency:
+            self._use_controller_cap(
+                migration.get_src_controller(), migration.get_load())
+        for qos_group in migration.get_groups():
+            self._use_qos_cap(qos_group, 1)
+        self._migrations.add(migration.get_switch())
+
+    def unschedule_migration(self, migration, resiliency=False):
+        """Removes `migration` from the round, restoring its capacity.
+
+        Parameters
+        ----------
+        migration: Migration
+            A `Migration` object representing a migration scheduled in the
+            round.
+        resiliency: bool
+            A boolean value indicating whether failure resiliency should be
+            considered. A value of True indicates that the load of a migration
+            will be considered for both the source and destination controllers.
+            Otherwise, the load is only considered for the destination
+            controller.
+
+        Returns
+        -------
+        None
+
+        """
+        self._use_controller_cap(
+            migration.get_dst_controller(), -migration.get_load())
+        if resiliency:
+            self._use_controller_cap(
+                migration.get_src_controller(), -migration.get_load())
+        for qos_group in migration.get_groups():
+            self._use_qos_cap(qos_group, -1)
+        self._migrations.discard(migration.get_switch())
+
+    def change_capacity(self, const_name, delta):
+        """Changes the remaining capacity of `const_name` by `delta`.
+
+        Only this round is affected. A change to every round sharing the
+        capacity dictionaries is made by changing the dictionaries instead.
+
+        Parameters
+        ----------
+        const_name: str
+            A string representing the name of a controller or QoS group.
+        delta: float
+            A float representing the change in the capacity of `const_name`.
+
+        Returns
+        -------
+        None
+
+        """
+        if const_name in self._controller_caps:
+            self._use_controller_cap(const_name, -delta)
+        else:
+            self._use_qos_cap(const_name, -delta)
+
+    def _within_controller_cap(self, controller, migration_load):
+        """Whether `migration_load` is within the capacity of `controller`.
+
+        Parameters
+        ----------
+        controller: str
+            A string representing the name of a controller.
+        migration_load: float
+            A float representing the load incurred on `controller` to
+            complete the migration.
+
+        Returns
+        -------
+        bool
+            True if the migration can be scheduled in the round without
+            exceeding the controller capacity.
+
+        """
+        if controller in self._controller_caps:
+            return self.get_remaining_capacity(controller) >= migration_load
+        return False
+
+    def _use_controller_cap(self, controller, load):
+        """Records `load` more capacity of `controller` used in the round.
+
+        Parameters
+        ----------
+        controller: str
+            The name of the controller whose used capacity is increased.
+        load: float
+            A float representing the additional load placed on the
+            controller in the round. A negative value releases capacity.
+
+        Returns
+        -------
+        None
+
+        """
+        self._used_controller_caps[controller] = (
+            self._used_controller_caps.get(controller, 0.0) + load)
+
+    def _use_qos_cap(self, qos_group, count):
+        """Records `count` more migrations of `qos_group` in the round.
+
+        The entry of `qos_group` is removed when no capacity of it is used.
+
+        Parameters
+        ----------
+        qos_group: str
+            The name of the QoS group whose used capacity is increased.
+        count: int
+            An integer representing the additional number of migrations of
+            the group in the round. A negative value releases capacity.
+
+        Returns
+        -------
+        None
+
+        """
+        used = self._used_qos_caps.get(qos_group, 0) + count
+        if used:
+            self._used_qos_caps[qos_group] = used
+        else:
+            self._used_qos_caps.pop(qos_group, None)
+
+    def print_migrations(self):
+        """Prints the migrations completed in the round.
+
+        Returns
+        -------
+        None
+
+        """
+        if self._migrations:
+            print("Migrations completed in round {0}: {1}.".format(
+                self._round_num, " ".join(self._migrations)))
+        else:
+            print("No migrations scheduled in round {}.".format(
+                self._round_num))
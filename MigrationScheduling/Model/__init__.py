@@ -4,4 +4,15 @@ migration scheduling instance.
 """
 from MigrationScheduling.Model.Parser import Parser
 from MigrationScheduling.Model.Round import Round
+from MigrationScheduling.Model.SparseRound import SparseRound
+from MigrationScheduling.Model.CapacityMatrix import CapacityMatrix
+from MigrationScheduling.Model.RoundIndex import RoundIndex
+from MigrationScheduling.Model.CompiledInstance import CompiledInstance
+from MigrationScheduling.Model.BitsetRounds import BitsetRounds
+from MigrationScheduling.Model.Schedule import Schedule
+from MigrationScheduling.Model.SchedulingSession import SchedulingSession
+from MigrationScheduling.Model.DisjointSets import DisjointSets
+from MigrationScheduling.Model.InstanceBatch import InstanceBatch
+from MigrationScheduling.Model.BottleneckQueue import BottleneckQueue
+from MigrationScheduling.Model.MigrationScores import MigrationScores
 from MigrationScheduling.Model.Optimizer import Optimizer
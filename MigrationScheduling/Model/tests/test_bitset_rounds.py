@@ -0,0 +1,74 @@
+import pytest
+from MigrationScheduling.Model import BitsetRounds
+from MigrationScheduling.tests.helpers import make_migration
+
+
+@pytest.fixture(scope="function")
+def simple_rounds():
+    return BitsetRounds({'c0': 3.8}, {'g0': 1})
+
+@pytest.fixture(scope="function")
+def complex_rounds():
+    return BitsetRounds({'c0': 5.9, 'c1': 2.7, 'c2': 11.9},
+                        {'g0': 2, 'g1': 1, 'g2': 5})
+
+@pytest.fixture(scope="function")
+def simple_migration():
+    return make_migration('s0', 'c1', 'c0', 2.1, {'g0'})
+
+@pytest.fixture(scope="function")
+def complex_migration():
+    return make_migration('s1', 'c0', 'c1', 1.5, {'g0', 'g1'})
+
+
+def test_instantiation(complex_rounds):
+    assert complex_rounds.get_num_rounds() == 0
+    assert complex_rounds.get_compiled_instance().get_group_idx('g1') == 1
+    assert complex_rounds.add_round() == 0
+    assert complex_rounds.get_saturated_mask(0) == 0
+    assert complex_rounds.get_remaining_capacity('c2', 0) == 11.9
+    assert complex_rounds.get_remaining_capacity('g2', 0) == 5
+
+def test_zero_capacity_group_is_saturated(simple_migration):
+    rounds = BitsetRounds({'c0': 3.8}, {'g0': 0})
+    rounds.add_round()
+    assert rounds.get_saturated_mask(0) == 1
+    assert rounds.find_scheduling_round(simple_migration) == 1
+
+def test_schedule_migration_saturates_group(simple_rounds, simple_migration):
+    assert simple_rounds.find_scheduling_round(simple_migration) == 0
+    simple_rounds.schedule_migration(simple_migration, 0)
+    assert simple_rounds.get_num_rounds() == 1
+    assert simple_rounds.get_saturated_mask(0) == 1
+    assert simple_rounds.get_remaining_capacity('c0', 0) == pytest.approx(1.7)
+    assert simple_rounds.can_schedule_migration(
+        make_migration('s2', 'c1', 'c0', 1.6, set()), 0)
+    assert not simple_rounds.can_schedule_migration(
+        make_migration('s3', 'c1', 'c0', 1.8, set()), 0)
+    assert simple_rounds.find_scheduling_round(simple_migration) == 1
+
+def test_find_scheduling_round_multi_round(complex_rounds, simple_migration,
+                                           complex_migration):
+    complex_rounds.schedule_migration(complex_migration, 0)
+    complex_rounds.schedule_migration(simple_migration, 1)
+    assert complex_rounds.get_saturated_mask(0) == 0b010
+    assert complex_rounds.get_saturated_mask(1) == 0
+    other = make_migration('s2', 'c2', 'c1', 1.0, {'g1'})
+    assert not complex_rounds.can_schedule_migration(other, 0)
+    assert complex_rounds.can_schedule_migration(other, 1)
+    assert complex_rounds.find_scheduling_round(other) == 1
+    too_large = make_migration('s4', 'c2', 'c1', 3.0, set())
+    assert complex_rounds.find_scheduling_round(too_large) == 2
+    assert complex_rounds.find_scheduling_rounds(
+        make_migration('s5', 'c1', 'c0', 1.0, {'g0'})) == [0, 1]
+
+def test_unschedule_migration(complex_rounds, simple_migration,
+                              complex_migration):
+    complex_rounds.schedule_migration(complex_migration, 0)
+    complex_rounds.schedule_migration(simple_migration, 0)
+    assert complex_rounds.get_saturated_mask(0) == 0b011
+    complex_rounds.unschedule_migration(complex_migration, 0)
+    assert complex_rounds.get_saturated_mask(0) == 0
+    assert complex_rounds.get_remaining_capacity('c1', 0) == pytest.approx(2.7)
+    assert complex_rounds.get_remaining_capacity('g0', 0) == 1
+    assert complex_rounds.find_scheduling_round(complex_migration) == 0
@@ -0,0 +1,74 @@
+import pytest
+from unittest.mock import MagicMock
+from MigrationScheduling.Model import BottleneckQueue
+
+
+def make_const(load_factor):
+    const = MagicMock()
+    const.get_load_factor = MagicMock(return_value=load_factor)
+    return const
+
+@pytest.fixture(scope="function")
+def empty_queue():
+    return BottleneckQueue({})
+
+@pytest.fixture(scope="function")
+def consts_dict():
+    return {'c0': make_const(0.5),
+            'c1': make_const(1.5),
+            'g0': make_const(1.5),
+            'g1': make_const(0.25)}
+
+
+def test_instantiation(consts_dict):
+    queue = BottleneckQueue(consts_dict)
+    assert queue.get_heap_size() == 4
+
+
+def test_empty_queue(empty_queue):
+    assert empty_queue.get_heap_size() == 0
+    assert empty_queue.get_bottleneck_constraint() == (None, None)
+
+
+def test_bottleneck_ties_broken_by_order(consts_dict):
+    queue = BottleneckQueue(consts_dict)
+    assert queue.get_bottleneck_constraint() == ('c1', consts_dict['c1'])
+
+
+def test_bottleneck_after_removal(consts_dict):
+    queue = BottleneckQueue(consts_dict)
+    del consts_dict['c1']
+    queue.update_constraint('c1')
+    assert queue.get_bottleneck_constraint() == ('g0', consts_dict['g0'])
+    assert queue.get_heap_size() == 3
+
+
+def test_bottleneck_after_load_change(consts_dict):
+    queue = BottleneckQueue(consts_dict)
+    consts_dict['c1'].get_load_factor.return_value = 0.1
+    consts_dict['g0'].get_load_factor.return_value = 0.3
+    queue.update_constraints(['c1', 'g0'])
+    assert queue.get_heap_size() == 6
+    assert queue.get_bottleneck_constraint() == ('c0', consts_dict['c0'])
+    assert queue.get_heap_size() == 4
+
+
+def test_removed_without_update_is_skipped(consts_dict):
+    queue = BottleneckQueue(consts_dict)
+    del consts_dict['c1']
+    del consts_dict['g0']
+    assert queue.get_bottleneck_constraint() == ('c0', consts_dict['c0'])
+
+
+def test_all_removed(consts_dict):
+    queue = BottleneckQueue(consts_dict)
+    consts_dict.clear()
+    assert queue.get_bottleneck_constraint() == (None, None)
+    assert queue.get_heap_size() == 0
+
+
+def test_unknown_constraint_is_ignored(consts_dict):
+    queue = BottleneckQueue(consts_dict)
+    queue.update_constraint('c7')
+    assert queue.get_heap_size() == 4
+    assert queue.get_bottleneck_constraint() == ('c1', consts_dict['c1'])
@@ -0,0 +1,119 @@
+import pytest
+import numpy as np
+from MigrationScheduling.Model import CapacityMatrix
+from MigrationScheduling.tests.helpers import make_migration
+
+
+@pytest.fixture(scope="function")
+def empty_matrix():
+    return CapacityMatrix({}, {})
+
+@pytest.fixture(scope="function")
+def simple_matrix():
+    return CapacityMatrix({'c0': 3.8}, {'g0': 1})
+
+@pytest.fixture(scope="function")
+def complex_matrix():
+    return CapacityMatrix({'c0': 5.9, 'c1': 2.7, 'c2': 11.9},
+                          {'g0': 2, 'g1': 1, 'g2': 5}, init_rounds=1)
+
+@pytest.fixture(scope="function")
+def resilient_matrix():
+    return CapacityMatrix({'c0': 5.9, 'c1': 2.7, 'c2': 11.9},
+                          {'g0': 2, 'g1': 1, 'g2': 5}, resiliency=True)
+
+@pytest.fixture(scope="function")
+def simple_migration():
+    return make_migration('s0', 'c1', 'c0', 2.1, {'g0'})
+
+@pytest.fixture(scope="function")
+def complex_migration():
+    return make_migration('s1', 'c0', 'c1', 1.5, {'g0', 'g1'})
+
+
+def test_instantiation_empty_matrix(empty_matrix):
+    assert empty_matrix.get_num_rounds() == 0
+    assert empty_matrix.get_num_constraints() == 0
+    assert empty_matrix.get_remaining_capacities().shape == (0, 0)
+
+def test_instantiation_complex_matrix(complex_matrix):
+    assert complex_matrix.get_num_rounds() == 0
+    assert complex_matrix.get_num_constraints() == 6
+    assert complex_matrix.get_constraint_idx('c1') == 1
+    assert complex_matrix.get_constraint_idx('g0') == 3
+    assert list(complex_matrix.get_base_capacities()) == [
+        5.9, 2.7, 11.9, 2.0, 1.0, 5.0]
+
+def test_get_migration_demands(complex_matrix, complex_migration):
+    cols, demands = complex_matrix.get_migration_demands(complex_migration)
+    assert dict(zip(cols, demands)) == {1: 1.5, 3: 1.0, 4: 1.0}
+    complex_matrix.get_migration_demands(complex_migration)
+    complex_migration.get_groups.assert_called_once()
+
+def test_get_migration_demands_with_resiliency(resilient_matrix,
+                                               complex_migration):
+    cols, demands = resilient_matrix.get_migration_demands(complex_migration)
+    assert dict(zip(cols, demands)) == {0: 1.5, 1: 1.5, 3: 1.0, 4: 1.0}
+
+def test_add_round_grows_matrix(complex_matrix):
+    for round_num in range(5):
+        assert complex_matrix.add_round() == round_num
+    rem_caps = complex_matrix.get_remaining_capacities()
+    assert rem_caps.shape == (5, 6)
+    assert np.all(rem_caps == complex_matrix.get_base_capacities())
+
+def test_find_scheduling_round_with_no_rounds(simple_matrix,
+                                              simple_migration):
+    assert simple_matrix.find_scheduling_round(simple_migration) == 0
+
+def test_schedule_migration_opens_round(simple_matrix, simple_migration):
+    simple_matrix.schedule_migration(simple_migration, 0)
+    assert simple_matrix.get_num_rounds() == 1
+    assert np.allclose(simple_matrix.get_remaining_capacities(),
+                       [[1.7, 0.0]])
+    assert not simple_matrix.can_schedule_migration(simple_migration, 0)
+    assert simple_matrix.find_scheduling_round(simple_migration) == 1
+
+def test_find_scheduling_round_multi_round(complex_matrix, simple_migration,
+                                           complex_migration):
+    complex_matrix.schedule_migration(complex_migration, 0)
+    complex_matrix.schedule_migration(simple_migration, 1)
+    assert complex_matrix.get_num_rounds() == 2
+    other = make_migration('s2', 'c2', 'c1', 1.0, {'g1'})
+    assert not complex_matrix.can_schedule_migration(other, 0)
+    assert complex_matrix.can_schedule_migration(other, 1)
+    assert complex_matrix.find_scheduling_round(other) == 1
+    large = make_migration('s3', 'c2', 'c1', 2.0, set())
+    assert complex_matrix.find_scheduling_round(large) == 1
+    too_large = make_migration('s4', 'c2', 'c1', 3.0, set())
+    assert complex_matrix.find_scheduling_round(too_large) == 2
+
+def test_find_scheduling_rounds(complex_matrix, simple_migration,
+                                complex_migration):
+    assert complex_matrix.find_scheduling_rounds(simple_migration) == []
+    complex_matrix.schedule_migration(complex_migration, 0)
+    complex_matrix.schedule_migration(simple_migration, 1)
+    complex_matrix.add_round()
+    assert complex_matrix.find_scheduling_rounds(
+        make_migration('s5', 'c1', 'c0', 1.0, {'g0'})) == [0, 1, 2]
+    assert complex_matrix.find_scheduling_rounds(
+        make_migration('s6', 'c2', 'c1', 2.0, set())) == [1, 2]
+    assert complex_matrix.find_scheduling_rounds(
+        make_migration('s7', 'c2', 'c1', 3.0, set())) == []
+    assert complex_matrix.get_remaining_capacity('c1', 0) == pytest.approx(1.2)
+    assert complex_matrix.get_remaining_capacity('g0', 1) == 1
+    assert complex_matrix.get_remaining_capacity('g2', 2) == 5
+
+def test_unschedule_migration(complex_matrix, simple_migration,
+                              complex_migration):
+    complex_matrix.schedule_migration(complex_migration, 0)
+    complex_matrix.schedule_migration(simple_migration, 0)
+    complex_matrix.schedule_migration(complex_migration, 1)
+    complex_matrix.unschedule_migration(complex_migration, 0)
+    assert complex_matrix.get_remaining_capacity('c1', 0) == pytest.approx(2.7)
+    assert complex_matrix.get_remaining_capacity('g0', 0) == 1
+    assert complex_matrix.get_remaining_capacity('g1', 0) == 1
+    assert complex_matrix.get_remaining_capacity('c0', 0) == pytest.approx(3.8)
+    assert complex_matrix.find_scheduling_round(complex_migration) == 0
+    complex_matrix.unschedule_migration(complex_migration, 1)
+    assert complex_matrix.find_scheduling_rounds(complex_migration) == [0, 1]
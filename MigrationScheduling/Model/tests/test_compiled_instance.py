@@ -0,0 +1,37 @@
+import pytest
+from MigrationScheduling.Model import CompiledInstance
+from MigrationScheduling.tests.helpers import make_migration
+
+
+@pytest.fixture(scope="function")
+def compiled():
+    return CompiledInstance({'c0': 5.9, 'c1': 2.7, 'c2': 11.9},
+                            {'g0': 2, 'g1': 1, 'g2': 5})
+
+@pytest.fixture(scope="function")
+def resilient_compiled():
+    return CompiledInstance({'c0': 5.9, 'c1': 2.7, 'c2': 11.9},
+                            {'g0': 2, 'g1': 1, 'g2': 5}, resiliency=True)
+
+def test_instantiation(compiled):
+    assert compiled.get_controller_idx('c1') == 1
+    assert compiled.get_group_idx('g2') == 2
+    assert compiled.get_controller_caps() == [5.9, 2.7, 11.9]
+    assert compiled.get_qos_caps() == [2, 1, 5]
+
+def test_compile_migration(compiled):
+    migration = make_migration('s1', 'c0', 'c2', 1.5, {'g0', 'g2'})
+    assert compiled.compile_migration(migration) == (
+        0b101, (0, 2), (2,), 1.5)
+    compiled.compile_migration(migration)
+    migration.get_groups.assert_called_once()
+
+def test_compile_migration_with_resiliency(resilient_compiled):
+    migration = make_migration('s1', 'c2', 'c1', 0.5, set())
+    assert resilient_compiled.compile_migration(migration) == (
+        0, (), (1, 2), 0.5)
+
+def test_compile_migration_unknown_group(compiled):
+    with pytest.raises(KeyError):
+        compiled.compile_migration(
+            make_migration('s1', 'c0', 'c2', 1.5, {'g7'}))
@@ -0,0 +1,60 @@
+import pytest
+from MigrationScheduling.Model import DisjointSets
+
+
+@pytest.fixture(scope="function")
+def empty_sets():
+    return DisjointSets()
+
+@pytest.fixture(scope="function")
+def chain_sets():
+    sets = DisjointSets()
+    for item in ['s0', 's1', 's2', 's3', 's4']:
+        sets.add(item)
+    sets.union('s0', 's1')
+    sets.union('s2', 's1')
+    sets.union('s3', 's4')
+    return sets
+
+
+def test_instantiation(empty_sets):
+    assert len(empty_sets) == 0
+    assert empty_sets.get_sets() == []
+
+
+def test_add(empty_sets):
+    empty_sets.add('s0')
+    empty_sets.add('s0')
+    assert len(empty_sets) == 1
+    assert empty_sets.find('s0') == 's0'
+    assert empty_sets.get_sets() == [['s0']]
+
+
+def test_find_adds_item(empty_sets):
+    assert empty_sets.find('c0') == 'c0'
+    assert len(empty_sets) == 1
+
+
+def test_union(chain_sets):
+    assert chain_sets.find('s0') == chain_sets.find('s2')
+    assert chain_sets.find('s3') == chain_sets.find('s4')
+    assert chain_sets.find('s0') != chain_sets.find('s3')
+    assert chain_sets.get_sets() == [['s0', 's1', 's2'], ['s3', 's4']]
+
+
+def test_union_by_size(chain_sets):
+    root = chain_sets.find('s0')
+    assert chain_sets.union('s3', 's0') == root
+    assert chain_sets.get_sets() == [['s0', 's1', 's2', 's3', 's4']]
+
+
+def test_union_same_set(chain_sets):
+    root = chain_sets.find('s1')
+    assert chain_sets.union('s0', 's2') == root
+    assert len(chain_sets.get_sets()) == 2
+
+
+def test_union_adds_items(empty_sets):
+    empty_sets.union('s0', 's1')
+    assert len(empty_sets) == 2
+    assert empty_sets.get_sets() == [['s0', 's1']]
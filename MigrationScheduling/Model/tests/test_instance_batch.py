@@ -0,0 +1,76 @@
+import numpy as np
+from unittest.mock import MagicMock
+from MigrationScheduling.Model import InstanceBatch
+from MigrationScheduling.tests.helpers import make_migration
+
+
+def make_const(getter, name, cap):
+    const = MagicMock()
+    setattr(const, getter, MagicMock(return_value=name))
+    const.get_cap = MagicMock(return_value=cap)
+    return const
+
+
+def make_instance(controller_caps, qos_caps, migrations):
+    instance_data = MagicMock()
+    instance_data.get_control_consts = MagicMock(
+        return_value=[make_const("get_controller", name, cap)
+                      for name, cap in controller_caps.items()])
+    instance_data.get_qos_consts = MagicMock(
+        return_value=[make_const("get_group", name, cap)
+                      for name, cap in qos_caps.items()])
+    instance_data.get_migrations = MagicMock(
+        return_value={migration.get_switch(): migration
+                      for migration in migrations})
+    return instance_data
+
+
+def make_instances():
+    instance0 = make_instance(
+        {'c0': 2.5, 'c1': 1.0}, {'g0': 1},
+        [make_migration('s0', 'c0', 'c1', 1.0, ['g0']),
+         make_migration('s1', 'c1', 'c0', 2.0, [])])
+    instance1 = make_instance(
+        {'c0': 3.0}, {'g0': 2, 'g1': 1},
+        [make_migration('s0', 'c0', 'c0', 1.5, ['g0', 'g1'])])
+    return [instance0, instance1]
+
+
+def test_empty_batch():
+    batch = InstanceBatch([])
+    assert batch.get_num_instances() == 0
+    assert batch.get_num_steps() == 0
+    assert batch.get_capacities().shape == (0, 0)
+
+
+def test_instantiation():
+    batch = InstanceBatch(make_instances())
+    assert batch.get_num_instances() == 2
+    assert batch.get_num_steps() == 2
+    assert np.array_equal(batch.get_capacities(),
+                          np.array([[2.5, 1.0, 1.0], [3.0, 2.0, 1.0]]))
+    assert np.array_equal(batch.get_num_migrations(), np.array([2, 1]))
+
+
+def test_step_entries():
+    batch = InstanceBatch(make_instances())
+    insts, cols, demands = batch.get_step_entries(0)
+    assert np.array_equal(insts, np.array([0, 0, 1, 1, 1]))
+    assert np.array_equal(cols, np.array([1, 2, 0, 1, 2]))
+    assert np.array_equal(demands, np.array([1.0, 1.0, 1.5, 1.0, 1.0]))
+    insts, cols, demands = batch.get_step_entries(1)
+    assert np.array_equal(insts, np.array([0]))
+    assert np.array_equal(cols, np.array([0]))
+    assert np.array_equal(demands, np.array([2.0]))
+
+
+def test_step_entries_with_resiliency():
+    batch = InstanceBatch(make_instances(), True)
+    insts, cols, demands = batch.get_step_entries(0)
+    assert np.array_equal(insts, np.array([0, 0, 0, 1, 1, 1]))
+    assert np.array_equal(cols, np.array([1, 0, 2, 0, 1, 2]))
+    assert np.array_equal(demands, np.array([1.0, 1.0, 1.0, 1.5, 1.0, 1.0]))
+    insts, cols, demands = batch.get_step_entries(1)
+    assert np.array_equal(insts, np.array([0, 0]))
+    assert np.array_equal(cols, np.array([0, 1]))
+    assert np.array_equal(demands, np.array([2.0, 2.0]))
@@ -0,0 +1,60 @@
+import pytest
+from unittest.mock import MagicMock
+from MigrationScheduling.Data import ConstraintDict
+from MigrationScheduling.Model import MigrationScores
+from MigrationScheduling.tests.helpers import make_migration
+
+
+@pytest.fixture(scope="function")
+def consts_dict():
+    return {'c0': ConstraintDict(2.0, 3.0, {'s0', 's1'}),
+            'c1': ConstraintDict(1.0, 0.5, {'s2'}),
+            'g0': ConstraintDict(1, 2, {'s0', 's2'}),
+            'g1': ConstraintDict(2, 2, {'s0', 's1'})}
+
+@pytest.fixture(scope="function")
+def scores(consts_dict):
+    data = MagicMock()
+    data.get_migrations = MagicMock(return_value={
+        's0': make_migration(dst='c0', groups={'g0', 'g1'}),
+        's1': make_migration(dst='c0', groups={'g1'}),
+        's2': make_migration(dst='c1', groups={'g0'})})
+    return MigrationScores(data, consts_dict)
+
+
+def test_instantiation(scores):
+    assert scores.get_num_migrations() == 3
+
+
+def test_score_without_exclusion(scores):
+    assert scores.get_score('s0', 'c1') == 2.0
+    assert scores.get_score('s1', 'g0') == 1.5
+    assert scores.get_score('s2', 'c0') == 2.0
+
+
+def test_score_with_exclusion(scores):
+    assert scores.get_score('s0', 'g0') == 1.5
+    assert scores.get_score('s1', 'c0') == 1.0
+    assert scores.get_score('s2', 'g0') == 0.5
+    assert scores.get_score('s0', 'g0') == 1.5
+
+
+def test_score_with_only_constraint_excluded(consts_dict):
+    data = MagicMock()
+    data.get_migrations = MagicMock(
+        return_value={'s2': make_migration(dst='c1', groups=set())})
+    scores = MigrationScores(data, consts_dict)
+    assert scores.get_score('s2', 'c1') == 0
+
+
+def test_score_after_loads_decrease(scores, consts_dict):
+    consts_dict['g0'].remove_switch('s2', 1)
+    consts_dict['c1'].remove_switch('s2', 0.5)
+    scores.remove_migration('s2')
+    assert scores.get_num_migrations() == 2
+    assert scores.get_score('s0', 'c1') == 1.5
+    consts_dict['c0'].remove_switch('s1', 2.5)
+    consts_dict['g1'].remove_switch('s1', 1)
+    scores.remove_migration('s1')
+    assert scores.get_score('s0', 'g1') == 1.0
+    assert scores.get_score('s0', 'g0') == 0.5
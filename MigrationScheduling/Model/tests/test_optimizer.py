@@ -0,0 +1,296 @@
+import pytest
+import gurobipy as gp
+from unittest.mock import MagicMock
+from MigrationScheduling import algorithms, specs
+from MigrationScheduling import exceptions as exc
+from MigrationScheduling.Model import Optimizer
+from MigrationScheduling.tests.helpers import build_instance
+
+
+@pytest.fixture(scope="function")
+def uniform_optimizer():
+    # eight interchangeable migrations into c0 and four into c1 sharing g0
+    migrations = [('s{}'.format(idx), 'c2', 'c0', 3.0) for idx in range(8)]
+    migrations += [('s{}'.format(idx), 'c2', 'c1', 1.0)
+                   for idx in range(8, 12)]
+    optimizer = Optimizer()
+    optimizer.set_model_data(build_instance(
+        {'g0': 1}, {'g0': ['s8', 's9', 's10', 's11']},
+        {'c0': 10.0, 'c1': 8.0, 'c2': 6.0}, migrations))
+    return optimizer
+
+
+def test_without_data():
+    with pytest.raises(exc.InstanceNotSpecified):
+        Optimizer().build_class_ip_model()
+
+
+def test_assignment_before_optimizing():
+    with pytest.raises(exc.ModelNotOptimized):
+        Optimizer().get_assignment()
+
+
+def test_num_rounds_before_optimizing():
+    with pytest.raises(exc.ModelNotOptimized):
+        Optimizer().get_num_rounds()
+
+
+@pytest.mark.parametrize("obj_val, num_rounds",
+                         [(1.9999999999999973, 3), (2.0000000000000004, 3),
+                          (1.5, 3), (0.0, 1)])
+def test_num_rounds_within_tolerance(obj_val, num_rounds):
+    optimizer = Optimizer()
+    optimizer._model = MagicMock(status=gp.GRB.OPTIMAL, objVal=obj_val)
+    assert optimizer.get_num_rounds() == num_rounds
+
+
+@pytest.mark.parametrize("resiliency", [False, True])
+def test_class_ip_matches_ip(uniform_optimizer, resiliency):
+    opt_val = uniform_optimizer.build_ip_model(resiliency, verbose=False)
+    assert len(uniform_optimizer.get_assignment()) == 12
+    class_val = uniform_optimizer.build_class_ip_model(
+        resiliency, verbose=False)
+    assert class_val == pytest.approx(opt_val)
+    assignment = uniform_optimizer.get_assignment()
+    assert len(assignment) == 12
+    schedule = algorithms.build_schedule(
+        uniform_optimizer.instance_data(), assignment, resiliency)
+    assert schedule.get_num_rounds() == uniform_optimizer.get_num_rounds()
+    for round_num in range(schedule.get_num_rounds()):
+        for const_name in ('c0', 'c1', 'c2', 'g0'):
+            assert schedule.get_remaining_capacity(
+                const_name, round_num) >= 0
+
+
+def test_class_ip_rounds(uniform_optimizer):
+    # g0 forces four rounds without resiliency. With resiliency c2 takes
+    # two migrations of load 3 or one with a migration of load 1 per round
+    assert uniform_optimizer.build_class_ip_model(verbose=False) == (
+        pytest.approx(3))
+    assert uniform_optimizer.build_class_ip_model(True, verbose=False) == (
+        pytest.approx(5))
+
+
+@pytest.mark.parametrize("resiliency", [False, True])
+def test_bounded_horizon_matches_ip(uniform_optimizer, resiliency):
+    opt_val = uniform_optimizer.build_ip_model(resiliency, verbose=False)
+    num_rounds = uniform_optimizer.get_num_rounds()
+    assert uniform_optimizer.build_ip_model(
+        resiliency, verbose=False, num_rounds=num_rounds) == (
+        pytest.approx(opt_val))
+    assignment = uniform_optimizer.get_assignment()
+    assert len(assignment) == 12
+    assert max(assignment.values()) < num_rounds
+    assert uniform_optimizer.build_class_ip_model(
+        resiliency, verbose=False, num_rounds=num_rounds) == (
+        pytest.approx(opt_val))
+    assert len(uniform_optimizer.get_assignment()) == 12
+
+
+def test_bounded_horizon_variables(uniform_optimizer):
+    uniform_optimizer.build_ip_model(verbose=False, num_rounds=4)
+    assert uniform_optimizer._model.NumVars == 12 * 4 + 1
+    uniform_optimizer.build_ip_model(verbose=False)
+    assert uniform_optimizer._model.NumVars == 12 * 12 + 1
+
+
+def test_horizon_too_short(uniform_optimizer):
+    with pytest.raises(exc.ModelNotOptimized):
+        uniform_optimizer.build_ip_model(verbose=False, num_rounds=3)
+
+
+def test_bounds_with_horizon(uniform_optimizer):
+    lb, ub = uniform_optimizer.get_model_bounds()
+    assert lb <= 4 and ub == 12
+    lb, ub = uniform_optimizer.get_model_bounds(num_rounds=5)
+    assert lb <= 4 and ub == 5
+
+
+def test_invalid_formulation(uniform_optimizer):
+    with pytest.raises(exc.IncorrectFormulation):
+        uniform_optimizer.build_ip_model(verbose=False, formulation="slack")
+
+
+@pytest.mark.parametrize("resiliency", [False, True])
+def test_rounds_formulation_matches_ip(uniform_optimizer, resiliency):
+    opt_val = uniform_optimizer.build_ip_model(resiliency, verbose=False)
+    num_constrs = uniform_optimizer._model.NumConstrs
+    assert uniform_optimizer.build_ip_model(
+        resiliency, verbose=False, formulation="rounds") == (
+        pytest.approx(opt_val))
+    assert uniform_optimizer._model.NumConstrs < num_constrs
+    schedule = algorithms.build_schedule(
+        uniform_optimizer.instance_data(),
+        uniform_optimizer.get_assignment(), resiliency)
+    assert schedule.get_num_migrations() == 12
+    assert schedule.get_num_rounds() == uniform_optimizer.get_num_rounds()
+
+
+def test_rounds_formulation_bounds(uniform_optimizer):
+    # g0 takes one of its four migrations per round, so the bound is the
+    # optimal four rounds
+    lb, _ = uniform_optimizer.get_model_bounds(formulation="rounds")
+    assert lb == 4
+    assert uniform_optimizer.get_model_bounds(formulation="lambda")[0] <= lb
+
+
+def test_rounds_formulation_with_no_load():
+    optimizer = Optimizer()
+    optimizer.set_model_data(build_instance(
+        {}, {}, {'c0': 2.0, 'c1': 10.0},
+        [('s0', 'c1', 'c0', 2.0), ('s1', 'c1', 'c0', 2.0),
+         ('s2', 'c1', 'c0', 0.0)]))
+    assert optimizer.build_ip_model(
+        verbose=False, formulation="rounds") == pytest.approx(1)
+    assignment = optimizer.get_assignment()
+    assert assignment['s2'] in (0, 1)
+    assert {assignment['s0'], assignment['s1']} == {0, 1}
+
+
+@pytest.mark.parametrize("formulation", sorted(specs.MODEL_FORMULATIONS))
+def test_start_schedule(uniform_optimizer, formulation):
+    data = uniform_optimizer.instance_data()
+    num_rounds, schedule = algorithms.vector_first_fit(
+        data, return_schedule=True)
+    opt_val = uniform_optimizer.build_ip_model(
+        verbose=False, num_rounds=num_rounds, formulation=formulation,
+        start_schedule=schedule)
+    assert opt_val == pytest.approx(3)
+    for switch, round_num in schedule.get_assignment().items():
+        i = data.get_switch_id(switch)
+        assert uniform_optimizer._x_vars[i, round_num].Start == 1.0
+        assert sum(uniform_optimizer._x_vars[i, r].Start
+                   for r in range(num_rounds)) == 1.0
+
+
+def test_start_schedule_beyond_horizon(uniform_optimizer):
+    # one round per migration
+    data = uniform_optimizer.instance_data()
+    schedule = algorithms.build_schedule(
+        data, {switch: round_num for round_num, switch
+               in enumerate(data.get_migrations())})
+    assert uniform_optimizer.build_ip_model(
+        verbose=False, num_rounds=4, start_schedule=schedule) == (
+        pytest.approx(3))
+    assert all(x_var.Start == gp.GRB.UNDEFINED
+               for x_var in uniform_optimizer._x_vars.values())
+
+
+@pytest.mark.parametrize("formulation", sorted(specs.MODEL_FORMULATIONS))
+@pytest.mark.parametrize("resiliency", [False, True])
+def test_symmetry_breaking_matches_ip(uniform_optimizer, formulation,
+                                      resiliency):
+    opt_val = uniform_optimizer.build_ip_model(resiliency, verbose=False)
+    assert uniform_optimizer.build_ip_model(
+        resiliency, verbose=False, formulation=formulation,
+        symmetry_breaking=True) == pytest.approx(opt_val)
+    schedule = algorithms.build_schedule(
+        uniform_optimizer.instance_data(),
+        uniform_optimizer.get_assignment(), resiliency)
+    assert schedule.get_num_migrations() == 12
+    assert schedule.get_num_rounds() == uniform_optimizer.get_num_rounds()
+
+
+def test_symmetry_breaking_order(uniform_optimizer):
+    data = uniform_optimizer.instance_data()
+    uniform_optimizer.build_ip_model(verbose=False, symmetry_breaking=True)
+    # the migrations of load 3 come first, so s0 is fixed in round 0 and
+    # s8 of load 1 can be in any of the first nine rounds
+    assert uniform_optimizer.get_assignment()['s0'] == 0
+    x_vars = uniform_optimizer._x_vars
+    s0, s8 = data.get_switch_id('s0'), data.get_switch_id('s8')
+    assert [x_vars[s0, r].UB for r in range(3)] == [1.0, 0.0, 0.0]
+    assert x_vars[s8, 8].UB == 1.0
+    assert x_vars[s8, 9].UB == 0.0
+
+
+def test_symmetry_breaking_start(uniform_optimizer):
+    # s0 starts in the last round and is renumbered into round 0
+    data = uniform_optimizer.instance_data()
+    _, schedule = algorithms.vector_first_fit(data, return_schedule=True)
+    assignment = schedule.get_assignment()
+    last_round = schedule.get_num_rounds() - 1
+    for switch, round_num in assignment.items():
+        if round_num == assignment['s0']:
+            assignment[switch] = last_round
+        elif round_num == last_round:
+            assignment[switch] = assignment['s0']
+    schedule = algorithms.build_schedule(data, assignment)
+    uniform_optimizer.build_ip_model(
+        verbose=False, start_schedule=schedule, symmetry_breaking=True)
+    x_vars = uniform_optimizer._x_vars
+    assert x_vars[data.get_switch_id('s0'), 0].Start == 1.0
+    assert all(x_var.Start <= x_var.UB for x_var in x_vars.values())
+
+
+def get_model_rows(optimizer):
+    # the name, sense, right-hand side and coefficients of every constraint,
+    # written as 'a x <= b', and the bounds of every variable. A constraint
+    # with no migrations is trivially satisfied and the side gurobi puts
+    # it on, or its right-hand side if it has no coefficients, may differ
+    model = optimizer._model
+    model.update()
+    matrix = model.getA().tocsr()
+    matrix.eliminate_zeros()
+    rows = []
+    for idx, constr in enumerate(model.getConstrs()):
+        row = matrix[idx]
+        sign = -1.0 if constr.Sense == '>' else 1.0
+        rows.append((constr.ConstrName, '=' if constr.Sense == '=' else '<',
+                     sign * constr.RHS if row.nnz else None,
+                     sorted((col, sign * coeff)
+                            for col, coeff in zip(row.indices, row.data))))
+    return rows, [(var.VarName, var.LB, var.UB, var.Obj)
+                  for var in model.getVars()], model.ObjCon
+
+
+@pytest.mark.parametrize("formulation", sorted(specs.MODEL_FORMULATIONS))
+@pytest.mark.parametrize("resiliency", [False, True])
+@pytest.mark.parametrize("is_ip", [False, True])
+def test_matrix_api_model(uniform_optimizer, formulation, resiliency,
+                          is_ip):
+    build_model = (uniform_optimizer.build_ip_model if is_ip
+                   else uniform_optimizer.build_lp_model)
+    opt_val = build_model(resiliency, verbose=False, num_rounds=6,
+                          formulation=formulation)
+    model_rows = get_model_rows(uniform_optimizer)
+    assert build_model(resiliency, verbose=False, num_rounds=6,
+                       formulation=formulation, matrix_api=True) == (
+        pytest.approx(opt_val))
+    assert get_model_rows(uniform_optimizer) == model_rows
+
+
+def test_matrix_api_with_no_load():
+    optimizer = Optimizer()
+    optimizer.set_model_data(build_instance(
+        {}, {}, {'c0': 2.0, 'c1': 10.0},
+        [('s0', 'c1', 'c0', 2.0), ('s1', 'c1', 'c0', 2.0),
+         ('s2', 'c1', 'c0', 0.0)]))
+    optimizer.build_ip_model(verbose=False, formulation="rounds")
+    model_rows = get_model_rows(optimizer)
+    assert optimizer.build_ip_model(
+        verbose=False, formulation="rounds", matrix_api=True) == (
+        pytest.approx(1))
+    assert get_model_rows(optimizer) == model_rows
+
+
+@pytest.mark.parametrize("matrix_api", [False, True])
+@pytest.mark.parametrize("resiliency", [False, True])
+def test_constraints_without_migrations_skipped(matrix_api, resiliency):
+    # c2 only loses switches, so its row is empty without resiliency, and
+    # g1 has no migrations
+    optimizer = Optimizer()
+    optimizer.set_model_data(build_instance(
+        {'g0': 1, 'g1': 1}, {'g0': ['s0', 's1'], 'g1': []},
+        {'c0': 2.0, 'c1': 2.0, 'c2': 2.0},
+        [('s0', 'c2', 'c0', 1.0), ('s1', 'c2', 'c1', 1.0)]))
+    optimizer.build_ip_model(
+        resiliency, verbose=False, matrix_api=matrix_api)
+    optimizer._model.update()
+    names = {constr.ConstrName for constr in optimizer._model.getConstrs()}
+    controller_idxs = {0, 1, 2} if resiliency else {0, 1}
+    assert {name for name in names if name.startswith("controller")} == {
+        "controller[{0}, {1}]".format(idx, r)
+        for idx in controller_idxs for r in range(2)}
+    assert {name for name in names if name.startswith("QoS")} == {
+        "QoS[0, 0]", "QoS[0, 1]"}
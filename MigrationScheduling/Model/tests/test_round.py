@@ -303,3 +303,41 @@ def test_print_migrations_multiple_migrations(complex_round):
     second_part2 = "s5 s3.\n"
     assert capturedOutput.getvalue() in [first_part + second_part1,
                                          first_part + second_part2]
+
+def test_unschedule_migration_no_resiliency(complex_round,
+                                            complex_migration):
+    complex_round.schedule_migration(complex_migration)
+    complex_round.unschedule_migration(complex_migration)
+    assert complex_round.get_remaining_controller_capacities() == {
+        'c0': 5.9, 'c1': 2.7, 'c2': 11.9}
+    assert complex_round.get_remaining_qos_capacities() == {
+        'g0': 2, 'g1': 1, 'g2': 5, 'g3': 0}
+    assert complex_round.get_scheduled_migrations() == set()
+
+def test_unschedule_migration_with_resiliency(complex_round,
+                                              complex_migration,
+                                              no_group_migration):
+    complex_round.schedule_migration(complex_migration, True)
+    complex_round.schedule_migration(no_group_migration)
+    complex_round.unschedule_migration(complex_migration, True)
+    rem_caps = complex_round.get_remaining_controller_capacities()
+    assert rem_caps['c0'] == pytest.approx(3.8)
+    assert rem_caps['c1'] == pytest.approx(2.7)
+    assert complex_round.get_remaining_qos_capacities()['g1'] == 1
+    assert complex_round.get_scheduled_migrations() == {'s0'}
+
+def test_change_capacity(simple_round, no_group_migration):
+    simple_round.schedule_migration(no_group_migration)
+    simple_round.change_capacity('c0', -2.0)
+    simple_round.change_capacity('g0', 1)
+    assert simple_round.get_remaining_controller_capacities()[
+        'c0'] == pytest.approx(-0.3)
+    assert simple_round.get_remaining_qos_capacities() == {'g0': 2}
+    assert not simple_round.can_schedule_migration(no_group_migration)
+
+def test_get_remaining_capacity(complex_round, complex_migration):
+    complex_round.schedule_migration(complex_migration)
+    assert complex_round.get_remaining_capacity('c1') == pytest.approx(1.7)
+    assert complex_round.get_remaining_capacity('c0') == 5.9
+    assert complex_round.get_remaining_capacity('g1') == 0
+    assert complex_round.get_remaining_capacity('g3') == 0
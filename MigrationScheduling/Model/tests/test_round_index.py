@@ -0,0 +1,121 @@
+import pytest
+from MigrationScheduling.Model import RoundIndex
+from MigrationScheduling.tests.helpers import make_migration
+
+
+@pytest.fixture(scope="function")
+def simple_index():
+    return RoundIndex({'c0': 3.8}, {'g0': 1})
+
+@pytest.fixture(scope="function")
+def complex_index():
+    return RoundIndex({'c0': 5.9, 'c1': 2.7, 'c2': 11.9},
+                      {'g0': 2, 'g1': 1, 'g2': 5}, init_rounds=1)
+
+@pytest.fixture(scope="function")
+def resilient_index():
+    return RoundIndex({'c0': 5.9, 'c1': 2.7, 'c2': 11.9},
+                      {'g0': 2, 'g1': 1, 'g2': 5}, resiliency=True)
+
+@pytest.fixture(scope="function")
+def simple_migration():
+    return make_migration('s0', 'c1', 'c0', 2.1, {'g0'})
+
+@pytest.fixture(scope="function")
+def complex_migration():
+    return make_migration('s1', 'c0', 'c1', 1.5, {'g0', 'g1'})
+
+
+def test_instantiation(simple_index, complex_index):
+    assert simple_index.get_num_rounds() == 0
+    assert simple_index.get_size() == 8
+    assert complex_index.get_size() == 1
+    assert complex_index.get_remaining_capacity('c1', 0) == 2.7
+    assert complex_index.get_remaining_capacity('g2', 3) == 5
+
+def test_get_migration_demands(complex_index, complex_migration):
+    demands = complex_index.get_migration_demands(complex_migration)
+    assert dict(demands) == {'c1': 1.5, 'g0': 1, 'g1': 1}
+    complex_index.get_migration_demands(complex_migration)
+    complex_migration.get_groups.assert_called_once()
+
+def test_get_migration_demands_with_resiliency(resilient_index,
+                                               complex_migration):
+    demands = resilient_index.get_migration_demands(complex_migration)
+    assert dict(demands) == {'c0': 1.5, 'c1': 1.5, 'g0': 1, 'g1': 1}
+
+def test_add_round_grows_index(complex_index):
+    for round_num in range(5):
+        assert complex_index.add_round() == round_num
+    assert complex_index.get_num_rounds() == 5
+    assert complex_index.get_size() == 8
+
+def test_find_scheduling_round_with_no_rounds(simple_index,
+                                              simple_migration):
+    assert simple_index.find_scheduling_round(simple_migration) == 0
+
+def test_schedule_migration_opens_round(simple_index, simple_migration):
+    simple_index.schedule_migration(simple_migration, 0)
+    assert simple_index.get_num_rounds() == 1
+    assert simple_index.get_remaining_capacity('c0', 0) == pytest.approx(1.7)
+    assert simple_index.get_remaining_capacity('g0', 0) == 0
+    assert simple_index.get_remaining_capacity('c0', 1) == 3.8
+    assert not simple_index.can_schedule_migration(simple_migration, 0)
+    assert simple_index.find_scheduling_round(simple_migration) == 1
+
+def test_find_scheduling_round_multi_round(complex_index, simple_migration,
+                                           complex_migration):
+    complex_index.schedule_migration(complex_migration, 0)
+    complex_index.schedule_migration(simple_migration, 1)
+    assert complex_index.get_num_rounds() == 2
+    other = make_migration('s2', 'c2', 'c1', 1.0, {'g1'})
+    assert not complex_index.can_schedule_migration(other, 0)
+    assert complex_index.can_schedule_migration(other, 1)
+    assert complex_index.find_scheduling_round(other) == 1
+    large = make_migration('s3', 'c2', 'c1', 2.0, set())
+    assert complex_index.find_scheduling_round(large) == 1
+    too_large = make_migration('s4', 'c2', 'c1', 3.0, set())
+    assert complex_index.find_scheduling_round(too_large) == 2
+
+def test_find_scheduling_round_skips_ahead(complex_index):
+    for round_num in range(6):
+        complex_index.schedule_migration(
+            make_migration('s{}'.format(round_num), 'c0', 'c1',
+                           2.0 if round_num % 2 else 0.5,
+                           {'g1'} if round_num < 3 else set()),
+            round_num)
+    assert complex_index.get_size() == 8
+    migration = make_migration('s9', 'c0', 'c1', 1.0, {'g1'})
+    assert complex_index.find_scheduling_round(migration) == 4
+    complex_index.schedule_migration(migration, 4)
+    assert complex_index.find_scheduling_round(migration) == 6
+
+def test_find_scheduling_rounds(complex_index, simple_migration,
+                                complex_migration):
+    assert complex_index.find_scheduling_rounds(simple_migration) == []
+    complex_index.schedule_migration(complex_migration, 0)
+    complex_index.schedule_migration(simple_migration, 1)
+    complex_index.add_round()
+    assert complex_index.find_scheduling_rounds(
+        make_migration('s5', 'c1', 'c0', 1.0, {'g0'})) == [0, 1, 2]
+    assert complex_index.find_scheduling_rounds(
+        make_migration('s6', 'c2', 'c1', 2.0, set())) == [1, 2]
+    assert complex_index.find_scheduling_rounds(
+        make_migration('s7', 'c2', 'c1', 3.0, set())) == []
+    assert complex_index.get_remaining_capacity('c1', 0) == pytest.approx(1.2)
+    assert complex_index.get_remaining_capacity('g0', 1) == 1
+    assert complex_index.get_remaining_capacity('g2', 2) == 5
+
+def test_unschedule_migration(complex_index, simple_migration,
+                              complex_migration):
+    complex_index.schedule_migration(complex_migration, 0)
+    complex_index.schedule_migration(simple_migration, 0)
+    complex_index.schedule_migration(complex_migration, 1)
+    complex_index.unschedule_migration(complex_migration, 0)
+    assert complex_index.get_remaining_capacity('c1', 0) == pytest.approx(2.7)
+    assert complex_index.get_remaining_capacity('g0', 0) == 1
+    assert complex_index.get_remaining_capacity('g1', 0) == 1
+    assert complex_index.get_remaining_capacity('c0', 0) == pytest.approx(3.8)
+    assert complex_index.find_scheduling_round(complex_migration) == 0
+    complex_index.unschedule_migration(complex_migration, 1)
+    assert complex_index.find_scheduling_rounds(complex_migration) == [0, 1]
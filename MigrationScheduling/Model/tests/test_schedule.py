@@ -0,0 +1,182 @@
+import pytest
+from MigrationScheduling import specs
+from MigrationScheduling import exceptions as exc
+from MigrationScheduling.Model import Schedule
+from MigrationScheduling.tests.helpers import make_migration
+
+
+CONTROL_CAPS = {'c0': 5.9, 'c1': 2.7, 'c2': 11.9}
+QOS_CAPS = {'g0': 2, 'g1': 1, 'g2': 5}
+
+
+@pytest.fixture(scope="function")
+def migrations():
+    return [make_migration('s0', 'c0', 'c1', 1.5, {'g0', 'g1'}),
+            make_migration('s1', 'c1', 'c0', 2.1, {'g0'}),
+            make_migration('s2', 'c2', 'c1', 1.0, {'g1'}),
+            make_migration('s3', 'c0', 'c1', 2.0, set()),
+            make_migration('s4', 'c1', 'c2', 3.0, {'g2'})]
+
+
+def test_instantiation():
+    schedule = Schedule(CONTROL_CAPS, QOS_CAPS)
+    assert schedule.get_backend() == "rounds"
+    assert not schedule.get_resiliency()
+    assert schedule.get_num_rounds() == 0
+    assert schedule.get_num_migrations() == 0
+    assert schedule.get_assignment() == {}
+
+
+def test_invalid_backend():
+    with pytest.raises(exc.IncorrectBackend):
+        Schedule(CONTROL_CAPS, QOS_CAPS, backend="invalid")
+
+
+@pytest.mark.parametrize("backend", sorted(specs.SCHEDULING_BACKENDS))
+def test_schedule_in_earliest_round(backend, migrations):
+    schedule = Schedule(CONTROL_CAPS, QOS_CAPS, False, backend)
+    rounds = [schedule.schedule_migration(migration)
+              for migration in migrations]
+    assert rounds == [0, 0, 1, 2, 0]
+    assert schedule.get_num_rounds() == 3
+    assert schedule.get_num_migrations() == 5
+    assert schedule.get_round_switches(0) == {'s0', 's1', 's4'}
+    assert schedule.get_switch_round('s3') == 2
+    assert schedule.is_scheduled('s2')
+    assert not schedule.is_scheduled('s5')
+    assert schedule.get_assignment() == {
+        's0': 0, 's1': 0, 's2': 1, 's3': 2, 's4': 0}
+
+
+@pytest.mark.parametrize("backend", sorted(specs.SCHEDULING_BACKENDS))
+def test_schedule_with_resiliency(backend, migrations):
+    schedule = Schedule(CONTROL_CAPS, QOS_CAPS, True, backend)
+    rounds = [schedule.schedule_migration(migration)
+              for migration in migrations]
+    assert rounds == [0, 1, 2, 3, 4]
+    assert not schedule.can_schedule_migration(migrations[1], 0)
+    assert schedule.can_schedule_migration(
+        make_migration('s5', 'c2', 'c0', 1.0, set()), 0)
+
+
+@pytest.mark.parametrize("backend", sorted(specs.SCHEDULING_BACKENDS))
+def test_schedule_in_given_round(backend, migrations):
+    schedule = Schedule(CONTROL_CAPS, QOS_CAPS, False, backend)
+    assert schedule.schedule_migration(migrations[0], 2) == 2
+    assert schedule.get_num_rounds() == 3
+    assert schedule.get_round_switches(0) == set()
+    assert schedule.find_scheduling_round(migrations[2]) == 0
+    assert not schedule.can_schedule_migration(migrations[2], 2)
+
+
+def test_print_rounds(migrations, capsys):
+    schedule = Schedule(CONTROL_CAPS, QOS_CAPS)
+    schedule.schedule_migration(migrations[0], 1)
+    schedule.schedule_migration(migrations[3], 1)
+    schedule.print_rounds()
+    assert capsys.readouterr().out == (
+        "No migrations scheduled in round 0.\n"
+        "Migrations completed in round 1: s0 s3.\n")
+
+
+@pytest.mark.parametrize("backend", sorted(specs.SCHEDULING_BACKENDS))
+def test_find_scheduling_rounds(backend, migrations):
+    schedule = Schedule(CONTROL_CAPS, QOS_CAPS, False, backend)
+    for migration in migrations[:4]:
+        schedule.schedule_migration(migration)
+    assert schedule.find_scheduling_rounds(migrations[4]) == [0, 1, 2]
+    assert schedule.find_scheduling_rounds(
+        make_migration('s6', 'c0', 'c1', 1.6, set())) == [1]
+    assert schedule.find_scheduling_rounds(
+        make_migration('s5', 'c0', 'c1', 3.0, set())) == []
+    assert schedule.get_remaining_capacity('c1', 1) == pytest.approx(1.7)
+    assert schedule.get_remaining_capacity('g0', 0) == 0
+    assert schedule.get_remaining_capacity('g2', 2) == 5
+
+
+@pytest.mark.parametrize("backend", sorted(specs.SCHEDULING_BACKENDS))
+def test_unschedule_migration(backend, migrations):
+    schedule = Schedule(CONTROL_CAPS, QOS_CAPS, False, backend)
+    for migration in migrations:
+        schedule.schedule_migration(migration)
+    assert schedule.get_migration('s2') is migrations[2]
+    assert schedule.unschedule_migration('s2') == 1
+    assert schedule.get_num_rounds() == 3
+    assert schedule.get_round_switches(1) == set()
+    assert not schedule.is_scheduled('s2')
+    assert schedule.get_num_migrations() == 4
+    assert schedule.get_remaining_capacity('c1', 1) == pytest.approx(2.7)
+    assert schedule.unschedule_migration('s0') == 0
+    assert schedule.find_scheduling_round(migrations[2]) == 0
+
+
+@pytest.mark.parametrize("backend", sorted(specs.SCHEDULING_BACKENDS))
+def test_remove_empty_rounds(backend, migrations):
+    schedule = Schedule(CONTROL_CAPS, QOS_CAPS, False, backend)
+    for migration in migrations:
+        schedule.schedule_migration(migration)
+    assert schedule.remove_empty_rounds() == 0
+    schedule.unschedule_migration('s2')
+    assert schedule.remove_empty_rounds() == 1
+    assert schedule.get_num_rounds() == 2
+    assert schedule.get_assignment() == {'s0': 0, 's1': 0, 's3': 1, 's4': 0}
+    assert schedule.get_remaining_capacity('c1', 1) == pytest.approx(0.7)
+    assert schedule.get_backend() == backend
+
+
+@pytest.mark.parametrize("backend", sorted(specs.SCHEDULING_BACKENDS))
+def test_copy(backend, migrations):
+    schedule = Schedule(CONTROL_CAPS, QOS_CAPS, True, "rounds")
+    schedule.schedule_migration(migrations[0], 1)
+    schedule.schedule_migration(migrations[4], 3)
+    schedule.unschedule_migration('s4')
+    copied = schedule.copy(backend)
+    assert copied.get_backend() == backend
+    assert copied.get_resiliency()
+    assert copied.get_num_rounds() == 4
+    assert copied.get_assignment() == {'s0': 1}
+    assert copied.get_remaining_capacity('c0', 1) == pytest.approx(4.4)
+    copied.schedule_migration(migrations[1], 0)
+    assert not schedule.is_scheduled('s1')
+    assert schedule.copy().get_backend() == "rounds"
+
+
+@pytest.mark.parametrize("backend", sorted(specs.SCHEDULING_BACKENDS))
+def test_find_scheduling_round_from_start(backend, migrations):
+    schedule = Schedule(CONTROL_CAPS, QOS_CAPS, False, backend)
+    for migration in migrations[:4]:
+        schedule.schedule_migration(migration)
+    assert schedule.find_scheduling_round(migrations[4]) == 0
+    assert schedule.find_scheduling_round(migrations[4], 2) == 2
+    assert schedule.find_scheduling_round(migrations[4], 3) == 3
+    other = make_migration('s6', 'c0', 'c1', 1.6, set())
+    assert schedule.find_scheduling_round(other, 2) == 3
+
+
+@pytest.mark.parametrize("backend", sorted(specs.SCHEDULING_BACKENDS))
+def test_change_capacity(backend, migrations):
+    schedule = Schedule(CONTROL_CAPS, QOS_CAPS, False, backend)
+    for migration in migrations:
+        schedule.schedule_migration(migration)
+    schedule.change_capacity('c1', -1.0)
+    schedule.change_capacity('g0', -1)
+    assert schedule.get_capacity('c1') == pytest.approx(1.7)
+    assert schedule.get_capacity('g0') == 1
+    assert CONTROL_CAPS['c1'] == 2.7
+    assert schedule.is_qos_group('g0')
+    assert not schedule.is_qos_group('c1')
+    assert schedule.get_remaining_capacity('c1', 0) == pytest.approx(0.2)
+    assert schedule.get_remaining_capacity('c1', 2) == pytest.approx(-0.3)
+    assert schedule.get_remaining_capacity('g0', 0) == -1
+    assert not schedule.can_schedule_migration(
+        make_migration('s5', 'c0', 'c1', 0.1, set()), 2)
+    assert schedule.find_scheduling_round(
+        make_migration('s6', 'c1', 'c0', 1.0, {'g0'})) == 1
+    schedule.change_capacity('g0', 1)
+    assert schedule.find_scheduling_round(
+        make_migration('s7', 'c1', 'c0', 1.0, {'g0'})) == 1
+    schedule.schedule_migration(
+        make_migration('s8', 'c1', 'c0', 1.0, set()), 3)
+    assert schedule.get_remaining_capacity('g0', 3) == 2
+    assert schedule.copy().get_remaining_capacity('c1', 2) == pytest.approx(
+        -0.3)
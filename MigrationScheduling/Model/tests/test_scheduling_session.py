@@ -0,0 +1,68 @@
+import pytest
+from MigrationScheduling import specs
+from MigrationScheduling import exceptions as exc
+from MigrationScheduling.Model import SchedulingSession
+from MigrationScheduling.tests.helpers import make_migration
+
+
+CONTROL_CAPS = {'c0': 5.9, 'c1': 2.7, 'c2': 11.9}
+QOS_CAPS = {'g0': 2, 'g1': 1, 'g2': 5}
+
+
+@pytest.fixture(scope="function")
+def migrations():
+    return [make_migration('s0', 'c0', 'c1', 1.5, {'g0', 'g1'}),
+            make_migration('s1', 'c1', 'c0', 2.1, {'g0'}),
+            make_migration('s2', 'c2', 'c1', 1.0, {'g1'}),
+            make_migration('s3', 'c0', 'c1', 2.0, set()),
+            make_migration('s4', 'c1', 'c2', 3.0, {'g2'})]
+
+
+def test_instantiation():
+    session = SchedulingSession(CONTROL_CAPS, QOS_CAPS)
+    assert session.get_num_rounds() == 0
+    assert session.get_num_executed_rounds() == 0
+    assert session.get_schedule().get_backend() == "tree"
+    assert not session.is_frozen(0)
+
+
+def test_invalid_backend():
+    with pytest.raises(exc.IncorrectBackend):
+        SchedulingSession(CONTROL_CAPS, QOS_CAPS, backend="invalid")
+
+
+@pytest.mark.parametrize("backend", sorted(specs.SCHEDULING_BACKENDS))
+def test_add_migrations_in_batches(backend, migrations):
+    session = SchedulingSession(CONTROL_CAPS, QOS_CAPS, False, backend)
+    assert session.add_migrations(migrations[:2]) == {'s0': 0, 's1': 0}
+    assert session.add_migrations(iter(migrations[2:])) == {
+        's2': 1, 's3': 2, 's4': 0}
+    assert session.get_num_rounds() == 3
+
+
+@pytest.mark.parametrize("backend", sorted(specs.SCHEDULING_BACKENDS))
+def test_executed_rounds_are_frozen(backend, migrations):
+    session = SchedulingSession(CONTROL_CAPS, QOS_CAPS, False, backend)
+    session.add_migrations(migrations[:3])
+    assert session.execute_round() == {'s0', 's1'}
+    assert session.is_frozen(0)
+    assert not session.is_frozen(1)
+    assert session.add_migrations(migrations[3:]) == {'s3': 2, 's4': 1}
+    assert session.execute_round() == {'s2', 's4'}
+    assert session.execute_round() == {'s3'}
+    assert session.get_num_executed_rounds() == 3
+    with pytest.raises(exc.NoPendingRounds):
+        session.execute_round()
+    assert session.add_migrations(
+        [make_migration('s5', 'c1', 'c2', 1.0, set())]) == {'s5': 3}
+
+
+def test_add_duplicate_migration(migrations):
+    session = SchedulingSession(CONTROL_CAPS, QOS_CAPS)
+    session.add_migrations(migrations[:2])
+    with pytest.raises(exc.MigrationAlreadyScheduled):
+        session.add_migrations(migrations[2:3] + migrations[1:2])
+    assert not session.get_schedule().is_scheduled('s2')
+    with pytest.raises(exc.MigrationAlreadyScheduled):
+        session.add_migrations(migrations[3:4] * 2)
+    assert session.get_schedule().get_num_migrations() == 2
@@ -0,0 +1,133 @@
+import io
+import sys
+import pytest
+from MigrationScheduling.Model import SparseRound
+from MigrationScheduling.tests.helpers import make_migration
+
+
+@pytest.fixture(scope="function")
+def empty_round():
+    return SparseRound(0, {}, {})
+
+@pytest.fixture(scope="function")
+def simple_round():
+    return SparseRound(1, {'c0': 3.8}, {'g0': 1})
+
+@pytest.fixture(scope="function")
+def complex_round():
+    return SparseRound(0,
+                       {'c0': 5.9, 'c1': 2.7, 'c2': 11.9},
+                       {'g0': 2, 'g1': 1, 'g2': 5, 'g3': 0})
+
+@pytest.fixture(scope="function")
+def no_group_migration():
+    return make_migration('s0', 'c3', 'c0', 2.1, set())
+
+@pytest.fixture(scope="function")
+def simple_migration():
+    return make_migration('s3', 'c7', 'c2', 10.5, {'g0'})
+
+@pytest.fixture(scope="function")
+def complex_migration():
+    return make_migration('s1', 'c0', 'c1', 1.0, {'g0', 'g1', 'g2'})
+
+
+def test_uses_slots(simple_round):
+    with pytest.raises(AttributeError):
+        simple_round.extra = 1
+    assert not hasattr(simple_round, "__dict__")
+
+def test_instantiation_empty_round(empty_round):
+    assert empty_round.get_round_number() == 0
+    assert empty_round.get_remaining_controller_capacities() == {}
+    assert empty_round.get_remaining_qos_capacities() == {}
+    assert empty_round.get_scheduled_migrations() == set()
+    assert empty_round.get_used_constraints() == set()
+
+def test_instantiation_complex_round(complex_round):
+    assert complex_round.get_round_number() == 0
+    assert complex_round.get_remaining_controller_capacities() == {
+        'c0': 5.9, 'c1': 2.7, 'c2': 11.9}
+    assert complex_round.get_remaining_qos_capacities() == {
+        'g0': 2, 'g1': 1, 'g2': 5, 'g3': 0}
+    assert complex_round.get_used_constraints() == set()
+
+def test_capacities_not_copied():
+    controller_caps = {'c0': 3.8}
+    curr_round = SparseRound(0, controller_caps, {'g0': 1})
+    controller_caps['c0'] = 5.0
+    assert curr_round.get_remaining_capacity('c0') == 5.0
+
+def test_can_schedule_migration(simple_round, complex_round,
+                                no_group_migration, simple_migration,
+                                complex_migration):
+    assert simple_round.can_schedule_migration(no_group_migration)
+    assert complex_round.can_schedule_migration(simple_migration)
+    assert complex_round.can_schedule_migration(complex_migration)
+    assert complex_round.can_schedule_migration(complex_migration, True)
+
+def test_cant_schedule_migration(simple_round, complex_round,
+                                 simple_migration, complex_migration):
+    # c2 is unknown to the simple round
+    assert not simple_round.can_schedule_migration(simple_migration)
+    complex_migration.get_load.return_value = 3.0
+    assert not complex_round.can_schedule_migration(complex_migration)
+    complex_migration.get_load.return_value = 2.0
+    complex_migration.get_dst_controller.return_value = 'c2'
+    complex_migration.get_groups.return_value = {'g3'}
+    assert not complex_round.can_schedule_migration(complex_migration)
+
+def test_cant_schedule_src_with_resiliency(complex_round, complex_migration):
+    complex_migration.get_src_controller.return_value = 'c1'
+    complex_migration.get_dst_controller.return_value = 'c2'
+    complex_migration.get_load.return_value = 3.0
+    assert complex_round.can_schedule_migration(complex_migration)
+    assert not complex_round.can_schedule_migration(complex_migration, True)
+
+def test_schedule_migration(complex_round, complex_migration):
+    complex_round.schedule_migration(complex_migration)
+    assert complex_round.get_scheduled_migrations() == {'s1'}
+    assert complex_round.get_used_constraints() == {'c1', 'g0', 'g1', 'g2'}
+    assert complex_round.get_remaining_capacity('c1') == pytest.approx(1.7)
+    assert complex_round.get_remaining_capacity('c0') == 5.9
+    assert complex_round.get_remaining_qos_capacities() == {
+        'g0': 1, 'g1': 0, 'g2': 4, 'g3': 0}
+    assert not complex_round.can_schedule_migration(complex_migration)
+
+def test_schedule_migration_with_resiliency(complex_round, complex_migration):
+    complex_round.schedule_migration(complex_migration, True)
+    assert complex_round.get_used_constraints() == {
+        'c0', 'c1', 'g0', 'g1', 'g2'}
+    assert complex_round.get_remaining_capacity('c0') == pytest.approx(4.9)
+
+def test_unschedule_migration(complex_round, complex_migration,
+                              simple_migration):
+    complex_round.schedule_migration(simple_migration, True)
+    complex_round.schedule_migration(complex_migration, True)
+    complex_round.unschedule_migration(complex_migration, True)
+    assert complex_round.get_scheduled_migrations() == {'s3'}
+    assert complex_round.get_remaining_capacity('c1') == pytest.approx(2.7)
+    assert complex_round.get_remaining_capacity('c2') == pytest.approx(1.4)
+    assert complex_round.get_remaining_qos_capacities() == {
+        'g0': 1, 'g1': 1, 'g2': 5, 'g3': 0}
+    assert complex_round.get_used_constraints() == {'c0', 'c1', 'c2', 'c7',
+                                                    'g0'}
+
+def test_change_capacity(simple_round, no_group_migration):
+    simple_round.schedule_migration(no_group_migration)
+    simple_round.change_capacity('c0', -2.0)
+    assert simple_round.get_remaining_capacity('c0') == pytest.approx(-0.3)
+    simple_round.change_capacity('g0', 2)
+    assert simple_round.get_remaining_capacity('g0') == 3
+    assert not simple_round.can_schedule_migration(no_group_migration)
+
+def test_print_migrations(empty_round, simple_round, no_group_migration):
+    output = io.StringIO()
+    sys.stdout = output
+    empty_round.print_migrations()
+    simple_round.schedule_migration(no_group_migration)
+    simple_round.print_migrations()
+    sys.stdout = sys.__stdout__
+    assert output.getvalue() == (
+        "No migrations scheduled in round 0.\n"
+        "Migrations completed in round 1: s0.\n")
@@ -2,9 +2,20 @@
 load migration scheduling problem.
 
 """
+import heapq
 import random
-from MigrationScheduling import utils
-from MigrationScheduling.Model import Round
+import multiprocessing
+import numpy as np
+from timeit import default_timer as timer
+from MigrationScheduling import bounds, specs, utils
+from MigrationScheduling import validation as val
+from MigrationScheduling.Model import (
+    Round, Schedule, InstanceBatch, BottleneckQueue, MigrationScores)
+
+
+# the arguments of the seeded current bottleneck first runs made by a worker
+# process, set by `initialize_cbf_worker`.
+CBF_WORKER_ARGS = None
 
 
 def find_scheduling_round(existing_rounds, num_rounds,
@@ -94,26 +105,29 @@ def select_candidate_migrations(constraint_dict, num_candidates):
     num_candidates: int
         The number of candidate migrations to sample from `constraint_dict`
         among which a migration is chosen. A value of -1 indicates that all
-        migrations are considered as candidates.
+        migrations are considered as candidates. The switches are sorted,
+        so the candidates and their order only depend on the random seed.
 
     Returns
     -------
-    collection
-        A collection of strings representing the names of the switches for
-        the candidate migrations.
+    list
+        A list of strings representing the names of the switches for the
+        candidate migrations.
 
     """
     if (num_candidates == -1 or
         num_candidates >= len(constraint_dict.get_switches())):
-        return constraint_dict.get_switches()
+        return sorted(constraint_dict.get_switches())
     else:
-        return random.sample(constraint_dict.get_switches(), num_candidates)
+        return random.sample(
+            sorted(constraint_dict.get_switches()), num_candidates)
 
 def remove_migration_from_controller(migration, controller, consts_dict):
     """Removes `migration` from the controller `controller` in `consts_dict`.
 
     `consts_dict` is updated to reflect the removal of `migration` from
-    the controller named `controller`.
+    the controller named `controller`. A controller without a constraint in
+    `consts_dict`, as it counts none of the migrations, is left as is.
 
     Parameters
     ----------
@@ -135,6 +149,8 @@ def remove_migration_from_controller(migration, controller, consts_dict):
         from the constraint for `controller`.
 
     """
+    if controller not in consts_dict:
+        return consts_dict
     consts_dict[controller].remove_switch(
         migration.get_switch(), migration.get_load())
     if not (len(consts_dict[controller].get_switches())):
@@ -214,12 +230,14 @@ def remove_migration_from_constraints(migration, consts_dict,
 
 def schedule_migration_in_earliest_round(rounds, num_rounds, migration,
                                          controller_caps, qos_caps,
-                                         resiliency=False):
+                                         resiliency=False, round_index=None):
     """Schedules `migration` in the earliest round possible given `rounds`.
 
     `migration` is scheduled in the earliest round in `rounds` in which the
     migration fits. If it does not fit in any of the rounds, a new round is
-    created and migration is scheduled in that round.
+    created and migration is scheduled in that round. If `round_index` is
+    supplied the round is found by searching the index instead of probing
+    each round of `rounds`, and the index is updated with the migration.
 
     Parameters
     ----------
@@ -243,6 +261,9 @@ def schedule_migration_in_earliest_round(rounds, num_rounds, migration,
         considered. A value of True indicates that the load of a migration
         will be considered for both the source and destination controllers.
         Otherwise, the load is only considered for the destination controller.
+    round_index: RoundIndex
+        A `RoundIndex` tracking the same rounds as `rounds`. The default
+        value is None, in which case the rounds are probed in turn.
 
     Returns
     -------
@@ -254,8 +275,12 @@ def schedule_migration_in_earliest_round(rounds, num_rounds, migration,
     """
     round_count = num_rounds
     curr_rounds = [round for round in rounds]
-    schedule_round = find_scheduling_round(
-        rounds, round_count, migration, resiliency)
+    if round_index:
+        schedule_round = round_index.find_scheduling_round(migration)
+        round_index.schedule_migration(migration, schedule_round)
+    else:
+        schedule_round = find_scheduling_round(
+            rounds, round_count, migration, resiliency)
     if schedule_round == round_count:
         curr_rounds.append(Round(round_count, controller_caps, qos_caps))
         round_count += 1
@@ -268,7 +293,8 @@ def calculate_migration_load(migration, exclude_const, consts_dict):
 
     The maximum load among the constraints of `consts_dict` to which
     `migration` is associated is calculated. The constraint with name
-    `exclude_const` is ignored in the calculation.
+    `exclude_const` is ignored in the calculation, as are the constraints
+    of `migration` that are not in `consts_dict`.
 
     Parameters
     ----------
@@ -288,18 +314,21 @@ def calculate_migration_load(migration, exclude_const, consts_dict):
         {migration.get_dst_controller()})
     if exclude_const in migration_consts:
         migration_consts.remove(exclude_const)
-    for const_name in migration_consts:
+    for const_name in migration_consts.intersection(consts_dict):
         load = max(load, consts_dict[const_name].get_load_factor())
     return load
 
 
 def get_bottleneck_migration(migrations, bottleneck_const_name,
-                             instance_data, consts_dict):
+                             instance_data, consts_dict,
+                             migration_scores=None):
     """Selects the bottleneck migration among `migrations`.
 
     The bottleneck migration among `migrations` is the migration belonging
     to the constraint with the highest load among `consts_dict`, excluding
-    the constraint for `bottleneck_const_name`.
+    the constraint for `bottleneck_const_name`. If `migration_scores` is
+    supplied the load of each migration is read from the cached scores
+    instead of being recalculated from `consts_dict`.
 
     Parameters
     ----------
@@ -316,6 +345,10 @@ def get_bottleneck_migration(migrations, bottleneck_const_name,
         A dictionary of the constraints. The keys are strings representing
         the names of the constraints and the corresponding value is a
         `ConstraintDict` object for that constraint.
+    migration_scores: MigrationScores
+        A `MigrationScores` object caching the load of each migration. The
+        default value is None, in which case the loads are calculated from
+        `consts_dict`.
 
     Returns
     -------
@@ -328,20 +361,29 @@ def get_bottleneck_migration(migrations, bottleneck_const_name,
     max_load = 0
     for migration_name in migrations:
         curr_migration = instance_data.get_migration(migration_name)
-        curr_load = calculate_migration_load(
-            curr_migration, bottleneck_const_name, consts_dict)
+        if migration_scores:
+            curr_load = migration_scores.get_score(
+                migration_name, bottleneck_const_name)
+        else:
+            curr_load = calculate_migration_load(
+                curr_migration, bottleneck_const_name, consts_dict)
         if ((not bottleneck_migration) or (curr_load > max_load)):
             bottleneck_migration = curr_migration
             max_load = curr_load
     return bottleneck_migration
 
 
-def select_bottleneck_migration(instance_data, num_candidates, consts_dict):
+def select_bottleneck_migration(instance_data, num_candidates, consts_dict,
+                                bottleneck_queue=None, migration_scores=None):
     """Selects a bottleneck migration from `consts_dict`.
 
     A migration is selected from a bottleneck constraint among
     `consts_dict`. `num_candidates` candidate migrations
     are considered in the bottleneck constraint and the best is chosen.
+    If `bottleneck_queue` is supplied the bottleneck constraint is taken
+    from the queue rather than by scanning `consts_dict`, and if
+    `migration_scores` is supplied the candidates are compared using the
+    cached scores.
 
     Parameters
     ----------
@@ -356,6 +398,14 @@ def select_bottleneck_migration(instance_data, num_candidates, consts_dict):
         A dictionary of the constraints. The keys are strings representing
         the names of the constraints and the corresponding value is a
         `ConstraintDict` object for the constraint.
+    bottleneck_queue: BottleneckQueue
+        A `BottleneckQueue` tracking the load factors of the constraints in
+        `consts_dict`. The default value is None, in which case the
+        bottleneck constraint is found by scanning `consts_dict`.
+    migration_scores: MigrationScores
+        A `MigrationScores` object caching the load of each migration. The
+        default value is None, in which case the loads are calculated from
+        `consts_dict`.
 
     Returns
     -------
@@ -364,13 +414,18 @@ def select_bottleneck_migration(instance_data, num_candidates, consts_dict):
         bottleneck constraint among `consts_dict`.
 
     """
-    const_name, const = get_bottleneck_constraint(consts_dict)
+    if bottleneck_queue:
+        const_name, const = bottleneck_queue.get_bottleneck_constraint()
+    else:
+        const_name, const = get_bottleneck_constraint(consts_dict)
     candidate_migrations = select_candidate_migrations(const, num_candidates)
     return get_bottleneck_migration(
-        candidate_migrations, const_name, instance_data, consts_dict)
+        candidate_migrations, const_name, instance_data,
+        consts_dict, migration_scores)
 
 
-def vector_first_fit(instance_data, resiliency=False):
+def vector_first_fit(instance_data, resiliency=False, backend="rounds",
+                     return_schedule=False):
     """Runs the vectorized version of the first fit algorithm.
 
     The vectorized first fit algorithm is inspired by the algorithm of the
@@ -399,25 +454,498 @@ def vector_first_fit(instance_data, resiliency=False):
         considered. A value of True indicates that the load of a migration
         will be considered for both the source and destination controllers.
         Otherwise, the load is only considered for the destination controller.
+    backend: str
+        A string identifying how the remaining capacity of the rounds is
+        tracked. A value of 'rounds' uses a list of `Round` objects, a
+        value of 'sparse' uses a list of `SparseRound` objects, storing only
+        the constraints used in each round, a value of 'matrix' uses a
+        `CapacityMatrix`, checking every round for
+        a migration with a single vectorized comparison, a value of 'tree'
+        uses a `RoundIndex`, searching the rounds in logarithmic time per
+        constraint, and a value of 'bitset' uses a `BitsetRounds`, checking
+        the QoS groups of a migration in a round with a single AND. The
+        default value is 'rounds'.
+    return_schedule: bool
+        A boolean value indicating whether the `Schedule` built by the
+        algorithm is returned along with the number of rounds. The default
+        value is False.
+
+    Raises
+    ------
+    IncorrectBackend
+        If `backend` is not one of the backends in
+        `specs.SCHEDULING_BACKENDS`.
 
     Returns
     -------
-    int
+    int or (int, Schedule)
         An integer representing the number of rounds used by the algorithm
         to schedule the load migration instance specified by `instance_data`.
+        If `return_schedule` is True, the `Schedule` of the migrations is
+        also returned.
 
     """
-    rounds = []
-    num_rounds = 0
     controller_caps, qos_caps = utils.get_cap_dicts(instance_data)
+    schedule = Schedule(controller_caps, qos_caps, resiliency, backend)
     for migration in instance_data.get_migrations().values():
-        rounds, num_rounds = schedule_migration_in_earliest_round(
-            rounds, num_rounds, migration,
-            controller_caps, qos_caps, resiliency)
+        schedule.schedule_migration(migration)
+    if return_schedule:
+        return schedule.get_num_rounds(), schedule
+    return schedule.get_num_rounds()
+
+
+def get_class_fit_count(schedule, migration, round_num=None):
+    """The number of copies of `migration` that fit in round `round_num`.
+
+    Parameters
+    ----------
+    schedule: Schedule
+        The `Schedule` in which the migrations are placed.
+    migration: Migration
+        A `Migration` object representing a class of interchangeable
+        migrations.
+    round_num: int
+        An integer representing the index of a round of `schedule`. The
+        default value is None, in which case an empty round is considered.
+
+    Returns
+    -------
+    int or None
+        An integer representing the largest number of migrations of the
+        class of `migration` that fit together in the round, or None if
+        the number is unbounded because `migration` places no demand on
+        any of its constraints with a finite capacity.
+
+    """
+    fit_count = None
+    for const_name in utils.get_migration_constraints(
+        migration, schedule.get_resiliency()):
+        demand = get_constraint_demand(schedule, migration, const_name)
+        if demand > 0:
+            if round_num is None:
+                remaining = schedule.get_capacity(const_name)
+            else:
+                remaining = schedule.get_remaining_capacity(
+                    const_name, round_num)
+            if np.isinf(remaining):
+                continue
+            count = max(0, int(np.floor(
+                remaining / demand + specs.BOUND_TOLERANCE)))
+            fit_count = count if fit_count is None else min(fit_count, count)
+    return fit_count
+
+
+def class_first_fit(instance_data, resiliency=False, backend="rounds",
+                    return_schedule=False):
+    """Runs the first fit algorithm over classes of migrations.
+
+    The migrations are grouped into classes of interchangeable migrations
+    by `InstanceData.get_migration_classes`. The classes are considered in
+    turn and, for each round in order, as many of the unscheduled
+    migrations of the class are placed in the round as fit there, so the
+    rounds are searched once per class rather than once per migration. The
+    remaining migrations are placed in new rounds in the same way. A
+    migration that does not fit in an empty round is placed alone in a new
+    round, as in `vector_first_fit`.
+
+    Parameters
+    ----------
+    instance_data: InstanceData
+        An `InstanceData` object representing the data for a load migration
+        scheduling instance, on which the algorithm is run.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. A value of True indicates that the load of a migration
+        will be considered for both the source and destination controllers.
+        Otherwise, the load is only considered for the destination controller.
+    backend: str
+        A string identifying how the remaining capacity of the rounds is
+        tracked. The default value is 'rounds'.
+    return_schedule: bool
+        A boolean value indicating whether the `Schedule` built by the
+        algorithm is returned along with the number of rounds. The default
+        value is False.
+
+    Raises
+    ------
+    IncorrectBackend
+        If `backend` is not one of the backends in
+        `specs.SCHEDULING_BACKENDS`.
+
+    Returns
+    -------
+    int or (int, Schedule)
+        An integer representing the number of rounds used by the algorithm
+        to schedule the load migration instance specified by `instance_data`.
+        If `return_schedule` is True, the `Schedule` of the migrations is
+        also returned.
+
+    """
+    controller_caps, qos_caps = utils.get_cap_dicts(instance_data)
+    schedule = Schedule(controller_caps, qos_caps, resiliency, backend)
+    for migration_class in instance_data.get_migration_classes(resiliency):
+        switches = migration_class.get_switches()
+        placed = 0
+        round_num = 0
+        while placed < len(switches):
+            if round_num < schedule.get_num_rounds():
+                fit_count = get_class_fit_count(
+                    schedule, migration_class.get_migration(), round_num)
+            else:
+                fit_count = get_class_fit_count(
+                    schedule, migration_class.get_migration())
+                fit_count = 1 if fit_count == 0 else fit_count
+            if fit_count is None:
+                fit_count = len(switches)
+            for switch in switches[placed:placed + fit_count]:
+                schedule.schedule_migration(
+                    instance_data.get_migration(switch), round_num)
+            placed += fit_count
+            round_num += 1
+    if return_schedule:
+        return schedule.get_num_rounds(), schedule
+    return schedule.get_num_rounds()
+
+
+def select_placement_round(schedule, migration, placement, demands,
+                           const_caps):
+    """The round of `schedule` chosen for `migration` by `placement`.
+
+    Parameters
+    ----------
+    schedule: Schedule
+        The `Schedule` in which `migration` is to be scheduled.
+    migration: Migration
+        A `Migration` object representing the migration to be scheduled.
+    placement: str
+        A string identifying the placement rule. A value of 'first' chooses
+        the earliest round in which `migration` fits. Otherwise, the score of
+        each round in which `migration` fits is calculated from the
+        normalized residual capacities of the constraints of `migration`,
+        that is the remaining capacity of each constraint divided by its
+        capacity. 'best' chooses the round with the smallest total residual
+        left after scheduling `migration`, 'worst' the round with the largest
+        total residual left, and 'dot' the round with the largest dot product
+        of the normalized demands and residuals. Ties are broken in favour of
+        the earliest round.
+    demands: dict
+        A dictionary in which the keys are strings representing the names of
+        the constraints involving `migration` and the corresponding value is
+        a float representing the normalized demand of `migration` on that
+        constraint.
+    const_caps: dict
+        A dictionary in which the keys are strings representing the names of
+        constraints and the corresponding value is the capacity of that
+        constraint in a single round.
+
+    Returns
+    -------
+    int
+        An integer representing the index of the round chosen for
+        `migration`. If it does not fit in any round then the number of
+        rounds is returned, signifying that a new round is needed.
+
+    """
+    if placement == "first":
+        return schedule.find_scheduling_round(migration)
+    best_round = schedule.get_num_rounds()
+    best_score = None
+    for round_num in schedule.find_scheduling_rounds(migration):
+        residuals = {const_name: schedule.get_remaining_capacity(
+                        const_name, round_num) / const_caps[const_name]
+                     for const_name in demands}
+        if placement == "dot":
+            score = -sum(demands[const_name] * residual
+                         for const_name, residual in residuals.items())
+        else:
+            score = sum(residual - demands[const_name]
+                        for const_name, residual in residuals.items())
+            if placement == "worst":
+                score = -score
+        if best_score is None or score < best_score:
+            best_round, best_score = round_num, score
+    return best_round
+
+
+def ordered_vector_fit(instance_data, ordering="input", placement="first",
+                       resiliency=False, backend="rounds",
+                       return_schedule=False):
+    """Runs a variant of the vectorized first fit algorithm.
+
+    The migrations are taken in the order given by `ordering` and each is
+    scheduled in the round chosen by `placement` among the rounds in which
+    it fits. If it fits in no round, a new round is added for it. With the
+    'input' ordering and the 'first' placement this is `vector_first_fit`.
+    All combinations find the rounds in which a migration fits through the
+    capacity tracking of `backend`.
+
+    Parameters
+    ----------
+    instance_data: InstanceData
+        An `InstanceData` object representing the data for a load migration
+        scheduling instance, on which the algorithm is run.
+    ordering: str
+        A string identifying the order in which migrations are scheduled.
+        See `utils.order_migrations`. The default value is 'input'.
+    placement: str
+        A string identifying the rule used to choose the round of each
+        migration. See `select_placement_round`. The default value is
+        'first'.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. A value of True indicates that the load of a migration
+        will be considered for both the source and destination controllers.
+        Otherwise, the load is only considered for the destination controller.
+    backend: str
+        A string identifying how the remaining capacity of the rounds is
+        tracked. The default value is 'rounds'.
+    return_schedule: bool
+        A boolean value indicating whether the `Schedule` built by the
+        algorithm is returned along with the number of rounds. The default
+        value is False.
+
+    Raises
+    ------
+    IncorrectOrdering
+        If `ordering` is not one of the orderings in
+        `specs.MIGRATION_ORDERINGS`.
+    IncorrectPlacement
+        If `placement` is not one of the rules in `specs.PLACEMENT_RULES`.
+    IncorrectBackend
+        If `backend` is not one of the backends in
+        `specs.SCHEDULING_BACKENDS`.
+
+    Returns
+    -------
+    int or (int, Schedule)
+        An integer representing the number of rounds used by the algorithm
+        to schedule the load migration instance specified by `instance_data`.
+        If `return_schedule` is True, the `Schedule` of the migrations is
+        also returned.
+
+    """
+    val.validate_placement(placement)
+    migrations = utils.order_migrations(instance_data, ordering, resiliency)
+    controller_caps, qos_caps = utils.get_cap_dicts(instance_data)
+    const_caps = {**controller_caps, **qos_caps}
+    schedule = Schedule(controller_caps, qos_caps, resiliency, backend)
+    for migration in migrations:
+        demands = {}
+        if placement != "first":
+            demands = utils.get_normalized_demands(
+                migration, controller_caps, qos_caps, resiliency)
+        schedule.schedule_migration(migration, select_placement_round(
+            schedule, migration, placement, demands, const_caps))
+    if return_schedule:
+        return schedule.get_num_rounds(), schedule
+    return schedule.get_num_rounds()
+
+
+def build_conflict_masks(instance_data, switches, resiliency=False):
+    """The conflicts and QoS groups of `switches` as integer bitsets.
+
+    Switch `switches[i]` is represented by bit i of a bitset. Two migrations
+    conflict if they cannot be scheduled in the same round, as given by
+    `bounds.build_conflict_graph`.
+
+    Parameters
+    ----------
+    instance_data: InstanceData
+        An `InstanceData` object representing the data for a load migration
+        scheduling instance.
+    switches: list
+        A list of strings representing the names of the switches being
+        migrated, giving the bit of each switch.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. A value of True indicates that the load of a migration
+        will be considered for both the source and destination controllers.
+        Otherwise, the load is only considered for the destination controller.
+
+    Returns
+    -------
+    list, dict
+        A list with one integer per switch whose set bits are the switches
+        conflicting with that switch, and a dictionary in which the keys are
+        strings representing the names of the QoS groups and the
+        corresponding value is an integer whose set bits are the switches in
+        that group.
+
+    """
+    switch_bits = {switch: 1 << idx for idx, switch in enumerate(switches)}
+    conflicts = bounds.build_conflict_graph(instance_data, resiliency)
+    conflict_masks = [
+        sum(switch_bits[other] for other in conflicts[switch])
+        for switch in switches]
+    group_masks = {
+        qos_const.get_group(): sum(
+            switch_bits[switch] for switch in qos_const.get_switches()
+            if switch in switch_bits)
+        for qos_const in instance_data.get_qos_consts()}
+    return conflict_masks, group_masks
+
+
+def degree_of_saturation_first(instance_data, resiliency=False,
+                               backend="rounds", return_schedule=False):
+    """Runs the degree of saturation first scheduling algorithm.
+
+    The algorithm is an adaptation of the DSATUR graph coloring heuristic,
+    treating rounds as colors. A round is blocked for a migration if the
+    migration conflicts with a migration scheduled in the round, or if one
+    of its QoS groups has no capacity left in the round. The saturation of a
+    migration is its number of blocked rounds. At each iteration the
+    unscheduled migration with the largest saturation is scheduled in the
+    earliest round that is not blocked and in which it fits, with ties
+    broken in favour of the migration with the most conflicts and then the
+    earliest migration. If it fits in no round, a new round is added for it.
+
+    Conflicts, QoS groups and blocked rounds are held as integer bitsets and
+    the migrations are kept in a lazily updated heap, so each scheduled
+    migration only updates the migrations it conflicts with or shares a
+    full QoS group with.
+
+    Parameters
+    ----------
+    instance_data: InstanceData
+        An `InstanceData` object representing the data for a load migration
+        scheduling instance, on which the algorithm is run.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. A value of True indicates that the load of a migration
+        will be considered for both the source and destination controllers.
+        Otherwise, the load is only considered for the destination controller.
+    backend: str
+        A string identifying how the remaining capacity of the rounds is
+        tracked. The default value is 'rounds'.
+    return_schedule: bool
+        A boolean value indicating whether the `Schedule` built by the
+        algorithm is returned along with the number of rounds. The default
+        value is False.
+
+    Raises
+    ------
+    IncorrectBackend
+        If `backend` is not one of the backends in
+        `specs.SCHEDULING_BACKENDS`.
+
+    Returns
+    -------
+    int or (int, Schedule)
+        An integer representing the number of rounds used by the algorithm
+        to schedule the load migration instance specified by `instance_data`.
+        If `return_schedule` is True, the `Schedule` of the migrations is
+        also returned.
+
+    """
+    controller_caps, qos_caps = utils.get_cap_dicts(instance_data)
+    schedule = Schedule(controller_caps, qos_caps, resiliency, backend)
+    migrations = instance_data.get_migrations()
+    switches = list(migrations.keys())
+    conflict_masks, group_masks = build_conflict_masks(
+        instance_data, switches, resiliency)
+    degrees = [bin(mask).count("1") for mask in conflict_masks]
+    blocked = [0] * len(switches)
+    saturation = [0] * len(switches)
+    unscheduled = (1 << len(switches)) - 1
+    heap = [(0, -degree, idx) for idx, degree in enumerate(degrees)]
+    heapq.heapify(heap)
+    while heap:
+        neg_saturation, _, idx = heapq.heappop(heap)
+        if not (unscheduled >> idx) & 1 or -neg_saturation != saturation[idx]:
+            continue
+        migration = migrations[switches[idx]]
+        round_num = schedule.get_num_rounds()
+        free = ~blocked[idx] & ((1 << round_num) - 1)
+        while free:
+            low_bit = free & -free
+            if schedule.can_schedule_migration(
+                migration, low_bit.bit_length() - 1):
+                round_num = low_bit.bit_length() - 1
+                break
+            free ^= low_bit
+        schedule.schedule_migration(migration, round_num)
+        unscheduled ^= 1 << idx
+        affected = conflict_masks[idx]
+        for group in migration.get_groups():
+            if schedule.get_remaining_capacity(group, round_num) < 1:
+                affected |= group_masks[group]
+        affected &= unscheduled
+        round_bit = 1 << round_num
+        while affected:
+            low_bit = affected & -affected
+            other = low_bit.bit_length() - 1
+            if not blocked[other] & round_bit:
+                blocked[other] |= round_bit
+                saturation[other] += 1
+                heapq.heappush(
+                    heap, (-saturation[other], -degrees[other], other))
+            affected ^= low_bit
+    if return_schedule:
+        return schedule.get_num_rounds(), schedule
+    return schedule.get_num_rounds()
+
+
+def batch_vector_first_fit(instances, resiliency=False, init_rounds=8):
+    """Runs the vectorized first fit algorithm on a batch of instances.
+
+    The instances are packed into an `InstanceBatch` and scheduled in
+    lockstep: at step i the i-th migration of every instance that has one is
+    scheduled in the first round of its instance in which it fits, using one
+    vectorized comparison across the batch. The remaining capacities of all
+    instances are kept in a single array indexed by instance, constraint and
+    round. The number of rounds found for each instance is the same as
+    `vector_first_fit` would find for it.
+
+    Parameters
+    ----------
+    instances: list
+        A list of `InstanceData` objects representing the instances on which
+        the algorithm is run.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. A value of True indicates that the load of a migration
+        will be considered for both the source and destination controllers.
+        Otherwise, the load is only considered for the destination controller.
+    init_rounds: int
+        An integer representing the number of rounds for which space is
+        initially allocated for each instance. The default value is 8.
+
+    Returns
+    -------
+    np.array
+        A 1-D integer array with the number of rounds used by the algorithm
+        to schedule each instance of `instances`, in the same order.
+
+    """
+    batch = InstanceBatch(instances, resiliency)
+    base_caps = batch.get_capacities()[:, :, np.newaxis]
+    rem_caps = np.repeat(base_caps, max(1, init_rounds), axis=2)
+    num_rounds = np.zeros(batch.get_num_instances(), dtype=int)
+    for step in range(batch.get_num_steps()):
+        entry_insts, entry_cols, entry_demands = batch.get_step_entries(step)
+        starts = np.flatnonzero(np.diff(entry_insts, prepend=-1))
+        insts = entry_insts[starts]
+        curr_rounds = num_rounds[insts]
+        max_rounds = curr_rounds.max()
+        if max_rounds:
+            fits = np.logical_and.reduceat(
+                rem_caps[entry_insts, entry_cols, :max_rounds] >=
+                entry_demands[:, np.newaxis], starts, axis=0)
+            curr_rounds = np.where(
+                fits.any(axis=1), fits.argmax(axis=1), curr_rounds)
+        if curr_rounds.max() >= rem_caps.shape[2]:
+            rem_caps = np.concatenate([rem_caps, np.repeat(
+                base_caps, rem_caps.shape[2], axis=2)], axis=2)
+        num_rounds[insts] = np.maximum(num_rounds[insts], curr_rounds + 1)
+        rem_caps[entry_insts, entry_cols, np.repeat(
+            curr_rounds, np.diff(starts, append=len(entry_insts)))] -= (
+                entry_demands)
     return num_rounds
 
 
-def current_bottleneck_first(instance_data, num_choices, resiliency=False):
+def current_bottleneck_first(instance_data, num_choices, resiliency=False,
+                             indexed=False, backend="rounds",
+                             return_schedule=False):
     """Runs the current bottleneck first scheduling algorithm.
 
     The current bottleneck first schedules one migration per iteration in
@@ -447,24 +975,587 @@ def current_bottleneck_first(instance_data, num_choices, resiliency=False):
         considered. A value of True indicates that the load of a migration
         will be considered for both the source and destination controllers.
         Otherwise, the load is only considered for the destination controller.
+    indexed: bool
+        A boolean value indicating whether the bottleneck constraint is
+        tracked with a `BottleneckQueue` instead of being found by scanning
+        every constraint on each iteration. Both modes schedule the same
+        migrations in the same order. The default value is False.
+    backend: str
+        A string identifying how the remaining capacity of the rounds is
+        tracked. The default value is 'rounds'.
+    return_schedule: bool
+        A boolean value indicating whether the `Schedule` built by the
+        algorithm is returned along with the number of rounds. The default
+        value is False.
+
+    Raises
+    ------
+    IncorrectBackend
+        If `backend` is not one of the backends in
+        `specs.SCHEDULING_BACKENDS`.
 
     Returns
     -------
-    int
+    int or (int, Schedule)
         An integer representing the number of rounds used by the algorithm
         to schedule the load migration instance specified by `instance_data`.
+        If `return_schedule` is True, the `Schedule` of the migrations is
+        also returned.
 
     """
-    rounds = []
-    num_rounds = 0
+    if indexed:
+        return indexed_current_bottleneck_first(
+            instance_data, num_choices, resiliency, backend, return_schedule)
     controller_caps, qos_caps = utils.get_cap_dicts(instance_data)
+    schedule = Schedule(controller_caps, qos_caps, resiliency, backend)
     constraints_dict = utils.get_constraints_dict(instance_data, resiliency)
     while constraints_dict:
         migration = select_bottleneck_migration(
             instance_data, num_choices, constraints_dict)
-        rounds, num_rounds = schedule_migration_in_earliest_round(
-            rounds, num_rounds, migration,
-            controller_caps, qos_caps, resiliency)
+        schedule.schedule_migration(migration)
         constraints_dict = remove_migration_from_constraints(
             migration, constraints_dict, resiliency)
-    return num_rounds
+    if return_schedule:
+        return schedule.get_num_rounds(), schedule
+    return schedule.get_num_rounds()
+
+
+def indexed_current_bottleneck_first(instance_data, num_choices,
+                                     resiliency=False, backend="rounds",
+                                     return_schedule=False):
+    """Runs current bottleneck first with a priority queue of constraints.
+
+    The algorithm schedules the same migrations in the same order as
+    `current_bottleneck_first`, but the constraint load factors are kept in
+    a `BottleneckQueue` and the scores of the candidate migrations are
+    cached in a `MigrationScores` object. After a migration is scheduled
+    only the entries of the constraints involving that migration are
+    refreshed, and the cached scores of the migrations sharing those
+    constraints are only refreshed when they are next compared. This makes
+    it practical to consider every migration of the bottleneck constraint as
+    a candidate on large instances.
+
+    Parameters
+    ----------
+    instance_data: InstanceData
+        An `InstanceData` object representing the data for a load migration
+        scheduling instance, on which the algorithm is run.
+    num_choices: int
+        An integer denoting the number of candidate migrations considered
+        when selecting a migration from the bottleneck constraint. The most
+        loaded migration among the candidates will be selected. A value of
+        -1 signifies to consider all migrations of the bottleneck constraint.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. A value of True indicates that the load of a migration
+        will be considered for both the source and destination controllers.
+        Otherwise, the load is only considered for the destination controller.
+    backend: str
+        A string identifying how the remaining capacity of the rounds is
+        tracked. The default value is 'rounds'.
+    return_schedule: bool
+        A boolean value indicating whether the `Schedule` built by the
+        algorithm is returned along with the number of rounds. The default
+        value is False.
+
+    Raises
+    ------
+    IncorrectBackend
+        If `backend` is not one of the backends in
+        `specs.SCHEDULING_BACKENDS`.
+
+    Returns
+    -------
+    int or (int, Schedule)
+        An integer representing the number of rounds used by the algorithm
+        to schedule the load migration instance specified by `instance_data`.
+        If `return_schedule` is True, the `Schedule` of the migrations is
+        also returned.
+
+    """
+    controller_caps, qos_caps = utils.get_cap_dicts(instance_data)
+    schedule = Schedule(controller_caps, qos_caps, resiliency, backend)
+    constraints_dict = utils.get_constraints_dict(instance_data, resiliency)
+    bottleneck_queue = BottleneckQueue(constraints_dict)
+    migration_scores = MigrationScores(instance_data, constraints_dict)
+    while constraints_dict:
+        migration = select_bottleneck_migration(
+            instance_data, num_choices, constraints_dict,
+            bottleneck_queue, migration_scores)
+        schedule.schedule_migration(migration)
+        constraints_dict = remove_migration_from_constraints(
+            migration, constraints_dict, resiliency)
+        bottleneck_queue.update_constraints(
+            utils.get_migration_constraints(migration, resiliency))
+        migration_scores.remove_migration(migration.get_switch())
+    if return_schedule:
+        return schedule.get_num_rounds(), schedule
+    return schedule.get_num_rounds()
+
+
+def build_schedule(instance_data, assignment, resiliency=False,
+                   backend="rounds"):
+    """Builds the `Schedule` of `instance_data` given by `assignment`.
+
+    Parameters
+    ----------
+    instance_data: InstanceData
+        An `InstanceData` object representing the data for a load migration
+        scheduling instance.
+    assignment: dict
+        A dictionary in which the keys are strings representing the names of
+        the switches of `instance_data` and the corresponding value is an
+        integer representing the index of the round of its migration.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. A value of True indicates that the load of a migration
+        will be considered for both the source and destination controllers.
+        Otherwise, the load is only considered for the destination controller.
+    backend: str
+        A string identifying how the remaining capacity of the rounds is
+        tracked. The default value is 'rounds'.
+
+    Returns
+    -------
+    Schedule
+        A `Schedule` in which the migration of each switch of `assignment`
+        is scheduled in its assigned round.
+
+    """
+    controller_caps, qos_caps = utils.get_cap_dicts(instance_data)
+    schedule = Schedule(controller_caps, qos_caps, resiliency, backend)
+    for switch, round_num in assignment.items():
+        schedule.schedule_migration(
+            instance_data.get_migration(switch), round_num)
+    return schedule
+
+
+def get_heuristic_upper_bound(instance_data, resiliency=False):
+    """An upper bound on the number of rounds from the heuristics.
+
+    The bound is the fewest rounds used by `vector_first_fit` and
+    `indexed_current_bottleneck_first`, which can be used to limit the
+    rounds of the optimization model.
+
+    Parameters
+    ----------
+    instance_data: InstanceData
+        An `InstanceData` object representing the data for a load migration
+        scheduling instance.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. A value of True indicates that the load of a migration
+        will be considered for both the source and destination controllers.
+        Otherwise, the load is only considered for the destination controller.
+
+    Returns
+    -------
+    int
+        An integer representing the number of rounds of the best heuristic
+        schedule of `instance_data`.
+
+    """
+    return min(vector_first_fit(instance_data, resiliency),
+               indexed_current_bottleneck_first(
+                   instance_data, specs.CBF_CHOICES, resiliency))
+
+
+def initialize_cbf_worker(instance_data, num_choices, resiliency=False):
+    """Stores the arguments used by `run_seeded_cbf` in this process.
+
+    This is used as the initializer of the worker processes of
+    `multi_start_current_bottleneck_first`, so that the instance is passed
+    to each worker once rather than once per run.
+
+    Parameters
+    ----------
+    instance_data: InstanceData
+        An `InstanceData` object representing the data for a load migration
+        scheduling instance.
+    num_choices: int
+        An integer representing the number of candidate migrations sampled
+        from the bottleneck constraint.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. The default value is False.
+
+    Returns
+    -------
+    None
+
+    """
+    global CBF_WORKER_ARGS
+    CBF_WORKER_ARGS = (instance_data, num_choices, resiliency)
+
+
+def run_seeded_cbf(seed):
+    """Runs the current bottleneck first algorithm with seed `seed`.
+
+    The instance and settings are those stored by `initialize_cbf_worker`.
+
+    Parameters
+    ----------
+    seed: int
+        An integer representing the seed of the random number generator
+        used to sample candidate migrations.
+
+    Returns
+    -------
+    int, int, dict
+        The seed of the run, an integer representing the number of rounds
+        of the schedule found, and a dictionary mapping the name of each
+        switch to the index of the round of its migration.
+
+    """
+    instance_data, num_choices, resiliency = CBF_WORKER_ARGS
+    random.seed(seed)
+    num_rounds, schedule = indexed_current_bottleneck_first(
+        instance_data, num_choices, resiliency, return_schedule=True)
+    return seed, num_rounds, schedule.get_assignment()
+
+
+def collect_cbf_runs(runs, lower_bound):
+    """The best of `runs` and the number of rounds of each run.
+
+    The runs are consumed until they are exhausted or a run uses no more
+    than `lower_bound` rounds.
+
+    Parameters
+    ----------
+    runs: iterable
+        An iterable of the results of `run_seeded_cbf`.
+    lower_bound: int
+        An integer representing a lower bound on the number of rounds.
+
+    Returns
+    -------
+    dict, dict
+        The assignment of the run using the fewest rounds, with ties broken
+        in favour of the smallest seed, and a dictionary mapping the seed of
+        each consumed run to the number of rounds it used.
+
+    """
+    run_rounds = {}
+    best_run = None
+    for seed, num_rounds, assignment in runs:
+        run_rounds[seed] = num_rounds
+        if best_run is None or (num_rounds, seed) < best_run[:2]:
+            best_run = (num_rounds, seed, assignment)
+        if num_rounds <= lower_bound:
+            break
+    return (best_run[2] if best_run else {}), dict(sorted(run_rounds.items()))
+
+
+def multi_start_current_bottleneck_first(instance_data, num_choices,
+                                         num_runs=specs.CBF_NUM_RUNS,
+                                         resiliency=False, num_workers=None,
+                                         seed=specs.SEED_NUM,
+                                         lower_bound=None):
+    """Runs the current bottleneck first algorithm from several seeds.
+
+    Run i uses the seed `seed + i`, so the runs are reproducible. The runs
+    are shared among a pool of worker processes, each of which receives the
+    instance once when it starts. As soon as a run finds a schedule with no
+    more rounds than `lower_bound` the remaining runs are cancelled.
+
+    Parameters
+    ----------
+    instance_data: InstanceData
+        An `InstanceData` object representing the data for a load migration
+        scheduling instance, on which the algorithm is run.
+    num_choices: int
+        An integer representing the number of candidate migrations sampled
+        from the bottleneck constraint in each run.
+    num_runs: int
+        An integer representing the number of runs. The default value is
+        `specs.CBF_NUM_RUNS`.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. A value of True indicates that the load of a migration
+        will be considered for both the source and destination controllers.
+        Otherwise, the load is only considered for the destination controller.
+    num_workers: int
+        An integer representing the number of worker processes. A value of 1
+        makes the runs in the calling process. The default value is None,
+        in which case one worker is used per CPU.
+    seed: int
+        An integer representing the seed of the first run. The default value
+        is `specs.SEED_NUM`.
+    lower_bound: int
+        An integer representing a lower bound on the number of rounds. The
+        default value is None, in which case the bound given by
+        `bounds.get_lower_bound` is used.
+
+    Returns
+    -------
+    Schedule, dict
+        The `Schedule` of the best run and a dictionary mapping the seed of
+        each completed run to the number of rounds it used.
+
+    """
+    if lower_bound is None:
+        lower_bound = bounds.get_lower_bound(instance_data, resiliency)
+    seeds = [seed + run_idx for run_idx in range(num_runs)]
+    init_args = (instance_data, num_choices, resiliency)
+    if num_workers == 1:
+        initialize_cbf_worker(*init_args)
+        assignment, run_rounds = collect_cbf_runs(
+            map(run_seeded_cbf, seeds), lower_bound)
+    else:
+        with multiprocessing.Pool(num_workers, initialize_cbf_worker,
+                                  init_args) as pool:
+            assignment, run_rounds = collect_cbf_runs(
+                pool.imap_unordered(run_seeded_cbf, seeds), lower_bound)
+    return build_schedule(instance_data, assignment, resiliency), run_rounds
+
+
+def relocate_round_migrations(schedule, round_num):
+    """Tries to empty round `round_num` of `schedule`.
+
+    Each migration of the round is moved to the earliest other non-empty
+    round in which it fits. If some migration does not fit in any other
+    non-empty round, every migration moved is returned to round `round_num`
+    and the schedule is left unchanged.
+
+    Parameters
+    ----------
+    schedule: Schedule
+        The `Schedule` being improved. It is updated in place.
+    round_num: int
+        An integer representing the index of the round to be emptied.
+
+    Returns
+    -------
+    bool
+        True if every migration of round `round_num` was moved to another
+        round. Otherwise, False.
+
+    """
+    moved = []
+    for switch in sorted(schedule.get_round_switches(round_num)):
+        migration = schedule.get_migration(switch)
+        schedule.unschedule_migration(switch)
+        target_rounds = [
+            other_round for other_round in
+            schedule.find_scheduling_rounds(migration)
+            if other_round != round_num and
+            schedule.get_round_switches(other_round)]
+        if not target_rounds:
+            schedule.schedule_migration(migration, round_num)
+            for moved_migration in moved:
+                schedule.unschedule_migration(moved_migration.get_switch())
+                schedule.schedule_migration(moved_migration, round_num)
+            return False
+        schedule.schedule_migration(migration, target_rounds[0])
+        moved.append(migration)
+    return True
+
+
+def compact_schedule(schedule):
+    """Moves the migrations of `schedule` into earlier rounds.
+
+    The rounds are visited in order and each of their migrations is moved
+    to the earliest round in which it fits, if that round is earlier than
+    its current round.
+
+    Parameters
+    ----------
+    schedule: Schedule
+        The `Schedule` being compacted. It is updated in place.
+
+    Returns
+    -------
+    int
+        An integer representing the number of migrations moved.
+
+    """
+    num_moved = 0
+    for round_num in range(1, schedule.get_num_rounds()):
+        for switch in sorted(schedule.get_round_switches(round_num)):
+            migration = schedule.get_migration(switch)
+            schedule.unschedule_migration(switch)
+            new_round = schedule.schedule_migration(migration)
+            num_moved += int(new_round != round_num)
+    return num_moved
+
+
+def eliminate_rounds(schedule, time_limit=specs.LOCAL_SEARCH_TIME_LIMIT,
+                     max_iterations=None, lower_bound=None):
+    """Improves `schedule` by removing rounds with a local search.
+
+    The search works on a copy of `schedule` using the 'matrix' backend, so
+    that checking whether a migration fits in a round only compares the
+    constraints of that migration. The rounds are tried in increasing order
+    of their number of migrations and the first round that can be emptied
+    by relocating its migrations to other rounds is emptied. This is
+    repeated until no round can be emptied, the budget is exhausted, or the
+    number of non-empty rounds reaches `lower_bound`. The migrations are
+    then compacted into earlier rounds and empty rounds are removed.
+
+    Parameters
+    ----------
+    schedule: Schedule
+        The `Schedule` to be improved. It is not modified.
+    time_limit: float
+        A float representing the number of seconds after which no further
+        rounds are tried. A value of None means there is no time limit. The
+        default value is `specs.LOCAL_SEARCH_TIME_LIMIT`.
+    max_iterations: int
+        An integer representing the maximum number of rounds tried. A value
+        of None means there is no limit. The default value is None.
+    lower_bound: int
+        An integer representing a lower bound on the number of rounds, such
+        as the bound given by `bounds.get_lower_bound`. The default value is
+        None, in which case the search does not stop early.
+
+    Returns
+    -------
+    Schedule
+        A `Schedule` with the same migrations as `schedule` using no more
+        rounds.
+
+    """
+    start = timer()
+    schedule = schedule.copy("matrix")
+    num_iterations = 0
+    improved = True
+    while improved:
+        improved = False
+        round_nums = sorted(
+            (round_num for round_num in range(schedule.get_num_rounds())
+             if schedule.get_round_switches(round_num)),
+            key=lambda round_num: len(schedule.get_round_switches(round_num)))
+        if lower_bound is not None and len(round_nums) <= lower_bound:
+            break
+        for round_num in round_nums:
+            if ((max_iterations is not None and
+                 num_iterations >= max_iterations) or
+                (time_limit is not None and timer() - start >= time_limit)):
+                break
+            num_iterations += 1
+            if relocate_round_migrations(schedule, round_num):
+                improved = True
+                break
+    compact_schedule(schedule)
+    schedule.remove_empty_rounds()
+    return schedule
+
+
+def get_constraint_demand(schedule, migration, const_name):
+    """The demand of `migration` on the constraint `const_name`.
+
+    Parameters
+    ----------
+    schedule: Schedule
+        The `Schedule` whose constraints are considered.
+    migration: Migration
+        The `Migration` object for which the demand is calculated.
+    const_name: str
+        A string representing the name of a controller or QoS group of
+        `schedule`.
+
+    Returns
+    -------
+    float
+        A float representing the capacity of `const_name` used by
+        `migration` in a round. This is 1 for a QoS group containing
+        `migration`, the load contribution of `migration` for a controller
+        and 0 if `migration` does not involve `const_name`.
+
+    """
+    if schedule.is_qos_group(const_name):
+        return 1 if migration.is_in_group(const_name) else 0
+    return utils.get_load_contribution(
+        migration, const_name, schedule.get_resiliency())
+
+
+def evict_overloaded_migrations(schedule, const_name, round_num):
+    """Removes migrations from an overloaded round of `schedule`.
+
+    If the remaining capacity of `const_name` in round `round_num` is
+    negative, the migrations of the round involving `const_name` are
+    removed in decreasing order of their demand on it until the remaining
+    capacity is no longer negative. This removes the fewest migrations
+    needed.
+
+    Parameters
+    ----------
+    schedule: Schedule
+        The `Schedule` from which the migrations are removed. It is modified
+        in place.
+    const_name: str
+        A string representing the name of a controller or QoS group of
+        `schedule`.
+    round_num: int
+        An integer representing the index of a round of `schedule`.
+
+    Returns
+    -------
+    list
+        A list of the `Migration` objects removed from the round.
+
+    """
+    if schedule.get_remaining_capacity(const_name, round_num) >= 0:
+        return []
+    demands = sorted(
+        ((get_constraint_demand(
+            schedule, schedule.get_migration(switch), const_name), switch)
+         for switch in schedule.get_round_switches(round_num)),
+        reverse=True)
+    evicted = []
+    for demand, switch in demands:
+        if (demand <= 0 or
+            schedule.get_remaining_capacity(const_name, round_num) >= 0):
+            break
+        evicted.append(schedule.get_migration(switch))
+        schedule.unschedule_migration(switch)
+    return evicted
+
+
+def repair_schedule(schedule, capacity_changes, start_round=0):
+    """Repairs `schedule` after the capacities of constraints change.
+
+    The capacity of each constraint in `capacity_changes` is changed in
+    every round of `schedule`. Only the rounds from `start_round` in which
+    a reduced constraint is left with negative remaining capacity are
+    repaired, by removing the fewest migrations needed with
+    `evict_overloaded_migrations`. The removed migrations are then
+    scheduled again in decreasing order of load, each in the earliest round
+    from `start_round` in which it fits, adding rounds as needed. Rounds
+    before `start_round`, such as rounds already executed, are not changed.
+
+    Parameters
+    ----------
+    schedule: Schedule
+        The `Schedule` being repaired. It is modified in place.
+    capacity_changes: dict
+        A dictionary in which the keys are strings representing the names of
+        controllers or QoS groups of `schedule` and the corresponding value
+        is a float representing the change in the capacity of that
+        constraint.
+    start_round: int
+        An integer representing the index of the first round that can be
+        changed. The default value is 0.
+
+    Returns
+    -------
+    dict
+        A dictionary in which the keys are strings representing the names of
+        the switches whose migrations were moved and the corresponding value
+        is an integer representing the index of the round in which the
+        migration of that switch is now scheduled.
+
+    """
+    for const_name, delta in capacity_changes.items():
+        schedule.change_capacity(const_name, delta)
+    evicted = []
+    for const_name, delta in capacity_changes.items():
+        if delta < 0:
+            for round_num in range(start_round, schedule.get_num_rounds()):
+                evicted.extend(evict_overloaded_migrations(
+                    schedule, const_name, round_num))
+    evicted.sort(key=lambda migration: migration.get_load(), reverse=True)
+    return {migration.get_switch(): schedule.schedule_migration(
+                migration, schedule.find_scheduling_round(
+                    migration, start_round))
+            for migration in evicted}
@@ -8,7 +8,7 @@ import pandas as pd
 import multiprocessing as mp
 from timeit import default_timer as timer
 from MigrationScheduling.Model import Optimizer
-from MigrationScheduling import algorithms, specs, utils
+from MigrationScheduling import algorithms, bounds, specs, utils
 
 
 def get_cores_and_instances_per_core(instance_count):
@@ -86,7 +86,89 @@ def initialize_and_join_processes(procs):
         proc.join()
 
 
-def build_heuristics_string(instance_data, resiliency=False):
+def run_heuristics(instance_data, resiliency=False, vff_result=None,
+                   lower_bound=None):
+    """Runs the heuristic algorithms on `instance_data`.
+
+    Current bottleneck first is not run if vector first fit already matches
+    the lower bound of the instance, in which case its number of rounds and
+    time are reported as NaN.
+
+    Parameters
+    ----------
+    instance_data: InstanceData
+        An `InstanceData` object specifying an instance of the load migration
+        scheduling problem.
+    resiliency: bool
+        A boolean indicating whether failure resilience is considered when
+        calculating solutions. The default value is False.
+    vff_result: tuple
+        A tuple of the number of rounds found by the vector first fit
+        algorithm for `instance_data` and the time taken to find it. The
+        default value is None, in which case the algorithm is run.
+    lower_bound: int
+        An integer representing a lower bound on the number of rounds for
+        `instance_data`. The default value is None, in which case it is
+        computed with `bounds.get_lower_bound`.
+
+    Returns
+    -------
+    list, Schedule
+        A list of tuples of the number of rounds found by each heuristic
+        algorithm and the time taken to find it, for vector first fit
+        followed by current bottleneck first. The `Schedule` with the
+        fewest rounds is also returned, with ties going to vector first
+        fit. The schedule of vector first fit is only available if the
+        algorithm is run.
+
+    """
+    vff_schedule = None
+    if vff_result is None:
+        start = timer()
+        vff, vff_schedule = algorithms.vector_first_fit(
+            instance_data, resiliency, return_schedule=True)
+        vff_time = timer() - start
+    else:
+        vff, vff_time = vff_result
+    if lower_bound is None:
+        lower_bound = bounds.get_lower_bound(instance_data, resiliency)
+    if vff <= lower_bound:
+        return [(vff, vff_time), (np.nan, np.nan)], vff_schedule
+
+    start = timer()
+    cbf, cbf_schedule = algorithms.current_bottleneck_first(
+        instance_data, specs.CBF_CHOICES, resiliency, return_schedule=True)
+    cbf_time = timer() - start
+
+    results = [(vff, vff_time), (cbf, cbf_time)]
+    if vff_schedule is not None and vff <= cbf:
+        return results, vff_schedule
+    return results, cbf_schedule
+
+
+def format_heuristic_results(results):
+    """Builds the heuristics string from `results`.
+
+    Parameters
+    ----------
+    results: list
+        A list of tuples of the number of rounds found by each heuristic
+        algorithm and the time taken to find it, as given by
+        `run_heuristics`.
+
+    Returns
+    -------
+    str
+        A space separated string of the number of rounds and time of each
+        result in `results`.
+
+    """
+    return " ".join("{0} {1}".format(num_rounds, run_time)
+                    for num_rounds, run_time in results)
+
+
+def build_heuristics_string(instance_data, resiliency=False,
+                            vff_result=None):
     """Builds the heuristics string for `instance_data`.
 
     The heuristics string is a space separated string containing the results
@@ -100,6 +182,10 @@ def build_heuristics_string(instance_data, resiliency=False):
     resiliency: bool
         A boolean indicating whether failure resilience is considered when
         calculating solutions. The default value is False.
+    vff_result: tuple
+        A tuple of the number of rounds found by the vector first fit
+        algorithm for `instance_data` and the time taken to find it. The
+        default value is None, in which case the algorithm is run.
 
     Returns
     -------
@@ -107,23 +193,20 @@ def build_heuristics_string(instance_data, resiliency=False):
         The heuristics string for `instance_data`.
 
     """
-    start = timer()
-    vff = algorithms.vector_first_fit(instance_data, resiliency)
-    vff_time = timer() - start
-
-    start = timer()
-    cbf = algorithms.current_bottleneck_first(
-        instance_data, specs.CBF_CHOICES, resiliency)
-    cbf_time = timer() - start
+    results, _ = run_heuristics(instance_data, resiliency, vff_result)
+    return format_heuristic_results(results)
 
-    return "{0} {1} {2} {3}".format(vff, vff_time, cbf, cbf_time)
 
-
-def build_optimal_string(optimizer, resiliency=False):
+def build_optimal_string(optimizer, resiliency=False, upper_bound=None,
+                         start_schedule=None, lower_bound=None):
     """Builds the optimal string from the optimizer.
 
     The optimal string is a space-separated string reporting the optimal
     result and time taken by the optimizer to find the optimal solution.
+    If `upper_bound` matches the lower bound of `bounds.get_lower_bound`
+    then it is optimal and is reported without solving the IP model.
+    Otherwise, the IP model only has the rounds of `upper_bound` and starts
+    from `start_schedule`.
 
     Parameters
     ----------
@@ -133,6 +216,17 @@ def build_optimal_string(optimizer, resiliency=False):
     resiliency: bool
         A boolean indicating whether failure resilience is considered when
         calculating solutions. The default value is False.
+    upper_bound: int
+        An integer representing the number of rounds of a known schedule,
+        such as the best heuristic result. The default value is None.
+    start_schedule: Schedule
+        A `Schedule` of the instance used as the starting solution of the
+        IP model, such as the best heuristic schedule. The default value is
+        None, in which case the model is solved without a start.
+    lower_bound: int
+        An integer representing a lower bound on the number of rounds for
+        the instance. The default value is None, in which case it is
+        computed with `bounds.get_lower_bound` if `upper_bound` is given.
 
     Returns
     -------
@@ -141,9 +235,16 @@ def build_optimal_string(optimizer, resiliency=False):
 
     """
     start = timer()
+    if upper_bound is not None and lower_bound is None:
+        lower_bound = bounds.get_lower_bound(
+            optimizer.instance_data(), resiliency)
+    if upper_bound is not None and upper_bound <= lower_bound:
+        return "{0} {1}".format(upper_bound, timer() - start)
     try:
-        opt = 1 + int(optimizer.build_ip_model(
-            resiliency=resiliency, verbose=False))
+        optimizer.build_ip_model(
+            resiliency=resiliency, verbose=False, num_rounds=upper_bound,
+            start_schedule=start_schedule)
+        opt = optimizer.get_num_rounds()
     except:
         opt = np.nan
     opt_time = timer() - start
@@ -151,8 +252,32 @@ def build_optimal_string(optimizer, resiliency=False):
     return "{0} {1}".format(opt, opt_time)
 
 
+def load_optimizer(input_dir, instance_file):
+    """Creates an `Optimizer` holding the data of `instance_file`.
+
+    Parameters
+    ----------
+    input_dir: str
+        A string specifying the name of the directory from which the
+        instance will be read.
+    instance_file: str
+        A string specifying the name of a file containing the instance.
+
+    Returns
+    -------
+    Optimizer
+        An `Optimizer` object with the data of the instance in
+        `instance_file`.
+
+    """
+    optimizer = Optimizer()
+    optimizer.get_model_data(os.path.join(input_dir, instance_file))
+    return optimizer
+
+
 def build_results_string(input_dir, instance_file, output_idx,
-                         run_optimizer=False, resiliency=False):
+                         run_optimizer=False, resiliency=False,
+                         optimizer=None, vff_result=None):
     """Builds the results string for the instance given in `instance_file`.
 
     The results string is a space separated string specifying the size of the
@@ -172,10 +297,20 @@ def build_results_string(input_dir, instance_file, output_idx,
     run_optimizer: bool
         A boolean specifying whether the optimizer will be run to find the
         optimal solution of the instance. Otherwise, just the heuristic
-        algorithms are run. The default value is False.
+        algorithms are run. The optimizer is skipped if the best heuristic
+        result matches the lower bound of the instance and otherwise starts
+        from the best heuristic schedule. The default value is False.
     resiliency: bool
         A boolean indicating whether failure resilience is considered when
         calculating solutions. The default value is False.
+    optimizer: Optimizer
+        An `Optimizer` object already holding the data of `instance_file`.
+        The default value is None, in which case the instance is read from
+        `input_dir`.
+    vff_result: tuple
+        A tuple of the number of rounds found by the vector first fit
+        algorithm for the instance and the time taken to find it. The
+        default value is None, in which case the algorithm is run.
 
     Returns
     -------
@@ -183,14 +318,22 @@ def build_results_string(input_dir, instance_file, output_idx,
         A string representing the results for `instance_file`.
 
     """
-    optimizer = Optimizer()
-    optimizer.get_model_data(os.path.join(input_dir, instance_file))
+    if optimizer is None:
+        optimizer = load_optimizer(input_dir, instance_file)
+    instance_data = optimizer.instance_data()
+    lower_bound = bounds.get_lower_bound(instance_data, resiliency)
+    heuristic_results, start_schedule = run_heuristics(
+        instance_data, resiliency, vff_result, lower_bound)
     results_str = "{0} {1} {2}".format(
         output_idx, optimizer.get_size_string(),
-        build_heuristics_string(optimizer.instance_data(), resiliency))
+        format_heuristic_results(heuristic_results))
     if run_optimizer:
+        upper_bound = min(num_rounds for num_rounds, _ in heuristic_results
+                          if not np.isnan(num_rounds))
         results_str = "{0} {1}".format(
-            results_str, build_optimal_string(optimizer, resiliency))
+            results_str, build_optimal_string(
+                optimizer, resiliency, upper_bound, start_schedule,
+                lower_bound))
     return results_str + "\n"
 
 
@@ -199,7 +342,11 @@ def get_results_for_instances(results_list, instance_files, file_pattern,
     """Gets results for all the instances specified in `instance_files`.
 
     For each instance in `instance_files` the result string is computed and
-    appended to `results_list`.
+    appended to `results_list`. The instances are processed in chunks of
+    `specs.VFF_BATCH_SIZE` and the vector first fit results of each chunk
+    are computed with a single call to `algorithms.batch_vector_first_fit`.
+    The time reported for each of those results is the time taken for the
+    chunk divided by the number of instances in the chunk.
 
     Parameters
     ----------
@@ -221,10 +368,22 @@ def get_results_for_instances(results_list, instance_files, file_pattern,
     None
 
     """
-    for instance_file in instance_files:
-        output_idx = utils.extract_file_idx(instance_file, file_pattern)
-        results_list.append(build_results_string(
-            input_dir, instance_file, output_idx, False, resiliency))
+    for chunk_start in range(0, len(instance_files), specs.VFF_BATCH_SIZE):
+        chunk_files = instance_files[
+            chunk_start:chunk_start + specs.VFF_BATCH_SIZE]
+        optimizers = [load_optimizer(input_dir, instance_file)
+                      for instance_file in chunk_files]
+        start = timer()
+        vff_rounds = algorithms.batch_vector_first_fit(
+            [optimizer.instance_data() for optimizer in optimizers],
+            resiliency)
+        vff_time = (timer() - start) / len(chunk_files)
+        for instance_file, optimizer, vff in zip(
+            chunk_files, optimizers, vff_rounds):
+            output_idx = utils.extract_file_idx(instance_file, file_pattern)
+            results_list.append(build_results_string(
+                input_dir, instance_file, output_idx, False, resiliency,
+                optimizer, (int(vff), vff_time)))
 
 def write_optimal_results(instance_file, input_dir, result_idx,
                           output_dir, resiliency=False):
@@ -0,0 +1,245 @@
+"""This module computes combinatorial lower bounds on the number of rounds
+needed to schedule an instance of the load migration scheduling problem,
+without solving a linear program.
+
+"""
+import math
+import numpy as np
+from MigrationScheduling import specs, utils
+
+
+def get_controller_loads(instance_data, resiliency=False):
+    """The loads placed on each controller by the migrations.
+
+    Parameters
+    ----------
+    instance_data: InstanceData
+        An `InstanceData` object specifying a load migration scheduling
+        instance.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. A value of True indicates that the load of a migration
+        will be considered for both the source and destination controllers.
+        Otherwise, the load is only considered for the destination controller.
+
+    Returns
+    -------
+    dict
+        A dictionary in which the keys are strings representing the names of
+        the controllers and the corresponding value is a list of pairs of a
+        float representing the load of a migration involving that controller
+        and a string representing the name of the switch being migrated.
+
+    """
+    controller_loads = {
+        control_const.get_controller(): []
+        for control_const in instance_data.get_control_consts()}
+    for switch, migration in instance_data.get_migrations().items():
+        controllers = {migration.get_dst_controller()}
+        if resiliency:
+            controllers.add(migration.get_src_controller())
+        for controller in controllers:
+            if controller in controller_loads:
+                controller_loads[controller].append(
+                    (migration.get_load(), switch))
+    return controller_loads
+
+
+def load_bound(total_load, capacity):
+    """The number of rounds needed for `total_load` under `capacity`.
+
+    Parameters
+    ----------
+    total_load: float
+        A float representing the total load placed on a constraint.
+    capacity: float
+        A float representing the capacity of the constraint in a round.
+
+    Returns
+    -------
+    int
+        An integer representing `total_load` divided by `capacity`, rounded
+        up.
+
+    """
+    if total_load <= 0:
+        return 0
+    return math.ceil(total_load / capacity - specs.BOUND_TOLERANCE)
+
+
+def bin_packing_bound(loads, capacity):
+    """A bin packing lower bound on the rounds needed for `loads`.
+
+    This is the bound L2 of Martello and Toth. For a threshold k of at most
+    half of `capacity`, no two loads above half of `capacity` share a round,
+    loads above `capacity` - k share a round with no load of at least k,
+    and the loads between k and half of `capacity` must fit in the space
+    left by the loads above half of `capacity` or in additional rounds. The
+    bound is the largest over the thresholds given by the loads themselves.
+
+    Parameters
+    ----------
+    loads: collection
+        A collection of floats representing the loads placed on a
+        constraint.
+    capacity: float
+        A float representing the capacity of the constraint in a round.
+
+    Returns
+    -------
+    int
+        An integer representing a lower bound on the number of rounds in
+        which `loads` can be scheduled. It is at least the bound given by
+        `load_bound` for the total of `loads`.
+
+    """
+    if not loads:
+        return 0
+    sizes = np.sort(np.asarray(loads, dtype=float))
+    sums = np.concatenate(([0.0], np.cumsum(sizes)))
+    half = capacity / 2
+    thresholds = np.unique(np.concatenate(([0.0], sizes[sizes <= half])))
+    # sizes[half_idx:] are above half of the capacity
+    half_idx = np.searchsorted(sizes, half, side="right")
+    # sizes[big_idxs[i]:] are above capacity - thresholds[i]
+    big_idxs = np.searchsorted(sizes, capacity - thresholds, side="right")
+    # sizes[small_idxs[i]:half_idx] are between thresholds[i] and half
+    small_idxs = np.searchsorted(sizes, thresholds, side="left")
+    num_large = len(sizes) - half_idx
+    num_mid = big_idxs - half_idx
+    mid_space = num_mid * capacity - (sums[big_idxs] - sums[half_idx])
+    small_load = sums[half_idx] - sums[small_idxs]
+    extra = np.ceil(
+        (small_load - mid_space) / capacity - specs.BOUND_TOLERANCE)
+    return int(num_large + np.maximum(extra, 0).max())
+
+
+def build_conflict_graph(instance_data, resiliency=False):
+    """The graph of pairs of migrations that cannot share a round.
+
+    Two migrations conflict if they belong to a common QoS group of
+    capacity 1, or if they involve a common controller and their combined
+    load exceeds its capacity. Pairs of controller loads are only compared
+    when one of them is above half of the capacity, as two loads of at
+    most half of the capacity always fit together.
+
+    Parameters
+    ----------
+    instance_data: InstanceData
+        An `InstanceData` object specifying a load migration scheduling
+        instance.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. A value of True indicates that the load of a migration
+        will be considered for both the source and destination controllers.
+        Otherwise, the load is only considered for the destination controller.
+
+    Returns
+    -------
+    dict
+        A dictionary in which the keys are strings representing the names of
+        the switches being migrated and the corresponding value is the set
+        of switches whose migrations conflict with that migration.
+
+    """
+    migrations = instance_data.get_migrations()
+    conflicts = {switch: set() for switch in migrations}
+    for qos_const in instance_data.get_qos_consts():
+        if qos_const.get_cap() == 1:
+            switches = set(qos_const.get_switches()) & conflicts.keys()
+            for switch in switches:
+                conflicts[switch] |= switches - {switch}
+    controller_caps = utils.get_controller_cap_dict(
+        instance_data.get_control_consts())
+    controller_switches = get_controller_loads(instance_data, resiliency)
+    for controller, switch_loads in controller_switches.items():
+        cap = controller_caps[controller]
+        switch_loads.sort(reverse=True)
+        for idx, (load, switch) in enumerate(switch_loads):
+            if load <= cap / 2:
+                break
+            for other_load, other_switch in switch_loads[idx + 1:]:
+                if load + other_load <= cap:
+                    break
+                conflicts[switch].add(other_switch)
+                conflicts[other_switch].add(switch)
+    return conflicts
+
+
+def clique_bound(conflicts, num_starts=specs.CLIQUE_STARTS):
+    """The size of a clique of `conflicts` found greedily.
+
+    Every migration of a clique of the conflict graph needs its own round.
+    A clique is grown from each of the `num_starts` migrations with the most
+    conflicts, repeatedly adding the migration with the most conflicts that
+    conflicts with every migration already in the clique.
+
+    Parameters
+    ----------
+    conflicts: dict
+        A dictionary in which the keys are strings representing the names of
+        the switches and the corresponding value is the set of switches
+        conflicting with that switch.
+    num_starts: int
+        An integer representing the number of migrations from which a clique
+        is grown. The default value is `specs.CLIQUE_STARTS`.
+
+    Returns
+    -------
+    int
+        An integer representing the size of the largest clique found.
+
+    """
+    order = sorted(conflicts, key=lambda switch: (
+        -len(conflicts[switch]), switch))
+    best_size = 0
+    for start in order[:num_starts]:
+        clique_size = 1
+        candidates = set(conflicts[start])
+        for switch in order:
+            if not candidates:
+                break
+            if switch in candidates:
+                clique_size += 1
+                candidates &= conflicts[switch]
+        best_size = max(best_size, clique_size)
+    return best_size
+
+
+def get_lower_bound(instance_data, resiliency=False):
+    """A lower bound on the number of rounds needed for `instance_data`.
+
+    The bound is the largest of the bin packing bound of each controller,
+    the number of rounds needed by the size of each QoS group, and the size
+    of a clique of conflicting migrations.
+
+    Parameters
+    ----------
+    instance_data: InstanceData
+        An `InstanceData` object specifying a load migration scheduling
+        instance.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. A value of True indicates that the load of a migration
+        will be considered for both the source and destination controllers.
+        Otherwise, the load is only considered for the destination controller.
+
+    Returns
+    -------
+    int
+        An integer representing a lower bound on the optimal number of
+        rounds.
+
+    """
+    controller_caps = utils.get_controller_cap_dict(
+        instance_data.get_control_consts())
+    lower_bound = 0
+    for controller, switch_loads in get_controller_loads(
+        instance_data, resiliency).items():
+        lower_bound = max(lower_bound, bin_packing_bound(
+            [load for load, _ in switch_loads], controller_caps[controller]))
+    for qos_const in instance_data.get_qos_consts():
+        lower_bound = max(lower_bound, load_bound(
+            len(qos_const.get_switches()), qos_const.get_cap()))
+    return max(lower_bound, clique_bound(
+        build_conflict_graph(instance_data, resiliency)))
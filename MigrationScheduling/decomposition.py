@@ -0,0 +1,276 @@
+"""This module splits a load migration scheduling instance into independent
+components, which share no controller or QoS group, and solves the
+components separately.
+
+"""
+import multiprocessing
+from MigrationScheduling import algorithms, specs, utils
+from MigrationScheduling.Data import (
+    ControllerConstraint, InstanceData, Migration, QosConstraint)
+from MigrationScheduling.Model import DisjointSets, Optimizer
+
+
+def find_components(instance_data, resiliency=False):
+    """The independent components of `instance_data`.
+
+    Two migrations are in the same component if they are connected through
+    the constraints they are involved in. The components are found with a
+    single pass of union-find over the constraints of the migrations.
+
+    Parameters
+    ----------
+    instance_data: InstanceData
+        An `InstanceData` object representing the data for a load migration
+        scheduling instance.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. A value of True indicates that the load of a migration
+        will be considered for both the source and destination controllers.
+        Otherwise, the load is only considered for the destination controller.
+
+    Returns
+    -------
+    list
+        A list of lists of strings, one per component, giving the names of
+        the switches whose migrations are in the component. The components
+        are ordered by decreasing size.
+
+    """
+    components = DisjointSets()
+    const_switches = {}
+    for switch, migration in instance_data.get_migrations().items():
+        components.add(switch)
+        for const_name in utils.get_migration_constraints(
+            migration, resiliency):
+            components.union(
+                const_switches.setdefault(const_name, switch), switch)
+    return sorted(components.get_sets(), key=len, reverse=True)
+
+
+def build_component_data(instance_data, switches, excluded_groups=(),
+                         excluded_controllers=()):
+    """The instance formed by the migrations of `switches`.
+
+    Parameters
+    ----------
+    instance_data: InstanceData
+        An `InstanceData` object representing the data for a load migration
+        scheduling instance.
+    switches: collection
+        A collection of strings representing the names of the switches of
+        `instance_data` in the component.
+    excluded_groups: collection
+        A collection of strings representing the names of QoS groups left
+        out of the instance. The migrations in these groups are copied
+        without them. The default value is an empty tuple.
+    excluded_controllers: collection
+        A collection of strings representing the names of controllers left
+        out of the instance. Their migrations still name them, but having no
+        constraint they are not limited in any round. The default value is
+        an empty tuple.
+
+    Returns
+    -------
+    InstanceData
+        An `InstanceData` object holding the migrations of `switches` and the
+        controller and QoS constraints they are involved in, restricted to
+        those migrations. The instance has one round per migration.
+
+    """
+    excluded_groups = set(excluded_groups)
+    excluded_controllers = set(excluded_controllers)
+    migrations = {}
+    for switch in switches:
+        migration = instance_data.get_migration(switch)
+        if excluded_groups.intersection(migration.get_groups()):
+            migration = copy_migration(migration, excluded_groups)
+        migrations[switch] = migration
+    control_consts = set()
+    for const in instance_data.get_control_consts():
+        in_switches = const.get_in_switches().intersection(migrations)
+        out_switches = const.get_out_switches().intersection(migrations)
+        if ((in_switches or out_switches) and
+                const.get_controller() not in excluded_controllers):
+            component_const = ControllerConstraint(
+                const.get_controller(), const.get_cap())
+            for switch in in_switches:
+                component_const.add_in_switch(switch)
+            for switch in out_switches:
+                component_const.add_out_switch(switch)
+            control_consts.add(component_const)
+    qos_consts = set()
+    for const in instance_data.get_qos_consts():
+        group_switches = const.get_switches().intersection(migrations)
+        if group_switches and const.get_group() not in excluded_groups:
+            component_const = QosConstraint(const.get_group(), const.get_cap())
+            for switch in group_switches:
+                component_const.add_switch(switch)
+            qos_consts.add(component_const)
+    return InstanceData(
+        migrations, control_consts, qos_consts,
+        sorted(migration.get_switch_idx()
+               for migration in migrations.values()),
+        list(range(len(migrations))),
+        sorted(const.get_controller_idx() for const in control_consts),
+        sorted(const.get_group_idx() for const in qos_consts))
+
+
+def copy_migration(migration, excluded_groups=()):
+    """A copy of `migration` without the QoS groups of `excluded_groups`.
+
+    Parameters
+    ----------
+    migration: Migration
+        The `Migration` object being copied.
+    excluded_groups: collection
+        A collection of strings representing the names of the QoS groups
+        left out of the copy. The default value is an empty tuple.
+
+    Returns
+    -------
+    Migration
+        A `Migration` object with the switch, controllers and load of
+        `migration` and its QoS groups that are not in `excluded_groups`.
+
+    """
+    copy = Migration(migration.get_switch(), migration.get_src_controller(),
+                     migration.get_dst_controller(), migration.get_load())
+    for group in migration.get_groups():
+        if group not in excluded_groups:
+            copy.add_qos_group(group)
+    return copy
+
+
+def optimize_schedule(instance_data, resiliency=False, return_schedule=False):
+    """Solves the Integer Programming model of `instance_data`.
+
+    The model only has the rounds of the best heuristic schedule, given by
+    `algorithms.get_heuristic_upper_bound`.
+
+    Parameters
+    ----------
+    instance_data: InstanceData
+        An `InstanceData` object representing the data for a load migration
+        scheduling instance.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. A value of True indicates that the load of a migration
+        will be considered for both the source and destination controllers.
+        Otherwise, the load is only considered for the destination controller.
+    return_schedule: bool
+        A boolean value indicating whether the optimal `Schedule` is returned
+        along with the number of rounds. The default value is False.
+
+    Returns
+    -------
+    int or (int, Schedule)
+        An integer representing the optimal number of rounds. If
+        `return_schedule` is True, the optimal `Schedule` is also returned.
+
+    """
+    if instance_data.get_migrations():
+        optimizer = Optimizer()
+        optimizer.set_model_data(instance_data)
+        optimizer.build_ip_model(
+            resiliency, verbose=False,
+            num_rounds=algorithms.get_heuristic_upper_bound(
+                instance_data, resiliency))
+        assignment = optimizer.get_assignment()
+    else:
+        assignment = {}
+    schedule = algorithms.build_schedule(instance_data, assignment, resiliency)
+    if return_schedule:
+        return schedule.get_num_rounds(), schedule
+    return schedule.get_num_rounds()
+
+
+def solve_component(instance_data, algorithm, resiliency=False):
+    """Solves the component `instance_data` with `algorithm`.
+
+    Parameters
+    ----------
+    instance_data: InstanceData
+        An `InstanceData` object representing the data for a component of a
+        load migration scheduling instance.
+    algorithm: function
+        The function used to solve the component. It is called with
+        `instance_data`, `resiliency` and `return_schedule=True` and returns
+        the number of rounds and the `Schedule` found.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. A value of True indicates that the load of a migration
+        will be considered for both the source and destination controllers.
+        Otherwise, the load is only considered for the destination controller.
+
+    Returns
+    -------
+    dict
+        A dictionary in which the keys are strings representing the names of
+        the switches of the component and the corresponding value is an
+        integer representing the index of the round of its migration.
+
+    """
+    _, schedule = algorithm(
+        instance_data, resiliency=resiliency, return_schedule=True)
+    return schedule.get_assignment()
+
+
+def solve_by_components(instance_data,
+                        algorithm=algorithms.vector_first_fit,
+                        resiliency=False, num_workers=1,
+                        return_schedule=False):
+    """Solves `instance_data` by solving each of its components.
+
+    The components of `find_components` are solved independently and the
+    round lists of their schedules are merged, so that round i of the
+    schedule holds round i of every component. The number of rounds is the
+    largest number used by a component. If there are at least
+    `specs.PARALLEL_COMPONENTS` components and `num_workers` is not 1, the
+    components are shared among a pool of worker processes, largest first.
+
+    Parameters
+    ----------
+    instance_data: InstanceData
+        An `InstanceData` object representing the data for a load migration
+        scheduling instance.
+    algorithm: function
+        The function used to solve each component, such as
+        `algorithms.vector_first_fit` or `optimize_schedule`. It is called
+        with the data of the component, `resiliency` and
+        `return_schedule=True`. The default value is
+        `algorithms.vector_first_fit`.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. A value of True indicates that the load of a migration
+        will be considered for both the source and destination controllers.
+        Otherwise, the load is only considered for the destination controller.
+    num_workers: int
+        An integer representing the number of worker processes. The default
+        value is 1, in which case the components are solved in the calling
+        process. A value of None uses one worker per CPU.
+    return_schedule: bool
+        A boolean value indicating whether the merged `Schedule` is returned
+        along with the number of rounds. The default value is False.
+
+    Returns
+    -------
+    int or (int, Schedule)
+        An integer representing the number of rounds of the merged schedule.
+        If `return_schedule` is True, the merged `Schedule` is also returned.
+
+    """
+    args = [(build_component_data(instance_data, switches),
+             algorithm, resiliency)
+            for switches in find_components(instance_data, resiliency)]
+    if num_workers == 1 or len(args) < specs.PARALLEL_COMPONENTS:
+        assignments = [solve_component(*arg) for arg in args]
+    else:
+        with multiprocessing.Pool(num_workers) as pool:
+            assignments = pool.starmap(solve_component, args, chunksize=1)
+    assignment = {}
+    for component_assignment in assignments:
+        assignment.update(component_assignment)
+    schedule = algorithms.build_schedule(instance_data, assignment, resiliency)
+    if return_schedule:
+        return schedule.get_num_rounds(), schedule
+    return schedule.get_num_rounds()
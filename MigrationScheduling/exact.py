@@ -0,0 +1,236 @@
+"""This module implements an exact branch and bound algorithm for the load
+migration scheduling problem that does not require an IP solver, intended
+for small instances.
+
+"""
+import numpy as np
+from MigrationScheduling import algorithms, bounds, specs, utils
+
+
+def build_demand_arrays(instance_data, resiliency=False):
+    """The capacities of the constraints and the demands of the migrations.
+
+    Parameters
+    ----------
+    instance_data: InstanceData
+        An `InstanceData` object representing the data for a load migration
+        scheduling instance.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. A value of True indicates that the load of a migration
+        will be considered for both the source and destination controllers.
+        Otherwise, the load is only considered for the destination controller.
+
+    Returns
+    -------
+    list, np.array, np.array
+        A list of strings representing the names of the switches being
+        migrated, a 1-D array of the capacity of each constraint in a single
+        round and a 2-D array with one row per switch, in the order of the
+        list, giving the demand of its migration on each constraint.
+
+    """
+    controller_caps, qos_caps = utils.get_cap_dicts(instance_data)
+    const_idxs = {const_name: idx for idx, const_name in enumerate(
+        list(controller_caps) + list(qos_caps))}
+    caps = np.array(list(controller_caps.values()) + list(qos_caps.values()),
+                    dtype=float)
+    migrations = instance_data.get_migrations()
+    switches = list(migrations.keys())
+    demands = np.zeros((len(switches), len(caps)))
+    for row, switch in enumerate(switches):
+        migration = migrations[switch]
+        for const_name in utils.get_migration_constraints(
+            migration, resiliency):
+            demands[row, const_idxs[const_name]] = (
+                1.0 if const_name in qos_caps else migration.get_load())
+    return switches, caps, demands
+
+
+def order_for_branching(demands, caps):
+    """The order in which migrations are assigned during branching.
+
+    Migrations are taken in decreasing order of their largest demand as a
+    fraction of the capacity of a constraint, and then of their total such
+    demand, so that the migrations that are hardest to place are branched
+    on first.
+
+    Parameters
+    ----------
+    demands: np.array
+        A 2-D array giving the demand of each migration (rows) on each
+        constraint (columns).
+    caps: np.array
+        A 1-D array of the capacity of each constraint in a single round.
+
+    Returns
+    -------
+    np.array
+        A 1-D array of the row indices of `demands` in branching order.
+
+    """
+    if not len(demands):
+        return np.zeros(0, dtype=int)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        normalized = np.where(demands > 0, demands / caps, 0.0)
+    return np.lexsort((-normalized.sum(axis=1), -normalized.max(axis=1)))
+
+
+def is_dominated(residuals, records):
+    """Whether `residuals` is dominated by one of `records`.
+
+    Parameters
+    ----------
+    residuals: np.array
+        A 2-D array of the residual capacity of each round (rows) on each
+        constraint (columns) of a partial schedule, with the rounds sorted.
+    records: collection
+        A collection of 2-D arrays of the sorted residual capacities of
+        partial schedules that have failed, with the same migrations
+        assigned as the partial schedule of `residuals`.
+
+    Returns
+    -------
+    bool
+        True if every entry of `residuals` is at most the corresponding
+        entry of some array of `records`. Otherwise, False.
+
+    """
+    return any(np.all(residuals <= record) for record in records)
+
+
+def find_assignment(demands, caps, num_rounds, ranks):
+    """A schedule of the migrations of `demands` in `num_rounds` rounds.
+
+    The migrations are assigned to rounds by depth first search. At each
+    node the unassigned migration that fits in the fewest rounds is
+    branched on, with ties broken by `ranks`, and the search backtracks as
+    soon as some unassigned migration fits in no round. A migration is only
+    tried in the rounds already in use and the first unused round, so
+    schedules that differ only in the order of their rounds are searched
+    once. A branch is also pruned if the unassigned demand on some
+    constraint exceeds its remaining capacity over all rounds.
+
+    Partial schedules that have failed are memoized by the set of assigned
+    migrations, recording the residual capacities of the rounds sorted so
+    that the record does not depend on the order of the rounds. A partial
+    schedule with the same assigned migrations is dominated by a record if
+    each of its sorted residual capacities is at most that of the record,
+    since any completion of it would also complete the record. Dominated
+    partial schedules are not explored again.
+
+    Parameters
+    ----------
+    demands: np.array
+        A 2-D array giving the demand of each migration (rows) on each
+        constraint (columns).
+    caps: np.array
+        A 1-D array of the capacity of each constraint in a single round.
+    num_rounds: int
+        An integer representing the number of rounds available.
+    ranks: np.array
+        A 1-D array giving the rank of each migration, used to break ties
+        between migrations that fit in the same number of rounds. Lower
+        ranks are branched on first.
+
+    Returns
+    -------
+    list or None
+        A list giving the round assigned to each migration, or None if the
+        migrations cannot be scheduled in `num_rounds` rounds.
+
+    """
+    num_migrations = len(demands)
+    residuals = np.repeat(caps[np.newaxis, :], num_rounds, axis=0)
+    unassigned = np.ones(num_migrations, dtype=bool)
+    rounds = [0] * num_migrations
+    failed = {}
+
+    def search(num_used):
+        remaining = np.flatnonzero(unassigned)
+        if not len(remaining):
+            return True
+        if np.any(demands[remaining].sum(axis=0) >
+                  residuals.sum(axis=0) + specs.BOUND_TOLERANCE):
+            return False
+        key = unassigned.tobytes()
+        state = residuals.round(9)
+        state = state[np.lexsort(state.T[::-1])]
+        if is_dominated(state, failed.get(key, ())):
+            return False
+        num_open = min(num_used + 1, num_rounds)
+        fits = np.all(residuals[np.newaxis, :num_open, :] >=
+                      demands[remaining, np.newaxis, :], axis=2)
+        num_fits = fits.sum(axis=1)
+        if num_fits.min() == 0:
+            failed.setdefault(key, []).append(state)
+            return False
+        pos = np.lexsort((ranks[remaining], num_fits))[0]
+        row = remaining[pos]
+        unassigned[row] = False
+        for round_num in np.flatnonzero(fits[pos]):
+            residuals[round_num] -= demands[row]
+            rounds[row] = int(round_num)
+            if search(max(num_used, round_num + 1)):
+                return True
+            residuals[round_num] += demands[row]
+        unassigned[row] = True
+        failed.setdefault(key, []).append(state)
+        return False
+
+    return rounds if search(0) else None
+
+
+def branch_and_bound(instance_data, resiliency=False, return_schedule=False):
+    """Finds the minimum number of rounds needed for `instance_data`.
+
+    The search starts from the lower bound of `bounds.get_lower_bound` and
+    the best of the vector first fit and degree of saturation first
+    schedules. Each number of rounds between them is tried in increasing
+    order with `find_assignment`, so the first number for which a schedule
+    is found is optimal. If none is found the heuristic schedule is
+    optimal. The search is exponential in the worst case and is intended
+    for instances with fewer than `specs.SMALL_CUTOFF` migrations.
+
+    Parameters
+    ----------
+    instance_data: InstanceData
+        An `InstanceData` object representing the data for a load migration
+        scheduling instance.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. A value of True indicates that the load of a migration
+        will be considered for both the source and destination controllers.
+        Otherwise, the load is only considered for the destination controller.
+    return_schedule: bool
+        A boolean value indicating whether an optimal `Schedule` is returned
+        along with the number of rounds. The default value is False.
+
+    Returns
+    -------
+    int or (int, Schedule)
+        An integer representing the minimum number of rounds in which the
+        instance can be scheduled. This is one more than the optimal value
+        of `Optimizer.build_ip_model`, which numbers rounds from 0. If
+        `return_schedule` is True, a `Schedule` using that number of rounds
+        is also returned.
+
+    """
+    _, best = algorithms.vector_first_fit(
+        instance_data, resiliency, return_schedule=True)
+    _, dsatur = algorithms.degree_of_saturation_first(
+        instance_data, resiliency, return_schedule=True)
+    if dsatur.get_num_rounds() < best.get_num_rounds():
+        best = dsatur
+    lower_bound = bounds.get_lower_bound(instance_data, resiliency)
+    switches, caps, demands = build_demand_arrays(instance_data, resiliency)
+    ranks = np.argsort(order_for_branching(demands, caps))
+    for num_rounds in range(lower_bound, best.get_num_rounds()):
+        rounds = find_assignment(demands, caps, num_rounds, ranks)
+        if rounds is not None:
+            best = algorithms.build_schedule(
+                instance_data, dict(zip(switches, rounds)), resiliency)
+            break
+    if return_schedule:
+        return best.get_num_rounds(), best
+    return best.get_num_rounds()
@@ -2,6 +2,7 @@
 load migration schedule.
 
 """
+from MigrationScheduling import specs
 
 class InvalidName(Exception):
     """Exception raised when an invalid object name is generated.
@@ -72,3 +73,106 @@ class IncorrectBottleneckSetting(Exception):
         super().__init__(
             "Incorrect bottleneck setting used: {}. Possible settings are " +
             "'high', 'medium', or 'low'.\n".format(supplied_setting))
+
+class IncorrectBackend(Exception):
+    """Generated when `supplied_backend` is not a valid scheduling backend.
+
+    The exception is generated when an algorithm is asked to track round
+    capacities with a backend it does not support.
+
+    Parameters
+    ----------
+    supplied_backend: str
+        A string representing the supplied backend that generated the
+        exception.
+
+    """
+    def __init__(self, supplied_backend):
+        super().__init__(
+            "Incorrect backend used: {0}. Possible backends are {1}.".format(
+                supplied_backend, ", ".join(
+                    "'{}'".format(backend)
+                    for backend in sorted(specs.SCHEDULING_BACKENDS))))
+
+class IncorrectOrdering(Exception):
+    """Generated when `supplied_ordering` is not a valid migration ordering.
+
+    The exception is generated when an algorithm is asked to consider
+    migrations in an order it does not support.
+
+    Parameters
+    ----------
+    supplied_ordering: str
+        A string representing the supplied ordering that generated the
+        exception.
+
+    """
+    def __init__(self, supplied_ordering):
+        super().__init__(
+            "Incorrect ordering used: {0}. Possible orderings are {1}.".format(
+                supplied_ordering, ", ".join(
+                    "'{}'".format(ordering)
+                    for ordering in sorted(specs.MIGRATION_ORDERINGS))))
+
+class IncorrectPlacement(Exception):
+    """Generated when `supplied_placement` is not a valid placement rule.
+
+    The exception is generated when an algorithm is asked to choose the
+    round of a migration with a rule it does not support.
+
+    Parameters
+    ----------
+    supplied_placement: str
+        A string representing the supplied placement rule that generated the
+        exception.
+
+    """
+    def __init__(self, supplied_placement):
+        super().__init__(
+            "Incorrect placement used: {0}. Possible placements are "
+            "{1}.".format(supplied_placement, ", ".join(
+                    "'{}'".format(placement)
+                    for placement in sorted(specs.PLACEMENT_RULES))))
+
+class MigrationAlreadyScheduled(Exception):
+    """Generated when the migration of `switch_name` is scheduled twice.
+
+    Parameters
+    ----------
+    switch_name: str
+        A string representing the name of the switch whose migration is
+        already scheduled.
+
+    """
+    def __init__(self, switch_name):
+        super().__init__(
+            "Migration of switch {} is already scheduled.".format(
+                switch_name))
+
+class NoPendingRounds(Exception):
+    """Generated when executing a round when every round is executed.
+
+    """
+    def __init__(self):
+        super().__init__("No pending rounds. Every round of the schedule " +
+                         "has already been executed.")
+
+class IncorrectFormulation(Exception):
+    """Generated when `supplied_formulation` is not a valid formulation.
+
+    The exception is generated when an `Optimizer` is asked to build a model
+    with a formulation it does not support.
+
+    Parameters
+    ----------
+    supplied_formulation: str
+        A string representing the supplied formulation that generated the
+        exception.
+
+    """
+    def __init__(self, supplied_formulation):
+        super().__init__(
+            "Incorrect formulation used: {0}. Possible formulations are "
+            "{1}.".format(supplied_formulation, ", ".join(
+                    "'{}'".format(formulation)
+                    for formulation in sorted(specs.MODEL_FORMULATIONS))))
@@ -0,0 +1,171 @@
+"""This module reduces a load migration scheduling instance before it is
+solved, removing the constraints that can never bind and the migrations
+that are involved in no other constraints.
+
+"""
+from MigrationScheduling import algorithms, utils
+from MigrationScheduling.decomposition import build_component_data
+
+
+def get_redundant_constraints(instance_data, resiliency=False):
+    """The constraints of `instance_data` that can never bind.
+
+    A QoS group is redundant if its capacity is at least the number of its
+    migrations and a controller is redundant if its capacity is at least the
+    total load placed on it, since neither can be exceeded by any round.
+
+    Parameters
+    ----------
+    instance_data: InstanceData
+        An `InstanceData` object representing the data for a load migration
+        scheduling instance.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. A value of True indicates that the load of a migration
+        will be considered for both the source and destination controllers.
+        Otherwise, the load is only considered for the destination controller.
+
+    Returns
+    -------
+    set
+        A set of strings representing the names of the redundant controllers
+        and QoS groups.
+
+    """
+    redundant = set()
+    for const in instance_data.get_control_consts():
+        load = sum(instance_data.get_load(switch) for switch
+                   in const.get_constraint_switches(resiliency))
+        if const.get_cap() >= load:
+            redundant.add(const.get_controller())
+    for const in instance_data.get_qos_consts():
+        if const.get_cap() >= len(const.get_switches()):
+            redundant.add(const.get_group())
+    return redundant
+
+
+def presolve(instance_data, resiliency=False):
+    """Reduces `instance_data` by removing what can never bind.
+
+    A migration is loose if every constraint it is involved in is
+    redundant, in which case it fits in any round. Loose migrations are
+    removed, along with the rows of the redundant constraints. Removing
+    loose migrations only lowers the demand on redundant constraints, so no
+    further constraints become redundant. The redundant QoS groups and
+    controllers are dropped from the instance, and the remaining migrations
+    of a dropped controller are not limited by it.
+
+    Parameters
+    ----------
+    instance_data: InstanceData
+        An `InstanceData` object representing the data for a load migration
+        scheduling instance.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. A value of True indicates that the load of a migration
+        will be considered for both the source and destination controllers.
+        Otherwise, the load is only considered for the destination controller.
+
+    Returns
+    -------
+    InstanceData, list
+        An `InstanceData` object for the reduced instance and a list of
+        strings representing the names of the switches of the loose
+        migrations, which `postsolve` uses to recover a schedule of
+        `instance_data`.
+
+    """
+    redundant = get_redundant_constraints(instance_data, resiliency)
+    loose_switches = []
+    switches = []
+    for switch, migration in instance_data.get_migrations().items():
+        if redundant.issuperset(
+                utils.get_migration_constraints(migration, resiliency)):
+            loose_switches.append(switch)
+        else:
+            switches.append(switch)
+    redundant_groups = {const.get_group()
+                        for const in instance_data.get_qos_consts()
+                        if const.get_group() in redundant}
+    redundant_controllers = redundant.difference(redundant_groups)
+    return (build_component_data(instance_data, switches, redundant_groups,
+                                 redundant_controllers),
+            loose_switches)
+
+
+def postsolve(instance_data, schedule, loose_switches, resiliency=False):
+    """The schedule of `instance_data` recovered from `schedule`.
+
+    Each migration of `schedule` keeps its round and each loose migration
+    is placed in the first round, which it fits in as its constraints are
+    all redundant.
+
+    Parameters
+    ----------
+    instance_data: InstanceData
+        An `InstanceData` object representing the data for a load migration
+        scheduling instance.
+    schedule: Schedule
+        A `Schedule` of the instance reduced from `instance_data` by
+        `presolve`.
+    loose_switches: collection
+        A collection of strings representing the names of the switches of
+        the loose migrations removed by `presolve`.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. A value of True indicates that the load of a migration
+        will be considered for both the source and destination controllers.
+        Otherwise, the load is only considered for the destination controller.
+
+    Returns
+    -------
+    Schedule
+        A `Schedule` of every migration of `instance_data`.
+
+    """
+    assignment = schedule.get_assignment()
+    for switch in loose_switches:
+        assignment[switch] = 0
+    return algorithms.build_schedule(instance_data, assignment, resiliency)
+
+
+def solve_presolved(instance_data, algorithm=algorithms.vector_first_fit,
+                    resiliency=False, return_schedule=False):
+    """Solves `instance_data` by solving its reduced instance.
+
+    Parameters
+    ----------
+    instance_data: InstanceData
+        An `InstanceData` object representing the data for a load migration
+        scheduling instance.
+    algorithm: function
+        The function used to solve the reduced instance, such as
+        `algorithms.vector_first_fit` or `decomposition.optimize_schedule`.
+        It is called with the reduced instance, `resiliency` and
+        `return_schedule=True`. The default value is
+        `algorithms.vector_first_fit`.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. A value of True indicates that the load of a migration
+        will be considered for both the source and destination controllers.
+        Otherwise, the load is only considered for the destination controller.
+    return_schedule: bool
+        A boolean value indicating whether the recovered `Schedule` is
+        returned along with the number of rounds. The default value is
+        False.
+
+    Returns
+    -------
+    int or (int, Schedule)
+        An integer representing the number of rounds of the recovered
+        schedule. If `return_schedule` is True, the recovered `Schedule` is
+        also returned.
+
+    """
+    reduced_data, loose_switches = presolve(instance_data, resiliency)
+    _, schedule = algorithm(
+        reduced_data, resiliency=resiliency, return_schedule=True)
+    schedule = postsolve(instance_data, schedule, loose_switches, resiliency)
+    if return_schedule:
+        return schedule.get_num_rounds(), schedule
+    return schedule.get_num_rounds()
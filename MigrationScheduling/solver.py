@@ -0,0 +1,165 @@
+"""This module implements an anytime solver for the load migration
+scheduling problem, combining the heuristics of `algorithms` to improve a
+schedule until a deadline.
+
+"""
+from timeit import default_timer as timer
+from MigrationScheduling import algorithms, bounds, specs
+
+
+def generate_candidates(instance_data, resiliency=False,
+                        num_choices=specs.CBF_CHOICES, num_workers=1,
+                        seed=specs.SEED_NUM, lower_bound=None):
+    """Generates candidate schedules for `instance_data`.
+
+    The degree of saturation first and current bottleneck first schedules
+    are generated first, followed by the best schedule of each batch of
+    `specs.SOLVE_BATCH_RUNS` seeded current bottleneck first runs. Each
+    batch starts from the seed after the last seed of the previous batch,
+    so the batches continue indefinitely and are only run when requested.
+
+    Parameters
+    ----------
+    instance_data: InstanceData
+        An `InstanceData` object representing the data for a load migration
+        scheduling instance.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. A value of True indicates that the load of a migration
+        will be considered for both the source and destination controllers.
+        Otherwise, the load is only considered for the destination controller.
+    num_choices: int
+        An integer representing the number of candidate migrations sampled
+        from the bottleneck constraint in each seeded run. The default value
+        is `specs.CBF_CHOICES`.
+    num_workers: int
+        An integer representing the number of worker processes used for the
+        seeded runs. The default value is 1, in which case the runs are made
+        in the calling process.
+    seed: int
+        An integer representing the seed of the first seeded run. The
+        default value is `specs.SEED_NUM`.
+    lower_bound: int
+        An integer representing a lower bound on the number of rounds, at
+        which a batch of seeded runs stops early. The default value is None,
+        in which case the bound given by `bounds.get_lower_bound` is used.
+
+    Yields
+    ------
+    str, Schedule
+        A string naming the algorithm that built the candidate and the
+        `Schedule` of the candidate.
+
+    """
+    _, schedule = algorithms.degree_of_saturation_first(
+        instance_data, resiliency, return_schedule=True)
+    yield "DSATUR", schedule
+    _, schedule = algorithms.current_bottleneck_first(
+        instance_data, -1, resiliency, indexed=True, return_schedule=True)
+    yield "CBF", schedule
+    while True:
+        schedule, _ = algorithms.multi_start_current_bottleneck_first(
+            instance_data, num_choices, specs.SOLVE_BATCH_RUNS, resiliency,
+            num_workers, seed, lower_bound)
+        yield "MSCBF", schedule
+        seed += specs.SOLVE_BATCH_RUNS
+
+
+def report_incumbent(name, schedule, callback=None):
+    """Reports the incumbent `schedule` found by `name` to `callback`.
+
+    Parameters
+    ----------
+    name: str
+        A string naming the algorithm that found the incumbent.
+    schedule: Schedule
+        The `Schedule` of the incumbent.
+    callback: function
+        A function called with `name` and `schedule`. The default value is
+        None, in which case no function is called.
+
+    Returns
+    -------
+    str, Schedule
+        The values of `name` and `schedule`.
+
+    """
+    if callback is not None:
+        callback(name, schedule)
+    return name, schedule
+
+
+def solve(instance_data, deadline=specs.SOLVE_DEADLINE, resiliency=False,
+          num_choices=specs.CBF_CHOICES, num_workers=1, seed=specs.SEED_NUM,
+          callback=None):
+    """Solves `instance_data`, yielding each improved schedule found.
+
+    The vector first fit schedule is yielded straight away. The schedule is
+    then improved until `deadline` seconds have passed or it reaches the
+    lower bound of `bounds.get_lower_bound`. The candidates of
+    `generate_candidates` are tried in turn and each time a candidate
+    improves on the incumbent, `algorithms.eliminate_rounds` is run on it
+    for the remaining time. A step that has started when the deadline
+    passes is allowed to finish, so the deadline is exceeded by at most the
+    time of one step.
+
+    Parameters
+    ----------
+    instance_data: InstanceData
+        An `InstanceData` object representing the data for a load migration
+        scheduling instance.
+    deadline: float
+        A float representing the number of seconds after which no further
+        improvements are tried. The default value is `specs.SOLVE_DEADLINE`.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. A value of True indicates that the load of a migration
+        will be considered for both the source and destination controllers.
+        Otherwise, the load is only considered for the destination controller.
+    num_choices: int
+        An integer representing the number of candidate migrations sampled
+        from the bottleneck constraint in each seeded run. The default value
+        is `specs.CBF_CHOICES`.
+    num_workers: int
+        An integer representing the number of worker processes used for the
+        seeded runs. The default value is 1, in which case the runs are made
+        in the calling process.
+    seed: int
+        An integer representing the seed of the first seeded run. The
+        default value is `specs.SEED_NUM`.
+    callback: function
+        A function called with the name of the algorithm and the `Schedule`
+        of each incumbent before it is yielded. The default value is None,
+        in which case no function is called.
+
+    Yields
+    ------
+    str, Schedule
+        A string naming the algorithm that found the incumbent, one of
+        'VFF', 'DSATUR', 'CBF', 'MSCBF' or 'LS' for the local search, and
+        the `Schedule` of the incumbent. Each incumbent uses fewer rounds
+        than the one before it.
+
+    """
+    end = timer() + deadline
+    _, best = algorithms.vector_first_fit(
+        instance_data, resiliency, return_schedule=True)
+    yield report_incumbent("VFF", best, callback)
+    lower_bound = bounds.get_lower_bound(instance_data, resiliency)
+    improved = True
+    candidates = generate_candidates(
+        instance_data, resiliency, num_choices, num_workers, seed, lower_bound)
+    while best.get_num_rounds() > lower_bound and timer() < end:
+        if improved:
+            improved = False
+            schedule = algorithms.eliminate_rounds(
+                best, end - timer(), lower_bound=lower_bound)
+            if schedule.get_num_rounds() < best.get_num_rounds():
+                best = schedule
+                yield report_incumbent("LS", best, callback)
+            continue
+        name, schedule = next(candidates)
+        if schedule.get_num_rounds() < best.get_num_rounds():
+            best = schedule
+            improved = True
+            yield report_incumbent(name, best, callback)
@@ -17,11 +17,43 @@ LARGE_IDX = 0
 # with the optimizer, large instances require heuristic methods.
 SMALL_CUTOFF = 250
 
+# the number of instances whose vector first fit results are computed
+# together with `algorithms.batch_vector_first_fit` during bulk analysis.
+VFF_BATCH_SIZE = 64
+
+# the default number of seconds spent by `algorithms.eliminate_rounds`
+# trying to remove rounds from a schedule.
+LOCAL_SEARCH_TIME_LIMIT = 0.05
+
+# the tolerance subtracted from a ratio of load to capacity before rounding
+# it up to a number of rounds, so that floating point error in the load does
+# not add a round to a lower bound.
+BOUND_TOLERANCE = 1e-9
+
+# the number of migrations from which a clique of conflicting migrations is
+# grown by `bounds.clique_bound`.
+CLIQUE_STARTS = 16
+
+# the default number of independently seeded runs made by
+# `algorithms.multi_start_current_bottleneck_first`.
+CBF_NUM_RUNS = 16
+
 # number of choices used in the current bottleneck first algorithm when
 # selecting the number of candidate migrations from the bottleneck
 # constraint.
 CBF_CHOICES = 2
 
+# the default number of seconds spent by `solver.solve` improving a schedule.
+SOLVE_DEADLINE = 1.0
+
+# the number of seeded current bottleneck first runs made together by each
+# step of `solver.solve`.
+SOLVE_BATCH_RUNS = 4
+
+# the number of independent components from which
+# `decomposition.solve_by_components` solves the components in parallel.
+PARALLEL_COMPONENTS = 8
+
 # seed number used when setting seeds for reproducibility of experiments
 SEED_NUM = 42
 
@@ -39,3 +71,39 @@ ALPHA_MAP = {"VFF": 1.0, "CBF": 0.6, "OPT": 1.0}
 
 # the set of valid bottlenek settings
 BOTTLENECK_SETTINGS = {'low', 'medium', 'high'}
+
+# the set of valid backends used to track the remaining capacity of rounds
+# when scheduling migrations. 'rounds' uses a list of `Round` objects,
+# 'sparse' uses a list of `SparseRound` objects, 'matrix' uses a
+# `CapacityMatrix`, 'tree' uses a `RoundIndex` and 'bitset' uses a
+# `BitsetRounds`.
+SCHEDULING_BACKENDS = {'rounds', 'sparse', 'matrix', 'tree', 'bitset'}
+
+# the set of valid orderings in which migrations are considered by
+# `algorithms.ordered_vector_fit`. 'input' keeps the order of the instance,
+# 'load' takes migrations by decreasing load, 'constraints' by decreasing
+# number of constraints and 'demand' by decreasing maximum normalized demand.
+MIGRATION_ORDERINGS = {'input', 'load', 'constraints', 'demand'}
+
+# the set of valid rules used by `algorithms.ordered_vector_fit` to choose
+# among the rounds in which a migration fits. 'first' takes the earliest
+# round, 'best' the round left with the least normalized residual capacity,
+# 'worst' the round left with the most and 'dot' the round maximizing the
+# dot product of the normalized demand and residual capacity vectors.
+PLACEMENT_RULES = {'first', 'best', 'worst', 'dot'}
+
+# the set of valid formulations of the optimization model built by
+# `Optimizer`. 'lambda' minimizes the latest round used, bounded by a
+# constraint per migration and round, and 'rounds' minimizes the number of
+# rounds opened, with an indicator variable per round scaling the capacity
+# of each constraint in the round.
+MODEL_FORMULATIONS = {'lambda', 'rounds'}
+
+# the tolerance allowed for the objective value of a linear program solved
+# by `Optimizer` before it is rounded up to a lower bound, matching the
+# default optimality tolerance of gurobi.
+MODEL_TOLERANCE = 1e-6
+
+# the number of constraints compared at once when searching a
+# `CapacityMatrix` for the earliest round in which a migration fits.
+MATRIX_CHUNK_SIZE = 64
@@ -0,0 +1,42 @@
+import os
+import numpy as np
+from MigrationScheduling import algorithms
+from MigrationScheduling.Model import Parser
+
+
+DIR = os.path.dirname(os.path.dirname(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+DATA_FILES = [os.path.join(DIR, "instances", "migrations{}.txt".format(idx))
+              for idx in range(4)]
+
+
+def load_instances():
+    instances = []
+    for data_file in DATA_FILES:
+        parser = Parser()
+        parser.parse_migrations(data_file)
+        instances.append(parser.to_data())
+    return instances
+
+
+def test_with_no_instances():
+    assert len(algorithms.batch_vector_first_fit([])) == 0
+
+
+def test_matches_vector_first_fit():
+    instances = load_instances()
+    for resiliency in (False, True):
+        vff_vals = [algorithms.vector_first_fit(instance_data, resiliency)
+                    for instance_data in instances]
+        assert np.array_equal(
+            algorithms.batch_vector_first_fit(instances, resiliency),
+            np.array(vff_vals))
+
+
+def test_with_growth():
+    instances = load_instances()
+    vff_vals = [algorithms.vector_first_fit(instance_data)
+                for instance_data in instances]
+    assert np.array_equal(
+        algorithms.batch_vector_first_fit(instances, init_rounds=1),
+        np.array(vff_vals))
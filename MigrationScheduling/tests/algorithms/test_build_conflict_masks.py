@@ -0,0 +1,35 @@
+from unittest.mock import patch, MagicMock
+from MigrationScheduling.algorithms import build_conflict_masks
+
+
+GRAPH_STR = "MigrationScheduling.algorithms.bounds.build_conflict_graph"
+
+
+def make_qos_const(group, switches):
+    const = MagicMock()
+    const.get_group = MagicMock(return_value=group)
+    const.get_switches = MagicMock(return_value=switches)
+    return const
+
+
+@patch(GRAPH_STR, return_value={})
+def test_with_no_switches(mock_graph):
+    mock_data = MagicMock()
+    mock_data.get_qos_consts = MagicMock(return_value=set())
+    assert build_conflict_masks(mock_data, []) == ([], {})
+    mock_graph.assert_called_once_with(mock_data, False)
+
+
+@patch(GRAPH_STR)
+def test_with_switches(mock_graph):
+    mock_graph.return_value = {
+        's0': {'s2'}, 's1': set(), 's2': {'s0', 's3'}, 's3': {'s2'}}
+    mock_data = MagicMock()
+    mock_data.get_qos_consts = MagicMock(return_value=[
+        make_qos_const('g0', {'s0', 's2'}),
+        make_qos_const('g1', {'s1', 's2', 's3'})])
+    conflict_masks, group_masks = build_conflict_masks(
+        mock_data, ['s0', 's1', 's2', 's3'], True)
+    assert conflict_masks == [0b0100, 0b0000, 0b1001, 0b0100]
+    assert group_masks == {'g0': 0b0101, 'g1': 0b1110}
+    mock_graph.assert_called_once_with(mock_data, True)
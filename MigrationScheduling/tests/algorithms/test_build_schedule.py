@@ -0,0 +1,30 @@
+from unittest.mock import call, patch, MagicMock
+from MigrationScheduling.algorithms import build_schedule
+
+
+SCHEDULE_STR = "MigrationScheduling.algorithms.Schedule"
+CAPS_STR = "MigrationScheduling.algorithms.utils.get_cap_dicts"
+
+
+@patch(CAPS_STR, return_value=({'c0': 1.0}, {'g0': 1}))
+@patch(SCHEDULE_STR)
+def test_with_no_migrations(mock_schedule, mock_caps):
+    mock_data = MagicMock()
+    assert build_schedule(mock_data, {}) == mock_schedule.return_value
+    mock_caps.assert_called_once_with(mock_data)
+    mock_schedule.assert_called_once_with(
+        {'c0': 1.0}, {'g0': 1}, False, "rounds")
+    mock_schedule.return_value.schedule_migration.assert_not_called()
+
+
+@patch(CAPS_STR, return_value=({'c0': 1.0}, {'g0': 1}))
+@patch(SCHEDULE_STR)
+def test_with_migrations(mock_schedule, mock_caps):
+    migrations = {'s0': MagicMock(), 's3': MagicMock()}
+    mock_data = MagicMock()
+    mock_data.get_migration = MagicMock(side_effect=migrations.get)
+    schedule = build_schedule(mock_data, {'s0': 2, 's3': 0}, True, "tree")
+    mock_schedule.assert_called_once_with(
+        {'c0': 1.0}, {'g0': 1}, True, "tree")
+    schedule.schedule_migration.assert_has_calls(
+        [call(migrations['s0'], 2), call(migrations['s3'], 0)])
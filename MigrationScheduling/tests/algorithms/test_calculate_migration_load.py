@@ -67,3 +67,11 @@ def test_with_multi_groups(control_const, qos_const):
         const.get_load_factor.assert_called_once()
     for const in other_consts[1:]:
         const.get_load_factor.assert_not_called()
+
+
+def test_controller_without_constraint(qos_const):
+    consts_dict = {'g1': qos_const}
+    migration = MagicMock()
+    migration.get_groups = MagicMock(return_value={'g1', 'g2'})
+    migration.get_dst_controller = MagicMock(return_value='c0')
+    assert calculate_migration_load(migration, 'g2', consts_dict) == 1.2
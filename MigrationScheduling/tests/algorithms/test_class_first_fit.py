@@ -0,0 +1,48 @@
+import pytest
+from MigrationScheduling import specs
+from MigrationScheduling import exceptions as exc
+from MigrationScheduling.algorithms import class_first_fit, vector_first_fit
+from MigrationScheduling.tests.helpers import build_instance
+
+
+@pytest.fixture(scope="function")
+def instance():
+    # six interchangeable migrations into c0, three into c1 sharing g0 and
+    # one that does not fit in a round
+    migrations = [('s{}'.format(idx), 'c2', 'c0', 3.0) for idx in range(6)]
+    migrations += [('s{}'.format(idx), 'c2', 'c1', 1.0)
+                   for idx in range(6, 9)]
+    migrations.append(('s9', 'c2', 'c1', 9.0))
+    return build_instance(
+        {'g0': 2}, {'g0': ['s6', 's7', 's8']},
+        {'c0': 10.0, 'c1': 8.0, 'c2': 100.0}, migrations)
+
+
+def test_with_no_migrations():
+    data = build_instance({}, {}, {'c0': 1.0}, [])
+    assert class_first_fit(data) == 0
+
+
+def test_invalid_backend(instance):
+    with pytest.raises(exc.IncorrectBackend):
+        class_first_fit(instance, backend="heap")
+
+
+@pytest.mark.parametrize("backend", sorted(specs.SCHEDULING_BACKENDS))
+def test_schedule(instance, backend):
+    num_rounds, schedule = class_first_fit(
+        instance, backend=backend, return_schedule=True)
+    assert num_rounds == 3
+    assert schedule.get_num_migrations() == 10
+    assert schedule.get_round_switches(0) == {'s0', 's1', 's2', 's6', 's7'}
+    assert schedule.get_round_switches(1) == {'s3', 's4', 's5', 's8'}
+    assert schedule.get_round_switches(2) == {'s9'}
+    assert num_rounds == vector_first_fit(instance)
+
+
+def test_with_resiliency(instance):
+    # c2 carries 18 + 3 + 9 = 30 load, within its capacity
+    num_rounds, schedule = class_first_fit(
+        instance, True, return_schedule=True)
+    assert num_rounds == 3
+    assert schedule.get_num_migrations() == 10
@@ -0,0 +1,18 @@
+from MigrationScheduling.algorithms import collect_cbf_runs
+
+
+def test_with_no_runs():
+    assert collect_cbf_runs(iter([]), 3) == ({}, {})
+
+
+def test_with_all_runs():
+    runs = [(43, 5, {'s0': 4}), (42, 4, {'s0': 3}), (44, 4, {'s0': 1})]
+    assert collect_cbf_runs(iter(runs), 3) == (
+        {'s0': 3}, {42: 4, 43: 5, 44: 4})
+
+
+def test_stops_at_lower_bound():
+    runs = iter([(42, 5, {'s0': 4}), (43, 3, {'s0': 2}),
+                 (44, 3, {'s0': 1})])
+    assert collect_cbf_runs(runs, 3) == ({'s0': 2}, {42: 5, 43: 3})
+    assert next(runs) == (44, 3, {'s0': 1})
@@ -0,0 +1,25 @@
+from MigrationScheduling.Model import Schedule
+from MigrationScheduling.algorithms import compact_schedule
+from MigrationScheduling.tests.helpers import make_migration
+
+
+def test_with_empty_schedule():
+    schedule = Schedule({'c0': 3.0}, {})
+    assert compact_schedule(schedule) == 0
+    assert schedule.get_num_rounds() == 0
+
+
+def test_with_moves():
+    schedule = Schedule({'c0': 3.0, 'c1': 1.0}, {}, False, "matrix")
+    schedule.schedule_migration(
+        make_migration('s0', 'c0', 'c0', 1.0, set()), 0)
+    schedule.schedule_migration(
+        make_migration('s1', 'c0', 'c0', 2.0, set()), 2)
+    schedule.schedule_migration(
+        make_migration('s2', 'c1', 'c1', 1.0, set()), 1)
+    schedule.schedule_migration(
+        make_migration('s3', 'c0', 'c0', 1.0, set()), 3)
+    assert compact_schedule(schedule) == 3
+    assert schedule.get_assignment() == {
+        's0': 0, 's1': 0, 's2': 0, 's3': 1}
+    assert schedule.get_num_rounds() == 4
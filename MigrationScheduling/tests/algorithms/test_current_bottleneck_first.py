@@ -6,8 +6,7 @@ from MigrationScheduling.algorithms import current_bottleneck_first
 CAP_STR = "MigrationScheduling.algorithms.utils.get_cap_dicts"
 CONST_STR = "MigrationScheduling.algorithms.utils.get_constraints_dict"
 SELECT_STR = "MigrationScheduling.algorithms.select_bottleneck_migration"
-SCHEDULE_STR = (
-    "MigrationScheduling.algorithms.schedule_migration_in_earliest_round")
+SCHEDULE_STR = "MigrationScheduling.algorithms.Schedule"
 REMOVE_STR = (
     "MigrationScheduling.algorithms.remove_migration_from_constraints")
 
@@ -32,11 +31,15 @@ CONSTS_DICT2 = {'c1': MagicMock(),
 def test_with_no_migrations(mock_caps, mock_consts, mock_select,
                             mock_schedule, mock_remove):
     mock_data = MagicMock()
+    schedule = MagicMock()
+    schedule.get_num_rounds = MagicMock(return_value=0)
+    mock_schedule.return_value = schedule
     assert current_bottleneck_first(mock_data, 1, False) == 0
     mock_caps.assert_called_once_with(mock_data)
     mock_consts.assert_called_once_with(mock_data, False)
+    mock_schedule.assert_called_once_with({}, {}, False, "rounds")
     mock_select.assert_not_called()
-    mock_schedule.assert_not_called()
+    schedule.schedule_migration.assert_not_called()
     mock_remove.assert_not_called()
 
 
@@ -49,16 +52,18 @@ def test_with_one_migration(mock_caps, mock_consts, mock_select,
                             mock_schedule, mock_remove):
     mock_data = MagicMock()
     migration = MagicMock()
-    round = MagicMock()
+    schedule = MagicMock()
+    schedule.get_num_rounds = MagicMock(return_value=1)
+    mock_schedule.return_value = schedule
     mock_select.return_value = migration
-    mock_schedule.return_value = ([round], 1)
     mock_remove.return_value = {}
     assert current_bottleneck_first(mock_data, 1, False) == 1
     mock_caps.assert_called_once_with(mock_data)
     mock_consts.assert_called_once_with(mock_data, False)
-    mock_select.assert_called_once_with(mock_data, 1, CONSTS_DICT1)
     mock_schedule.assert_called_once_with(
-        [], 0, migration, CONTROL_CAPS1, QOS_CAPS1, False)
+        CONTROL_CAPS1, QOS_CAPS1, False, "rounds")
+    mock_select.assert_called_once_with(mock_data, 1, CONSTS_DICT1)
+    schedule.schedule_migration.assert_called_once_with(migration)
     mock_remove.assert_called_once_with(migration, CONSTS_DICT1, False)
 
 
@@ -76,29 +81,36 @@ def test_with_multi_migrations(mock_caps, mock_consts, mock_select,
              'g0': CONSTS_DICT2['g0'], 'g1': CONSTS_DICT2['g1']}
     dict3 = {'c1': CONSTS_DICT2['c1'], 'g1': CONSTS_DICT2['g1']}
     dict4 = {'g1': CONSTS_DICT2['g1']}
-    rounds = [MagicMock() for _ in range(3)]
+    schedule = MagicMock()
+    schedule.get_num_rounds = MagicMock(return_value=3)
+    mock_schedule.return_value = schedule
     mock_select.side_effect = migrations
-    mock_schedule.side_effect = ((rounds[:1], 1),
-                                 (rounds[:1], 1),
-                                 (rounds[:1], 1),
-                                 (rounds[:2], 2),
-                                 (rounds, 3))
     mock_remove.side_effect = (dict1, dict2, dict3, dict4, {})
-    assert current_bottleneck_first(mock_data, 2, True) == 3
+    assert current_bottleneck_first(
+        mock_data, 2, True, backend="matrix",
+        return_schedule=True) == (3, schedule)
     mock_caps.assert_called_once_with(mock_data)
     mock_consts.assert_called_once_with(mock_data, True)
+    mock_schedule.assert_called_once_with(
+        CONTROL_CAPS2, QOS_CAPS2, True, "matrix")
     dicts = [CONSTS_DICT2, dict1, dict2, dict3, dict4]
     select_calls = [call(mock_data, 2, const_dict) for const_dict in dicts]
     assert mock_select.call_count == 5
     mock_select.assert_has_calls(select_calls)
-    schedule_calls = [
-        call([], 0, migrations[0], CONTROL_CAPS2, QOS_CAPS2, True),
-        call(rounds[:1], 1, migrations[1], CONTROL_CAPS2, QOS_CAPS2, True),
-        call(rounds[:1], 1, migrations[2], CONTROL_CAPS2, QOS_CAPS2, True),
-        call(rounds[:1], 1, migrations[3], CONTROL_CAPS2, QOS_CAPS2, True),
-        call(rounds[:2], 2, migrations[4], CONTROL_CAPS2, QOS_CAPS2, True)]
-    assert mock_schedule.call_count == 5
-    mock_schedule.assert_has_calls(schedule_calls)
+    schedule_calls = [call(migration) for migration in migrations]
+    assert schedule.schedule_migration.call_count == 5
+    schedule.schedule_migration.assert_has_calls(schedule_calls)
     remove_calls = [call(migrations[i], dicts[i], True) for i in range(5)]
     assert mock_remove.call_count == 5
     mock_remove.assert_has_calls(remove_calls)
+
+
+@patch("MigrationScheduling.algorithms.indexed_current_bottleneck_first")
+@patch(CAP_STR)
+def test_with_indexed(mock_caps, mock_indexed):
+    mock_data = MagicMock()
+    mock_indexed.return_value = 7
+    assert current_bottleneck_first(mock_data, -1, True, indexed=True) == 7
+    mock_indexed.assert_called_once_with(
+        mock_data, -1, True, "rounds", False)
+    mock_caps.assert_not_called()
@@ -0,0 +1,63 @@
+import pytest
+from MigrationScheduling import exceptions as exc
+from MigrationScheduling.algorithms import degree_of_saturation_first
+from MigrationScheduling.Data import (
+    ControllerConstraint, InstanceData, Migration, QosConstraint)
+
+
+def build_instance(group_caps, group_switches, controller_caps, migrations):
+    migration_dict = {}
+    for switch, src, dst, load in migrations:
+        migration_dict[switch] = Migration(switch, src, dst, load)
+    qos_consts = set()
+    for group, cap in group_caps.items():
+        const = QosConstraint(group, cap)
+        for switch in group_switches[group]:
+            const.add_switch(switch)
+            migration_dict[switch].add_qos_group(group)
+        qos_consts.add(const)
+    control_consts = {ControllerConstraint(controller, cap)
+                      for controller, cap in controller_caps.items()}
+    return InstanceData(migration_dict, control_consts, qos_consts,
+                        {}, {}, {}, {})
+
+
+@pytest.fixture(scope="function")
+def instance():
+    return build_instance(
+        {'g0': 1, 'g1': 1, 'g2': 2},
+        {'g0': ['s0', 's1'], 'g1': ['s1', 's2'], 'g2': ['s0', 's2', 's3']},
+        {'c0': 10.0, 'c1': 2.0},
+        [('s0', 'c0', 'c1', 1.0), ('s1', 'c1', 'c0', 3.0),
+         ('s2', 'c0', 'c1', 1.5), ('s3', 'c1', 'c0', 8.0)])
+
+
+def test_with_no_migrations():
+    data = build_instance({}, {}, {'c0': 1.0}, [])
+    assert degree_of_saturation_first(data) == 0
+
+
+def test_invalid_backend(instance):
+    with pytest.raises(exc.IncorrectBackend):
+        degree_of_saturation_first(instance, backend="heap")
+
+
+def test_schedule(instance):
+    num_rounds, schedule = degree_of_saturation_first(
+        instance, return_schedule=True)
+    # s1 conflicts with every migration, s0 and s2 conflict through c1
+    assert num_rounds == 3
+    assert schedule.get_num_migrations() == 4
+    assert schedule.get_switch_round('s1') == 0
+    assert schedule.get_switch_round('s0') == 1
+    assert schedule.get_switch_round('s2') == 2
+    assert schedule.get_switch_round('s3') == 1
+
+
+def test_with_resiliency(instance):
+    # s1 and s3 both use c0 and c1 under resiliency
+    num_rounds, schedule = degree_of_saturation_first(
+        instance, True, "tree", True)
+    assert num_rounds == 4
+    assert len({schedule.get_switch_round(switch)
+                for switch in ('s0', 's1', 's2', 's3')}) == 4
@@ -0,0 +1,67 @@
+from unittest.mock import patch
+from MigrationScheduling.Model import Schedule
+from MigrationScheduling.algorithms import (
+    eliminate_rounds, relocate_round_migrations)
+from MigrationScheduling.tests.helpers import make_migration
+
+
+RELOCATE_STR = "MigrationScheduling.algorithms.relocate_round_migrations"
+
+
+def build_schedule():
+    schedule = Schedule({'c0': 2.0, 'c1': 2.0}, {'g0': 1}, False, "rounds")
+    schedule.schedule_migration(
+        make_migration('s0', 'c0', 'c0', 1.0, {'g0'}), 0)
+    schedule.schedule_migration(
+        make_migration('s1', 'c1', 'c1', 1.0, set()), 0)
+    schedule.schedule_migration(
+        make_migration('s2', 'c0', 'c0', 1.0, set()), 1)
+    schedule.schedule_migration(
+        make_migration('s3', 'c1', 'c1', 1.0, {'g0'}), 1)
+    schedule.schedule_migration(
+        make_migration('s4', 'c1', 'c1', 1.0, set()), 2)
+    return schedule
+
+
+def test_with_empty_schedule():
+    improved = eliminate_rounds(Schedule({'c0': 1.0}, {}))
+    assert improved.get_num_rounds() == 0
+    assert improved.get_backend() == "matrix"
+
+
+def test_eliminates_round():
+    schedule = build_schedule()
+    improved = eliminate_rounds(schedule, None)
+    assert improved.get_num_rounds() == 2
+    assert improved.get_num_migrations() == 5
+    assert improved.get_backend() == "matrix"
+    for round_num in range(2):
+        assert improved.get_remaining_capacity('c0', round_num) >= 0
+        assert improved.get_remaining_capacity('c1', round_num) >= 0
+        assert improved.get_remaining_capacity('g0', round_num) >= 0
+    assert schedule.get_num_rounds() == 3
+
+
+@patch(RELOCATE_STR, return_value=False)
+def test_with_iteration_limit(mock_relocate):
+    eliminate_rounds(build_schedule(), None, 0)
+    mock_relocate.assert_not_called()
+    improved = eliminate_rounds(build_schedule(), None, 2)
+    assert mock_relocate.call_count == 2
+    assert improved.get_num_rounds() == 2
+
+
+@patch(RELOCATE_STR, return_value=False)
+def test_with_time_limit(mock_relocate):
+    improved = eliminate_rounds(build_schedule(), 0)
+    mock_relocate.assert_not_called()
+    assert improved.get_num_migrations() == 5
+
+
+def test_stops_at_lower_bound():
+    with patch(RELOCATE_STR, wraps=relocate_round_migrations) as mock_relocate:
+        eliminate_rounds(build_schedule(), None, None, 3)
+        mock_relocate.assert_not_called()
+        improved = eliminate_rounds(build_schedule(), None, None, 2)
+        assert mock_relocate.call_count == 1
+        assert improved.get_num_rounds() == 2
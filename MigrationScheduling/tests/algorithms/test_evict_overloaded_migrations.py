@@ -0,0 +1,36 @@
+import pytest
+from MigrationScheduling.Model import Schedule
+from MigrationScheduling.algorithms import evict_overloaded_migrations
+from MigrationScheduling.tests.helpers import make_migration
+
+
+@pytest.fixture(scope="function")
+def schedule():
+    schedule = Schedule({'c0': 10.0, 'c1': 10.0}, {'g0': 3})
+    for migration in (make_migration('s0', 'c1', 'c0', 2.0, {'g0'}),
+                      make_migration('s1', 'c1', 'c0', 5.0, {'g0'}),
+                      make_migration('s2', 'c1', 'c0', 3.0, set()),
+                      make_migration('s3', 'c0', 'c1', 9.0, {'g0'})):
+        schedule.schedule_migration(migration, 0)
+    return schedule
+
+
+def test_with_feasible_round(schedule):
+    assert evict_overloaded_migrations(schedule, 'c0', 0) == []
+    assert schedule.get_num_migrations() == 4
+
+
+def test_with_overloaded_controller(schedule):
+    schedule.change_capacity('c0', -4.5)
+    evicted = evict_overloaded_migrations(schedule, 'c0', 0)
+    assert [migration.get_switch() for migration in evicted] == ['s1']
+    assert schedule.get_round_switches(0) == {'s0', 's2', 's3'}
+    assert schedule.get_remaining_capacity('c0', 0) == pytest.approx(0.5)
+
+
+def test_with_overloaded_group(schedule):
+    schedule.change_capacity('g0', -2)
+    evicted = evict_overloaded_migrations(schedule, 'g0', 0)
+    assert len(evicted) == 2
+    assert schedule.get_remaining_capacity('g0', 0) == 0
+    assert 's2' in schedule.get_round_switches(0)
@@ -48,3 +48,19 @@ def test_with_multi_migrations(mock_calc, mock_data):
                   for migration in migrations]
     assert mock_calc.call_count == 3
     mock_calc.assert_has_calls(calc_calls)
+
+
+@patch(CALC_STR)
+def test_with_migration_scores(mock_calc, mock_data):
+    migrations = (MagicMock(), MagicMock(), MagicMock())
+    mock_data.get_migration = MagicMock(side_effect=migrations)
+    scores = MagicMock()
+    scores.get_score = MagicMock(side_effect=(1.1, 0.4, 1.1))
+    consts_dict = {'c0': MagicMock(), 'g1': MagicMock()}
+    assert get_bottleneck_migration(
+        ['s0', 's2', 's5'], 'c0', mock_data,
+        consts_dict, scores) == migrations[0]
+    assert scores.get_score.call_count == 3
+    scores.get_score.assert_has_calls(
+        [call('s0', 'c0'), call('s2', 'c0'), call('s5', 'c0')])
+    mock_calc.assert_not_called()
@@ -0,0 +1,68 @@
+import pytest
+import numpy as np
+from MigrationScheduling.Data import Migration
+from MigrationScheduling.Model import Schedule
+from MigrationScheduling.algorithms import get_class_fit_count
+
+
+def build_migration(switch, src, dst, load, groups):
+    migration = Migration(switch, src, dst, load)
+    for group in groups:
+        migration.add_qos_group(group)
+    return migration
+
+
+@pytest.fixture(scope="function")
+def schedule():
+    return Schedule({'c0': 10.0, 'c1': 7.0}, {'g0': 3, 'g1': 1})
+
+
+def test_empty_round(schedule):
+    migration = build_migration('s0', 'c1', 'c0', 2.0, ['g0'])
+    assert get_class_fit_count(schedule, migration) == 3
+    assert get_class_fit_count(
+        schedule, build_migration('s1', 'c1', 'c0', 4.0, [])) == 2
+
+
+def test_partial_round(schedule):
+    schedule.schedule_migration(
+        build_migration('s0', 'c1', 'c0', 5.0, ['g0']), 0)
+    migration = build_migration('s1', 'c1', 'c0', 2.0, ['g0'])
+    assert get_class_fit_count(schedule, migration, 0) == 2
+    migration = build_migration('s2', 'c1', 'c0', 1.0, ['g0'])
+    assert get_class_fit_count(schedule, migration, 0) == 2
+
+
+def test_floating_point_load(schedule):
+    schedule.change_capacity('c0', -9.7)
+    migration = build_migration('s0', 'c1', 'c0', 0.1, [])
+    assert get_class_fit_count(schedule, migration) == 3
+
+
+def test_with_resiliency():
+    schedule = Schedule({'c0': 10.0, 'c1': 7.0}, {}, resiliency=True)
+    migration = build_migration('s0', 'c1', 'c0', 2.0, [])
+    assert get_class_fit_count(schedule, migration) == 3
+
+
+def test_does_not_fit(schedule):
+    schedule.schedule_migration(
+        build_migration('s0', 'c1', 'c0', 1.0, ['g1']), 0)
+    migration = build_migration('s1', 'c1', 'c0', 1.0, ['g1'])
+    assert get_class_fit_count(schedule, migration, 0) == 0
+    migration = build_migration('s2', 'c1', 'c0', 12.0, [])
+    assert get_class_fit_count(schedule, migration) == 0
+
+
+def test_unbounded(schedule):
+    migration = build_migration('s0', 'c1', 'c0', 0.0, [])
+    assert get_class_fit_count(schedule, migration) is None
+
+
+def test_controller_without_capacity():
+    schedule = Schedule({'c0': np.inf, 'c1': 7.0}, {'g0': 3})
+    assert get_class_fit_count(
+        schedule, build_migration('s0', 'c1', 'c0', 2.0, ['g0'])) == 3
+    assert get_class_fit_count(
+        schedule, build_migration('s1', 'c1', 'c0', 2.0, [])) is None
+
@@ -0,0 +1,29 @@
+from unittest.mock import patch, MagicMock
+from MigrationScheduling.algorithms import get_constraint_demand
+
+
+LOAD_STR = "MigrationScheduling.algorithms.utils.get_load_contribution"
+
+
+def make_schedule(is_group, resiliency=False):
+    schedule = MagicMock()
+    schedule.is_qos_group = MagicMock(return_value=is_group)
+    schedule.get_resiliency = MagicMock(return_value=resiliency)
+    return schedule
+
+
+@patch(LOAD_STR)
+def test_group_demand(mock_load):
+    migration = MagicMock()
+    migration.is_in_group = MagicMock(side_effect=lambda group: group == 'g0')
+    assert get_constraint_demand(make_schedule(True), migration, 'g0') == 1
+    assert get_constraint_demand(make_schedule(True), migration, 'g1') == 0
+    mock_load.assert_not_called()
+
+
+@patch(LOAD_STR, return_value=2.5)
+def test_controller_demand(mock_load):
+    migration = MagicMock()
+    assert get_constraint_demand(
+        make_schedule(False, True), migration, 'c1') == 2.5
+    mock_load.assert_called_once_with(migration, 'c1', True)
@@ -0,0 +1,31 @@
+import pytest
+from unittest.mock import patch, MagicMock
+from MigrationScheduling import specs
+from MigrationScheduling.algorithms import get_heuristic_upper_bound
+
+
+VFF_STR = "MigrationScheduling.algorithms.vector_first_fit"
+CBF_STR = "MigrationScheduling.algorithms.indexed_current_bottleneck_first"
+
+
+@pytest.mark.parametrize("vff_rounds, cbf_rounds, expected",
+                         [(5, 7, 5), (8, 6, 6), (4, 4, 4)])
+@patch(CBF_STR)
+@patch(VFF_STR)
+def test_without_resiliency(mock_vff, mock_cbf, vff_rounds, cbf_rounds,
+                            expected):
+    mock_vff.return_value = vff_rounds
+    mock_cbf.return_value = cbf_rounds
+    mock_data = MagicMock()
+    assert get_heuristic_upper_bound(mock_data) == expected
+    mock_vff.assert_called_once_with(mock_data, False)
+    mock_cbf.assert_called_once_with(mock_data, specs.CBF_CHOICES, False)
+
+
+@patch(CBF_STR, return_value=6)
+@patch(VFF_STR, return_value=7)
+def test_with_resiliency(mock_vff, mock_cbf):
+    mock_data = MagicMock()
+    assert get_heuristic_upper_bound(mock_data, True) == 6
+    mock_vff.assert_called_once_with(mock_data, True)
+    mock_cbf.assert_called_once_with(mock_data, specs.CBF_CHOICES, True)
@@ -0,0 +1,98 @@
+import pytest
+from unittest.mock import call, patch, MagicMock
+from MigrationScheduling.algorithms import indexed_current_bottleneck_first
+
+
+CAP_STR = "MigrationScheduling.algorithms.utils.get_cap_dicts"
+CONST_STR = "MigrationScheduling.algorithms.utils.get_constraints_dict"
+MIG_CONST_STR = (
+    "MigrationScheduling.algorithms.utils.get_migration_constraints")
+QUEUE_STR = "MigrationScheduling.algorithms.BottleneckQueue"
+SCORES_STR = "MigrationScheduling.algorithms.MigrationScores"
+SELECT_STR = "MigrationScheduling.algorithms.select_bottleneck_migration"
+SCHEDULE_STR = "MigrationScheduling.algorithms.Schedule"
+REMOVE_STR = (
+    "MigrationScheduling.algorithms.remove_migration_from_constraints")
+
+CONTROL_CAPS = {'c1': 1.7, 'c2': 3.4}
+QOS_CAPS = {'g0': 1, 'g1': 3}
+CONSTS_DICT = {'c1': MagicMock(),
+               'c2': MagicMock(),
+               'g0': MagicMock(),
+               'g1': MagicMock()}
+
+
+@patch(REMOVE_STR)
+@patch(SCHEDULE_STR)
+@patch(SELECT_STR)
+@patch(MIG_CONST_STR)
+@patch(SCORES_STR)
+@patch(QUEUE_STR)
+@patch(CONST_STR, return_value={})
+@patch(CAP_STR, return_value=({}, {}))
+def test_with_no_migrations(mock_caps, mock_consts, mock_queue,
+                            mock_scores, mock_mig_consts, mock_select,
+                            mock_schedule, mock_remove):
+    mock_data = MagicMock()
+    schedule = MagicMock()
+    schedule.get_num_rounds = MagicMock(return_value=0)
+    mock_schedule.return_value = schedule
+    assert indexed_current_bottleneck_first(mock_data, 1, False) == 0
+    mock_schedule.assert_called_once_with({}, {}, False, "rounds")
+    mock_caps.assert_called_once_with(mock_data)
+    mock_consts.assert_called_once_with(mock_data, False)
+    mock_queue.assert_called_once_with({})
+    mock_scores.assert_called_once_with(mock_data, {})
+    mock_select.assert_not_called()
+    schedule.schedule_migration.assert_not_called()
+    mock_remove.assert_not_called()
+    mock_mig_consts.assert_not_called()
+
+
+@patch(REMOVE_STR)
+@patch(SCHEDULE_STR)
+@patch(SELECT_STR)
+@patch(MIG_CONST_STR)
+@patch(SCORES_STR)
+@patch(QUEUE_STR)
+@patch(CONST_STR, return_value=CONSTS_DICT)
+@patch(CAP_STR, return_value=(CONTROL_CAPS, QOS_CAPS))
+def test_with_multi_migrations(mock_caps, mock_consts, mock_queue,
+                               mock_scores, mock_mig_consts, mock_select,
+                               mock_schedule, mock_remove):
+    mock_data = MagicMock()
+    queue = MagicMock()
+    scores = MagicMock()
+    mock_queue.return_value = queue
+    mock_scores.return_value = scores
+    migrations = (MagicMock(), MagicMock())
+    migrations[0].get_switch = MagicMock(return_value='s0')
+    migrations[1].get_switch = MagicMock(return_value='s3')
+    dict1 = {'c2': CONSTS_DICT['c2'], 'g1': CONSTS_DICT['g1']}
+    schedule = MagicMock()
+    schedule.get_num_rounds = MagicMock(return_value=2)
+    mock_schedule.return_value = schedule
+    mock_select.side_effect = migrations
+    mock_remove.side_effect = (dict1, {})
+    mock_mig_consts.side_effect = (['c1', 'c2', 'g0'], ['c2', 'c1', 'g1'])
+    assert indexed_current_bottleneck_first(
+        mock_data, -1, True, "tree", True) == (2, schedule)
+    mock_schedule.assert_called_once_with(
+        CONTROL_CAPS, QOS_CAPS, True, "tree")
+    mock_queue.assert_called_once_with(CONSTS_DICT)
+    mock_scores.assert_called_once_with(mock_data, CONSTS_DICT)
+    assert mock_select.call_count == 2
+    mock_select.assert_has_calls(
+        [call(mock_data, -1, CONSTS_DICT, queue, scores),
+         call(mock_data, -1, dict1, queue, scores)])
+    assert schedule.schedule_migration.call_count == 2
+    schedule.schedule_migration.assert_has_calls(
+        [call(migrations[0]), call(migrations[1])])
+    mock_remove.assert_has_calls(
+        [call(migrations[0], CONSTS_DICT, True),
+         call(migrations[1], dict1, True)])
+    mock_mig_consts.assert_has_calls(
+        [call(migrations[0], True), call(migrations[1], True)])
+    queue.update_constraints.assert_has_calls(
+        [call(['c1', 'c2', 'g0']), call(['c2', 'c1', 'g1'])])
+    scores.remove_migration.assert_has_calls([call('s0'), call('s3')])
@@ -0,0 +1,100 @@
+from unittest.mock import call, patch, MagicMock
+from MigrationScheduling import specs
+from MigrationScheduling.Data import InstanceData
+from MigrationScheduling.algorithms import (
+    multi_start_current_bottleneck_first)
+from MigrationScheduling.tests.helpers import build_instance
+
+
+RUN_STR = "MigrationScheduling.algorithms.run_seeded_cbf"
+INIT_STR = "MigrationScheduling.algorithms.initialize_cbf_worker"
+BUILD_STR = "MigrationScheduling.algorithms.build_schedule"
+POOL_STR = "MigrationScheduling.algorithms.multiprocessing.Pool"
+BOUND_STR = "MigrationScheduling.algorithms.bounds.get_lower_bound"
+
+
+@patch(BOUND_STR, return_value=2)
+@patch(BUILD_STR)
+@patch(INIT_STR)
+@patch(RUN_STR, side_effect=lambda seed: (seed, 10 - seed, {'s0': seed}))
+def test_in_process(mock_run, mock_init, mock_build, mock_bound):
+    mock_data = MagicMock()
+    schedule, run_rounds = multi_start_current_bottleneck_first(
+        mock_data, 2, 3, False, 1, 5)
+    assert schedule == mock_build.return_value
+    assert run_rounds == {5: 5, 6: 4, 7: 3}
+    mock_bound.assert_called_once_with(mock_data, False)
+    mock_init.assert_called_once_with(mock_data, 2, False)
+    mock_build.assert_called_once_with(mock_data, {'s0': 7}, False)
+
+
+@patch(BOUND_STR)
+@patch(BUILD_STR)
+@patch(INIT_STR)
+@patch(RUN_STR, side_effect=lambda seed: (seed, 10 - seed, {'s0': seed}))
+def test_stops_at_given_bound(mock_run, mock_init, mock_build, mock_bound):
+    mock_data = MagicMock()
+    _, run_rounds = multi_start_current_bottleneck_first(
+        mock_data, 2, 6, True, 1, 0, 6)
+    assert run_rounds == {0: 10, 1: 9, 2: 8, 3: 7, 4: 6}
+    mock_bound.assert_not_called()
+    mock_build.assert_called_once_with(mock_data, {'s0': 4}, True)
+
+
+@patch(BOUND_STR, return_value=1)
+@patch(BUILD_STR)
+@patch(POOL_STR)
+def test_with_pool(mock_pool, mock_build, mock_bound):
+    mock_data = MagicMock()
+    pool = MagicMock()
+    pool.imap_unordered = MagicMock(
+        return_value=iter([(specs.SEED_NUM + 1, 3, {'s0': 1}),
+                           (specs.SEED_NUM, 3, {'s0': 0})]))
+    mock_pool.return_value.__enter__.return_value = pool
+    schedule, run_rounds = multi_start_current_bottleneck_first(
+        mock_data, 2, 2, num_workers=4)
+    assert run_rounds == {specs.SEED_NUM: 3, specs.SEED_NUM + 1: 3}
+    assert mock_pool.call_args[0][0] == 4
+    assert mock_pool.call_args[0][2] == (mock_data, 2, False)
+    assert pool.imap_unordered.call_args[0][1] == [
+        specs.SEED_NUM, specs.SEED_NUM + 1]
+    mock_build.assert_called_once_with(mock_data, {'s0': 0}, False)
+
+
+def test_with_resiliency():
+    # each migration also loads its source controller
+    data = build_instance(
+        {}, {}, {'c0': 6.0, 'c1': 6.0, 'c2': 6.0},
+        [('s0', 'c1', 'c0', 1.0), ('s1', 'c0', 'c1', 4.0),
+         ('s2', 'c2', 'c0', 3.0), ('s3', 'c0', 'c2', 2.0),
+         ('s4', 'c1', 'c0', 1.0), ('s5', 'c1', 'c2', 3.0)])
+    schedule, run_rounds = multi_start_current_bottleneck_first(
+        data, 2, 3, True, 1)
+    assert schedule.get_num_rounds() == 2
+    assert schedule.get_num_migrations() == 6
+    assert min(run_rounds.values()) == 2
+
+
+def test_independent_of_constraint_order():
+    # the constraints tie on load factor, so the schedule depends on how
+    # ties are broken
+    data = build_instance(
+        {'g0': 1, 'g1': 1}, {'g0': ['s4', 's5'], 'g1': ['s1', 's2']},
+        {'c0': 3.0, 'c1': 3.0},
+        [('s0', 'c1', 'c0', 1.0), ('s1', 'c0', 'c1', 2.0),
+         ('s2', 'c0', 'c1', 2.0), ('s3', 'c1', 'c0', 1.0),
+         ('s4', 'c0', 'c1', 1.0), ('s5', 'c1', 'c0', 2.0)])
+    results = []
+    for reverse in (False, True):
+        ordered_data = InstanceData(
+            data.get_migrations(),
+            sorted(data.get_control_consts(), reverse=reverse,
+                   key=lambda const: const.get_controller()),
+            sorted(data.get_qos_consts(), reverse=reverse,
+                   key=lambda const: const.get_group()),
+            data.get_switch_ids(), data.get_round_ids(),
+            data.get_controller_ids(), data.get_qos_ids())
+        schedule, run_rounds = multi_start_current_bottleneck_first(
+            ordered_data, -1, 3, False, 1, lower_bound=0)
+        results.append((schedule.get_assignment(), run_rounds))
+    assert results[0] == results[1]
@@ -0,0 +1,91 @@
+import pytest
+from unittest.mock import call, patch, MagicMock
+from MigrationScheduling import exceptions as exc
+from MigrationScheduling.algorithms import ordered_vector_fit
+
+
+SCHEDULE_STR = "MigrationScheduling.algorithms.Schedule"
+CAPS_STR = "MigrationScheduling.algorithms.utils.get_cap_dicts"
+ORDER_STR = "MigrationScheduling.algorithms.utils.order_migrations"
+DEMANDS_STR = "MigrationScheduling.algorithms.utils.get_normalized_demands"
+SELECT_STR = "MigrationScheduling.algorithms.select_placement_round"
+
+CONTROL_CAPS = {'c2': 11.5, 'c5': 3.7}
+QOS_CAPS = {'g0': 1, 'g5': 2}
+CONST_CAPS = {'c2': 11.5, 'c5': 3.7, 'g0': 1, 'g5': 2}
+
+
+@pytest.fixture(scope="function")
+def mock_data():
+    return MagicMock()
+
+
+@patch(SELECT_STR)
+@patch(DEMANDS_STR)
+@patch(ORDER_STR, return_value=[])
+@patch(CAPS_STR, return_value=({}, {}))
+@patch(SCHEDULE_STR)
+def test_with_no_migrations(mock_schedule, mock_caps, mock_order,
+                            mock_demands, mock_select, mock_data):
+    schedule = MagicMock()
+    schedule.get_num_rounds = MagicMock(return_value=0)
+    mock_schedule.return_value = schedule
+    assert ordered_vector_fit(mock_data) == 0
+    mock_order.assert_called_once_with(mock_data, "input", False)
+    mock_schedule.assert_called_once_with({}, {}, False, "rounds")
+    mock_demands.assert_not_called()
+    mock_select.assert_not_called()
+
+
+@patch(SELECT_STR, side_effect=(0, 1, 0))
+@patch(DEMANDS_STR)
+@patch(ORDER_STR)
+@patch(CAPS_STR, return_value=(CONTROL_CAPS, QOS_CAPS))
+@patch(SCHEDULE_STR)
+def test_with_first_placement(mock_schedule, mock_caps, mock_order,
+                              mock_demands, mock_select, mock_data):
+    migrations = [MagicMock() for _ in range(3)]
+    mock_order.return_value = migrations
+    schedule = MagicMock()
+    schedule.get_num_rounds = MagicMock(return_value=2)
+    mock_schedule.return_value = schedule
+    assert ordered_vector_fit(
+        mock_data, "load", "first", True, "matrix", True) == (2, schedule)
+    mock_order.assert_called_once_with(mock_data, "load", True)
+    mock_schedule.assert_called_once_with(
+        CONTROL_CAPS, QOS_CAPS, True, "matrix")
+    mock_demands.assert_not_called()
+    mock_select.assert_has_calls(
+        [call(schedule, migration, "first", {}, CONST_CAPS)
+         for migration in migrations])
+    schedule.schedule_migration.assert_has_calls(
+        [call(migrations[0], 0), call(migrations[1], 1),
+         call(migrations[2], 0)])
+
+
+@patch(SELECT_STR, side_effect=(0, 0))
+@patch(DEMANDS_STR, side_effect=({'c2': 0.1}, {'c5': 0.5, 'g0': 1.0}))
+@patch(ORDER_STR)
+@patch(CAPS_STR, return_value=(CONTROL_CAPS, QOS_CAPS))
+@patch(SCHEDULE_STR)
+def test_with_best_placement(mock_schedule, mock_caps, mock_order,
+                             mock_demands, mock_select, mock_data):
+    migrations = [MagicMock() for _ in range(2)]
+    mock_order.return_value = migrations
+    schedule = MagicMock()
+    schedule.get_num_rounds = MagicMock(return_value=1)
+    mock_schedule.return_value = schedule
+    assert ordered_vector_fit(mock_data, "demand", "best") == 1
+    mock_demands.assert_has_calls(
+        [call(migration, CONTROL_CAPS, QOS_CAPS, False)
+         for migration in migrations])
+    mock_select.assert_has_calls(
+        [call(schedule, migrations[0], "best", {'c2': 0.1}, CONST_CAPS),
+         call(schedule, migrations[1], "best", {'c5': 0.5, 'g0': 1.0},
+              CONST_CAPS)])
+    assert schedule.schedule_migration.call_count == 2
+
+
+def test_with_invalid_placement(mock_data):
+    with pytest.raises(exc.IncorrectPlacement):
+        ordered_vector_fit(mock_data, "input", "next")
@@ -0,0 +1,49 @@
+from MigrationScheduling.Model import Schedule
+from MigrationScheduling.algorithms import relocate_round_migrations
+from MigrationScheduling.tests.helpers import make_migration
+
+
+def test_with_round_emptied():
+    schedule = Schedule({'c0': 3.0}, {}, False, "matrix")
+    for round_num in range(3):
+        schedule.schedule_migration(
+            make_migration('s{}'.format(round_num), 'c0', 'c0', 1.0, set()),
+            round_num)
+    assert relocate_round_migrations(schedule, 2)
+    assert schedule.get_round_switches(2) == set()
+    assert schedule.get_assignment() == {'s0': 0, 's1': 1, 's2': 0}
+
+
+def test_with_no_other_round():
+    schedule = Schedule({'c0': 1.0}, {}, False, "matrix")
+    schedule.schedule_migration(
+        make_migration('s0', 'c0', 'c0', 1.0, set()), 0)
+    schedule.schedule_migration(
+        make_migration('s1', 'c0', 'c0', 1.0, set()), 1)
+    assert not relocate_round_migrations(schedule, 1)
+    assert schedule.get_assignment() == {'s0': 0, 's1': 1}
+
+
+def test_with_partial_move_reverted():
+    schedule = Schedule({'c0': 2.0, 'c1': 1.0}, {}, False, "matrix")
+    schedule.schedule_migration(
+        make_migration('s0', 'c0', 'c0', 1.0, set()), 0)
+    schedule.schedule_migration(
+        make_migration('s3', 'c1', 'c1', 1.0, set()), 0)
+    schedule.schedule_migration(
+        make_migration('s1', 'c0', 'c0', 1.0, set()), 1)
+    schedule.schedule_migration(
+        make_migration('s2', 'c1', 'c1', 1.0, set()), 1)
+    assert not relocate_round_migrations(schedule, 1)
+    assert schedule.get_assignment() == {
+        's0': 0, 's1': 1, 's2': 1, 's3': 0}
+    assert schedule.get_remaining_capacity('c0', 0) == 1.0
+    assert schedule.get_remaining_capacity('c0', 1) == 1.0
+
+
+def test_skips_empty_rounds():
+    schedule = Schedule({'c0': 1.0}, {}, False, "matrix")
+    schedule.schedule_migration(
+        make_migration('s0', 'c0', 'c0', 1.0, set()), 2)
+    assert not relocate_round_migrations(schedule, 2)
+    assert schedule.get_switch_round('s0') == 2
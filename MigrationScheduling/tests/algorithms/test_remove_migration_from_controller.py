@@ -36,3 +36,12 @@ def test_controller_has_other_switches():
     assert result_dict == {'c1': control_const,
                            'g3': consts_dict['g3'],
                            'g4': consts_dict['g4']}
+
+
+def test_controller_without_constraint():
+    migration = MagicMock()
+    consts_dict = {'c1': MagicMock(), 'g0': MagicMock()}
+    result_dict = remove_migration_from_controller(
+        migration, 'c3', consts_dict)
+    assert result_dict == {'c1': consts_dict['c1'], 'g0': consts_dict['g0']}
+    migration.get_switch.assert_not_called()
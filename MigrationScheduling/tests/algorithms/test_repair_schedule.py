@@ -0,0 +1,46 @@
+import pytest
+from MigrationScheduling import specs
+from MigrationScheduling.Model import Schedule
+from MigrationScheduling.algorithms import repair_schedule
+from MigrationScheduling.tests.helpers import make_migration
+
+
+def build_schedule(backend):
+    schedule = Schedule({'c0': 10.0, 'c1': 4.0}, {'g0': 2}, False, backend)
+    for migration, round_num in (
+        (make_migration('s0', 'c1', 'c0', 6.0, {'g0'}), 0),
+        (make_migration('s1', 'c1', 'c0', 3.0, {'g0'}), 0),
+        (make_migration('s2', 'c0', 'c1', 4.0, set()), 0),
+        (make_migration('s3', 'c1', 'c0', 2.0, set()), 1),
+        (make_migration('s4', 'c1', 'c0', 8.0, {'g0'}), 2)):
+        schedule.schedule_migration(migration, round_num)
+    return schedule
+
+
+@pytest.mark.parametrize("backend", sorted(specs.SCHEDULING_BACKENDS))
+def test_capacity_increase(backend):
+    schedule = build_schedule(backend)
+    assert repair_schedule(schedule, {'c0': 2.0, 'g0': 1}) == {}
+    assert schedule.get_capacity('c0') == 12.0
+    assert schedule.get_num_rounds() == 3
+
+
+@pytest.mark.parametrize("backend", sorted(specs.SCHEDULING_BACKENDS))
+def test_capacity_decrease(backend):
+    schedule = build_schedule(backend)
+    assert repair_schedule(schedule, {'c0': -2.0, 'g0': -1}) == {'s0': 1}
+    assert schedule.get_num_migrations() == 5
+    assert schedule.get_num_rounds() == 3
+    assert schedule.get_round_switches(0) == {'s1', 's2'}
+    for round_num in range(schedule.get_num_rounds()):
+        for const_name in ('c0', 'c1', 'g0'):
+            assert schedule.get_remaining_capacity(
+                const_name, round_num) >= 0
+
+
+@pytest.mark.parametrize("backend", sorted(specs.SCHEDULING_BACKENDS))
+def test_frozen_rounds_unchanged(backend):
+    schedule = build_schedule(backend)
+    assert repair_schedule(schedule, {'c0': -3.0}, 1) == {'s4': 3}
+    assert schedule.get_round_switches(0) == {'s0', 's1', 's2'}
+    assert schedule.get_remaining_capacity('c0', 0) == pytest.approx(-2.0)
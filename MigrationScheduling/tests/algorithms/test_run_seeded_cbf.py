@@ -0,0 +1,22 @@
+from unittest.mock import patch, MagicMock
+from MigrationScheduling import algorithms
+
+
+CBF_STR = "MigrationScheduling.algorithms.indexed_current_bottleneck_first"
+SEED_STR = "MigrationScheduling.algorithms.random.seed"
+
+
+@patch(SEED_STR)
+@patch(CBF_STR)
+def test_run_seeded_cbf(mock_cbf, mock_seed):
+    mock_data = MagicMock()
+    schedule = MagicMock()
+    schedule.get_assignment = MagicMock(return_value={'s0': 0, 's1': 1})
+    mock_cbf.return_value = (2, schedule)
+    algorithms.initialize_cbf_worker(mock_data, 3, True)
+    assert algorithms.CBF_WORKER_ARGS == (mock_data, 3, True)
+    assert algorithms.run_seeded_cbf(45) == (45, 2, {'s0': 0, 's1': 1})
+    mock_seed.assert_called_once_with(45)
+    mock_cbf.assert_called_once_with(
+        mock_data, 3, True, return_schedule=True)
+    algorithms.initialize_cbf_worker(None, 0)
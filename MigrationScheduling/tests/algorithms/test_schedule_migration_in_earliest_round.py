@@ -74,3 +74,23 @@ def test_with_multi_round_cant_fit(mock_round, mock_find, mock_migration):
     new_round.schedule_migration.assert_called_once_with(mock_migration, True)
     assert result_rounds == rounds + [new_round]
     assert result_cnt == 6
+
+@patch(FIND_STR)
+@patch(ROUND_STR)
+def test_with_round_index(mock_round, mock_find, mock_migration):
+    rounds = [MagicMock() for _ in range(2)]
+    new_round = MagicMock()
+    mock_round.return_value = new_round
+    round_index = MagicMock()
+    round_index.find_scheduling_round = MagicMock(return_value=2)
+    result_rounds, result_cnt = schedule_migration_in_earliest_round(
+        rounds, 2, mock_migration, CONTROLLER_CAPS1, QOS_CAPS1,
+        False, round_index)
+    mock_find.assert_not_called()
+    round_index.find_scheduling_round.assert_called_once_with(mock_migration)
+    round_index.schedule_migration.assert_called_once_with(mock_migration, 2)
+    mock_round.assert_called_once_with(2, CONTROLLER_CAPS1, QOS_CAPS1)
+    new_round.schedule_migration.assert_called_once_with(
+        mock_migration, False)
+    assert result_rounds == rounds + [new_round]
+    assert result_cnt == 3
@@ -22,7 +22,8 @@ def test_with_one_candidate(mock_const, mock_select, mock_bottleneck):
     assert select_bottleneck_migration(data, 1, consts_dict) == migration
     mock_const.assert_called_once_with(consts_dict)
     mock_select.assert_called_once_with(const, 1)
-    mock_bottleneck.assert_called_once_with({'s3'}, 'c0', data, consts_dict)
+    mock_bottleneck.assert_called_once_with(
+        {'s3'}, 'c0', data, consts_dict, None)
 
 
 @patch(BOTTLENECK_STR)
@@ -46,4 +47,26 @@ def test_with_multi_candidates(mock_const, mock_select, mock_bottleneck):
     mock_const.assert_called_once_with(consts_dict)
     mock_select.assert_called_once_with(const, 2)
     mock_bottleneck.assert_called_once_with(
-        {'s0', 's2'}, 'g3', data, consts_dict)
+        {'s0', 's2'}, 'g3', data, consts_dict, None)
+
+
+@patch(BOTTLENECK_STR)
+@patch(SELECT_STR)
+@patch(CONST_STR)
+def test_with_bottleneck_queue(mock_const, mock_select, mock_bottleneck):
+    data = MagicMock()
+    const = MagicMock()
+    migration = MagicMock()
+    queue = MagicMock()
+    scores = MagicMock()
+    consts_dict = {'c0': const, 'g2': MagicMock()}
+    queue.get_bottleneck_constraint = MagicMock(return_value=('c0', const))
+    mock_select.return_value = {'s1', 's4'}
+    mock_bottleneck.return_value = migration
+    assert select_bottleneck_migration(
+        data, -1, consts_dict, queue, scores) == migration
+    mock_const.assert_not_called()
+    queue.get_bottleneck_constraint.assert_called_once()
+    mock_select.assert_called_once_with(const, -1)
+    mock_bottleneck.assert_called_once_with(
+        {'s1', 's4'}, 'c0', data, consts_dict, scores)
@@ -1,3 +1,4 @@
+import random
 import pytest
 from unittest.mock import patch, MagicMock
 from MigrationScheduling.algorithms import select_candidate_migrations
@@ -22,7 +23,7 @@ def const_dict2():
 
 @patch(RANDOM_STR)
 def test_sample_all_directly_specified(mock_random, const_dict1):
-    assert select_candidate_migrations(const_dict1, -1) == {'s0', 's3', 's7'}
+    assert select_candidate_migrations(const_dict1, -1) == ['s0', 's3', 's7']
     const_dict1.get_switches.assert_called_once()
     mock_random.assert_not_called()
 
@@ -30,7 +31,7 @@ def test_sample_all_directly_specified(mock_random, const_dict1):
 @patch(RANDOM_STR)
 def test_sample_all_indirectly_specified(mock_random, const_dict2):
     assert select_candidate_migrations(
-        const_dict2, 4) == {'s1', 's2', 's5', 's6'}
+        const_dict2, 4) == ['s1', 's2', 's5', 's6']
     assert const_dict2.get_switches.call_count == 2
     mock_random.assert_not_called()
 
@@ -39,11 +40,19 @@ def test_sample_all_indirectly_specified(mock_random, const_dict2):
 def test_sample_2(mock_random, const_dict1):
     assert select_candidate_migrations(const_dict1, 2) == ['s0', 's7']
     assert const_dict1.get_switches.call_count == 2
-    mock_random.assert_called_once_with({'s0', 's3', 's7'}, 2)
+    mock_random.assert_called_once_with(['s0', 's3', 's7'], 2)
 
 
 @patch(RANDOM_STR, return_value=['s5'])
 def test_sample_1(mock_random, const_dict2):
     assert select_candidate_migrations(const_dict2, 1) == ['s5']
     assert const_dict2.get_switches.call_count == 2
-    mock_random.assert_called_once_with({'s1', 's2', 's5', 's6'}, 1)
+    mock_random.assert_called_once_with(['s1', 's2', 's5', 's6'], 1)
+
+
+def test_sample_is_seeded(const_dict2):
+    random.seed(7)
+    first_sample = select_candidate_migrations(const_dict2, 2)
+    random.seed(7)
+    assert select_candidate_migrations(const_dict2, 2) == first_sample
+    assert set(first_sample) <= {'s1', 's2', 's5', 's6'}
@@ -0,0 +1,60 @@
+import pytest
+from unittest.mock import MagicMock
+from MigrationScheduling.algorithms import select_placement_round
+
+
+DEMANDS = {'c0': 0.8, 'g0': 0.25}
+CONST_CAPS = {'c0': 5.0, 'c1': 2.0, 'g0': 4}
+REM_CAPS = {0: {'c0': 5.0, 'g0': 2},
+            2: {'c0': 4.0, 'g0': 1},
+            3: {'c0': 4.0, 'g0': 4}}
+
+
+@pytest.fixture(scope="function")
+def mock_schedule():
+    schedule = MagicMock()
+    schedule.get_num_rounds = MagicMock(return_value=4)
+    schedule.find_scheduling_round = MagicMock(return_value=0)
+    schedule.find_scheduling_rounds = MagicMock(return_value=[0, 2, 3])
+    schedule.get_remaining_capacity = MagicMock(
+        side_effect=lambda const, round_num: REM_CAPS[round_num][const])
+    return schedule
+
+
+def test_first_placement(mock_schedule):
+    migration = MagicMock()
+    assert select_placement_round(
+        mock_schedule, migration, "first", {}, CONST_CAPS) == 0
+    mock_schedule.find_scheduling_round.assert_called_once_with(migration)
+    mock_schedule.find_scheduling_rounds.assert_not_called()
+
+
+def test_best_placement(mock_schedule):
+    migration = MagicMock()
+    assert select_placement_round(
+        mock_schedule, migration, "best", DEMANDS, CONST_CAPS) == 2
+    mock_schedule.find_scheduling_rounds.assert_called_once_with(migration)
+    assert mock_schedule.get_remaining_capacity.call_count == 6
+
+
+def test_worst_placement(mock_schedule):
+    assert select_placement_round(
+        mock_schedule, MagicMock(), "worst", DEMANDS, CONST_CAPS) == 3
+
+
+def test_dot_placement(mock_schedule):
+    assert select_placement_round(
+        mock_schedule, MagicMock(), "dot", DEMANDS, CONST_CAPS) == 0
+
+
+def test_with_ties(mock_schedule):
+    mock_schedule.get_remaining_capacity = MagicMock(return_value=2)
+    assert select_placement_round(
+        mock_schedule, MagicMock(), "best", DEMANDS, CONST_CAPS) == 0
+
+
+def test_with_no_fitting_rounds(mock_schedule):
+    mock_schedule.find_scheduling_rounds = MagicMock(return_value=[])
+    assert select_placement_round(
+        mock_schedule, MagicMock(), "dot", DEMANDS, CONST_CAPS) == 4
+    mock_schedule.get_remaining_capacity.assert_not_called()
@@ -1,10 +1,10 @@
 import pytest
 from unittest.mock import call, patch, MagicMock
+from MigrationScheduling import exceptions as exc
 from MigrationScheduling.algorithms import vector_first_fit
 
 
-SCHEDULE_STR = (
-    "MigrationScheduling.algorithms.schedule_migration_in_earliest_round")
+SCHEDULE_STR = "MigrationScheduling.algorithms.Schedule"
 CAPS_STR = "MigrationScheduling.algorithms.utils.get_cap_dicts"
 
 CONTROL_CAPS1 = {'c0': 3.4}
@@ -21,25 +21,31 @@ def mock_data():
 @patch(CAPS_STR, return_value=({}, {}))
 @patch(SCHEDULE_STR)
 def test_with_no_migrations(mock_schedule, mock_caps, mock_data):
+    schedule = MagicMock()
+    schedule.get_num_rounds = MagicMock(return_value=0)
+    mock_schedule.return_value = schedule
     mock_data.get_migrations = MagicMock(return_value={})
     assert vector_first_fit(mock_data, False) == 0
     mock_data.get_migrations.assert_called_once()
     mock_caps.assert_called_once_with(mock_data)
-    mock_schedule.assert_not_called()
+    mock_schedule.assert_called_once_with({}, {}, False, "rounds")
+    schedule.schedule_migration.assert_not_called()
 
 
 @patch(CAPS_STR, return_value=(CONTROL_CAPS1, QOS_CAPS1))
 @patch(SCHEDULE_STR)
 def test_with_one_migration(mock_schedule, mock_caps, mock_data):
-    migration = [MagicMock()]
+    migration = MagicMock()
     mock_data.get_migrations = MagicMock(return_value={'s0': migration})
-    round = MagicMock()
-    mock_schedule.return_value = ([round], 1)
+    schedule = MagicMock()
+    schedule.get_num_rounds = MagicMock(return_value=1)
+    mock_schedule.return_value = schedule
     assert vector_first_fit(mock_data, False) == 1
     mock_data.get_migrations.assert_called_once()
     mock_caps.assert_called_once_with(mock_data)
     mock_schedule.assert_called_once_with(
-        [], 0, migration, CONTROL_CAPS1, QOS_CAPS1, False)
+        CONTROL_CAPS1, QOS_CAPS1, False, "rounds")
+    schedule.schedule_migration.assert_called_once_with(migration)
 
 @patch(CAPS_STR, return_value=(CONTROL_CAPS2, QOS_CAPS2))
 @patch(SCHEDULE_STR)
@@ -48,21 +54,36 @@ def test_with_multi_migrations(mock_schedule, mock_caps, mock_data):
     mock_dict = MagicMock()
     mock_data.get_migrations = MagicMock(return_value=mock_dict)
     mock_dict.values = MagicMock(return_value=migrations)
-    rounds = [MagicMock() for _ in range(3)]
-    mock_schedule.side_effect = ((rounds[:1], 1),
-                                 (rounds[:2], 2),
-                                 (rounds[:2], 2),
-                                 (rounds[:2], 2),
-                                 (rounds, 3))
+    schedule = MagicMock()
+    schedule.get_num_rounds = MagicMock(return_value=3)
+    mock_schedule.return_value = schedule
     assert vector_first_fit(mock_data, True) == 3
     mock_data.get_migrations.assert_called_once()
     mock_dict.values.assert_called_once()
     mock_caps.assert_called_once_with(mock_data)
-    schedule_calls = [
-        call([], 0, migrations[0], CONTROL_CAPS2, QOS_CAPS2, True),
-        call(rounds[:1], 1, migrations[1], CONTROL_CAPS2, QOS_CAPS2, True),
-        call(rounds[:2], 2, migrations[2], CONTROL_CAPS2, QOS_CAPS2, True),
-        call(rounds[:2], 2, migrations[3], CONTROL_CAPS2, QOS_CAPS2, True),
-        call(rounds[:2], 2, migrations[4], CONTROL_CAPS2, QOS_CAPS2, True)]
-    assert mock_schedule.call_count == 5
-    mock_schedule.assert_has_calls(schedule_calls)
+    mock_schedule.assert_called_once_with(
+        CONTROL_CAPS2, QOS_CAPS2, True, "rounds")
+    schedule_calls = [call(migration) for migration in migrations]
+    assert schedule.schedule_migration.call_count == 5
+    schedule.schedule_migration.assert_has_calls(schedule_calls)
+
+
+@patch(CAPS_STR, return_value=(CONTROL_CAPS1, QOS_CAPS1))
+@patch(SCHEDULE_STR)
+def test_with_backend_and_schedule(mock_schedule, mock_caps, mock_data):
+    migration = MagicMock()
+    mock_data.get_migrations = MagicMock(return_value={'s0': migration})
+    schedule = MagicMock()
+    schedule.get_num_rounds = MagicMock(return_value=1)
+    mock_schedule.return_value = schedule
+    assert vector_first_fit(mock_data, True, "tree", True) == (1, schedule)
+    mock_schedule.assert_called_once_with(
+        CONTROL_CAPS1, QOS_CAPS1, True, "tree")
+    schedule.schedule_migration.assert_called_once_with(migration)
+
+
+def test_with_invalid_backend(mock_data):
+    mock_data.get_migrations = MagicMock(return_value={})
+    with patch(CAPS_STR, return_value=({}, {})):
+        with pytest.raises(exc.IncorrectBackend):
+            vector_first_fit(mock_data, False, "invalid")
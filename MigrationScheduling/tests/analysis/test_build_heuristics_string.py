@@ -6,12 +6,14 @@ from MigrationScheduling.analysis import build_heuristics_string
 TIMER_STR = "MigrationScheduling.analysis.timer"
 VFF_STR = "MigrationScheduling.analysis.algorithms.vector_first_fit"
 CBF_STR = "MigrationScheduling.analysis.algorithms.current_bottleneck_first"
+BOUND_STR = "MigrationScheduling.analysis.bounds.get_lower_bound"
 
 
-@patch(CBF_STR, return_value=7)
-@patch(VFF_STR, return_value=8)
+@patch(BOUND_STR, return_value=1)
+@patch(CBF_STR, return_value=(7, "cbf"))
+@patch(VFF_STR, return_value=(8, "vff"))
 @patch(TIMER_STR, side_effect=(1.1, 2.3, 5.7, 8.9))
-def test_no_resilience(mock_timer, mock_vff, mock_cbf):
+def test_no_resilience(mock_timer, mock_vff, mock_cbf, mock_bound):
     mock_data = MagicMock()
     result_str = build_heuristics_string(mock_data, False)
     results = [float(x) for x in result_str.split(" ")]
@@ -21,14 +23,17 @@ def test_no_resilience(mock_timer, mock_vff, mock_cbf):
     assert round(results[2], 0) == 7
     assert round(results[3], 1) == 3.2
     assert mock_timer.call_count == 4
-    mock_vff.assert_called_once_with(mock_data, False)
-    mock_cbf.assert_called_once_with(mock_data, specs.CBF_CHOICES, False)
+    mock_vff.assert_called_once_with(
+        mock_data, False, return_schedule=True)
+    mock_cbf.assert_called_once_with(
+        mock_data, specs.CBF_CHOICES, False, return_schedule=True)
 
 
-@patch(CBF_STR, return_value=10)
-@patch(VFF_STR, return_value=12)
+@patch(BOUND_STR, return_value=1)
+@patch(CBF_STR, return_value=(10, "cbf"))
+@patch(VFF_STR, return_value=(12, "vff"))
 @patch(TIMER_STR, side_effect=(1.3, 2.9, 3.2, 7.8))
-def test_with_resilience(mock_timer, mock_vff, mock_cbf):
+def test_with_resilience(mock_timer, mock_vff, mock_cbf, mock_bound):
     mock_data = MagicMock()
     result_str = build_heuristics_string(mock_data, True)
     results = [float(x) for x in result_str.split(" ")]
@@ -38,5 +43,33 @@ def test_with_resilience(mock_timer, mock_vff, mock_cbf):
     assert round(results[2], 0) == 10
     assert round(results[3], 1) == 4.6
     assert mock_timer.call_count == 4
-    mock_vff.assert_called_once_with(mock_data, True)
-    mock_cbf.assert_called_once_with(mock_data, specs.CBF_CHOICES, True)
+    mock_vff.assert_called_once_with(
+        mock_data, True, return_schedule=True)
+    mock_cbf.assert_called_once_with(
+        mock_data, specs.CBF_CHOICES, True, return_schedule=True)
+
+
+@patch(BOUND_STR, return_value=1)
+@patch(CBF_STR, return_value=(5, "cbf"))
+@patch(VFF_STR)
+@patch(TIMER_STR, side_effect=(2.5, 4.0))
+def test_with_vff_result(mock_timer, mock_vff, mock_cbf, mock_bound):
+    mock_data = MagicMock()
+    result_str = build_heuristics_string(mock_data, False, (6, 0.25))
+    results = [float(x) for x in result_str.split(" ")]
+    assert results == [6, 0.25, 5, 1.5]
+    assert mock_timer.call_count == 2
+    mock_vff.assert_not_called()
+    mock_cbf.assert_called_once_with(
+        mock_data, specs.CBF_CHOICES, False, return_schedule=True)
+
+
+@patch(BOUND_STR, return_value=6)
+@patch(CBF_STR)
+@patch(VFF_STR)
+@patch(TIMER_STR)
+def test_vff_result_at_lower_bound(mock_timer, mock_vff, mock_cbf,
+                                   mock_bound):
+    result_str = build_heuristics_string(MagicMock(), False, (6, 0.25))
+    assert result_str == "6 0.25 nan nan"
+    mock_cbf.assert_not_called()
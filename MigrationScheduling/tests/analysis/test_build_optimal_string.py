@@ -1,8 +1,11 @@
+import gurobipy as gp
 from unittest.mock import patch, MagicMock
 from MigrationScheduling.analysis import build_optimal_string
+from MigrationScheduling.Model import Optimizer
 
 
 TIMER_STR = "MigrationScheduling.analysis.timer"
+BOUND_STR = "MigrationScheduling.analysis.bounds.get_lower_bound"
 
 
 @patch(TIMER_STR, side_effect=(1.2, 19.7))
@@ -16,7 +19,7 @@ def test_with_exception(mock_timer):
     assert results[0] == "nan"
     assert round(float(results[1]), 1) == 18.5
     mock_optimizer.build_ip_model.assert_called_once_with(
-        resiliency=False, verbose=False)
+        resiliency=False, verbose=False, num_rounds=None, start_schedule=None)
     assert mock_timer.call_count == 2
 
 
@@ -24,12 +27,72 @@ def test_with_exception(mock_timer):
 def test_without_exception(mock_timer):
     mock_data = MagicMock()
     mock_optimizer = MagicMock()
-    mock_optimizer.build_ip_model = MagicMock(return_value=6)
+    mock_optimizer.get_num_rounds = MagicMock(return_value=7)
     result_str = build_optimal_string(mock_optimizer, True)
     results = result_str.split(" ")
     assert len(results) == 2
     assert results[0] == "7"
     assert round(float(results[1]), 1) == 122.6
     mock_optimizer.build_ip_model.assert_called_once_with(
-        resiliency=True, verbose=False)
+        resiliency=True, verbose=False, num_rounds=None, start_schedule=None)
     assert mock_timer.call_count == 2
+
+
+@patch(BOUND_STR, return_value=5)
+@patch(TIMER_STR, side_effect=(3.0, 3.5))
+def test_with_optimal_upper_bound(mock_timer, mock_bound):
+    mock_data = MagicMock()
+    mock_optimizer = MagicMock()
+    mock_optimizer.instance_data = MagicMock(return_value=mock_data)
+    result_str = build_optimal_string(mock_optimizer, True, 5)
+    assert result_str == "5 0.5"
+    mock_bound.assert_called_once_with(mock_data, True)
+    mock_optimizer.build_ip_model.assert_not_called()
+
+
+@patch(BOUND_STR)
+@patch(TIMER_STR, side_effect=(6.0, 6.25))
+def test_with_given_lower_bound(mock_timer, mock_bound):
+    mock_optimizer = MagicMock()
+    result_str = build_optimal_string(mock_optimizer, False, 4, None, 4)
+    assert result_str == "4 0.25"
+    mock_bound.assert_not_called()
+    mock_optimizer.build_ip_model.assert_not_called()
+
+
+@patch(BOUND_STR, return_value=4)
+@patch(TIMER_STR, side_effect=(10.0, 12.0))
+def test_with_loose_upper_bound(mock_timer, mock_bound):
+    mock_optimizer = MagicMock()
+    mock_optimizer.get_num_rounds = MagicMock(return_value=5)
+    result_str = build_optimal_string(mock_optimizer, False, 6)
+    assert result_str == "5 2.0"
+    mock_optimizer.build_ip_model.assert_called_once_with(
+        resiliency=False, verbose=False, num_rounds=6, start_schedule=None)
+
+
+@patch(BOUND_STR, return_value=3)
+@patch(TIMER_STR, side_effect=(1.0, 4.0))
+def test_with_start_schedule(mock_timer, mock_bound):
+    mock_optimizer = MagicMock()
+    mock_schedule = MagicMock()
+    mock_optimizer.get_num_rounds = MagicMock(return_value=4)
+    result_str = build_optimal_string(
+        mock_optimizer, True, 5, mock_schedule)
+    assert result_str == "4 3.0"
+    mock_optimizer.build_ip_model.assert_called_once_with(
+        resiliency=True, verbose=False, num_rounds=5,
+        start_schedule=mock_schedule)
+
+
+@patch(TIMER_STR, side_effect=(2.0, 2.5))
+def test_with_objective_below_integer(mock_timer):
+    optimizer = Optimizer()
+
+    def build_ip_model(**kwargs):
+        optimizer._model = MagicMock(
+            status=gp.GRB.OPTIMAL, objVal=1.9999999999999973)
+        return optimizer._model.objVal
+
+    optimizer.build_ip_model = MagicMock(side_effect=build_ip_model)
+    assert build_optimal_string(optimizer, False) == "3 0.5"
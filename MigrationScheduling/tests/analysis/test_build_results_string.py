@@ -1,57 +1,84 @@
+import numpy as np
 from unittest.mock import patch, MagicMock
 from MigrationScheduling.analysis import build_results_string
 
 
-OPTIMIZER_STR = "MigrationScheduling.analysis.Optimizer"
-HEURISTICS_STR = "MigrationScheduling.analysis.build_heuristics_string"
+LOAD_STR = "MigrationScheduling.analysis.load_optimizer"
+HEURISTICS_STR = "MigrationScheduling.analysis.run_heuristics"
 OPT_STR = "MigrationScheduling.analysis.build_optimal_string"
-OS_STR = "MigrationScheduling.analysis.os.path.join"
+BOUND_STR = "MigrationScheduling.analysis.bounds.get_lower_bound"
 
 
+@patch(BOUND_STR, return_value=4)
 @patch(OPT_STR)
-@patch(HEURISTICS_STR, return_value="6 1.7 6 2.5")
-@patch(OS_STR, return_value="/some/instance/file.txt")
-@patch(OPTIMIZER_STR)
-def test_without_optimizer(mock_optimizer, mock_os,
-                           build_heuristics, build_opt):
+@patch(HEURISTICS_STR, return_value=([(6, 1.7), (6, 2.5)], "schedule"))
+@patch(LOAD_STR)
+def test_without_optimizer(mock_load, run_heuristics, build_opt,
+                           mock_bound):
     optimizer = MagicMock()
-    mock_optimizer.return_value = optimizer
-    optimizer.get_model_data = MagicMock(side_effect=None)
+    mock_load.return_value = optimizer
     mock_data = MagicMock()
     optimizer.instance_data = MagicMock(return_value=mock_data)
     optimizer.get_size_string = MagicMock(return_value="15 10 20")
     result_str = build_results_string(
         "/some/instance", "file.txt", 1, False, True)
     assert result_str == "1 15 10 20 6 1.7 6 2.5\n"
-    mock_optimizer.assert_called_once()
-    mock_os.assert_called_once_with("/some/instance", "file.txt")
-    optimizer.get_model_data.assert_called_once_with(
-        "/some/instance/file.txt")
+    mock_load.assert_called_once_with("/some/instance", "file.txt")
     optimizer.get_size_string.assert_called_once()
     optimizer.instance_data.assert_called_once()
-    build_heuristics.assert_called_once_with(mock_data, True)
+    mock_bound.assert_called_once_with(mock_data, True)
+    run_heuristics.assert_called_once_with(mock_data, True, None, 4)
     build_opt.assert_not_called()
 
 
+@patch(BOUND_STR, return_value=5)
 @patch(OPT_STR, return_value="7 132.4")
-@patch(HEURISTICS_STR, return_value="8 1.9 7 3.2")
-@patch(OS_STR, return_value="/another/instance/results.csv")
-@patch(OPTIMIZER_STR)
-def test_with_optimizer(mock_optimizer, mock_os, build_heuristics, build_opt):
+@patch(HEURISTICS_STR, return_value=([(8, 1.9), (7, 3.2)], "schedule"))
+@patch(LOAD_STR)
+def test_with_optimizer(mock_load, run_heuristics, build_opt, mock_bound):
     optimizer = MagicMock()
-    mock_optimizer.return_value = optimizer
-    optimizer.get_model_data = MagicMock(side_effect=None)
+    mock_load.return_value = optimizer
     mock_data = MagicMock()
     optimizer.instance_data = MagicMock(return_value=mock_data)
     optimizer.get_size_string = MagicMock(return_value="105 40 97")
     result_str = build_results_string(
         "/another/instance", "results.csv", 0, True, False)
     assert result_str == "0 105 40 97 8 1.9 7 3.2 7 132.4\n"
-    mock_optimizer.assert_called_once()
-    mock_os.assert_called_once_with("/another/instance", "results.csv")
-    optimizer.get_model_data.assert_called_once_with(
-        "/another/instance/results.csv")
+    mock_load.assert_called_once_with("/another/instance", "results.csv")
     optimizer.get_size_string.assert_called_once()
     optimizer.instance_data.assert_called_once()
-    build_heuristics.assert_called_once_with(mock_data, False)
-    build_opt.assert_called_once_with(optimizer, False)
+    mock_bound.assert_called_once_with(mock_data, False)
+    run_heuristics.assert_called_once_with(mock_data, False, None, 5)
+    build_opt.assert_called_once_with(optimizer, False, 7, "schedule", 5)
+
+
+@patch(BOUND_STR, return_value=2)
+@patch(OPT_STR)
+@patch(HEURISTICS_STR, return_value=([(5, 0.2), (6, 2.5)], "schedule"))
+@patch(LOAD_STR)
+def test_with_loaded_optimizer(mock_load, run_heuristics, build_opt,
+                               mock_bound):
+    optimizer = MagicMock()
+    mock_data = MagicMock()
+    optimizer.instance_data = MagicMock(return_value=mock_data)
+    optimizer.get_size_string = MagicMock(return_value="12 4 6")
+    result_str = build_results_string(
+        "/some/instance", "file.txt", 3, False, False, optimizer, (5, 0.2))
+    assert result_str == "3 12 4 6 5 0.2 6 2.5\n"
+    mock_load.assert_not_called()
+    run_heuristics.assert_called_once_with(mock_data, False, (5, 0.2), 2)
+    build_opt.assert_not_called()
+
+
+@patch(BOUND_STR, return_value=6)
+@patch(OPT_STR, return_value="6 0.0")
+@patch(HEURISTICS_STR, return_value=([(6, 0.4), (np.nan, np.nan)], None))
+@patch(LOAD_STR)
+def test_with_skipped_cbf(mock_load, run_heuristics, build_opt,
+                          mock_bound):
+    optimizer = MagicMock()
+    optimizer.get_size_string = MagicMock(return_value="9 3 4")
+    result_str = build_results_string(
+        "/some/instance", "file.txt", 2, True, False, optimizer, (6, 0.4))
+    assert result_str == "2 9 3 4 6 0.4 nan nan 6 0.0\n"
+    build_opt.assert_called_once_with(optimizer, False, 6, None, 6)
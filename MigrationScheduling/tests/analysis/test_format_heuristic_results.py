@@ -0,0 +1,9 @@
+from MigrationScheduling.analysis import format_heuristic_results
+
+
+def test_with_no_results():
+    assert format_heuristic_results([]) == ""
+
+
+def test_with_results():
+    assert format_heuristic_results([(8, 1.25), (7, 0.5)]) == "8 1.25 7 0.5"
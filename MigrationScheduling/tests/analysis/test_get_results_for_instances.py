@@ -1,36 +1,67 @@
+import numpy as np
 from unittest.mock import call, patch, MagicMock
 from MigrationScheduling.analysis import get_results_for_instances
 
 
 EXTRACT_STR = "MigrationScheduling.analysis.utils.extract_file_idx"
 BUILD_STR = "MigrationScheduling.analysis.build_results_string"
+LOAD_STR = "MigrationScheduling.analysis.load_optimizer"
+BATCH_STR = "MigrationScheduling.analysis.algorithms.batch_vector_first_fit"
+TIMER_STR = "MigrationScheduling.analysis.timer"
+SIZE_STR = "MigrationScheduling.analysis.specs.VFF_BATCH_SIZE"
 
 
+@patch(TIMER_STR)
+@patch(BATCH_STR)
+@patch(LOAD_STR)
 @patch(BUILD_STR)
 @patch(EXTRACT_STR)
-def test_with_no_files(mock_extract, mock_build):
+def test_with_no_files(mock_extract, mock_build, mock_load,
+                       mock_batch, mock_timer):
     results = ["result0.\n", "result1.\n", "results2.\n"]
     get_results_for_instances(results, [], "migrations", "/empty/dir", False)
     assert results == ["result0.\n", "result1.\n", "results2.\n"]
     mock_extract.assert_not_called()
     mock_build.assert_not_called()
+    mock_load.assert_not_called()
+    mock_batch.assert_not_called()
 
 
+@patch(TIMER_STR, side_effect=(1.5, 2.0))
+@patch(BATCH_STR, return_value=np.array([4]))
+@patch(LOAD_STR)
 @patch(BUILD_STR, return_value="result7.\n")
 @patch(EXTRACT_STR, return_value=7)
-def test_with_1_file(mock_extract, mock_build):
+def test_with_1_file(mock_extract, mock_build, mock_load,
+                     mock_batch, mock_timer):
+    optimizer = MagicMock()
+    data = MagicMock()
+    optimizer.instance_data = MagicMock(return_value=data)
+    mock_load.return_value = optimizer
     results = ["result5.\n"]
     get_results_for_instances(
         results, ["file7.txt"], "file", "/random/dir", True)
     assert results == ["result5.\n", "result7.\n"]
     mock_extract.assert_called_once_with("file7.txt", "file")
+    mock_load.assert_called_once_with("/random/dir", "file7.txt")
+    mock_batch.assert_called_once_with([data], True)
     mock_build.assert_called_once_with(
-        "/random/dir", "file7.txt", 7, False, True)
+        "/random/dir", "file7.txt", 7, False, True, optimizer, (4, 0.5))
 
 
+@patch(SIZE_STR, 2)
+@patch(TIMER_STR, side_effect=(1.0, 2.0, 3.0, 3.5))
+@patch(BATCH_STR, side_effect=(np.array([3, 5]), np.array([2])))
+@patch(LOAD_STR)
 @patch(BUILD_STR, side_effect=("result3.\n", "result4.\n", "result5.\n"))
 @patch(EXTRACT_STR, side_effect=(3, 4, 5))
-def test_with_multi_file(mock_extract, mock_build):
+def test_with_multi_file(mock_extract, mock_build, mock_load,
+                         mock_batch, mock_timer):
+    optimizers = [MagicMock() for _ in range(3)]
+    datas = [MagicMock() for _ in range(3)]
+    for optimizer, data in zip(optimizers, datas):
+        optimizer.instance_data = MagicMock(return_value=data)
+    mock_load.side_effect = optimizers
     results = []
     get_results_for_instances(
         results, ["migrations3.txt", "migrations4.csv", "migrations5.dat"],
@@ -41,10 +72,16 @@ def test_with_multi_file(mock_extract, mock_build):
                      call("migrations5.dat", "migrations")]
     assert mock_extract.call_count == 3
     mock_extract.assert_has_calls(extract_calls)
+    assert mock_batch.call_count == 2
+    mock_batch.assert_has_calls(
+        [call(datas[:2], False), call(datas[2:], False)])
     build_calls = [
-        call("/yet/another/dir", "migrations3.txt", 3, False, False),
-        call("/yet/another/dir", "migrations4.csv", 4, False, False),
-        call("/yet/another/dir", "migrations5.dat", 5, False, False)
+        call("/yet/another/dir", "migrations3.txt", 3, False, False,
+             optimizers[0], (3, 0.5)),
+        call("/yet/another/dir", "migrations4.csv", 4, False, False,
+             optimizers[1], (5, 0.5)),
+        call("/yet/another/dir", "migrations5.dat", 5, False, False,
+             optimizers[2], (2, 0.5))
     ]
     assert mock_build.call_count == 3
     mock_build.assert_has_calls(build_calls)
@@ -0,0 +1,15 @@
+from unittest.mock import patch, MagicMock
+from MigrationScheduling.analysis import load_optimizer
+
+
+OPTIMIZER_STR = "MigrationScheduling.analysis.Optimizer"
+
+
+@patch(OPTIMIZER_STR)
+def test_load_optimizer(mock_optimizer):
+    optimizer = MagicMock()
+    mock_optimizer.return_value = optimizer
+    assert load_optimizer("/some/dir", "migrations4.txt") == optimizer
+    mock_optimizer.assert_called_once()
+    optimizer.get_model_data.assert_called_once_with(
+        "/some/dir/migrations4.txt")
@@ -0,0 +1,69 @@
+import pytest
+import numpy as np
+from MigrationScheduling import specs
+from unittest.mock import patch, MagicMock
+from MigrationScheduling.analysis import run_heuristics
+
+
+TIMER_STR = "MigrationScheduling.analysis.timer"
+VFF_STR = "MigrationScheduling.analysis.algorithms.vector_first_fit"
+CBF_STR = "MigrationScheduling.analysis.algorithms.current_bottleneck_first"
+BOUND_STR = "MigrationScheduling.analysis.bounds.get_lower_bound"
+
+
+@pytest.mark.parametrize("vff_rounds, cbf_rounds, expected",
+                         [(8, 7, "cbf"), (6, 7, "vff"), (7, 7, "vff")])
+@patch(BOUND_STR, return_value=5)
+@patch(CBF_STR)
+@patch(VFF_STR)
+@patch(TIMER_STR, side_effect=(1.0, 2.0, 3.0, 4.0))
+def test_best_schedule(mock_timer, mock_vff, mock_cbf, mock_bound,
+                       vff_rounds, cbf_rounds, expected):
+    mock_data = MagicMock()
+    mock_vff.return_value = (vff_rounds, "vff")
+    mock_cbf.return_value = (cbf_rounds, "cbf")
+    results, schedule = run_heuristics(mock_data, True)
+    assert results == [(vff_rounds, 1.0), (cbf_rounds, 1.0)]
+    assert schedule == expected
+    mock_vff.assert_called_once_with(mock_data, True, return_schedule=True)
+    mock_cbf.assert_called_once_with(
+        mock_data, specs.CBF_CHOICES, True, return_schedule=True)
+    mock_bound.assert_called_once_with(mock_data, True)
+
+
+@patch(BOUND_STR)
+@patch(CBF_STR, return_value=(7, "cbf"))
+@patch(VFF_STR)
+@patch(TIMER_STR, side_effect=(2.0, 3.0))
+def test_with_vff_result(mock_timer, mock_vff, mock_cbf, mock_bound):
+    results, schedule = run_heuristics(MagicMock(), False, (8, 0.5), 4)
+    assert results == [(8, 0.5), (7, 1.0)]
+    assert schedule == "cbf"
+    mock_vff.assert_not_called()
+    mock_bound.assert_not_called()
+
+
+@patch(BOUND_STR, return_value=6)
+@patch(CBF_STR)
+@patch(VFF_STR, return_value=(6, "vff"))
+@patch(TIMER_STR, side_effect=(1.0, 1.5))
+def test_vff_at_lower_bound(mock_timer, mock_vff, mock_cbf, mock_bound):
+    mock_data = MagicMock()
+    results, schedule = run_heuristics(mock_data, False)
+    assert results[0] == (6, 0.5)
+    assert np.isnan(results[1][0]) and np.isnan(results[1][1])
+    assert schedule == "vff"
+    mock_bound.assert_called_once_with(mock_data, False)
+    mock_cbf.assert_not_called()
+
+
+@patch(CBF_STR)
+@patch(VFF_STR)
+@patch(TIMER_STR)
+def test_vff_result_at_lower_bound(mock_timer, mock_vff, mock_cbf):
+    results, schedule = run_heuristics(MagicMock(), True, (3, 0.5), 3)
+    assert results[0] == (3, 0.5)
+    assert np.isnan(results[1][0])
+    assert schedule is None
+    mock_timer.assert_not_called()
+    mock_cbf.assert_not_called()
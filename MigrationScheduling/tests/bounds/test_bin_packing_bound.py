@@ -0,0 +1,25 @@
+from MigrationScheduling.bounds import bin_packing_bound
+
+
+def test_no_loads():
+    assert bin_packing_bound([], 10.0) == 0
+
+
+def test_small_loads():
+    assert bin_packing_bound([1.0, 2.0, 3.0], 10.0) == 1
+    assert bin_packing_bound([4.0, 4.0, 4.0], 10.0) == 2
+
+
+def test_large_loads():
+    assert bin_packing_bound([6.0, 7.0, 8.0], 10.0) == 3
+
+
+def test_beats_load_bound():
+    # total load of 18 only needs 2 rounds by capacity, but the 3 largest
+    # loads leave no space for the others
+    assert bin_packing_bound([6.0, 6.0, 6.0], 10.0) == 3
+    assert bin_packing_bound([6.0, 6.0, 4.5, 4.5], 10.0) == 3
+
+
+def test_fits_in_large_rounds():
+    assert bin_packing_bound([6.0, 6.0, 4.0, 4.0], 10.0) == 2
@@ -0,0 +1,43 @@
+import pytest
+from unittest.mock import patch, MagicMock
+from MigrationScheduling.bounds import build_conflict_graph
+
+
+CAP_STR = "MigrationScheduling.bounds.utils.get_controller_cap_dict"
+LOADS_STR = "MigrationScheduling.bounds.get_controller_loads"
+
+
+def make_qos_const(cap, switches):
+    const = MagicMock()
+    const.get_cap = MagicMock(return_value=cap)
+    const.get_switches = MagicMock(return_value=switches)
+    return const
+
+
+@pytest.fixture(scope="function")
+def mock_data():
+    instance_data = MagicMock()
+    instance_data.get_migrations = MagicMock(
+        return_value={'s0': None, 's1': None, 's2': None, 's3': None})
+    instance_data.get_qos_consts = MagicMock(return_value={
+        make_qos_const(1, {'s0', 's1'}), make_qos_const(2, {'s2', 's3'})})
+    return instance_data
+
+
+@patch(LOADS_STR, return_value={'c0': [], 'c1': []})
+@patch(CAP_STR, return_value={'c0': 10.0, 'c1': 5.0})
+def test_qos_conflicts(mock_caps, mock_loads, mock_data):
+    assert build_conflict_graph(mock_data) == {
+        's0': {'s1'}, 's1': {'s0'}, 's2': set(), 's3': set()}
+    mock_loads.assert_called_once_with(mock_data, False)
+
+
+@patch(LOADS_STR)
+@patch(CAP_STR, return_value={'c0': 10.0, 'c1': 5.0})
+def test_controller_conflicts(mock_caps, mock_loads, mock_data):
+    mock_loads.return_value = {
+        'c0': [(6.0, 's2'), (5.0, 's3'), (3.0, 's1')],
+        'c1': [(2.0, 's2'), (2.5, 's3')]}
+    assert build_conflict_graph(mock_data, True) == {
+        's0': {'s1'}, 's1': {'s0'}, 's2': {'s3'}, 's3': {'s2'}}
+    mock_loads.assert_called_once_with(mock_data, True)
@@ -0,0 +1,24 @@
+from MigrationScheduling.bounds import clique_bound
+
+
+def test_no_migrations():
+    assert clique_bound({}) == 0
+
+
+def test_no_conflicts():
+    assert clique_bound({'s0': set(), 's1': set()}) == 1
+
+
+def test_triangle():
+    conflicts = {'s0': {'s1', 's2', 's3'}, 's1': {'s0', 's2'},
+                 's2': {'s0', 's1'}, 's3': {'s0'}}
+    assert clique_bound(conflicts) == 3
+
+
+def test_limited_starts():
+    # s4 has the most conflicts but is not in the largest clique
+    conflicts = {'s0': {'s1', 's2'}, 's1': {'s0', 's2'},
+                 's2': {'s0', 's1'}, 's3': {'s4'}, 's5': {'s4'},
+                 's6': {'s4'}, 's4': {'s3', 's5', 's6'}}
+    assert clique_bound(conflicts, 1) == 2
+    assert clique_bound(conflicts) == 3
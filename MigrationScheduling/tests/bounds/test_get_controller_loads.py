@@ -0,0 +1,33 @@
+import pytest
+from unittest.mock import MagicMock
+from MigrationScheduling.bounds import get_controller_loads
+from MigrationScheduling.tests.helpers import make_migration
+
+
+def make_const(controller):
+    const = MagicMock()
+    const.get_controller = MagicMock(return_value=controller)
+    return const
+
+
+@pytest.fixture(scope="function")
+def mock_data():
+    instance_data = MagicMock()
+    instance_data.get_control_consts = MagicMock(
+        return_value={make_const('c0'), make_const('c1')})
+    instance_data.get_migrations = MagicMock(return_value={
+        's0': make_migration(src='c0', dst='c1', load=2.0),
+        's1': make_migration(src='c1', dst='c1', load=3.0),
+        's2': make_migration(src='c1', dst='c0', load=0.5)})
+    return instance_data
+
+
+def test_without_resiliency(mock_data):
+    assert get_controller_loads(mock_data) == {
+        'c0': [(0.5, 's2')], 'c1': [(2.0, 's0'), (3.0, 's1')]}
+
+
+def test_with_resiliency(mock_data):
+    assert get_controller_loads(mock_data, True) == {
+        'c0': [(2.0, 's0'), (0.5, 's2')],
+        'c1': [(2.0, 's0'), (3.0, 's1'), (0.5, 's2')]}
@@ -0,0 +1,63 @@
+import pytest
+from unittest.mock import patch, MagicMock
+from MigrationScheduling.bounds import get_lower_bound
+
+
+CAP_STR = "MigrationScheduling.bounds.utils.get_controller_cap_dict"
+LOADS_STR = "MigrationScheduling.bounds.get_controller_loads"
+PACKING_STR = "MigrationScheduling.bounds.bin_packing_bound"
+GRAPH_STR = "MigrationScheduling.bounds.build_conflict_graph"
+CLIQUE_STR = "MigrationScheduling.bounds.clique_bound"
+
+
+def make_qos_const(cap, num_switches):
+    const = MagicMock()
+    const.get_cap = MagicMock(return_value=cap)
+    const.get_switches = MagicMock(
+        return_value={'s{}'.format(idx) for idx in range(num_switches)})
+    return const
+
+
+@pytest.fixture(scope="function")
+def mock_data():
+    instance_data = MagicMock()
+    instance_data.get_qos_consts = MagicMock(return_value=[
+        make_qos_const(2, 5), make_qos_const(1, 2)])
+    return instance_data
+
+
+@patch(CLIQUE_STR, return_value=2)
+@patch(GRAPH_STR)
+@patch(PACKING_STR, side_effect=(1, 4))
+@patch(LOADS_STR, return_value={
+    'c0': [(1.0, 's0')], 'c1': [(2.0, 's1'), (3.0, 's2')]})
+@patch(CAP_STR, return_value={'c0': 5.0, 'c1': 4.0})
+def test_controller_bound(mock_caps, mock_loads, mock_packing,
+                          mock_graph, mock_clique, mock_data):
+    assert get_lower_bound(mock_data, True) == 4
+    mock_loads.assert_called_once_with(mock_data, True)
+    assert mock_packing.call_count == 2
+    mock_packing.assert_any_call([1.0], 5.0)
+    mock_packing.assert_any_call([2.0, 3.0], 4.0)
+    mock_graph.assert_called_once_with(mock_data, True)
+    mock_clique.assert_called_once_with(mock_graph.return_value)
+
+
+@patch(CLIQUE_STR, return_value=2)
+@patch(GRAPH_STR)
+@patch(PACKING_STR, return_value=1)
+@patch(LOADS_STR, return_value={'c0': [(1.0, 's0')]})
+@patch(CAP_STR, return_value={'c0': 5.0})
+def test_qos_bound(mock_caps, mock_loads, mock_packing,
+                   mock_graph, mock_clique, mock_data):
+    assert get_lower_bound(mock_data) == 3
+
+
+@patch(CLIQUE_STR, return_value=6)
+@patch(GRAPH_STR)
+@patch(PACKING_STR, return_value=1)
+@patch(LOADS_STR, return_value={'c0': [(1.0, 's0')]})
+@patch(CAP_STR, return_value={'c0': 5.0})
+def test_clique_bound(mock_caps, mock_loads, mock_packing,
+                      mock_graph, mock_clique, mock_data):
+    assert get_lower_bound(mock_data) == 6
@@ -0,0 +1,16 @@
+from MigrationScheduling.bounds import load_bound
+
+
+def test_no_load():
+    assert load_bound(0, 5.0) == 0
+    assert load_bound(-1.0, 5.0) == 0
+
+
+def test_exact_multiple():
+    assert load_bound(10.0, 5.0) == 2
+    assert load_bound(0.3, 0.1) == 3
+
+
+def test_rounded_up():
+    assert load_bound(10.5, 5.0) == 3
+    assert load_bound(3, 4) == 1
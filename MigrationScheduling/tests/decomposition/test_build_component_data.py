@@ -0,0 +1,63 @@
+from MigrationScheduling.decomposition import build_component_data
+from MigrationScheduling.tests.helpers import build_instance
+
+
+def test_component_data():
+    data = build_instance(
+        {'g1': 2, 'g2': 1}, {'g1': ['s1', 's3'], 'g2': ['s0']},
+        {'c0': 5.0, 'c1': 4.0, 'c2': 3.0},
+        [('s0', 'c1', 'c0', 1.0), ('s1', 'c0', 'c1', 2.0),
+         ('s3', 'c2', 'c1', 3.0)])
+    component = build_component_data(data, ['s1', 's3'])
+    assert set(component.get_migrations()) == {'s1', 's3'}
+    assert component.get_migration('s1') is data.get_migration('s1')
+    assert component.get_switch_ids() == [1, 3]
+    assert component.get_round_ids() == [0, 1]
+    assert component.get_controller_ids() == [0, 1, 2]
+    assert component.get_qos_ids() == [1]
+    controller_consts = {const.get_controller(): const
+                         for const in component.get_control_consts()}
+    assert controller_consts['c0'].get_cap() == 5.0
+    assert controller_consts['c0'].get_in_switches() == set()
+    assert controller_consts['c0'].get_out_switches() == {'s1'}
+    assert controller_consts['c1'].get_in_switches() == {'s1', 's3'}
+    assert controller_consts['c1'].get_out_switches() == set()
+    assert controller_consts['c2'].get_out_switches() == {'s3'}
+    qos_const, = component.get_qos_consts()
+    assert qos_const.get_group() == 'g1'
+    assert qos_const.get_cap() == 2
+    assert qos_const.get_switches() == {'s1', 's3'}
+
+
+def test_constraints_left_unchanged():
+    data = build_instance(
+        {'g0': 1}, {'g0': ['s0', 's1']}, {'c0': 5.0, 'c1': 4.0},
+        [('s0', 'c1', 'c0', 1.0), ('s1', 'c1', 'c0', 2.0)])
+    build_component_data(data, ['s0'])
+    qos_const, = data.get_qos_consts()
+    assert qos_const.get_switches() == {'s0', 's1'}
+
+
+def test_excluded_groups():
+    data = build_instance(
+        {'g0': 1, 'g1': 5}, {'g0': ['s0', 's1'], 'g1': ['s0', 's1']},
+        {'c0': 5.0, 'c1': 4.0},
+        [('s0', 'c1', 'c0', 1.0), ('s1', 'c1', 'c0', 2.0)])
+    component = build_component_data(data, ['s0', 's1'], {'g1'})
+    assert [const.get_group() for const in component.get_qos_consts()] == [
+        'g0']
+    assert component.get_qos_ids() == [0]
+    assert set(component.get_migration('s0').get_groups()) == {'g0'}
+    assert set(data.get_migration('s0').get_groups()) == {'g0', 'g1'}
+
+
+def test_excluded_controllers():
+    data = build_instance(
+        {}, {}, {'c0': 5.0, 'c1': 4.0},
+        [('s0', 'c1', 'c0', 1.0), ('s1', 'c0', 'c1', 2.0)])
+    component = build_component_data(data, ['s0', 's1'], (), {'c1'})
+    const, = component.get_control_consts()
+    assert const.get_controller() == 'c0'
+    assert const.get_constraint_switches(True) == {'s0', 's1'}
+    assert component.get_controller_ids() == [0]
+    assert component.get_migration('s1').get_dst_controller() == 'c1'
@@ -0,0 +1,24 @@
+from MigrationScheduling.Data import Migration
+from MigrationScheduling.decomposition import copy_migration
+
+
+def test_copy_migration():
+    migration = Migration('s3', 'c0', 'c1', 2.5)
+    migration.add_qos_group('g0')
+    migration.add_qos_group('g1')
+    copy = copy_migration(migration)
+    assert copy is not migration
+    assert copy.get_switch() == 's3'
+    assert copy.get_src_controller() == 'c0'
+    assert copy.get_dst_controller() == 'c1'
+    assert copy.get_load() == 2.5
+    assert set(copy.get_groups()) == {'g0', 'g1'}
+
+
+def test_excluded_groups():
+    migration = Migration('s3', 'c0', 'c1', 2.5)
+    migration.add_qos_group('g0')
+    migration.add_qos_group('g1')
+    copy = copy_migration(migration, {'g1', 'g2'})
+    assert set(copy.get_groups()) == {'g0'}
+    assert set(migration.get_groups()) == {'g0', 'g1'}
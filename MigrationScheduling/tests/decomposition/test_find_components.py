@@ -0,0 +1,32 @@
+import pytest
+from MigrationScheduling.decomposition import find_components
+from MigrationScheduling.tests.helpers import build_instance
+
+
+@pytest.fixture(scope="function")
+def instance():
+    return build_instance(
+        {'g0': 1}, {'g0': ['s1', 's3']},
+        {'c0': 5.0, 'c1': 5.0, 'c2': 5.0, 'c3': 5.0},
+        [('s0', 'c1', 'c0', 1.0), ('s1', 'c0', 'c1', 2.0),
+         ('s2', 'c3', 'c2', 1.0), ('s3', 'c1', 'c2', 3.0),
+         ('s4', 'c2', 'c3', 1.0)])
+
+
+def test_with_no_migrations():
+    data = build_instance({}, {}, {'c0': 1.0}, [])
+    assert find_components(data) == []
+
+
+def test_without_resiliency(instance):
+    # s1 and s3 share g0, s3 and s2 share c2
+    components = find_components(instance)
+    assert [sorted(component) for component in components] == [
+        ['s1', 's2', 's3'], ['s0'], ['s4']]
+
+
+def test_with_resiliency(instance):
+    # source controllers join s0 and s1 through c0, s2 and s4 through c3
+    components = find_components(instance, True)
+    assert [sorted(component) for component in components] == [
+        ['s0', 's1', 's2', 's3', 's4']]
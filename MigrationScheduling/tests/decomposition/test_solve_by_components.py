@@ -0,0 +1,59 @@
+import pytest
+from unittest.mock import patch
+from MigrationScheduling import algorithms
+from MigrationScheduling.decomposition import (
+    optimize_schedule, solve_by_components)
+from MigrationScheduling.tests.helpers import build_instance
+
+
+PARALLEL_STR = "MigrationScheduling.specs.PARALLEL_COMPONENTS"
+
+
+@pytest.fixture(scope="function")
+def instance():
+    # two copies of a packing that first fit solves in three rounds, and
+    # two migrations with their own controllers
+    migrations = []
+    for offset, (src, dst) in enumerate([('c2', 'c0'), ('c3', 'c1')]):
+        for idx, load in enumerate([3.0, 2.0, 4.0, 4.0, 5.0, 2.0]):
+            migrations.append(
+                ('s{}'.format(6 * offset + idx), src, dst, load))
+    migrations += [('s12', 'c5', 'c4', 6.0), ('s13', 'c4', 'c5', 6.0)]
+    caps = {'c{}'.format(idx): 10.0 for idx in range(6)}
+    caps.update({'c2': 100.0, 'c3': 100.0})
+    return build_instance({}, {}, caps, migrations)
+
+
+def test_with_no_migrations():
+    data = build_instance({}, {}, {'c0': 1.0}, [])
+    assert solve_by_components(data) == 0
+
+
+def test_first_fit(instance):
+    num_rounds, schedule = solve_by_components(
+        instance, return_schedule=True)
+    assert num_rounds == algorithms.vector_first_fit(instance) == 3
+    assert schedule.get_num_migrations() == 14
+
+
+def test_optimizer(instance):
+    num_rounds, schedule = solve_by_components(
+        instance, optimize_schedule, return_schedule=True)
+    assert num_rounds == 2
+    assert schedule.get_num_rounds() == 2
+    assert schedule.get_num_migrations() == 14
+
+
+def test_optimizer_with_resiliency(instance):
+    # s12 and s13 both use c4 and c5, so need separate rounds
+    assert solve_by_components(instance, optimize_schedule, True) == 2
+
+
+@patch(PARALLEL_STR, 2)
+def test_parallel(instance):
+    num_rounds, schedule = solve_by_components(
+        instance, algorithms.degree_of_saturation_first,
+        num_workers=2, return_schedule=True)
+    assert num_rounds == solve_by_components(
+        instance, algorithms.degree_of_saturation_first)
+    assert schedule.get_num_migrations() == 14
@@ -0,0 +1,13 @@
+from unittest.mock import MagicMock
+from MigrationScheduling.decomposition import solve_component
+
+
+def test_solve_component():
+    instance_data = MagicMock()
+    schedule = MagicMock()
+    schedule.get_assignment.return_value = {'s0': 0, 's1': 1}
+    algorithm = MagicMock(return_value=(2, schedule))
+    assert solve_component(instance_data, algorithm, True) == {
+        's0': 0, 's1': 1}
+    algorithm.assert_called_once_with(
+        instance_data, resiliency=True, return_schedule=True)
@@ -0,0 +1,69 @@
+import pytest
+from MigrationScheduling import algorithms
+from MigrationScheduling.exact import branch_and_bound
+from MigrationScheduling.Data import (
+    ControllerConstraint, InstanceData, Migration, QosConstraint)
+
+
+def build_instance(group_caps, group_switches, controller_caps, migrations):
+    migration_dict = {}
+    for switch, src, dst, load in migrations:
+        migration_dict[switch] = Migration(switch, src, dst, load)
+    qos_consts = set()
+    for group, cap in group_caps.items():
+        const = QosConstraint(group, cap)
+        for switch in group_switches[group]:
+            const.add_switch(switch)
+            migration_dict[switch].add_qos_group(group)
+        qos_consts.add(const)
+    control_consts = {ControllerConstraint(controller, cap)
+                      for controller, cap in controller_caps.items()}
+    return InstanceData(migration_dict, control_consts, qos_consts,
+                        {}, {}, {}, {})
+
+
+@pytest.fixture(scope="function")
+def instance():
+    return build_instance(
+        {'g0': 1, 'g1': 1, 'g2': 2},
+        {'g0': ['s0', 's1'], 'g1': ['s1', 's2'], 'g2': ['s0', 's2', 's3']},
+        {'c0': 10.0, 'c1': 2.0},
+        [('s0', 'c0', 'c1', 1.0), ('s1', 'c1', 'c0', 3.0),
+         ('s2', 'c0', 'c1', 1.5), ('s3', 'c1', 'c0', 8.0)])
+
+
+@pytest.fixture(scope="function")
+def packing_instance():
+    # both heuristics use three rounds, but {5, 3, 2} and {4, 4, 2} fit
+    loads = [3.0, 2.0, 4.0, 4.0, 5.0, 2.0]
+    return build_instance(
+        {}, {}, {'c0': 10.0, 'c1': 100.0},
+        [('s{}'.format(idx), 'c1', 'c0', load)
+         for idx, load in enumerate(loads)])
+
+
+def test_with_no_migrations():
+    data = build_instance({}, {}, {'c0': 1.0}, [])
+    assert branch_and_bound(data) == 0
+
+
+def test_optimal(instance):
+    num_rounds, schedule = branch_and_bound(instance, return_schedule=True)
+    assert num_rounds == 3
+    assert schedule.get_num_rounds() == 3
+    assert schedule.get_num_migrations() == 4
+
+
+def test_with_resiliency(instance):
+    # s1 and s3 both overload c1 under resiliency
+    assert branch_and_bound(instance, True) == 4
+
+
+def test_improves_heuristics(packing_instance):
+    assert algorithms.vector_first_fit(packing_instance) == 3
+    assert algorithms.degree_of_saturation_first(packing_instance) == 3
+    num_rounds, schedule = branch_and_bound(
+        packing_instance, return_schedule=True)
+    assert num_rounds == 2
+    assert schedule.get_num_rounds() == 2
+    assert schedule.get_num_migrations() == 6
@@ -0,0 +1,42 @@
+import numpy as np
+from unittest.mock import MagicMock, patch
+from MigrationScheduling.exact import build_demand_arrays
+
+
+CAP_STR = "MigrationScheduling.utils.get_cap_dicts"
+CONST_STR = "MigrationScheduling.utils.get_migration_constraints"
+
+
+def build_migration(load):
+    migration = MagicMock()
+    migration.get_load.return_value = load
+    return migration
+
+
+@patch(CONST_STR, side_effect=[[], []])
+@patch(CAP_STR, return_value=({}, {}))
+def test_with_no_constraints(mock_caps, mock_consts):
+    instance_data = MagicMock()
+    instance_data.get_migrations.return_value = {
+        's0': build_migration(1.0), 's1': build_migration(2.0)}
+    switches, caps, demands = build_demand_arrays(instance_data)
+    assert switches == ['s0', 's1']
+    assert caps.shape == (0,)
+    assert demands.shape == (2, 0)
+
+
+@patch(CONST_STR, side_effect=[['c1', 'g0'], ['c0', 'c1', 'g0', 'g1']])
+@patch(CAP_STR, return_value=({'c0': 10.0, 'c1': 5.0}, {'g0': 1, 'g1': 2}))
+def test_demands(mock_caps, mock_consts):
+    instance_data = MagicMock()
+    s0 = build_migration(2.5)
+    s1 = build_migration(4.0)
+    instance_data.get_migrations.return_value = {'s0': s0, 's1': s1}
+    switches, caps, demands = build_demand_arrays(instance_data, True)
+    assert switches == ['s0', 's1']
+    assert np.array_equal(caps, [10.0, 5.0, 1.0, 2.0])
+    assert np.array_equal(demands, [[0.0, 2.5, 1.0, 0.0],
+                                    [4.0, 4.0, 1.0, 1.0]])
+    mock_caps.assert_called_once_with(instance_data)
+    mock_consts.assert_any_call(s0, True)
+    mock_consts.assert_any_call(s1, True)
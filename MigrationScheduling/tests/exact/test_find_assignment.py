@@ -0,0 +1,47 @@
+import numpy as np
+from MigrationScheduling.exact import find_assignment
+
+
+def check_assignment(demands, caps, num_rounds, rounds):
+    assert len(rounds) == len(demands)
+    for round_num in range(num_rounds):
+        rows = [row for row, assigned in enumerate(rounds)
+                if assigned == round_num]
+        assert np.all(demands[rows].sum(axis=0) <= caps)
+    assert all(0 <= round_num < num_rounds for round_num in rounds)
+
+
+def test_with_no_migrations():
+    assert find_assignment(
+        np.zeros((0, 1)), np.array([1.0]), 0, np.zeros(0, dtype=int)) == []
+
+
+def test_single_round():
+    caps = np.array([10.0])
+    demands = np.array([[3.0], [4.0], [3.0]])
+    rounds = find_assignment(demands, caps, 1, np.arange(3))
+    assert rounds == [0, 0, 0]
+
+
+def test_too_few_rounds():
+    caps = np.array([10.0, 1.0])
+    demands = np.array([[6.0, 0.0], [6.0, 0.0], [1.0, 1.0], [1.0, 1.0]])
+    assert find_assignment(demands, caps, 1, np.arange(4)) is None
+    rounds = find_assignment(demands, caps, 2, np.arange(4))
+    check_assignment(demands, caps, 2, rounds)
+
+
+def test_bin_packing():
+    # first fit in this order uses three rounds, but two suffice
+    caps = np.array([10.0])
+    demands = np.array([[4.0], [3.0], [3.0], [4.0], [3.0], [3.0]])
+    rounds = find_assignment(demands, caps, 2, np.arange(6))
+    check_assignment(demands, caps, 2, rounds)
+
+
+def test_infeasible_by_aggregate_demand():
+    caps = np.array([10.0])
+    demands = np.array([[6.0], [6.0], [6.0], [6.0]])
+    assert find_assignment(demands, caps, 2, np.arange(4)) is None
+    rounds = find_assignment(demands, caps, 4, np.arange(4))
+    check_assignment(demands, caps, 4, rounds)
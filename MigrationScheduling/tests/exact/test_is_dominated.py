@@ -0,0 +1,25 @@
+import numpy as np
+from MigrationScheduling.exact import is_dominated
+
+
+def test_with_no_records():
+    assert not is_dominated(np.array([[1.0, 2.0]]), [])
+
+
+def test_with_equal_record():
+    residuals = np.array([[1.0, 2.0], [3.0, 0.0]])
+    assert is_dominated(residuals, [residuals.copy()])
+
+
+def test_with_larger_record():
+    residuals = np.array([[1.0, 2.0], [3.0, 0.0]])
+    records = [np.array([[0.5, 4.0], [3.0, 1.0]]),
+               np.array([[1.0, 2.5], [3.5, 0.0]])]
+    assert is_dominated(residuals, records)
+
+
+def test_with_incomparable_records():
+    residuals = np.array([[1.0, 2.0], [3.0, 0.0]])
+    records = [np.array([[0.5, 4.0], [3.0, 1.0]]),
+               np.array([[2.0, 2.0], [2.0, 2.0]])]
+    assert not is_dominated(residuals, records)
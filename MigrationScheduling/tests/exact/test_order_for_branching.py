@@ -0,0 +1,25 @@
+import numpy as np
+from MigrationScheduling.exact import order_for_branching
+
+
+def test_with_no_migrations():
+    order = order_for_branching(np.zeros((0, 2)), np.array([1.0, 1.0]))
+    assert len(order) == 0
+
+
+def test_largest_fraction_first():
+    caps = np.array([10.0, 2.0])
+    demands = np.array([[5.0, 0.0], [0.0, 2.0], [1.0, 1.0], [2.0, 0.0]])
+    assert list(order_for_branching(demands, caps)) == [1, 2, 0, 3]
+
+
+def test_ties_broken_by_total():
+    caps = np.array([10.0, 4.0])
+    demands = np.array([[5.0, 0.0], [5.0, 1.0], [0.0, 2.0]])
+    assert list(order_for_branching(demands, caps)) == [1, 0, 2]
+
+
+def test_with_zero_capacity():
+    caps = np.array([0.0, 4.0])
+    demands = np.array([[0.0, 1.0], [0.0, 2.0]])
+    assert list(order_for_branching(demands, caps)) == [1, 0]
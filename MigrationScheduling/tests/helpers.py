@@ -0,0 +1,96 @@
+"""Helpers shared by the tests of the load migration scheduling problem.
+
+"""
+from unittest.mock import MagicMock
+from MigrationScheduling.Data import (
+    ControllerConstraint, InstanceData, Migration, QosConstraint)
+
+
+def build_instance(group_caps, group_switches, controller_caps, migrations):
+    """Builds an `InstanceData` object from plain collections.
+
+    Parameters
+    ----------
+    group_caps: dict
+        A dictionary mapping the name of each QoS group to its capacity.
+    group_switches: dict
+        A dictionary mapping the name of each QoS group to a list of the
+        names of the switches in the group.
+    controller_caps: dict
+        A dictionary mapping the name of each controller to its capacity.
+    migrations: list
+        A list of tuples of the switch name, source controller, destination
+        controller and load of each migration.
+
+    Returns
+    -------
+    InstanceData
+        The `InstanceData` object for the instance.
+
+    """
+    migration_dict = {}
+    for switch, src, dst, load in migrations:
+        migration_dict[switch] = Migration(switch, src, dst, load)
+    qos_consts = set()
+    for group, cap in group_caps.items():
+        const = QosConstraint(group, cap)
+        for switch in group_switches[group]:
+            const.add_switch(switch)
+            migration_dict[switch].add_qos_group(group)
+        qos_consts.add(const)
+    control_consts = set()
+    for controller, cap in controller_caps.items():
+        const = ControllerConstraint(controller, cap)
+        for migration in migration_dict.values():
+            if migration.get_src_controller() == controller:
+                const.add_out_switch(migration.get_switch())
+            elif migration.get_dst_controller() == controller:
+                const.add_in_switch(migration.get_switch())
+        control_consts.add(const)
+    return InstanceData(
+        migration_dict, control_consts, qos_consts,
+        sorted(migration.get_switch_idx()
+               for migration in migration_dict.values()),
+        list(range(len(migration_dict))),
+        sorted(const.get_controller_idx() for const in control_consts),
+        sorted(const.get_group_idx() for const in qos_consts))
+
+
+def make_migration(switch=None, src=None, dst=None, load=None, groups=None):
+    """Builds a mock `Migration` with the given attributes.
+
+    Only the getters of the attributes that are specified are configured.
+
+    Parameters
+    ----------
+    switch: str
+        The name of the switch being migrated. The default value is None.
+    src: str
+        The name of the source controller. The default value is None.
+    dst: str
+        The name of the destination controller. The default value is None.
+    load: float
+        The load of the migration. The default value is None.
+    groups: set
+        A set of the names of the QoS groups of the migration, which also
+        configures `is_in_group`. The default value is None.
+
+    Returns
+    -------
+    MagicMock
+        The mock `Migration`.
+
+    """
+    migration = MagicMock()
+    if switch is not None:
+        migration.get_switch = MagicMock(return_value=switch)
+    if src is not None:
+        migration.get_src_controller = MagicMock(return_value=src)
+    if dst is not None:
+        migration.get_dst_controller = MagicMock(return_value=dst)
+    if load is not None:
+        migration.get_load = MagicMock(return_value=load)
+    if groups is not None:
+        migration.get_groups = MagicMock(return_value=groups)
+        migration.is_in_group = MagicMock(side_effect=groups.__contains__)
+    return migration
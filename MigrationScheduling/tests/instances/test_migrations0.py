@@ -1,8 +1,15 @@
 import os
 import gurobipy as gp
 from gurobipy import GRB
+from MigrationScheduling import specs
+from MigrationScheduling import bounds
+from MigrationScheduling import exact
+from MigrationScheduling import decomposition
+from MigrationScheduling import presolve
 from MigrationScheduling import algorithms
-from MigrationScheduling.Model import Optimizer
+from MigrationScheduling import utils
+from MigrationScheduling import solver
+from MigrationScheduling.Model import Optimizer, SchedulingSession
 
 DIR = os.path.dirname(os.path.dirname(
         os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -122,3 +129,285 @@ def test_vff_heuristic_with_resilience():
     # - migration 5 is scheduled in round 5
     # - migration 9 is scheduled in round 6
     assert vff_val == 6
+
+
+def test_cbf_heuristic_no_resilience():
+    optimizer = Optimizer()
+    optimizer.get_model_data(DATA_PATH)
+    cbf_val = algorithms.current_bottleneck_first(
+        optimizer.instance_data(), -1, False)
+    indexed_val = algorithms.current_bottleneck_first(
+        optimizer.instance_data(), -1, False, indexed=True)
+    assert cbf_val == 4
+    assert indexed_val == cbf_val
+
+
+def test_vff_backends_agree():
+    optimizer = Optimizer()
+    optimizer.get_model_data(DATA_PATH)
+    for resiliency in (False, True):
+        vff_val = algorithms.vector_first_fit(
+            optimizer.instance_data(), resiliency)
+        for backend in ("matrix", "tree", "bitset"):
+            assert algorithms.vector_first_fit(
+                optimizer.instance_data(), resiliency, backend) == vff_val
+
+
+
+def test_ordered_vff_backends_agree():
+    optimizer = Optimizer()
+    optimizer.get_model_data(DATA_PATH)
+    assert algorithms.ordered_vector_fit(
+        optimizer.instance_data()) == algorithms.vector_first_fit(
+            optimizer.instance_data())
+    for ordering in specs.MIGRATION_ORDERINGS:
+        for placement in specs.PLACEMENT_RULES:
+            num_rounds = {algorithms.ordered_vector_fit(
+                optimizer.instance_data(), ordering, placement, False, backend)
+                for backend in specs.SCHEDULING_BACKENDS}
+            assert len(num_rounds) == 1
+def test_heuristic_schedules_cover_migrations():
+    optimizer = Optimizer()
+    optimizer.get_model_data(DATA_PATH)
+    data = optimizer.instance_data()
+    for num_rounds, schedule in (
+        algorithms.vector_first_fit(data, False, return_schedule=True),
+        algorithms.current_bottleneck_first(
+            data, -1, False, return_schedule=True)):
+        assert schedule.get_num_migrations() == len(data.get_migrations())
+        assert num_rounds == schedule.get_num_rounds()
+        for switch in data.get_migrations():
+            assert 0 <= schedule.get_switch_round(switch) < num_rounds
+
+
+def test_eliminate_rounds_improves_vff():
+    optimizer = Optimizer()
+    optimizer.get_model_data(DATA_PATH)
+    for resiliency in (False, True):
+        vff_val, schedule = algorithms.vector_first_fit(
+            optimizer.instance_data(), resiliency, return_schedule=True)
+        improved = algorithms.eliminate_rounds(schedule, None)
+        assert improved.get_num_rounds() <= vff_val
+        assert improved.get_num_migrations() == schedule.get_num_migrations()
+        checked = improved.copy("rounds")
+        for round_num in range(checked.get_num_rounds()):
+            for const_name in utils.get_constraints_dict(
+                optimizer.instance_data(), resiliency):
+                assert checked.get_remaining_capacity(
+                    const_name, round_num) >= 0
+
+
+def test_multi_start_cbf():
+    optimizer = Optimizer()
+    optimizer.get_model_data(DATA_PATH)
+    lower_bound = bounds.get_lower_bound(optimizer.instance_data())
+    schedule, run_rounds = algorithms.multi_start_current_bottleneck_first(
+        optimizer.instance_data(), 2, 4, num_workers=2)
+    assert schedule.get_num_rounds() == min(run_rounds.values())
+    assert schedule.get_num_rounds() >= lower_bound
+    assert schedule.get_num_migrations() == len(
+        optimizer.instance_data().get_migrations())
+    serial_schedule, serial_rounds = (
+        algorithms.multi_start_current_bottleneck_first(
+            optimizer.instance_data(), 2, 4, num_workers=1))
+    assert serial_schedule.get_num_rounds() == schedule.get_num_rounds()
+
+
+def test_lower_bound_below_optimum():
+    optimizer = Optimizer()
+    optimizer.get_model_data(DATA_PATH)
+    for resiliency in (False, True):
+        lower_bound = bounds.get_lower_bound(
+            optimizer.instance_data(), resiliency)
+        opt_rounds = 1 + int(round(optimizer.build_ip_model(
+            resiliency=resiliency, verbose=False)))
+        assert 1 <= lower_bound <= opt_rounds
+
+
+def test_dsatur_no_worse_than_vff():
+    optimizer = Optimizer()
+    optimizer.get_model_data(DATA_PATH)
+    for resiliency in (False, True):
+        vff_val = algorithms.vector_first_fit(
+            optimizer.instance_data(), resiliency)
+        num_rounds = {algorithms.degree_of_saturation_first(
+            optimizer.instance_data(), resiliency, backend)
+            for backend in specs.SCHEDULING_BACKENDS}
+        assert len(num_rounds) == 1
+        assert num_rounds.pop() <= vff_val
+
+
+def test_solve_improves_vff():
+    optimizer = Optimizer()
+    optimizer.get_model_data(DATA_PATH)
+    lower_bound = bounds.get_lower_bound(optimizer.instance_data())
+    incumbents = list(solver.solve(
+        optimizer.instance_data(), 0.5))
+    assert incumbents[0][0] == "VFF"
+    assert incumbents[0][1].get_num_rounds() == algorithms.vector_first_fit(
+        optimizer.instance_data())
+    num_rounds = [schedule.get_num_rounds() for _, schedule in incumbents]
+    assert num_rounds == sorted(set(num_rounds), reverse=True)
+    assert num_rounds[-1] >= lower_bound
+    assert incumbents[-1][1].get_num_migrations() == len(
+        optimizer.instance_data().get_migrations())
+
+
+def test_session_matches_vff():
+    optimizer = Optimizer()
+    optimizer.get_model_data(DATA_PATH)
+    controller_caps, qos_caps = utils.get_cap_dicts(optimizer.instance_data())
+    session = SchedulingSession(controller_caps, qos_caps)
+    migrations = list(optimizer.instance_data().get_migrations().values())
+    for idx in range(0, len(migrations), 3):
+        session.add_migrations(migrations[idx:idx + 3])
+    assert session.get_num_rounds() == algorithms.vector_first_fit(
+        optimizer.instance_data())
+
+
+def test_branch_and_bound_matches_optimizer():
+    optimizer = Optimizer()
+    optimizer.get_model_data(DATA_PATH)
+    for resiliency in (False, True):
+        opt_rounds = 1 + int(round(optimizer.build_ip_model(
+            resiliency=resiliency, verbose=False)))
+        assert exact.branch_and_bound(
+            optimizer.instance_data(), resiliency) == opt_rounds
+
+
+def test_components_match_optimizer():
+    optimizer = Optimizer()
+    optimizer.get_model_data(DATA_PATH)
+    for resiliency in (False, True):
+        opt_rounds = 1 + int(round(optimizer.build_ip_model(
+            resiliency=resiliency, verbose=False)))
+        num_rounds, schedule = decomposition.solve_by_components(
+            optimizer.instance_data(), decomposition.optimize_schedule,
+            resiliency, return_schedule=True)
+        assert num_rounds == opt_rounds
+        assert schedule.get_num_migrations() == len(
+            optimizer.instance_data().get_migrations())
+
+
+def test_presolve_matches_optimizer():
+    optimizer = Optimizer()
+    optimizer.get_model_data(DATA_PATH)
+    for resiliency in (False, True):
+        opt_rounds = 1 + int(round(optimizer.build_ip_model(
+            resiliency=resiliency, verbose=False)))
+        num_rounds, schedule = presolve.solve_presolved(
+            optimizer.instance_data(), decomposition.optimize_schedule,
+            resiliency, return_schedule=True)
+        assert num_rounds == opt_rounds
+        assert schedule.get_num_migrations() == len(
+            optimizer.instance_data().get_migrations())
+
+
+def test_class_ip_matches_ip():
+    optimizer = Optimizer()
+    optimizer.get_model_data(DATA_PATH)
+    data = optimizer.instance_data()
+    for resiliency in (False, True):
+        opt_val = optimizer.build_ip_model(
+            resiliency=resiliency, verbose=False)
+        assert optimizer.build_class_ip_model(
+            resiliency=resiliency, verbose=False) == opt_val
+        schedule = algorithms.build_schedule(
+            data, optimizer.get_assignment(), resiliency)
+        assert schedule.get_num_migrations() == len(data.get_migrations())
+        assert schedule.get_num_rounds() == 1 + int(round(opt_val))
+
+
+def test_class_first_fit_covers_migrations():
+    optimizer = Optimizer()
+    optimizer.get_model_data(DATA_PATH)
+    data = optimizer.instance_data()
+    for resiliency in (False, True):
+        num_rounds, schedule = algorithms.class_first_fit(
+            data, resiliency, return_schedule=True)
+        assert schedule.get_num_migrations() == len(data.get_migrations())
+        assert num_rounds >= bounds.get_lower_bound(data, resiliency)
+
+
+def test_heuristic_horizon_matches_ip():
+    optimizer = Optimizer()
+    optimizer.get_model_data(DATA_PATH)
+    data = optimizer.instance_data()
+    for resiliency in (False, True):
+        opt_val = optimizer.build_ip_model(
+            resiliency=resiliency, verbose=False)
+        upper_bound = algorithms.get_heuristic_upper_bound(data, resiliency)
+        assert optimizer.build_ip_model(
+            resiliency=resiliency, verbose=False,
+            num_rounds=upper_bound) == opt_val
+        assignment = optimizer.get_assignment()
+        assert len(assignment) == len(data.get_migrations())
+        assert max(assignment.values()) < upper_bound
+
+
+def test_rounds_formulation_matches_ip():
+    optimizer = Optimizer()
+    optimizer.get_model_data(DATA_PATH)
+    data = optimizer.instance_data()
+    for resiliency in (False, True):
+        opt_val = optimizer.build_ip_model(
+            resiliency=resiliency, verbose=False)
+        assert round(optimizer.build_ip_model(
+            resiliency=resiliency, verbose=False,
+            formulation="rounds")) == round(opt_val)
+        schedule = algorithms.build_schedule(
+            data, optimizer.get_assignment(), resiliency)
+        assert schedule.get_num_migrations() == len(data.get_migrations())
+        assert schedule.get_num_rounds() == 1 + int(round(opt_val))
+        lb, _ = optimizer.get_model_bounds(resiliency, formulation="rounds")
+        assert optimizer.get_model_bounds(resiliency)[0] <= lb
+        assert lb <= 1 + int(round(opt_val))
+
+
+def test_heuristic_start_matches_ip():
+    optimizer = Optimizer()
+    optimizer.get_model_data(DATA_PATH)
+    data = optimizer.instance_data()
+    for resiliency in (False, True):
+        opt_val = optimizer.build_ip_model(
+            resiliency=resiliency, verbose=False)
+        num_rounds, schedule = algorithms.vector_first_fit(
+            data, resiliency, return_schedule=True)
+        for formulation in specs.MODEL_FORMULATIONS:
+            assert round(optimizer.build_ip_model(
+                resiliency=resiliency, verbose=False, num_rounds=num_rounds,
+                formulation=formulation, start_schedule=schedule)) == (
+                round(opt_val))
+
+
+def test_symmetry_breaking_matches_ip():
+    optimizer = Optimizer()
+    optimizer.get_model_data(DATA_PATH)
+    data = optimizer.instance_data()
+    for resiliency in (False, True):
+        opt_val = optimizer.build_ip_model(
+            resiliency=resiliency, verbose=False)
+        num_rounds, schedule = algorithms.vector_first_fit(
+            data, resiliency, return_schedule=True)
+        for formulation in specs.MODEL_FORMULATIONS:
+            assert round(optimizer.build_ip_model(
+                resiliency=resiliency, verbose=False, num_rounds=num_rounds,
+                formulation=formulation, start_schedule=schedule,
+                symmetry_breaking=True)) == round(opt_val)
+            schedule_found = algorithms.build_schedule(
+                data, optimizer.get_assignment(), resiliency)
+            assert schedule_found.get_num_rounds() == (
+                optimizer.get_num_rounds())
+
+
+def test_matrix_api_matches_ip():
+    optimizer = Optimizer()
+    optimizer.get_model_data(DATA_PATH)
+    for resiliency in (False, True):
+        for formulation in specs.MODEL_FORMULATIONS:
+            opt_val = optimizer.build_ip_model(
+                resiliency=resiliency, verbose=False,
+                formulation=formulation)
+            assert optimizer.build_ip_model(
+                resiliency=resiliency, verbose=False,
+                formulation=formulation, matrix_api=True) == opt_val
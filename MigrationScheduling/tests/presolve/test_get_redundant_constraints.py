@@ -0,0 +1,20 @@
+from MigrationScheduling.presolve import get_redundant_constraints
+from MigrationScheduling.tests.helpers import build_instance
+
+
+def test_with_no_migrations():
+    data = build_instance({}, {}, {'c0': 1.0}, [])
+    assert get_redundant_constraints(data) == {'c0'}
+
+
+def test_redundant_constraints():
+    data = build_instance(
+        {'g0': 1, 'g1': 2, 'g2': 3},
+        {'g0': ['s0'], 'g1': ['s0', 's1', 's2'], 'g2': ['s1', 's2']},
+        {'c0': 3.0, 'c1': 4.0, 'c2': 6.0},
+        [('s0', 'c2', 'c0', 1.0), ('s1', 'c2', 'c0', 2.0),
+         ('s2', 'c0', 'c1', 4.0)])
+    assert get_redundant_constraints(data) == {'c0', 'c1', 'c2', 'g0', 'g2'}
+    # c0 also carries the load of s2 under resiliency
+    assert get_redundant_constraints(data, True) == {
+        'c1', 'c2', 'g0', 'g2'}
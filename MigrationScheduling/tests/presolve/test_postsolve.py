@@ -0,0 +1,27 @@
+from unittest.mock import MagicMock, patch
+from MigrationScheduling.presolve import postsolve
+
+
+BUILD_STR = "MigrationScheduling.algorithms.build_schedule"
+
+
+@patch(BUILD_STR)
+def test_postsolve(mock_build):
+    instance_data = MagicMock()
+    schedule = MagicMock()
+    schedule.get_assignment.return_value = {'s1': 1, 's2': 0}
+    full_schedule = MagicMock()
+    mock_build.return_value = full_schedule
+    assert postsolve(instance_data, schedule, ['s0', 's3'], True) is (
+        full_schedule)
+    mock_build.assert_called_once_with(
+        instance_data, {'s0': 0, 's1': 1, 's2': 0, 's3': 0}, True)
+
+
+@patch(BUILD_STR)
+def test_without_loose_switches(mock_build):
+    instance_data = MagicMock()
+    schedule = MagicMock()
+    schedule.get_assignment.return_value = {'s1': 1}
+    postsolve(instance_data, schedule, [])
+    mock_build.assert_called_once_with(instance_data, {'s1': 1}, False)
@@ -0,0 +1,67 @@
+import pytest
+from MigrationScheduling.Model import Optimizer
+from MigrationScheduling.presolve import presolve
+from MigrationScheduling.tests.helpers import build_instance
+
+
+@pytest.fixture(scope="function")
+def instance():
+    # c0 and g1 bind, c1, c2 and g0 are redundant without resiliency
+    return build_instance(
+        {'g0': 2, 'g1': 1}, {'g0': ['s0', 's3'], 'g1': ['s2', 's3']},
+        {'c0': 3.0, 'c1': 10.0, 'c2': 10.0},
+        [('s0', 'c0', 'c1', 1.0), ('s1', 'c2', 'c0', 2.0),
+         ('s2', 'c1', 'c0', 2.0), ('s3', 'c0', 'c2', 1.0)])
+
+
+def test_with_no_migrations():
+    data = build_instance({}, {}, {'c0': 1.0}, [])
+    reduced_data, loose_switches = presolve(data)
+    assert reduced_data.get_migrations() == {}
+    assert reduced_data.get_control_consts() == set()
+    assert loose_switches == []
+
+
+def test_without_resiliency(instance):
+    reduced_data, loose_switches = presolve(instance)
+    assert loose_switches == ['s0']
+    assert set(reduced_data.get_migrations()) == {'s1', 's2', 's3'}
+    assert [const.get_group() for const in reduced_data.get_qos_consts()] == [
+        'g1']
+    assert set(reduced_data.get_migration('s3').get_groups()) == {'g1'}
+    # c1 and c2 are dropped although s2 and s3 still migrate to them
+    const, = reduced_data.get_control_consts()
+    assert const.get_controller() == 'c0'
+    assert const.get_constraint_switches(True) == {'s1', 's2', 's3'}
+    assert reduced_data.get_switch_ids() == [1, 2, 3]
+    assert reduced_data.get_round_ids() == [0, 1, 2]
+
+
+def test_with_resiliency(instance):
+    # c0 also carries the load of s0 and s3, so no migration is loose
+    reduced_data, loose_switches = presolve(instance, True)
+    assert loose_switches == []
+    assert len(reduced_data.get_migrations()) == 4
+    assert [const.get_group() for const in reduced_data.get_qos_consts()] == [
+        'g1']
+
+
+@pytest.mark.parametrize("matrix_api", [False, True])
+def test_model_has_fewer_constraints(instance, matrix_api):
+    optimizer = Optimizer()
+    optimizer.set_model_data(instance)
+    optimizer.build_ip_model(
+        verbose=False, num_rounds=3, matrix_api=matrix_api)
+    num_constrs = optimizer._model.NumConstrs
+    num_rounds = optimizer.get_num_rounds()
+    reduced_data, _ = presolve(instance)
+    optimizer.set_model_data(reduced_data)
+    optimizer.build_ip_model(
+        verbose=False, num_rounds=3, matrix_api=matrix_api)
+    assert optimizer._model.NumConstrs < num_constrs
+    assert optimizer.get_num_rounds() == num_rounds
+    # only c0 and g1 keep their rows
+    assert sorted(constr.ConstrName.split("[")[0]
+                  for constr in optimizer._model.getConstrs()
+                  if constr.ConstrName.startswith(("controller", "QoS"))) == (
+        ["QoS"] * 3 + ["controller"] * 3)
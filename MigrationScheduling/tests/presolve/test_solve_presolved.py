@@ -0,0 +1,53 @@
+from MigrationScheduling import algorithms
+from MigrationScheduling.decomposition import optimize_schedule
+from MigrationScheduling.presolve import solve_presolved
+from MigrationScheduling.tests.helpers import build_instance
+
+
+def test_with_no_migrations():
+    data = build_instance({}, {}, {'c0': 1.0}, [])
+    assert solve_presolved(data) == 0
+
+
+def test_only_loose_migrations():
+    data = build_instance(
+        {'g0': 2}, {'g0': ['s0', 's1']}, {'c0': 5.0, 'c1': 5.0},
+        [('s0', 'c1', 'c0', 2.0), ('s1', 'c0', 'c1', 3.0)])
+    num_rounds, schedule = solve_presolved(data, return_schedule=True)
+    assert num_rounds == 1
+    assert schedule.get_assignment() == {'s0': 0, 's1': 0}
+
+
+def test_matches_full_instance():
+    data = build_instance(
+        {'g0': 2, 'g1': 1}, {'g0': ['s0', 's3'], 'g1': ['s2', 's3']},
+        {'c0': 3.0, 'c1': 10.0, 'c2': 10.0},
+        [('s0', 'c0', 'c1', 1.0), ('s1', 'c2', 'c0', 2.0),
+         ('s2', 'c1', 'c0', 2.0), ('s3', 'c0', 'c2', 1.0)])
+    for resiliency in (False, True):
+        num_rounds, schedule = solve_presolved(
+            data, optimize_schedule, resiliency, True)
+        assert num_rounds == optimize_schedule(data, resiliency)
+        assert schedule.get_num_migrations() == 4
+        assert solve_presolved(data, resiliency=resiliency) <= (
+            algorithms.vector_first_fit(data, resiliency))
+
+
+def test_with_bottleneck_algorithm():
+    # c1 and c2 are redundant controllers dropped from the reduced instance
+    # while their migrations still name them
+    data = build_instance(
+        {'g0': 2, 'g1': 1}, {'g0': ['s0', 's3'], 'g1': ['s2', 's3']},
+        {'c0': 3.0, 'c1': 10.0, 'c2': 10.0},
+        [('s0', 'c0', 'c1', 1.0), ('s1', 'c2', 'c0', 2.0),
+         ('s2', 'c1', 'c0', 2.0), ('s3', 'c0', 'c2', 1.0)])
+
+    def bottleneck_first(instance_data, resiliency, return_schedule):
+        return algorithms.current_bottleneck_first(
+            instance_data, -1, resiliency, indexed=True,
+            return_schedule=return_schedule)
+
+    num_rounds, schedule = solve_presolved(
+        data, bottleneck_first, return_schedule=True)
+    assert num_rounds == optimize_schedule(data)
+    assert schedule.get_num_migrations() == 4
@@ -0,0 +1,30 @@
+from unittest.mock import call, patch, MagicMock
+from MigrationScheduling.solver import generate_candidates
+
+
+DSATUR_STR = "MigrationScheduling.solver.algorithms.degree_of_saturation_first"
+CBF_STR = "MigrationScheduling.solver.algorithms.current_bottleneck_first"
+MULTI_STR = ("MigrationScheduling.solver.algorithms." +
+             "multi_start_current_bottleneck_first")
+BATCH_STR = "MigrationScheduling.solver.specs.SOLVE_BATCH_RUNS"
+
+
+@patch(BATCH_STR, 3)
+@patch(MULTI_STR)
+@patch(CBF_STR)
+@patch(DSATUR_STR)
+def test_generate_candidates(mock_dsatur, mock_cbf, mock_multi):
+    schedules = [MagicMock() for _ in range(4)]
+    mock_dsatur.return_value = (3, schedules[0])
+    mock_cbf.return_value = (2, schedules[1])
+    mock_multi.side_effect = [(schedules[2], {}), (schedules[3], {})]
+    mock_data = MagicMock()
+    candidates = generate_candidates(mock_data, True, 2, 4, 10, 1)
+    assert [next(candidates) for _ in range(4)] == [
+        ("DSATUR", schedules[0]), ("CBF", schedules[1]),
+        ("MSCBF", schedules[2]), ("MSCBF", schedules[3])]
+    mock_dsatur.assert_called_once_with(mock_data, True, return_schedule=True)
+    mock_cbf.assert_called_once_with(
+        mock_data, -1, True, indexed=True, return_schedule=True)
+    mock_multi.assert_has_calls([call(mock_data, 2, 3, True, 4, 10, 1),
+                                 call(mock_data, 2, 3, True, 4, 13, 1)])
@@ -0,0 +1,14 @@
+from unittest.mock import MagicMock
+from MigrationScheduling.solver import report_incumbent
+
+
+def test_without_callback():
+    schedule = MagicMock()
+    assert report_incumbent("VFF", schedule) == ("VFF", schedule)
+
+
+def test_with_callback():
+    schedule = MagicMock()
+    callback = MagicMock()
+    assert report_incumbent("LS", schedule, callback) == ("LS", schedule)
+    callback.assert_called_once_with("LS", schedule)
@@ -0,0 +1,77 @@
+from unittest.mock import call, patch, MagicMock
+from MigrationScheduling.solver import solve
+from MigrationScheduling.tests.helpers import build_instance
+
+
+VFF_STR = "MigrationScheduling.solver.algorithms.vector_first_fit"
+LS_STR = "MigrationScheduling.solver.algorithms.eliminate_rounds"
+BOUND_STR = "MigrationScheduling.solver.bounds.get_lower_bound"
+CANDIDATES_STR = "MigrationScheduling.solver.generate_candidates"
+
+
+def make_schedule(num_rounds):
+    schedule = MagicMock()
+    schedule.get_num_rounds = MagicMock(return_value=num_rounds)
+    return schedule
+
+
+@patch(CANDIDATES_STR)
+@patch(BOUND_STR, return_value=3)
+@patch(LS_STR)
+@patch(VFF_STR)
+def test_stops_at_lower_bound(mock_vff, mock_ls, mock_bound,
+                              mock_candidates):
+    vff = make_schedule(3)
+    mock_vff.return_value = (3, vff)
+    mock_data = MagicMock()
+    callback = MagicMock()
+    assert list(solve(mock_data, 10.0, callback=callback)) == [("VFF", vff)]
+    mock_vff.assert_called_once_with(mock_data, False, return_schedule=True)
+    callback.assert_called_once_with("VFF", vff)
+    mock_ls.assert_not_called()
+
+
+@patch(CANDIDATES_STR)
+@patch(BOUND_STR, return_value=2)
+@patch(LS_STR)
+@patch(VFF_STR)
+def test_yields_improvements(mock_vff, mock_ls, mock_bound, mock_candidates):
+    vff, vff_ls = make_schedule(6), make_schedule(5)
+    dsatur, cbf, cbf_ls = make_schedule(5), make_schedule(3), make_schedule(2)
+    mock_vff.return_value = (6, vff)
+    mock_ls.side_effect = [vff_ls, cbf_ls]
+    mock_candidates.return_value = iter(
+        [("DSATUR", dsatur), ("CBF", cbf)])
+    mock_data = MagicMock()
+    assert list(solve(mock_data, 10.0, True, 2, 4, 7)) == [
+        ("VFF", vff), ("LS", vff_ls), ("CBF", cbf), ("LS", cbf_ls)]
+    mock_bound.assert_called_once_with(mock_data, True)
+    mock_candidates.assert_called_once_with(mock_data, True, 2, 4, 7, 2)
+    assert mock_ls.call_args_list[0][0][0] == vff
+    assert mock_ls.call_args_list[1][0][0] == cbf
+
+
+@patch(CANDIDATES_STR)
+@patch(BOUND_STR, return_value=1)
+@patch(LS_STR)
+@patch(VFF_STR)
+def test_stops_at_deadline(mock_vff, mock_ls, mock_bound, mock_candidates):
+    vff = make_schedule(4)
+    mock_vff.return_value = (4, vff)
+    assert list(solve(MagicMock(), 0.0)) == [("VFF", vff)]
+    mock_ls.assert_not_called()
+    mock_candidates.return_value.__next__.assert_not_called()
+
+
+def test_with_resiliency():
+    # first fit needs 3 rounds, the bottleneck candidates reach the bound of 2
+    data = build_instance(
+        {}, {}, {'c0': 6.0, 'c1': 6.0, 'c2': 6.0},
+        [('s0', 'c1', 'c0', 1.0), ('s1', 'c0', 'c1', 4.0),
+         ('s2', 'c2', 'c0', 3.0), ('s3', 'c0', 'c2', 2.0),
+         ('s4', 'c1', 'c0', 1.0), ('s5', 'c1', 'c2', 3.0)])
+    incumbents = list(solve(data, 10.0, True, num_workers=1))
+    assert incumbents[0][0] == "VFF"
+    assert incumbents[0][1].get_num_rounds() == 3
+    assert incumbents[-1][1].get_num_rounds() == 2
+    assert incumbents[-1][1].get_num_migrations() == 6
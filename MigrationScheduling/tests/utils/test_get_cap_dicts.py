@@ -1,3 +1,4 @@
+import numpy as np
 from unittest.mock import patch, MagicMock
 from MigrationScheduling.utils import get_cap_dicts
 
@@ -55,3 +56,16 @@ def test_with_multi_constraints(mock_control_caps, mock_qos_caps):
     mock_data.get_qos_consts.assert_called_once()
     mock_control_caps.assert_called_once_with(control_consts)
     mock_qos_caps.assert_called_once_with(qos_consts)
+
+
+@patch(QOS_STR, return_value={})
+@patch(CONTROLLER_STR, return_value={'c0': 3.24})
+def test_controller_without_constraint(mock_control_caps, mock_qos_caps):
+    mock_data = MagicMock()
+    migration = MagicMock()
+    migration.get_src_controller = MagicMock(return_value='c0')
+    migration.get_dst_controller = MagicMock(return_value='c4')
+    mock_data.get_migrations = MagicMock(return_value={'s0': migration})
+    control_caps, _ = get_cap_dicts(mock_data)
+    assert control_caps == {'c0': 3.24, 'c4': np.inf}
+
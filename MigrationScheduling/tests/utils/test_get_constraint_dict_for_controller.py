@@ -42,4 +42,4 @@ def test_with_migrations(mock_const, mock_load):
     mock_const.assert_called_once_with(5.16, 11.75, switch_set)
     control_const.get_cap.assert_called_once()
     control_const.get_controller.assert_called_once()
-    control_const.get_constraint_switches.assert_called_once_with(False)
+    control_const.get_constraint_switches.assert_called_once_with(True)
@@ -44,3 +44,29 @@ def test_complex_instance(mock_control_dicts, mock_qos_dicts):
     mock_control_dicts.assert_called_once_with(mock_data, True)
     mock_data.get_qos_consts.assert_called_once()
     mock_qos_dicts.assert_called_once_with(set(qos_consts))
+
+
+@patch(QOS_STR)
+@patch(CONTROL_STR)
+def test_omits_constraints_without_switches(mock_control_dicts,
+                                            mock_qos_dicts):
+    mock_data = MagicMock()
+    mock_data.get_qos_consts = MagicMock(return_value=set())
+    control_consts = [MagicMock() for _ in range(2)]
+    control_consts[1].get_switches = MagicMock(return_value=set())
+    qos_const = MagicMock()
+    qos_const.get_switches = MagicMock(return_value=set())
+    mock_control_dicts.return_value = {'c0': control_consts[0],
+                                       'c1': control_consts[1]}
+    mock_qos_dicts.return_value = {'g0': qos_const}
+    assert get_constraints_dict(mock_data, False) == {'c0': control_consts[0]}
+
+
+@patch(QOS_STR)
+@patch(CONTROL_STR)
+def test_constraints_ordered_by_name(mock_control_dicts, mock_qos_dicts):
+    mock_data = MagicMock()
+    mock_control_dicts.return_value = {'c4': MagicMock(), 'c2': MagicMock()}
+    mock_qos_dicts.return_value = {'g1': MagicMock(), 'g0': MagicMock()}
+    assert list(get_constraints_dict(mock_data, False)) == [
+        'c2', 'c4', 'g0', 'g1']
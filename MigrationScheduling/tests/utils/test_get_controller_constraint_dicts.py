@@ -39,7 +39,7 @@ def test_with_one_constraint(mock_const_dict, mock_control_const):
     mock_data.get_migrations.assert_called_once()
     mock_data.get_control_consts.assert_called_once()
     mock_const_dict.assert_called_once_with(
-        mock_control_const, set(migrations), False)
+        mock_control_const, migrations, False)
     mock_control_const.get_controller.assert_called_once()
 
 
@@ -61,7 +61,7 @@ def test_with_multi_constraints(mock_const_dict, mock_control_const):
     mock_data.get_control_consts.assert_called_once()
     for control_const in control_consts:
         control_const.get_controller.assert_called_once()
-    dict_calls = [call(control_const, set(migrations), True)
+    dict_calls = [call(control_const, migrations, True)
                   for control_const in control_consts]
     assert mock_const_dict.call_count == 3
     mock_const_dict.assert_has_calls(dict_calls)
@@ -0,0 +1,21 @@
+from MigrationScheduling.utils import get_migration_constraints
+from MigrationScheduling.tests.helpers import make_migration
+
+
+def test_with_no_groups():
+    migration = make_migration(src='c1', dst='c0', groups=set())
+    assert get_migration_constraints(migration) == ['c0']
+    migration.get_src_controller.assert_not_called()
+
+
+def test_with_groups_no_resiliency():
+    migration = make_migration(src='c1', dst='c0', groups={'g2'})
+    assert get_migration_constraints(migration, False) == ['c0', 'g2']
+    migration.get_src_controller.assert_not_called()
+
+
+def test_with_groups_and_resiliency():
+    migration = make_migration(src='c3', dst='c2', groups={'g0', 'g5'})
+    const_names = get_migration_constraints(migration, True)
+    assert const_names[:2] == ['c2', 'c3']
+    assert set(const_names[2:]) == {'g0', 'g5'}
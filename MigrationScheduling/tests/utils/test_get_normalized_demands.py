@@ -0,0 +1,30 @@
+import pytest
+from MigrationScheduling.utils import get_normalized_demands
+from MigrationScheduling.tests.helpers import make_migration
+
+
+CONTROL_CAPS = {'c0': 4.0, 'c1': 2.5, 'c2': 10.0}
+QOS_CAPS = {'g0': 2, 'g1': 1, 'g2': 4}
+
+
+def test_with_no_groups():
+    migration = make_migration(src='c1', dst='c0', load=2.0, groups=set())
+    assert get_normalized_demands(
+        migration, CONTROL_CAPS, QOS_CAPS) == {'c0': 0.5}
+
+
+def test_with_groups_no_resiliency():
+    migration = make_migration(
+        src='c2', dst='c1', load=1.0, groups={'g0', 'g2'})
+    assert get_normalized_demands(
+        migration, CONTROL_CAPS, QOS_CAPS, False) == {
+            'c1': 0.4, 'g0': 0.5, 'g2': 0.25}
+
+
+def test_with_groups_and_resiliency():
+    migration = make_migration(src='c2', dst='c0', load=3.0, groups={'g1'})
+    demands = get_normalized_demands(migration, CONTROL_CAPS, QOS_CAPS, True)
+    assert demands.keys() == {'c0', 'c2', 'g1'}
+    assert demands['c0'] == pytest.approx(0.75)
+    assert demands['c2'] == pytest.approx(0.3)
+    assert demands['g1'] == 1
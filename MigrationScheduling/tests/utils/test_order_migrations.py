@@ -0,0 +1,58 @@
+import pytest
+from unittest.mock import patch, MagicMock
+from MigrationScheduling import exceptions as exc
+from MigrationScheduling.utils import order_migrations
+from MigrationScheduling.tests.helpers import make_migration
+
+
+CAPS_STR = "MigrationScheduling.utils.get_cap_dicts"
+
+CONTROL_CAPS = {'c0': 4.0, 'c1': 2.0}
+QOS_CAPS = {'g0': 1, 'g1': 4}
+
+
+@pytest.fixture(scope="function")
+def migrations():
+    return [make_migration(src='c0', dst='c0', load=1.0, groups={'g1'}),
+            make_migration(src='c0', dst='c1', load=1.5, groups=set()),
+            make_migration(src='c1', dst='c0', load=3.0, groups={'g1'}),
+            make_migration(src='c1', dst='c0', load=0.5, groups={'g0', 'g1'})]
+
+
+@pytest.fixture(scope="function")
+def mock_data(migrations):
+    instance_data = MagicMock()
+    instance_data.get_migrations = MagicMock(return_value={
+        's{}'.format(idx): migration
+        for idx, migration in enumerate(migrations)})
+    return instance_data
+
+
+def test_input_ordering(mock_data, migrations):
+    assert order_migrations(mock_data) == migrations
+
+
+def test_load_ordering(mock_data, migrations):
+    assert order_migrations(mock_data, "load") == [
+        migrations[2], migrations[1], migrations[0], migrations[3]]
+
+
+def test_constraints_ordering(mock_data, migrations):
+    assert order_migrations(mock_data, "constraints") == [
+        migrations[3], migrations[0], migrations[2], migrations[1]]
+    assert order_migrations(mock_data, "constraints", True) == [
+        migrations[3], migrations[2], migrations[0], migrations[1]]
+
+
+@patch(CAPS_STR, return_value=(CONTROL_CAPS, QOS_CAPS))
+def test_demand_ordering(mock_caps, mock_data, migrations):
+    assert order_migrations(mock_data, "demand") == [
+        migrations[3], migrations[1], migrations[2], migrations[0]]
+    mock_caps.assert_called_once_with(mock_data)
+    assert order_migrations(mock_data, "demand", True) == [
+        migrations[2], migrations[3], migrations[1], migrations[0]]
+
+
+def test_invalid_ordering(mock_data):
+    with pytest.raises(exc.IncorrectOrdering):
+        order_migrations(mock_data, "random")
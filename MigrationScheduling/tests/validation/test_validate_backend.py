@@ -0,0 +1,16 @@
+import pytest
+from MigrationScheduling import specs
+from MigrationScheduling import exceptions as exc
+from MigrationScheduling.validation import validate_backend
+
+
+def test_valid_backends():
+    for backend in specs.SCHEDULING_BACKENDS:
+        validate_backend(backend)
+
+
+def test_invalid_backends():
+    with pytest.raises(exc.IncorrectBackend):
+        validate_backend("randomBackend")
+    with pytest.raises(exc.IncorrectBackend):
+        validate_backend("")
@@ -0,0 +1,16 @@
+import pytest
+from MigrationScheduling import specs
+from MigrationScheduling import exceptions as exc
+from MigrationScheduling.validation import validate_formulation
+
+
+def test_valid_formulations():
+    for formulation in specs.MODEL_FORMULATIONS:
+        validate_formulation(formulation)
+
+
+def test_invalid_formulations():
+    with pytest.raises(exc.IncorrectFormulation):
+        validate_formulation("randomFormulation")
+    with pytest.raises(exc.IncorrectFormulation):
+        validate_formulation("")
@@ -0,0 +1,16 @@
+import pytest
+from MigrationScheduling import specs
+from MigrationScheduling import exceptions as exc
+from MigrationScheduling.validation import validate_ordering
+
+
+def test_valid_orderings():
+    for ordering in specs.MIGRATION_ORDERINGS:
+        validate_ordering(ordering)
+
+
+def test_invalid_orderings():
+    with pytest.raises(exc.IncorrectOrdering):
+        validate_ordering("randomOrdering")
+    with pytest.raises(exc.IncorrectOrdering):
+        validate_ordering("")
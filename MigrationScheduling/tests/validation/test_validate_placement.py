@@ -0,0 +1,16 @@
+import pytest
+from MigrationScheduling import specs
+from MigrationScheduling import exceptions as exc
+from MigrationScheduling.validation import validate_placement
+
+
+def test_valid_placements():
+    for placement in specs.PLACEMENT_RULES:
+        validate_placement(placement)
+
+
+def test_invalid_placements():
+    with pytest.raises(exc.IncorrectPlacement):
+        validate_placement("randomPlacement")
+    with pytest.raises(exc.IncorrectPlacement):
+        validate_placement("")
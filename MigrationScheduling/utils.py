@@ -7,6 +7,7 @@ import re
 import random
 import numpy as np
 from MigrationScheduling import specs
+from MigrationScheduling import validation as val
 from MigrationScheduling.Data import ConstraintDict
 
 
@@ -55,11 +56,15 @@ def get_qos_group_cap_dict(qos_constraints):
     return {constraint.get_group(): constraint.get_cap()
             for constraint in qos_constraints}
 
+
 def get_cap_dicts(instance_data):
     """The dictionaries of controller and QoS group capacities.
 
     Constructs two dictionaries of controller capacities and QoS group
-    capacities for the constraints specified in `instance_data`.
+    capacities for the constraints specified in `instance_data`. A
+    controller of a migration without a constraint in `instance_data`, such
+    as a redundant controller dropped by `presolve`, is given an infinite
+    capacity.
 
     Parameters
     ----------
@@ -81,9 +86,13 @@ def get_cap_dicts(instance_data):
     """
     controller_caps = get_controller_cap_dict(
         instance_data.get_control_consts())
+    for migration in instance_data.get_migrations().values():
+        controller_caps.setdefault(migration.get_src_controller(), np.inf)
+        controller_caps.setdefault(migration.get_dst_controller(), np.inf)
     qos_caps = get_qos_group_cap_dict(instance_data.get_qos_consts())
     return controller_caps, qos_caps
 
+
 def get_load_contribution(migration, controller, resiliency=False):
     """Calculates the load contribution of `migration` to `controller`.
 
@@ -119,6 +128,7 @@ def get_load_contribution(migration, controller, resiliency=False):
         return migration.get_load()
     return 0.0
 
+
 def calculate_load_on_controller(controller_name,
                                  migrations, resiliency=False):
     """Calculates the load that `migrations` impose on `controller_name`.
@@ -151,6 +161,7 @@ def calculate_load_on_controller(controller_name,
             migration, controller_name, resiliency)
     return total_load
 
+
 def get_constraint_dict_for_controller(control_const,
                                        migrations, resiliency=False):
     """Builds a constraint dict for `control_consts`.
@@ -179,7 +190,8 @@ def get_constraint_dict_for_controller(control_const,
         control_const.get_cap(),
         calculate_load_on_controller(control_const.get_controller(),
                                      migrations, resiliency),
-        control_const.get_constraint_switches(False))
+        control_const.get_constraint_switches(resiliency))
+
 
 def get_constraint_dict_for_qos_group(qos_const):
     """Builds a constraint dict for `qos_const`.
@@ -199,6 +211,7 @@ def get_constraint_dict_for_qos_group(qos_const):
     switches = qos_const.get_switches()
     return ConstraintDict(qos_const.get_cap(), len(switches), switches)
 
+
 def get_controller_constraint_dicts(instance_data, resiliency=False):
     """The constraint dictionaries for the constraints in `instance_data`.
 
@@ -226,13 +239,14 @@ def get_controller_constraint_dicts(instance_data, resiliency=False):
         controller.
 
     """
-    migrations = set(instance_data.get_migrations().values())
+    migrations = list(instance_data.get_migrations().values())
     return {
         control_const.get_controller() :
         get_constraint_dict_for_controller(
             control_const, migrations, resiliency)
         for control_const in instance_data.get_control_consts()}
 
+
 def get_qos_constraint_dicts(qos_consts):
     """The constraint dictionaries for the constraints in `qos_consts`.
 
@@ -258,6 +272,7 @@ def get_qos_constraint_dicts(qos_consts):
             get_constraint_dict_for_qos_group(qos_const)
             for qos_const in qos_consts}
 
+
 def get_constraints_dict(instance_data, resiliency=False):
     """Dictionaries of the constraints from `instance_data`.
 
@@ -282,11 +297,144 @@ def get_constraints_dict(instance_data, resiliency=False):
         contains both controller and QoS group constraints. The keys are
         strings representing the name of the constraintz and the
         corresponding values is the associated `ConstraintDict` object.
+        Constraints without any switches are omitted as no migration can be
+        selected from them. The constraints are ordered by name, so that
+        ties between constraints are broken the same way in every run.
 
     """
     control_dict = get_controller_constraint_dicts(instance_data, resiliency)
     qos_dict = get_qos_constraint_dicts(instance_data.get_qos_consts())
-    return {**control_dict, **qos_dict}
+    return {const_name: const_dict for const_name, const_dict
+            in sorted({**control_dict, **qos_dict}.items(),
+                      key=lambda const_item: const_item[0])
+            if const_dict.get_switches()}
+
+
+def get_migration_constraints(migration, resiliency=False):
+    """The names of the constraints involving `migration`.
+
+    These are the destination controller of `migration`, its source
+    controller if `resiliency` is True, and each of its QoS groups.
+
+    Parameters
+    ----------
+    migration: Migration
+        The `Migration` object for which the constraints are retrieved.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. A value of True indicates that the load of a migration
+        will be considered for both the source and destination controllers.
+        Otherwise, the load is only considered for the destination controller.
+
+    Returns
+    -------
+    list
+        A list of strings representing the names of the controllers and QoS
+        groups whose constraints involve `migration`.
+
+    """
+    const_names = [migration.get_dst_controller()]
+    if resiliency:
+        const_names.append(migration.get_src_controller())
+    return const_names + list(migration.get_groups())
+
+
+def get_normalized_demands(migration, controller_caps, qos_caps,
+                           resiliency=False):
+    """The demand of `migration` on each of its constraints, normalized.
+
+    The demand on a controller is the load of `migration` and the demand on
+    a QoS group is 1. Each demand is divided by the capacity of its
+    constraint.
+
+    Parameters
+    ----------
+    migration: Migration
+        The `Migration` object for which the demands are calculated.
+    controller_caps: dict
+        A dictionary of controller capacities. The keys are strings
+        representing the names of the controllers and the corresponding value
+        is a float representing the capacity of that controller.
+    qos_caps: dict
+        A dictionary of QoS group capacities. The keys are strings
+        representing the names of the QoS groups and the corresponding value
+        is an integer representing the capacity of that group.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. A value of True indicates that the load of a migration
+        will be considered for both the source and destination controllers.
+        Otherwise, the load is only considered for the destination controller.
+
+    Returns
+    -------
+    dict
+        A dictionary in which the keys are strings representing the names of
+        the constraints involving `migration` and the corresponding value is
+        a float representing the demand of `migration` on that constraint as
+        a fraction of its capacity.
+
+    """
+    demands = {}
+    for const_name in get_migration_constraints(migration, resiliency):
+        if const_name in qos_caps:
+            demands[const_name] = 1 / qos_caps[const_name]
+        else:
+            demands[const_name] = (
+                migration.get_load() / controller_caps[const_name])
+    return demands
+
+
+def order_migrations(instance_data, ordering="input", resiliency=False):
+    """The migrations of `instance_data` sorted according to `ordering`.
+
+    The sort is stable, so migrations that are tied keep the order in which
+    they appear in `instance_data`.
+
+    Parameters
+    ----------
+    instance_data: InstanceData
+        An `InstanceData` object representing the data for a load migration
+        scheduling instance, whose migrations are ordered.
+    ordering: str
+        A string identifying the ordering. A value of 'input' keeps the
+        order of `instance_data`, 'load' sorts by decreasing load,
+        'constraints' sorts by decreasing number of constraints involving
+        the migration, and 'demand' sorts by decreasing maximum normalized
+        demand of the migration on its constraints. The default value is
+        'input'.
+    resiliency: bool
+        A boolean value indicating whether failure resiliency should be
+        considered. A value of True indicates that the load of a migration
+        will be considered for both the source and destination controllers.
+        Otherwise, the load is only considered for the destination controller.
+
+    Raises
+    ------
+    IncorrectOrdering
+        If `ordering` is not one of the orderings in
+        `specs.MIGRATION_ORDERINGS`.
+
+    Returns
+    -------
+    list
+        A list of the `Migration` objects of `instance_data` in the order
+        specified by `ordering`.
+
+    """
+    val.validate_ordering(ordering)
+    migrations = list(instance_data.get_migrations().values())
+    if ordering == "load":
+        migrations.sort(key=lambda m: m.get_load(), reverse=True)
+    elif ordering == "constraints":
+        migrations.sort(
+            key=lambda m: len(set(get_migration_constraints(m, resiliency))),
+            reverse=True)
+    elif ordering == "demand":
+        controller_caps, qos_caps = get_cap_dicts(instance_data)
+        migrations.sort(key=lambda m: max(get_normalized_demands(
+            m, controller_caps, qos_caps, resiliency).values()),
+            reverse=True)
+    return migrations
 
 
 def gaussian_controller_capacity(min_cap, max_cap, bottleneck_type):
@@ -445,6 +593,7 @@ def get_all_files_by_pattern(file_dir, file_pattern):
     return [file_name for file_name in os.listdir(file_dir)
             if re.match(match_str, file_name)]
 
+
 def get_results_header(run_optimizer=True):
     """The header for the file storing the results of solved instances.
 
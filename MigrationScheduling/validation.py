@@ -66,3 +66,99 @@ def validate_bottleneck_setting(supplied_setting):
     """
     if supplied_setting not in specs.BOTTLENECK_SETTINGS:
         raise exc.IncorrectBottleneckSetting(supplied_setting)
+
+
+def validate_backend(supplied_backend):
+    """Validates whether `supplied_backend` is a correct scheduling backend.
+
+    Correct backends are those in `specs.SCHEDULING_BACKENDS`.
+
+    Parameters
+    ----------
+    supplied_backend: str
+        A string representing the backend to be validated.
+
+    Raises
+    ------
+    IncorrectBackend
+        If `supplied_backend` is not one of the correct backends.
+
+    Returns
+    -------
+    None
+
+    """
+    if supplied_backend not in specs.SCHEDULING_BACKENDS:
+        raise exc.IncorrectBackend(supplied_backend)
+
+
+def validate_ordering(supplied_ordering):
+    """Validates whether `supplied_ordering` is a correct migration ordering.
+
+    Correct orderings are those in `specs.MIGRATION_ORDERINGS`.
+
+    Parameters
+    ----------
+    supplied_ordering: str
+        A string representing the ordering to be validated.
+
+    Raises
+    ------
+    IncorrectOrdering
+        If `supplied_ordering` is not one of the correct orderings.
+
+    Returns
+    -------
+    None
+
+    """
+    if supplied_ordering not in specs.MIGRATION_ORDERINGS:
+        raise exc.IncorrectOrdering(supplied_ordering)
+
+
+def validate_placement(supplied_placement):
+    """Validates whether `supplied_placement` is a correct placement rule.
+
+    Correct placement rules are those in `specs.PLACEMENT_RULES`.
+
+    Parameters
+    ----------
+    supplied_placement: str
+        A string representing the placement rule to be validated.
+
+    Raises
+    ------
+    IncorrectPlacement
+        If `supplied_placement` is not one of the correct placement rules.
+
+    Returns
+    -------
+    None
+
+    """
+    if supplied_placement not in specs.PLACEMENT_RULES:
+        raise exc.IncorrectPlacement(supplied_placement)
+
+
+def validate_formulation(supplied_formulation):
+    """Validates whether `supplied_formulation` is a correct model formulation.
+
+    Correct formulations are those in `specs.MODEL_FORMULATIONS`.
+
+    Parameters
+    ----------
+    supplied_formulation: str
+        A string representing the formulation to be validated.
+
+    Raises
+    ------
+    IncorrectFormulation
+        If `supplied_formulation` is not one of the correct formulations.
+
+    Returns
+    -------
+    None
+
+    """
+    if supplied_formulation not in specs.MODEL_FORMULATIONS:
+        raise exc.IncorrectFormulation(supplied_formulation)